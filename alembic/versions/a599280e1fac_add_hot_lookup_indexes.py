@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Add indexes for hot lookup columns
+
+Revision ID: a599280e1fac
+Revises: e4fc04d1a442
+Create Date: 2026-10-19 09:12:41.318204
+
+"""
+# Standard
+from typing import Sequence, Union
+
+# First-Party
+from alembic import op
+
+# Third-Party
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a599280e1fac'
+down_revision: Union[str, Sequence[str], None] = 'e4fc04d1a442'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) - kept in sync with the Index() entries in mcpgateway.db
+INDEXES = [
+    ("ix_tool_metrics_tool_id_timestamp", "tool_metrics", ["tool_id", "timestamp"]),
+    ("ix_mcp_messages_session_id", "mcp_messages", ["session_id"]),
+    ("ix_mcp_sessions_last_accessed", "mcp_sessions", ["last_accessed"]),
+    ("ix_server_tool_association_tool_id", "server_tool_association", ["tool_id"]),
+    ("ix_server_resource_association_resource_id", "server_resource_association", ["resource_id"]),
+    ("ix_server_prompt_association_prompt_id", "server_prompt_association", ["prompt_id"]),
+]
+
+
+def _existing_indexes(inspector: sa.Inspector, table: str) -> set:
+    if not inspector.has_table(table):
+        return set()
+    return {ix["name"] for ix in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """
+    Creates composite and single-column indexes for the hot query paths.
+
+    Fresh databases created through ``Base.metadata.create_all`` already carry
+    these indexes, so each one is only created when it is missing.
+    """
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if not inspector.has_table(table) or name in _existing_indexes(inspector, table):
+            continue
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """
+    Drops the indexes created by this revision.
+    """
+    inspector = sa.inspect(op.get_bind())
+    for name, table, _ in reversed(INDEXES):
+        if name in _existing_indexes(inspector, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Add catalog ETag to gateways
+
+Revision ID: c3f1b2a4d5e6
+Revises: a599280e1fac
+Create Date: 2026-10-19 10:04:17.552931
+
+"""
+# Standard
+from typing import Sequence, Union
+
+# First-Party
+from alembic import op
+
+# Third-Party
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1b2a4d5e6'
+down_revision: Union[str, Sequence[str], None] = 'a599280e1fac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Adds the nullable 'catalog_etag' column to the 'gateways' table.
+
+    Existing gateways start without an ETag, so their first sync performs a
+    full diff and records one.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if 'catalog_etag' in {col['name'] for col in inspector.get_columns('gateways')}:
+        return
+    op.add_column('gateways', sa.Column('catalog_etag', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """
+    Removes the 'catalog_etag' column from the 'gateways' table.
+    """
+    op.drop_column('gateways', 'catalog_etag')
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Add masked auth summary to tools
+
+Revision ID: d5a7c3e9f1b2
+Revises: c3f1b2a4d5e6
+Create Date: 2026-10-19 11:12:40.318204
+
+"""
+# Standard
+from typing import Sequence, Union
+
+# First-Party
+from alembic import op
+
+# Third-Party
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a7c3e9f1b2'
+down_revision: Union[str, Sequence[str], None] = 'c3f1b2a4d5e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Adds the nullable 'auth_summary' column to the 'tools' table.
+
+    Existing tools start without a summary; they are masked on read (from
+    the decrypted-credential cache) until they are next saved.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if 'auth_summary' in {col['name'] for col in inspector.get_columns('tools')}:
+        return
+    op.add_column('tools', sa.Column('auth_summary', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """
+    Removes the 'auth_summary' column from the 'tools' table.
+    """
+    op.drop_column('tools', 'auth_summary')
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Add invocation settings to tools
+
+Revision ID: f2b8d4c6a0e1
+Revises: d5a7c3e9f1b2
+Create Date: 2026-10-19 12:05:11.804213
+
+"""
+# Standard
+from typing import Sequence, Union
+
+# First-Party
+from alembic import op
+
+# Third-Party
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4c6a0e1'
+down_revision: Union[str, Sequence[str], None] = 'd5a7c3e9f1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Column name -> annotation key it used to be read from
+SETTINGS = {'request_timeout': 'timeout', 'cache_ttl': 'cache_ttl', 'stale_while_revalidate': 'stale_while_revalidate'}
+
+
+def _seconds(value):
+    """Parse a non-negative number of seconds, or return None."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds >= 0 else None
+
+
+def upgrade() -> None:
+    """
+    Adds the nullable 'request_timeout', 'cache_ttl' and 'stale_while_revalidate'
+    columns to the 'tools' table.
+
+    Values previously set in a tool's annotations are moved to the new
+    columns and removed from the annotations, which are shown to MCP clients.
+    """
+    bind = op.get_bind()
+    existing = {col['name'] for col in sa.inspect(bind).get_columns('tools')}
+    for column in SETTINGS:
+        if column not in existing:
+            op.add_column('tools', sa.Column(column, sa.Float(), nullable=True))
+
+    tools = sa.table('tools', sa.column('id', sa.String), sa.column('annotations', sa.JSON), *(sa.column(c, sa.Float) for c in SETTINGS))
+    for tool_id, annotations in bind.execute(sa.select(tools.c.id, tools.c.annotations)).all():
+        if not isinstance(annotations, dict) or not any(key in annotations for key in SETTINGS.values()):
+            continue
+        annotations = dict(annotations)
+        values = {column: _seconds(annotations.pop(key, None)) for column, key in SETTINGS.items()}
+        bind.execute(tools.update().where(tools.c.id == tool_id).values(annotations=annotations, **values))
+
+
+def downgrade() -> None:
+    """
+    Moves the settings back into the tools' annotations and removes the columns.
+    """
+    bind = op.get_bind()
+    tools = sa.table('tools', sa.column('id', sa.String), sa.column('annotations', sa.JSON), *(sa.column(c, sa.Float) for c in SETTINGS))
+    for row in bind.execute(sa.select(tools)).mappings().all():
+        moved = {key: row[column] for column, key in SETTINGS.items() if row[column] is not None}
+        if moved:
+            bind.execute(tools.update().where(tools.c.id == row['id']).values(annotations={**(row['annotations'] or {}), **moved}))
+    for column in SETTINGS:
+        op.drop_column('tools', column)
@@ -57,7 +57,7 @@ from mcpgateway.services.tool_service import (
     ToolService,
 )
 from mcpgateway.utils.create_jwt_token import get_jwt_token
-from mcpgateway.utils.verify_credentials import require_auth, require_basic_auth
+from mcpgateway.utils.verify_credentials import require_auth, require_basic_auth, revoke_token
 
 # Third-Party
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -1275,3 +1275,33 @@ async def admin_reset_metrics(db: Session = Depends(get_db), user: str = Depends
     await server_service.reset_metrics(db)
     await prompt_service.reset_metrics(db)
     return {"message": "All metrics reset successfully", "success": True}
+
+
+@admin_router.post("/tokens/revoke")
+async def admin_revoke_token(request: Request, user: str = Depends(require_auth)) -> JSONResponse:
+    """Revoke a JWT until it expires.
+
+    Expects a JSON body with the token to revoke:
+      - token
+
+    With ``CACHE_TYPE=redis`` every worker rejects the token; otherwise
+    only this one does.
+
+    Args:
+        request: FastAPI request containing the JSON body.
+        user: Authenticated user.
+
+    Returns:
+        JSONResponse: The time until which the token is rejected, or 400 if it
+        is malformed or has no ``exp`` claim.
+    """
+    logger.debug(f"User {user} is revoking a token")
+    body = await request.json()
+    token = body.get("token") if isinstance(body, dict) else None
+    if not token:
+        return JSONResponse(content={"message": "Missing token", "success": False}, status_code=400)
+    try:
+        until = await revoke_token(token)
+    except ValueError as ex:
+        return JSONResponse(content={"message": str(ex), "success": False}, status_code=400)
+    return JSONResponse(content={"message": "Token revoked", "success": True, "revoked_until": until}, status_code=200)
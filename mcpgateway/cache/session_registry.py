@@ -22,6 +22,7 @@ from mcpgateway.db import get_db, SessionMessageRecord, SessionRecord
 from mcpgateway.services import PromptService, ResourceService, ToolService
 from mcpgateway.transports import SSETransport
 from mcpgateway.types import Implementation, InitializeResult, ServerCapabilities
+from mcpgateway.utils.rate_limiter import rate_limit_subject, rate_limiter
 
 # Third-Party
 from fastapi import HTTPException, status
@@ -677,6 +678,44 @@ class SessionRegistry(SessionBackend):
             instructions=("MCP Gateway providing federated tools, resources and prompts. Use /admin interface for configuration."),
         )
 
+    async def _call_tool_with_progress(self, db: Any, params: Dict[str, Any], transport: SSETransport, user: dict) -> Dict[str, Any]:
+        """
+        Invoke a tool and stream its progress to the client as MCP progress notifications.
+
+        Args:
+            db: Database session
+            params: ``tools/call`` parameters, including ``_meta.progressToken``
+            transport: Transport the notifications are sent on
+            user: User information
+
+        Returns:
+            Dict[str, Any]: The tool result, or a tool error result
+        """
+        token = params["_meta"]["progressToken"]
+
+        async def report(progress: float, total: Optional[float], message: Optional[str]) -> None:
+            """
+            Send one progress notification.
+
+            Args:
+                progress: Bytes received so far
+                total: Expected total, if known
+                message: Partial result, if any
+            """
+            notification = {"progressToken": token, "progress": progress}
+            if total is not None:
+                notification["total"] = total
+            if message is not None:
+                notification["message"] = message
+            await transport.send_message({"jsonrpc": "2.0", "method": "notifications/progress", "params": notification})
+
+        try:
+            await rate_limiter.hit("user", rate_limit_subject(user), settings.user_rate_limit)
+            result = await tool_service.invoke_tool(db, params["name"], params.get("arguments") or {}, client_id=rate_limit_subject(user), progress=report)
+            return result.model_dump(by_alias=True, exclude_none=True)
+        except Exception as e:
+            return {"content": [{"type": "text", "text": str(e)}], "isError": True}
+
     async def generate_response(self, message: json, transport: SSETransport, server_id: Optional[str], user: dict, base_url: str):
         """
         Generates response according to SSE specifications
@@ -744,6 +783,9 @@ class SessionRegistry(SessionBackend):
                 result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
             elif method == "ping":
                 result = {}
+            elif method == "tools/call" and (params.get("_meta") or {}).get("progressToken") is not None:
+                # Streaming mode: invoke in-process so progress can be pushed on this SSE stream
+                result = await self._call_tool_with_progress(db, params, transport, user)
             elif method == "tools/call":
                 rpc_input = {
                     "jsonrpc": "2.0",
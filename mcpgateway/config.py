@@ -34,7 +34,8 @@ from functools import lru_cache
 from importlib.resources import files
 import json
 from pathlib import Path
-from typing import Annotated, Any, Dict, List, Optional, Set, Union
+import re
+from typing import Annotated, Any, Dict, List, Optional, Set, Tuple, Union
 
 # Third-Party
 from fastapi import HTTPException
@@ -67,6 +68,10 @@ class Settings(BaseSettings):
     basic_auth_password: str = "changeme"
     jwt_secret_key: str = "my-test-key"
     jwt_algorithm: str = "HS256"
+    jwt_public_key: str = ""  # PEM key verifying RS*/ES*/PS*/EdDSA tokens
+    jwt_jwks_url: str = ""  # JWKS endpoint for asymmetric tokens; takes precedence over jwt_public_key
+    jwt_cache_ttl: int = 60  # seconds a verified token is trusted without re-checking its signature; 0 disables
+    jwt_revocation_sync_interval: float = 30.0  # seconds between full reloads of revocations shared through Redis
     auth_required: bool = True
     token_expiry: int = 10080  # minutes
 
@@ -110,6 +115,18 @@ class Settings(BaseSettings):
     transport_type: str = "all"  # http, ws, sse, all
     websocket_ping_interval: int = 30  # seconds
     sse_retry_timeout: int = 5000  # milliseconds
+    sse_keepalive_interval: int = 30  # seconds of idle before an SSE keepalive event
+    sse_queue_size: int = 1024  # messages queued per SSE session
+    sse_queue_max_bytes: int = 16 * 1024 * 1024  # bytes queued per SSE session; 0 disables
+    sse_slow_consumer_policy: str = "block"  # block, drop-oldest or disconnect, when a session's queue is full
+    sse_block_timeout: float = 30.0  # seconds a producer waits for room before the client is disconnected
+
+    @field_validator("sse_slow_consumer_policy")
+    @classmethod
+    def _check_sse_slow_consumer_policy(cls, v):
+        if v not in ("block", "drop-oldest", "disconnect"):
+            raise ValueError(f"sse_slow_consumer_policy must be block, drop-oldest or disconnect, not {v!r}")
+        return v
 
     # Federation
     federation_enabled: bool = True
@@ -156,8 +173,29 @@ class Settings(BaseSettings):
     # Tools
     tool_timeout: int = 60  # seconds
     max_tool_retries: int = 3
-    tool_rate_limit: int = 100  # requests per minute
-    tool_concurrent_limit: int = 10
+    tool_rate_limit: int = 0  # requests per minute, per tool
+    tool_concurrent_limit: int = 10  # concurrent invocations per tool
+    gateway_concurrent_limit: int = 50  # concurrent tool invocations per federated gateway
+    tool_queue_limit: int = 100  # invocations allowed to wait per tool/gateway before rejecting
+
+    tool_coalescing: bool = True  # identical concurrent calls of idempotent tools share one upstream call
+    tool_result_cache_size: int = 1000  # cached results of tools that opt in via their cache_ttl setting
+
+    tool_max_response_size: int = 20 * 1024 * 1024  # largest REST tool response accepted (bytes); 0 disables
+    jsonpath_filter_thread_threshold: int = 1024 * 1024  # results this large (bytes) are filtered in a worker thread
+
+    # REST tool connection pools (one pool per upstream host)
+    rest_pool_max_connections: int = 20
+    rest_pool_max_keepalive: int = 10
+    rest_pool_keepalive_expiry: float = 30.0  # seconds
+    rest_pool_max_hosts: int = 100  # host pools kept open; least recently used idle pools are closed beyond this
+    rest_http2: bool = True  # used when the optional 'h2' package is installed
+
+    # Rate Limiting (token buckets, requests per minute; 0 disables a limit)
+    rate_limit_backend: str = "memory"  # memory (per worker) or redis (shared across workers)
+    gateway_rate_limit: int = 0  # requests forwarded to each federated gateway
+    user_rate_limit: int = 0  # JSON-RPC requests per authenticated user (JWT sub)
+    server_rate_limit: int = 0  # MCP requests per virtual server
 
     # Prompts
     prompt_cache_size: int = 100
@@ -167,8 +205,15 @@ class Settings(BaseSettings):
     # Health Checks
     health_check_interval: int = 60  # seconds
     health_check_timeout: int = 10  # seconds
+    health_check_concurrency: int = 20  # gateways probed in parallel
+    health_check_jitter: float = 0.2  # +/- fraction of the interval, spreads probes over time
     unhealthy_threshold: int = 10
 
+    # Circuit Breakers (per upstream gateway and per REST tool host)
+    circuit_breaker_failure_threshold: int = 5  # consecutive failures that open a circuit
+    circuit_breaker_recovery_timeout: float = 30.0  # seconds an open circuit fails fast
+    circuit_breaker_half_open_max_calls: int = 1  # concurrent trial calls while half-open
+
     filelock_path: str = "tmp/gateway_service_leader.lock"
 
     # Default Roots
@@ -194,6 +239,9 @@ class Settings(BaseSettings):
     # streamable http transport
     use_stateful_sessions: bool = False  # Set to False to use stateless sessions without event store
     json_response_enabled: bool = True  # Enable JSON responses instead of SSE streams
+    event_store_type: str = "memory"  # memory or redis; where stateful sessions keep events for resumption
+    event_store_max_events: int = 100  # events kept per stream
+    event_store_ttl: int = 3600  # seconds a stream may be idle before its events are dropped
 
     # Development
     dev_mode: bool = False
@@ -292,6 +340,36 @@ class Settings(BaseSettings):
                 db_dir.mkdir(parents=True)
 
 
+@lru_cache(maxsize=256)
+def compile_jq(jq_filter: str) -> Any:
+    """
+    Compiles a jq filter, caching the compiled program by filter text.
+
+    Tools keep the same filter for their whole lifetime, so each distinct
+    filter is compiled once instead of on every invocation.
+
+    Args:
+        jq_filter (str): The jq filter string.
+
+    Returns:
+        The compiled jq program.
+
+    Raises:
+        ValueError: If the filter is not valid jq.
+
+    Examples:
+        >>> compile_jq(".a") is compile_jq(".a")
+        True
+        >>> compile_jq(".a[") # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        ValueError: ...
+    """
+    # Pylint can't introspect C-extension modules, so it doesn't know that jq really does export a compile() function.
+    # pylint: disable=c-extension-no-member
+    return jq.compile(jq_filter)
+
+
 def extract_using_jq(data, jq_filter=""):
     """
     Extracts data from a given input (string, dict, or list) using a jq filter string.
@@ -302,6 +380,10 @@ def extract_using_jq(data, jq_filter=""):
 
     Returns:
         The result of applying the jq filter to the input data.
+
+    Examples:
+        >>> extract_using_jq({"a": [1, 2]}, ".a[]")
+        [1, 2]
     """
     if jq_filter == "":
         return data
@@ -318,9 +400,7 @@ def extract_using_jq(data, jq_filter=""):
 
     # Apply the jq filter to the data
     try:
-        # Pylint can't introspect C-extension modules, so it doesn't know that jq really does export an all() function.
-        # pylint: disable=c-extension-no-member
-        result = jq.all(jq_filter, data)  # Use `jq.all` to get all matches (returns a list)
+        result = compile_jq(jq_filter).input_value(data).all()  # Use `all` to get all matches (returns a list)
         if result == [None]:
             result = "Error applying jsonpath filter"
     except Exception as e:
@@ -330,11 +410,86 @@ def extract_using_jq(data, jq_filter=""):
     return result
 
 
+# Mappings such as "$.name" or "$.owner.id" are plain key lookups
+_FIELD_PATH_RE = re.compile(r"^\$(?:\.[A-Za-z_][A-Za-z0-9_]*)+$")
+
+
+@lru_cache(maxsize=256)
+def compile_jsonpath(expr: str) -> JSONPath:
+    """
+    Parses a JSONPath expression, caching the result by expression text.
+
+    Args:
+        expr (str): The JSONPath expression.
+
+    Returns:
+        JSONPath: The parsed expression.
+
+    Examples:
+        >>> compile_jsonpath("$[*].name") is compile_jsonpath("$[*].name")
+        True
+    """
+    return parse(expr)
+
+
+def _field_path(expr: str) -> Optional[Tuple[str, ...]]:
+    """
+    Returns the keys of a JSONPath expression that only selects nested fields.
+
+    Args:
+        expr (str): The JSONPath expression.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The keys to follow, or None if the expression needs the full engine.
+
+    Examples:
+        >>> _field_path("$.owner.id")
+        ('owner', 'id')
+        >>> _field_path("$.tags[*]") is None
+        True
+    """
+    if not _FIELD_PATH_RE.match(expr):
+        return None
+    return tuple(expr[2:].split("."))
+
+
+def _lookup_fields(item: Any, keys: Tuple[str, ...], expr: JSONPath) -> Any:
+    """
+    Resolves a field-only mapping against one item with plain dict lookups.
+
+    Anything other than nested dicts is handed to the parsed expression, so
+    the result always matches what the JSONPath engine would produce.
+
+    Args:
+        item (Any): The item being mapped.
+        keys (Tuple[str, ...]): The keys to follow.
+        expr (JSONPath): The parsed mapping, used as a fallback.
+
+    Returns:
+        Any: The mapped value, None if a key is missing.
+    """
+    value = item
+    for key in keys:
+        if not isinstance(value, dict):
+            matches = expr.find(item)
+            if not matches:
+                return None
+            return matches[0].value if len(matches) == 1 else [m.value for m in matches]
+        if key not in value:
+            return None
+        value = value[key]
+    return value
+
+
 def jsonpath_modifier(data: Any, jsonpath: str = "$[*]", mappings: Optional[Dict[str, str]] = None) -> Union[List, Dict]:
     """
     Applies the given JSONPath expression and mappings to the data.
     Only return data that is required by the user dynamically.
 
+    Expressions are parsed once and cached, and mappings are parsed before the
+    results are walked. Mappings that only select fields (``$.a.b``) are
+    resolved with plain dict lookups rather than the JSONPath engine.
+
     Args:
         data: The JSON data to query.
         jsonpath: The JSONPath expression to apply.
@@ -346,12 +501,16 @@ def jsonpath_modifier(data: Any, jsonpath: str = "$[*]", mappings: Optional[Dict
 
     Raises:
         HTTPException: If there's an error parsing or executing the JSONPath expressions.
+
+    Examples:
+        >>> jsonpath_modifier([{"id": 1, "owner": {"name": "a"}}, {"id": 2}], "$[*]", {"who": "$.owner.name"})
+        [{'who': 'a'}, {'who': None}]
     """
     if not jsonpath:
         jsonpath = "$[*]"
 
     try:
-        main_expr: JSONPath = parse(jsonpath)
+        main_expr: JSONPath = compile_jsonpath(jsonpath)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid main JSONPath expression: {e}")
 
@@ -363,14 +522,20 @@ def jsonpath_modifier(data: Any, jsonpath: str = "$[*]", mappings: Optional[Dict
     results = [match.value for match in main_matches]
 
     if mappings:
+        compiled = []
+        for new_key, mapping_expr_str in mappings.items():
+            try:
+                compiled.append((new_key, compile_jsonpath(mapping_expr_str), _field_path(mapping_expr_str)))
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"Invalid mapping JSONPath for key '{new_key}': {e}")
+
         mapped_results = []
         for item in results:
             mapped_item = {}
-            for new_key, mapping_expr_str in mappings.items():
-                try:
-                    mapping_expr = parse(mapping_expr_str)
-                except Exception as e:
-                    raise HTTPException(status_code=400, detail=f"Invalid mapping JSONPath for key '{new_key}': {e}")
+            for new_key, mapping_expr, keys in compiled:
+                if keys is not None:
+                    mapped_item[new_key] = _lookup_fields(item, keys, mapping_expr)
+                    continue
                 try:
                     mapping_matches = mapping_expr.find(item)
                 except Exception as e:
@@ -17,6 +17,7 @@ and to record tool execution metrics.
 
 # Standard
 from datetime import datetime, timezone
+import logging
 import re
 from typing import Any, Dict, List, Optional
 import uuid
@@ -26,6 +27,7 @@ from mcpgateway.config import settings
 from mcpgateway.types import ResourceContent
 from mcpgateway.utils.create_slug import slugify
 from mcpgateway.utils.db_isready import wait_for_db_ready
+from mcpgateway.utils.services_auth import mask_auth
 
 # Third-Party
 import jsonschema
@@ -38,6 +40,7 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     func,
+    Index,
     Integer,
     JSON,
     make_url,
@@ -63,6 +66,8 @@ from sqlalchemy.orm.attributes import get_history
 # 1. Parse the URL so we can inspect backend ("postgresql", "sqlite", …)
 #    and the specific driver ("psycopg2", "asyncpg", empty string = default).
 # ---------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
 url = make_url(settings.database_url)
 backend = url.get_backend_name()  # e.g. 'postgresql', 'sqlite'
 driver = url.get_driver_name() or "default"
@@ -152,6 +157,7 @@ server_tool_association = Table(
     Base.metadata,
     Column("server_id", String, ForeignKey("servers.id"), primary_key=True),
     Column("tool_id", String, ForeignKey("tools.id"), primary_key=True),
+    Index("ix_server_tool_association_tool_id", "tool_id"),
 )
 
 # Association table for servers and resources
@@ -160,6 +166,7 @@ server_resource_association = Table(
     Base.metadata,
     Column("server_id", String, ForeignKey("servers.id"), primary_key=True),
     Column("resource_id", Integer, ForeignKey("resources.id"), primary_key=True),
+    Index("ix_server_resource_association_resource_id", "resource_id"),
 )
 
 # Association table for servers and prompts
@@ -168,6 +175,7 @@ server_prompt_association = Table(
     Base.metadata,
     Column("server_id", String, ForeignKey("servers.id"), primary_key=True),
     Column("prompt_id", Integer, ForeignKey("prompts.id"), primary_key=True),
+    Index("ix_server_prompt_association_prompt_id", "prompt_id"),
 )
 
 
@@ -198,6 +206,8 @@ class ToolMetric(Base):
     # Relationship back to the Tool model.
     tool: Mapped["Tool"] = relationship("Tool", back_populates="metrics")
 
+    __table_args__ = (Index("ix_tool_metrics_tool_id_timestamp", "tool_id", "timestamp"),)
+
 
 class ResourceMetric(Base):
     """
@@ -307,6 +317,7 @@ class Tool(Base):
         - auth_token: Token for bearer token authentication.
         - auth_header_key: header key for authentication.
         - auth_header_value: header value for authentication.
+        - auth_summary: the credentials with secrets masked, as shown in listings.
     """
 
     __tablename__ = "tools"
@@ -326,9 +337,16 @@ class Tool(Base):
     is_active: Mapped[bool] = mapped_column(default=True)
     jsonpath_filter: Mapped[str] = mapped_column(default="")
 
+    # Gateway-side invocation settings; kept out of annotations, which MCP clients see
+    request_timeout: Mapped[Optional[float]] = mapped_column(default=None)  # seconds, REST tools
+    cache_ttl: Mapped[Optional[float]] = mapped_column(default=None)  # seconds; opts the tool in to result caching
+    stale_while_revalidate: Mapped[Optional[float]] = mapped_column(default=None)  # seconds
+
     # Request type and authentication fields
     auth_type: Mapped[Optional[str]] = mapped_column(default=None)  # "basic", "bearer", or None
     auth_value: Mapped[Optional[str]] = mapped_column(default=None)
+    # Masked view of the credentials, kept up to date on save so listings never decrypt
+    auth_summary: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, default=None)
 
     # Federation relationship with a local gateway
     gateway_id: Mapped[Optional[str]] = mapped_column(ForeignKey("gateways.id"))
@@ -1028,6 +1046,9 @@ class Gateway(Base):
     is_active: Mapped[bool] = mapped_column(default=True)
     last_seen: Mapped[Optional[datetime]]
 
+    # Digest of the remote catalog at the last sync; unchanged catalogs are not re-synced
+    catalog_etag: Mapped[Optional[str]]
+
     # Relationship with local tools this gateway provides
     tools: Mapped[List["Tool"]] = relationship(back_populates="gateway", foreign_keys="Tool.gateway_id", cascade="all, delete-orphan")
 
@@ -1101,6 +1122,8 @@ class SessionRecord(Base):
 
     messages: Mapped[List["SessionMessageRecord"]] = relationship("SessionMessageRecord", back_populates="session", cascade="all, delete-orphan")
 
+    __table_args__ = (Index("ix_mcp_sessions_last_accessed", "last_accessed"),)
+
 
 class SessionMessageRecord(Base):
     """ORM model for messages from SSE client."""
@@ -1115,6 +1138,8 @@ class SessionMessageRecord(Base):
 
     session: Mapped["SessionRecord"] = relationship("SessionRecord", back_populates="messages")
 
+    __table_args__ = (Index("ix_mcp_messages_session_id", "session_id"),)
+
 
 # Event listeners for validation
 def validate_tool_schema(mapper, connection, target):
@@ -1183,10 +1208,37 @@ def validate_prompt_schema(mapper, connection, target):
 
 # Register validation listeners
 
+def set_tool_auth_summary(mapper, connection, target):
+    """
+    Store the masked credentials summary of a tool before insert/update.
+
+    The summary is only recomputed when the credentials changed, so other
+    updates (toggles, metrics) never decrypt them. Credentials that cannot
+    be decrypted, e.g. after AUTH_ENCRYPTION_SECRET was rotated, get a
+    summary with just the auth type instead of failing the save.
+
+    Args:
+        mapper: The mapper being used for the operation.
+        connection: The database connection.
+        target: The tool being saved.
+    """
+    _ = mapper
+    _ = connection
+    if not (get_history(target, "auth_value").has_changes() or get_history(target, "auth_type").has_changes()):
+        return
+    try:
+        target.auth_summary = mask_auth(target.auth_type, target.auth_value)
+    except Exception as e:
+        logger.warning(f"Cannot decrypt credentials of tool {target.original_name}, storing a generic summary: {e}")
+        target.auth_summary = {"auth_type": target.auth_type}
+
+
 listen(Tool, "before_insert", validate_tool_schema)
 listen(Tool, "before_update", validate_tool_schema)
 listen(Tool, "before_insert", validate_tool_name)
 listen(Tool, "before_update", validate_tool_name)
+listen(Tool, "before_insert", set_tool_auth_summary)
+listen(Tool, "before_update", set_tool_auth_summary)
 listen(Prompt, "before_insert", validate_prompt_schema)
 listen(Prompt, "before_update", validate_prompt_schema)
 
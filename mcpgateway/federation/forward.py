@@ -24,6 +24,8 @@ from mcpgateway.config import settings
 from mcpgateway.db import Gateway as DbGateway
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.types import ToolResult
+from mcpgateway.utils.circuit_breaker import circuit_breakers
+from mcpgateway.utils.rate_limiter import rate_limiter, RateLimitExceeded
 
 # Third-Party
 import httpx
@@ -54,9 +56,6 @@ class ForwardingService:
         # Track active requests
         self._active_requests: Dict[str, asyncio.Task] = {}
 
-        # Request history for rate limiting
-        self._request_history: Dict[str, List[datetime]] = {}
-
         # Cache gateway information
         self._gateway_tools: Dict[int, Set[str]] = {}
 
@@ -212,7 +211,7 @@ class ForwardingService:
             raise ForwardingError(f"Gateway not found: {gateway_id}")
 
         # Check rate limits
-        if not self._check_rate_limit(gateway.url):
+        if not await self._check_rate_limit(gateway.url):
             raise ForwardingError("Rate limit exceeded")
 
         try:
@@ -221,15 +220,18 @@ class ForwardingService:
             if params:
                 request["params"] = params
 
-            # Send request with retries using the persistent client directly
+            # Send request with retries using the persistent client directly;
+            # an open circuit fails fast instead of waiting out the timeout
+            breaker = circuit_breakers.for_gateway(gateway.id)
             for attempt in range(settings.max_tool_retries):
                 try:
-                    response = await self._http_client.post(
-                        f"{gateway.url}/rpc",
-                        json=request,
-                        headers=self._get_auth_headers(),
-                    )
-                    response.raise_for_status()
+                    with breaker.guard():
+                        response = await self._http_client.post(
+                            f"{gateway.url}/rpc",
+                            json=request,
+                            headers=self._get_auth_headers(),
+                        )
+                        response.raise_for_status()
                     result = response.json()
 
                     # Update last seen
@@ -307,26 +309,23 @@ class ForwardingService:
 
         return None
 
-    def _check_rate_limit(self, gateway_url: str) -> bool:
+    async def _check_rate_limit(self, gateway_url: str) -> bool:
         """Check if gateway request is within rate limits.
 
+        Takes a token from the gateway's bucket, which is shared across
+        workers when the Redis rate-limit backend is configured.
+
         Args:
             gateway_url: Gateway URL
 
         Returns:
             True if request allowed
         """
-        now = datetime.now(timezone.utc)
-
-        # Clean old history
-        self._request_history[gateway_url] = [t for t in self._request_history.get(gateway_url, []) if (now - t).total_seconds() < 60]
-
-        # Check limit
-        if len(self._request_history[gateway_url]) >= settings.tool_rate_limit:
+        try:
+            await rate_limiter.hit("gateway", gateway_url, settings.gateway_rate_limit)
+        except RateLimitExceeded as e:
+            logger.warning(str(e))
             return False
-
-        # Record request
-        self._request_history[gateway_url].append(now)
         return True
 
     def _get_auth_headers(self) -> Dict[str, str]:
@@ -350,13 +350,16 @@ class FederationManager:
                     try:
                         # Update capabilities
                         capabilities = await self._initialize_gateway(gateway.url)
-                        gateway.capabilities = capabilities
+                        if gateway.capabilities != capabilities:
+                            gateway.capabilities = capabilities
                         gateway.last_seen = datetime.now(timezone.utc)
                         gateway.is_active = True
+                        # The tool catalog is mirrored by GatewayService alone (see federation.sync)
 
                     except Exception as e:
                         logger.warning(f"Failed to sync gateway {gateway.name}: {e}")
 
+                # One transaction for every gateway synced in this pass
                 db.commit()
 
             except Exception as e:
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""Federated Catalog Sync.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+This module implements incremental synchronisation of a peer gateway's
+catalog into the local database. Instead of re-creating every federated row
+on each refresh, it:
+- Fingerprints each remote tool, resource or prompt (hash of description + schema)
+- Diffs the remote catalog against the local rows into adds, updates and removes
+- Applies only the changes, leaving unchanged rows untouched
+- Skips unchanged gateways entirely via a catalog ETag stored on the gateway
+
+The caller owns the transaction: all changes are made on the session-bound
+gateway object and persisted by a single commit.
+
+GatewayService is the only writer of a gateway's tool rows and ETag, always
+from the MCP ``tools/list`` catalog, so fingerprints are comparable from one
+sync to the next. Editing or deleting a federated tool locally clears the
+ETag (``invalidate_catalog``), so the next sync diffs and repairs the rows
+instead of skipping.
+"""
+
+# Standard
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# First-Party
+from mcpgateway.db import Gateway as DbGateway
+from mcpgateway.db import Tool as DbTool
+from mcpgateway.schemas import ToolCreate
+from mcpgateway.utils.create_slug import slugify
+
+# Third-Party
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Attributes that make up an item's fingerprint, per catalog kind. Remote
+# items (schemas or dicts) and local ORM rows expose the same attribute names.
+FINGERPRINT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "tools": ("description", "input_schema", "annotations", "request_type"),
+    "resources": ("description", "mime_type", "template"),
+    "prompts": ("description", "argument_schema"),
+}
+
+# Tool attributes refreshed in place when a tool's fingerprint changes
+TOOL_SYNC_FIELDS = ("description", "input_schema", "annotations", "request_type", "integration_type", "headers", "jsonpath_filter")
+
+
+@dataclass
+class CatalogDiff:
+    """Changes between a remote catalog and the local rows mirroring it."""
+
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    skipped: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """Whether applying the diff modifies any local row.
+
+        Returns:
+            bool: True if there is at least one add, update or remove
+        """
+        return bool(self.added or self.updated or self.removed)
+
+
+def _get(item: Any, name: str) -> Any:
+    """Read an attribute from a schema/ORM object or a key from a dict.
+
+    Args:
+        item: Schema instance, ORM row or plain dict
+        name: Attribute name
+
+    Returns:
+        The value, or None if missing
+    """
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def fingerprint(item: Any, kind: str = "tools") -> str:
+    """Compute a stable fingerprint of a catalog item.
+
+    Empty values are normalised to None so that a remote ``{}`` and a local
+    NULL compare equal.
+
+    Args:
+        item: Remote item (schema or dict) or local ORM row
+        kind: Catalog kind, one of ``FINGERPRINT_FIELDS``
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON of the fingerprinted fields
+
+    Examples:
+        >>> fingerprint({"description": "d", "input_schema": {"b": 1, "a": 2}}) == fingerprint({"input_schema": {"a": 2, "b": 1}, "description": "d"})
+        True
+        >>> fingerprint({"description": "", "annotations": {}}) == fingerprint({})
+        True
+    """
+    payload = [_get(item, name) or None for name in FINGERPRINT_FIELDS[kind]]
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def catalog_etag(fingerprints: Dict[str, str]) -> str:
+    """Compute an ETag over a whole catalog from its item fingerprints.
+
+    Args:
+        fingerprints: Mapping of item key to fingerprint
+
+    Returns:
+        str: Hex SHA-256 digest, independent of item order
+
+    Examples:
+        >>> catalog_etag({"a": "1", "b": "2"}) == catalog_etag({"b": "2", "a": "1"})
+        True
+        >>> catalog_etag({"a": "1"}) == catalog_etag({"a": "2"})
+        False
+    """
+    digest = hashlib.sha256()
+    for key in sorted(fingerprints):
+        digest.update(f"{key}\x00{fingerprints[key]}\n".encode())
+    return digest.hexdigest()
+
+
+def diff_catalog(remote: Dict[str, str], local: Dict[str, str]) -> CatalogDiff:
+    """Diff two fingerprint maps.
+
+    Args:
+        remote: Key to fingerprint for the remote catalog
+        local: Key to fingerprint for the local rows
+
+    Returns:
+        CatalogDiff: Keys to add, update and remove
+
+    Examples:
+        >>> d = diff_catalog({"a": "1", "b": "2", "c": "3"}, {"b": "2", "c": "x", "d": "4"})
+        >>> (d.added, d.updated, d.removed, d.unchanged)
+        (['a'], ['c'], ['d'], 1)
+    """
+    diff = CatalogDiff()
+    for key, print_ in remote.items():
+        if key not in local:
+            diff.added.append(key)
+        elif local[key] != print_:
+            diff.updated.append(key)
+        else:
+            diff.unchanged += 1
+    diff.removed = [key for key in local if key not in remote]
+    return diff
+
+
+def _build_tool(gateway: DbGateway, tool: ToolCreate) -> DbTool:
+    """Create the local row mirroring a remote tool.
+
+    Args:
+        gateway: Gateway providing the tool
+        tool: Remote tool definition
+
+    Returns:
+        DbTool: New, not yet persisted, tool row
+    """
+    return DbTool(
+        original_name=tool.name,
+        original_name_slug=slugify(tool.name),
+        url=gateway.url,
+        description=tool.description,
+        integration_type=tool.integration_type,
+        request_type=tool.request_type,
+        headers=tool.headers,
+        input_schema=tool.input_schema,
+        annotations=tool.annotations,
+        jsonpath_filter=tool.jsonpath_filter,
+        auth_type=gateway.auth_type,
+        auth_value=gateway.auth_value,
+    )
+
+
+def sync_gateway_tools(gateway: DbGateway, tools: Iterable[ToolCreate], force: bool = False) -> CatalogDiff:
+    """Bring a gateway's local tool rows in line with its remote catalog.
+
+    If the catalog ETag matches the one recorded at the last sync, nothing is
+    read or written. Otherwise only added, changed and removed tools are
+    touched. Changes are staged on ``gateway``; the caller commits.
+
+    Args:
+        gateway: Session-bound (or new) gateway row
+        tools: Tools currently advertised by the gateway
+        force: Diff even if the catalog ETag is unchanged
+
+    Returns:
+        CatalogDiff: What was changed
+    """
+    remote = {tool.name: tool for tool in tools}
+    remote_prints = {name: fingerprint(tool) for name, tool in remote.items()}
+    etag = catalog_etag(remote_prints)
+
+    if not force and gateway.catalog_etag == etag:
+        logger.debug(f"Catalog of gateway {gateway.name} unchanged, skipping sync")
+        return CatalogDiff(unchanged=len(remote), skipped=True)
+
+    local = {row.original_name: row for row in gateway.tools}
+    diff = diff_catalog(remote_prints, {name: fingerprint(row) for name, row in local.items()})
+
+    for name in diff.added:
+        gateway.tools.append(_build_tool(gateway, remote[name]))
+    for name in diff.updated:
+        row, tool = local[name], remote[name]
+        for attr in TOOL_SYNC_FIELDS:
+            setattr(row, attr, getattr(tool, attr))
+    for name in diff.removed:
+        gateway.tools.remove(local[name])
+
+    gateway.catalog_etag = etag
+    if diff.changed:
+        logger.info(f"Synced gateway {gateway.name}: {len(diff.added)} added, {len(diff.updated)} updated, {len(diff.removed)} removed")
+    return diff
+
+
+def invalidate_catalog(db: Session, gateway_id: Optional[str]) -> None:
+    """Forget a gateway's catalog ETag after its tool rows were changed locally.
+
+    The remote catalog may be unchanged, so without this the next sync would
+    skip and never restore the edited or deleted rows. Staged in the caller's
+    transaction.
+
+    Args:
+        db: Database session
+        gateway_id: Gateway whose tools were changed; None (a local tool) does nothing
+    """
+    if gateway_id:
+        db.execute(update(DbGateway).where(DbGateway.id == gateway_id).values(catalog_etag=None))
@@ -28,6 +28,7 @@ Structure:
 # Standard
 import asyncio
 from contextlib import asynccontextmanager
+import hashlib
 import json
 import logging
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
@@ -40,6 +41,7 @@ from mcpgateway.config import jsonpath_modifier, settings
 from mcpgateway.db import Base, engine, SessionLocal
 from mcpgateway.handlers.sampling import SamplingHandler
 from mcpgateway.schemas import (
+    BulkRegistrationResult,
     GatewayCreate,
     GatewayRead,
     GatewayUpdate,
@@ -98,8 +100,10 @@ from mcpgateway.types import (
     Root,
 )
 from mcpgateway.utils.db_isready import wait_for_db_ready
+from mcpgateway.utils.invocation_scheduler import InvocationTimeoutError, SchedulerOverloadError
+from mcpgateway.utils.rate_limiter import rate_limit_subject, rate_limiter, RateLimitExceeded
 from mcpgateway.utils.redis_isready import wait_for_redis_ready
-from mcpgateway.utils.verify_credentials import require_auth, require_auth_override
+from mcpgateway.utils.verify_credentials import require_auth, require_auth_override, token_revocations
 from mcpgateway.validation.jsonrpc import (
     JSONRPCError,
     validate_request,
@@ -121,8 +125,9 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.background import BackgroundTasks
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import httpx
@@ -157,7 +162,7 @@ sampling_handler = SamplingHandler()
 server_service = ServerService()
 
 # Initialize session manager for Streamable HTTP transport
-streamable_http_session = SessionManagerWrapper()
+streamable_http_session = SessionManagerWrapper(logging_service=logging_service)
 
 # Wait for redis to be ready
 if settings.cache_type == "redis":
@@ -209,6 +214,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         await sampling_handler.initialize()
         await resource_cache.initialize()
         await streamable_http_session.initialize()
+        await token_revocations.initialize()
 
         logger.info("All services initialized successfully")
         yield
@@ -218,7 +224,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     finally:
         logger.info("Shutting down MCP Gateway services")
         # await stop_streamablehttp()
-        for service in [resource_cache, sampling_handler, logging_service, completion_service, root_service, gateway_service, prompt_service, resource_service, tool_service, streamable_http_session]:
+        for service in [token_revocations, resource_cache, sampling_handler, logging_service, completion_service, root_service, gateway_service, prompt_service, resource_service, tool_service, streamable_http_session]:
             try:
                 await service.shutdown()
             except Exception as e:
@@ -395,6 +401,30 @@ def require_api_key(api_key: str) -> None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
 
 
+def conditional_json(request: Request, content: Any) -> Response:
+    """
+    Serialize a listing with an ETag, answering 304 if the client already has it.
+
+    Polling clients (such as ``mcpgateway.wrapper``) send ``If-None-Match`` and
+    skip downloading and parsing catalogs that have not changed. The header may
+    list several ETags, weak (``W/``) or strong, or be ``*``.
+
+    Args:
+        request (Request): The incoming request.
+        content (Any): JSON-serializable response content.
+
+    Returns:
+        Response: The JSON body with an ``ETag`` header, or an empty 304 response.
+    """
+    body = json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    # If-None-Match uses the weak comparison, so a W/ prefix is ignored
+    candidates = {tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
 async def invalidate_resource_cache(uri: Optional[str] = None) -> None:
     """
     Invalidates the resource cache.
@@ -464,8 +494,9 @@ async def ping(request: Request, user: str = Depends(require_auth)) -> JSONRespo
     Raises:
         HTTPException: If the request method is not "ping".
     """
+    body = None
     try:
-        body: dict = await request.json()
+        body = await request.json()
         if body.get("method") != "ping":
             raise HTTPException(status_code=400, detail="Invalid method")
         req_id: str = body.get("id")
@@ -476,7 +507,7 @@ async def ping(request: Request, user: str = Depends(require_auth)) -> JSONRespo
     except Exception as e:
         error_response: dict = {
             "jsonrpc": "2.0",
-            "id": body.get("id") if "body" in locals() else None,
+            "id": body.get("id") if isinstance(body, dict) else None,
             "error": {"code": -32603, "message": "Internal error", "data": str(e)},
         }
         return JSONResponse(status_code=500, content=error_response)
@@ -798,10 +829,11 @@ async def message_endpoint(request: Request, server_id: str, user: str = Depends
 @server_router.get("/{server_id}/tools", response_model=List[ToolRead])
 async def server_get_tools(
     server_id: str,
+    request: Request,
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     user: str = Depends(require_auth),
-) -> List[ToolRead]:
+) -> Response:
     """
     List tools for the server  with an option to include inactive tools.
 
@@ -811,25 +843,27 @@ async def server_get_tools(
 
     Args:
         server_id (str): ID of the server
+        request (Request): The incoming request, checked for If-None-Match.
         include_inactive (bool): Whether to include inactive tools in the results.
         db (Session): Database session dependency.
         user (str): Authenticated user dependency.
 
     Returns:
-        List[ToolRead]: A list of tool records formatted with by_alias=True.
+        Response: The tool records (ToolRead, by alias) as JSON with an ETag, or 304 if unchanged.
     """
     logger.debug(f"User: {user} has listed tools for the server_id: {server_id}")
     tools = await tool_service.list_server_tools(db, server_id=server_id, include_inactive=include_inactive)
-    return [tool.model_dump(by_alias=True) for tool in tools]
+    return conditional_json(request, [tool.model_dump(by_alias=True) for tool in tools])
 
 
 @server_router.get("/{server_id}/resources", response_model=List[ResourceRead])
 async def server_get_resources(
     server_id: str,
+    request: Request,
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     user: str = Depends(require_auth),
-) -> List[ResourceRead]:
+) -> Response:
     """
     List resources for the server with an option to include inactive resources.
 
@@ -839,25 +873,27 @@ async def server_get_resources(
 
     Args:
         server_id (str): ID of the server
+        request (Request): The incoming request, checked for If-None-Match.
         include_inactive (bool): Whether to include inactive resources in the results.
         db (Session): Database session dependency.
         user (str): Authenticated user dependency.
 
     Returns:
-        List[ResourceRead]: A list of resource records formatted with by_alias=True.
+        Response: The resource records (ResourceRead, by alias) as JSON with an ETag, or 304 if unchanged.
     """
     logger.debug(f"User: {user} has listed resources for the server_id: {server_id}")
     resources = await resource_service.list_server_resources(db, server_id=server_id, include_inactive=include_inactive)
-    return [resource.model_dump(by_alias=True) for resource in resources]
+    return conditional_json(request, [resource.model_dump(by_alias=True) for resource in resources])
 
 
 @server_router.get("/{server_id}/prompts", response_model=List[PromptRead])
 async def server_get_prompts(
     server_id: str,
+    request: Request,
     include_inactive: bool = False,
     db: Session = Depends(get_db),
     user: str = Depends(require_auth),
-) -> List[PromptRead]:
+) -> Response:
     """
     List prompts for the server with an option to include inactive prompts.
 
@@ -867,16 +903,17 @@ async def server_get_prompts(
 
     Args:
         server_id (str): ID of the server
+        request (Request): The incoming request, checked for If-None-Match.
         include_inactive (bool): Whether to include inactive prompts in the results.
         db (Session): Database session dependency.
         user (str): Authenticated user dependency.
 
     Returns:
-        List[PromptRead]: A list of prompt records formatted with by_alias=True.
+        Response: The prompt records (PromptRead, by alias) as JSON with an ETag, or 304 if unchanged.
     """
     logger.debug(f"User: {user} has listed prompts for the server_id: {server_id}")
     prompts = await prompt_service.list_server_prompts(db, server_id=server_id, include_inactive=include_inactive)
-    return [prompt.model_dump(by_alias=True) for prompt in prompts]
+    return conditional_json(request, [prompt.model_dump(by_alias=True) for prompt in prompts])
 
 
 #############
@@ -946,6 +983,29 @@ async def create_tool(tool: ToolCreate, db: Session = Depends(get_db), user: str
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@tool_router.post("/bulk", response_model=BulkRegistrationResult)
+async def create_tools_bulk(tools: List[ToolCreate], db: Session = Depends(get_db), user: str = Depends(require_auth)) -> BulkRegistrationResult:
+    """
+    Creates many tools in a single transaction.
+
+    Args:
+        tools (List[ToolCreate]): The tools to create.
+        db (Session): The database session dependency.
+        user (str): The authenticated user making the request.
+
+    Returns:
+        BulkRegistrationResult: Per-item status (created, conflict, invalid) and totals.
+
+    Raises:
+        HTTPException: If the batch insert fails.
+    """
+    try:
+        logger.debug(f"User {user} is bulk creating {len(tools)} tools")
+        return await tool_service.register_tools_bulk(db, tools)
+    except ToolError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @tool_router.get("/{tool_id}", response_model=Union[ToolRead, Dict])
 async def get_tool(
     tool_id: str,
@@ -1188,6 +1248,36 @@ async def create_resource(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@resource_router.post("/bulk", response_model=BulkRegistrationResult)
+async def create_resources_bulk(
+    resources: List[ResourceCreate],
+    db: Session = Depends(get_db),
+    user: str = Depends(require_auth),
+) -> BulkRegistrationResult:
+    """
+    Create many resources in a single transaction.
+
+    Args:
+        resources (List[ResourceCreate]): Data for the new resources.
+        db (Session): Database session.
+        user (str): Authenticated user.
+
+    Returns:
+        BulkRegistrationResult: Per-item status (created, conflict, invalid) and totals.
+
+    Raises:
+        HTTPException: If the batch insert fails.
+    """
+    logger.debug(f"User {user} is bulk creating {len(resources)} resources")
+    try:
+        result = await resource_service.register_resources_bulk(db, resources)
+    except ResourceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if result.created:
+        resource_cache.delete("resource_list")
+    return result
+
+
 @resource_router.get("/{uri:path}")
 async def read_resource(uri: str, db: Session = Depends(get_db), user: str = Depends(require_auth)) -> ResourceContent:
     """
@@ -1383,6 +1473,35 @@ async def create_prompt(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@prompt_router.post("/bulk", response_model=BulkRegistrationResult)
+async def create_prompts_bulk(
+    prompts: List[PromptCreate],
+    db: Session = Depends(get_db),
+    user: str = Depends(require_auth),
+) -> BulkRegistrationResult:
+    """
+    Create many prompts in a single transaction.
+
+    Declared before ``POST /prompts/{name}`` so that ``bulk`` is not taken as a prompt name.
+
+    Args:
+        prompts (List[PromptCreate]): Payloads describing the prompts to create.
+        db (Session): Active SQLAlchemy session.
+        user (str): Authenticated username.
+
+    Returns:
+        BulkRegistrationResult: Per-item status (created, conflict, invalid) and totals.
+
+    Raises:
+        HTTPException: If the batch insert fails.
+    """
+    logger.debug(f"User: {user} requested to bulk create {len(prompts)} prompts")
+    try:
+        return await prompt_service.register_prompts_bulk(db, prompts)
+    except PromptError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @prompt_router.post("/{name}")
 async def get_prompt(
     name: str,
@@ -1732,8 +1851,11 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user: str
     Returns:
         Response with the RPC result or error.
     """
+    body = None
     try:
         logger.debug(f"User {user} made an RPC request")
+        subject = rate_limit_subject(user)
+        await rate_limiter.hit("user", subject, settings.user_rate_limit)
         body = await request.json()
         validate_request(body)
         method = body["method"]
@@ -1781,7 +1903,7 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user: str
             result = {}
         else:
             try:
-                result = await tool_service.invoke_tool(db=db, name=method, arguments=params)
+                result = await tool_service.invoke_tool(db=db, name=method, arguments=params, client_id=subject)
                 if hasattr(result, "model_dump"):
                     result = result.model_dump(by_alias=True, exclude_none=True)
             except ValueError:
@@ -1794,12 +1916,44 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user: str
 
     except JSONRPCError as e:
         return e.to_dict()
+    except RateLimitExceeded as e:
+        logger.info(f"RPC rate limited: {str(e)}")
+        return JSONResponse(
+            status_code=429,
+            content={
+                "jsonrpc": "2.0",
+                "error": {"code": -32000, "message": "Rate limit exceeded", "data": str(e)},
+                "id": body.get("id") if isinstance(body, dict) else None,
+            },
+            headers=e.headers,
+        )
+    except SchedulerOverloadError as e:
+        logger.info(f"RPC rejected: {str(e)}")
+        return JSONResponse(
+            status_code=503,
+            content={
+                "jsonrpc": "2.0",
+                "error": {"code": -32000, "message": "Server overloaded", "data": str(e)},
+                "id": body.get("id") if isinstance(body, dict) else None,
+            },
+            headers=e.headers,
+        )
+    except InvocationTimeoutError as e:
+        logger.warning(f"RPC timed out: {str(e)}")
+        return JSONResponse(
+            status_code=504,
+            content={
+                "jsonrpc": "2.0",
+                "error": {"code": -32000, "message": "Tool invocation timed out", "data": str(e)},
+                "id": body.get("id") if isinstance(body, dict) else None,
+            },
+        )
     except Exception as e:
         logger.error(f"RPC error: {str(e)}")
         return {
             "jsonrpc": "2.0",
             "error": {"code": -32000, "message": "Internal error", "data": str(e)},
-            "id": body.get("id") if "body" in locals() else None,
+            "id": body.get("id") if isinstance(body, dict) else None,
         }
 
 
@@ -1978,6 +2132,68 @@ async def get_metrics(db: Session = Depends(get_db), user: str = Depends(require
     }
 
 
+@metrics_router.get("/pools", response_model=dict)
+async def get_pool_metrics(user: str = Depends(require_auth)) -> dict:
+    """
+    Report the occupancy of the per-host connection pools used by REST tools.
+
+    Args:
+        user: Authenticated user
+
+    Returns:
+        A dictionary keyed by upstream origin with requests in flight, the connection limit and the protocol.
+    """
+    logger.debug(f"User {user} requested connection pool metrics")
+    return {"rest": tool_service.get_pool_occupancy()}
+
+
+@metrics_router.get("/cache", response_model=dict)
+async def get_cache_metrics(user: str = Depends(require_auth)) -> dict:
+    """
+    Report the effectiveness of the tool result cache and of request coalescing.
+
+    Args:
+        user: Authenticated user
+
+    Returns:
+        A dictionary with the tool result cache's entry count and hit, stale-hit and miss
+        counters, and how many tool calls were coalesced into shared upstream calls.
+    """
+    logger.debug(f"User {user} requested cache metrics")
+    return {"tool_results": tool_service.get_result_cache_stats(), "coalescing": tool_service.get_coalescing_stats()}
+
+
+@metrics_router.get("/scheduler", response_model=dict)
+async def get_scheduler_metrics(user: str = Depends(require_auth)) -> dict:
+    """
+    Report active and queued tool invocations per tool and per gateway.
+
+    Args:
+        user: Authenticated user
+
+    Returns:
+        A dictionary with per-tool and per-gateway counters and totals for rejected and timed-out calls.
+    """
+    logger.debug(f"User {user} requested invocation scheduler metrics")
+    return tool_service.get_scheduler_metrics()
+
+
+@metrics_router.get("/sse", response_model=dict)
+async def get_sse_metrics(user: str = Depends(require_auth)) -> dict:
+    """
+    Report the outbound queues of the SSE sessions connected to this worker.
+
+    Args:
+        user: Authenticated user
+
+    Returns:
+        A dictionary with per-session queued messages and bytes and their high-water marks, plus
+        worker-wide totals of dropped notifications and slow clients disconnected.
+    """
+    logger.debug(f"User {user} requested SSE queue metrics")
+    return SSETransport.metrics()
+
+
 @metrics_router.post("/reset", response_model=dict)
 async def reset_metrics(entity: Optional[str] = None, entity_id: Optional[int] = None, db: Session = Depends(get_db), user: str = Depends(require_auth)) -> dict:
     """
@@ -272,6 +272,9 @@ class ToolCreate(BaseModelWithConfigDict):
         description="Tool annotations for behavior hints (title, readOnlyHint, destructiveHint, idempotentHint, openWorldHint)",
     )
     jsonpath_filter: Optional[str] = Field(default="", description="JSON modification filter")
+    request_timeout: Optional[float] = Field(None, gt=0, description="Request timeout in seconds for REST tools, overriding the pool default")
+    cache_ttl: Optional[float] = Field(None, ge=0, description="Seconds results are cached for; unset or 0 disables result caching")
+    stale_while_revalidate: Optional[float] = Field(None, ge=0, description="Seconds an expired cached result may be served while it is refreshed")
     auth: Optional[AuthenticationValues] = Field(None, description="Authentication credentials (Basic or Bearer Token or custom headers) if required")
     gateway_id: Optional[str] = Field(None, description="id of gateway for the tool")
 
@@ -331,6 +334,9 @@ class ToolUpdate(BaseModelWithConfigDict):
     input_schema: Optional[Dict[str, Any]] = Field(None, description="JSON Schema for validating tool parameters")
     annotations: Optional[Dict[str, Any]] = Field(None, description="Tool annotations for behavior hints")
     jsonpath_filter: Optional[str] = Field(None, description="JSON path filter for rpc tool calls")
+    request_timeout: Optional[float] = Field(None, gt=0, description="Request timeout in seconds for REST tools, overriding the pool default")
+    cache_ttl: Optional[float] = Field(None, ge=0, description="Seconds results are cached for; 0 disables result caching")
+    stale_while_revalidate: Optional[float] = Field(None, ge=0, description="Seconds an expired cached result may be served while it is refreshed")
     auth: Optional[AuthenticationValues] = Field(None, description="Authentication credentials (Basic or Bearer Token or custom headers) if required")
     gateway_id: Optional[str] = Field(None, description="id of gateway for the tool")
 
@@ -399,6 +405,9 @@ class ToolRead(BaseModelWithConfigDict):
     input_schema: Dict[str, Any]
     annotations: Optional[Dict[str, Any]]
     jsonpath_filter: Optional[str]
+    request_timeout: Optional[float] = None
+    cache_ttl: Optional[float] = None
+    stale_while_revalidate: Optional[float] = None
     auth: Optional[AuthenticationValues]
     created_at: datetime
     updated_at: datetime
@@ -614,6 +623,39 @@ class PromptInvocation(BaseModelWithConfigDict):
     arguments: Dict[str, str] = Field(default_factory=dict, description="Arguments for template rendering")
 
 
+# --- Bulk Registration Schemas ---
+
+
+class BulkItemResult(BaseModelWithConfigDict):
+    """Outcome of a single item in a bulk registration request.
+
+    Contains:
+    - Position of the item in the request body
+    - Item key (tool/prompt name or resource URI)
+    - Status: created, conflict, invalid or error
+    - Database ID when created, or of the conflicting row
+    - Error message for anything that was not created
+    """
+
+    index: int = Field(..., description="Position of the item in the request")
+    key: str = Field(..., description="Tool/prompt name or resource URI")
+    status: Literal["created", "conflict", "invalid", "error"]
+    id: Optional[Union[str, int]] = Field(None, description="ID of the created or conflicting row")
+    error: Optional[str] = Field(None, description="Reason the item was not created")
+
+
+class BulkRegistrationResult(BaseModelWithConfigDict):
+    """Aggregated result of a bulk registration request.
+
+    Items that fail validation or conflict with existing rows are reported
+    individually; all remaining items are created in a single transaction.
+    """
+
+    created: int = 0
+    failed: int = 0
+    items: List[BulkItemResult] = Field(default_factory=list)
+
+
 # --- Gateway Schemas ---
 
 
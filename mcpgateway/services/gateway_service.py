@@ -18,6 +18,8 @@ It handles:
 import asyncio
 from datetime import datetime, timezone
 import logging
+import random
+import time
 from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 import uuid
 
@@ -26,9 +28,12 @@ from mcpgateway.config import settings
 from mcpgateway.db import Gateway as DbGateway
 from mcpgateway.db import SessionLocal
 from mcpgateway.db import Tool as DbTool
+from mcpgateway.federation.sync import sync_gateway_tools
 from mcpgateway.schemas import GatewayCreate, GatewayRead, GatewayUpdate, ToolCreate
 from mcpgateway.services.tool_service import ToolService
+from mcpgateway.utils.circuit_breaker import circuit_breakers, CircuitState
 from mcpgateway.utils.create_slug import slugify
+from mcpgateway.utils.rate_limiter import rate_limiter
 from mcpgateway.utils.services_auth import decode_auth
 
 # Third-Party
@@ -55,6 +60,8 @@ logger = logging.getLogger(__name__)
 
 GW_FAILURE_THRESHOLD = settings.unhealthy_threshold
 GW_HEALTH_CHECK_INTERVAL = settings.health_check_interval
+GW_HEALTH_BACKOFF_MAX = 4.0  # steadily healthy gateways are probed at most every 4 intervals
+GW_HEALTH_TIGHTEN = 0.25  # failing or flapping gateways are probed every quarter interval
 
 
 class GatewayError(Exception):
@@ -105,7 +112,19 @@ class GatewayService:
         self._event_subscribers: List[asyncio.Queue] = []
         self._http_client = httpx.AsyncClient(timeout=settings.federation_timeout, verify=not settings.skip_ssl_verify)
         self._health_check_interval = GW_HEALTH_CHECK_INTERVAL
+        # The loop wakes up more often than the interval and only probes gateways that are due
+        self._health_check_tick = max(1.0, GW_HEALTH_CHECK_INTERVAL / 10)
         self._health_check_task: Optional[asyncio.Task] = None
+        self._health_check_due: Dict[str, float] = {}  # gateway id -> monotonic time of next probe
+        self._gateway_health_latency: Dict[str, float] = {}  # gateway id -> last probe latency (seconds)
+        self._health_check_factor: Dict[str, float] = {}  # gateway id -> multiplier applied to the interval
+        # Active gateways as last loaded for the health scheduler, and the monotonic time they were loaded
+        self._active_gateway_cache: Optional[List[DbGateway]] = None
+        self._active_gateways_loaded = 0.0
+        # Probes run as background tasks so a slow gateway never holds up the tick; at most one per gateway
+        self._health_probes: Set[asyncio.Task] = set()
+        self._health_probing: Set[str] = set()  # ids of gateways with a probe in flight
+        self._health_probe_slots = asyncio.Semaphore(settings.health_check_concurrency)
         self._active_gateways: Set[str] = set()  # Track active gateway URLs
         self._stream_response = None
         self._pending_responses = {}
@@ -158,6 +177,9 @@ class GatewayService:
                 await self._health_check_task
             except asyncio.CancelledError:
                 pass
+        for probe in list(self._health_probes):
+            probe.cancel()
+        await asyncio.gather(*self._health_probes, return_exceptions=True)
 
         await self._http_client.aclose()
         self._event_subscribers.clear()
@@ -194,24 +216,6 @@ class GatewayService:
 
             capabilities, tools = await self._initialize_gateway(gateway.url, auth_value, gateway.transport)
 
-            tools = [
-                DbTool(
-                    original_name=tool.name,
-                    original_name_slug=slugify(tool.name),
-                    url=gateway.url,
-                    description=tool.description,
-                    integration_type=tool.integration_type,
-                    request_type=tool.request_type,
-                    headers=tool.headers,
-                    input_schema=tool.input_schema,
-                    annotations=tool.annotations,
-                    jsonpath_filter=tool.jsonpath_filter,
-                    auth_type=auth_type,
-                    auth_value=auth_value,
-                )
-                for tool in tools
-            ]
-
             # Create DB model
             db_gateway = DbGateway(
                 name=gateway.name,
@@ -223,12 +227,13 @@ class GatewayService:
                 last_seen=datetime.now(timezone.utc),
                 auth_type=auth_type,
                 auth_value=auth_value,
-                tools=tools,
             )
+            sync_gateway_tools(db_gateway, tools)
 
             # Add to DB
             db.add(db_gateway)
             db.commit()
+            self._invalidate_active_gateways()
             db.refresh(db_gateway)
 
             # Update tracking
@@ -327,29 +332,9 @@ class GatewayService:
             if gateway_update.url is not None:
                 try:
                     capabilities, tools = await self._initialize_gateway(gateway.url, gateway.auth_value, gateway.transport)
-                    new_tool_names = [tool.name for tool in tools]
-
-                    for tool in tools:
-                        existing_tool = db.execute(select(DbTool).where(DbTool.original_name == tool.name).where(DbTool.gateway_id == gateway_id)).scalar_one_or_none()
-                        if not existing_tool:
-                            gateway.tools.append(
-                                DbTool(
-                                    original_name=tool.name,
-                                    original_name_slug=slugify(tool.name),
-                                    url=gateway.url,
-                                    description=tool.description,
-                                    integration_type=tool.integration_type,
-                                    request_type=tool.request_type,
-                                    headers=tool.headers,
-                                    input_schema=tool.input_schema,
-                                    jsonpath_filter=tool.jsonpath_filter,
-                                    auth_type=gateway.auth_type,
-                                    auth_value=gateway.auth_value,
-                                )
-                            )
-
-                    gateway.capabilities = capabilities
-                    gateway.tools = [tool for tool in gateway.tools if tool.original_name in new_tool_names]  # keep only still-valid rows
+                    sync_gateway_tools(gateway, tools)
+                    if gateway.capabilities != capabilities:
+                        gateway.capabilities = capabilities
                     gateway.last_seen = datetime.now(timezone.utc)
 
                     # Update tracking with new URL
@@ -360,6 +345,7 @@ class GatewayService:
 
             gateway.updated_at = datetime.now(timezone.utc)
             db.commit()
+            self._invalidate_active_gateways()
             db.refresh(gateway)
 
             # Notify subscribers
@@ -426,30 +412,9 @@ class GatewayService:
                     # Try to initialize if activating
                     try:
                         capabilities, tools = await self._initialize_gateway(gateway.url, gateway.auth_value, gateway.transport)
-                        new_tool_names = [tool.name for tool in tools]
-
-                        for tool in tools:
-                            existing_tool = db.execute(select(DbTool).where(DbTool.original_name == tool.name).where(DbTool.gateway_id == gateway_id)).scalar_one_or_none()
-                            if not existing_tool:
-                                gateway.tools.append(
-                                    DbTool(
-                                        original_name=tool.name,
-                                        original_name_slug=slugify(tool.name),
-                                        url=gateway.url,
-                                        description=tool.description,
-                                        integration_type=tool.integration_type,
-                                        request_type=tool.request_type,
-                                        headers=tool.headers,
-                                        input_schema=tool.input_schema,
-                                        jsonpath_filter=tool.jsonpath_filter,
-                                        auth_type=gateway.auth_type,
-                                        auth_value=gateway.auth_value,
-                                    )
-                                )
-
-                        gateway.capabilities = capabilities
-                        gateway.tools = [tool for tool in gateway.tools if tool.original_name in new_tool_names]  # keep only still-valid rows
-
+                        sync_gateway_tools(gateway, tools)
+                        if gateway.capabilities != capabilities:
+                            gateway.capabilities = capabilities
                         gateway.last_seen = datetime.now(timezone.utc)
                     except Exception as e:
                         logger.warning(f"Failed to initialize reactivated gateway: {e}")
@@ -457,6 +422,7 @@ class GatewayService:
                     self._active_gateways.discard(gateway.url)
 
                 db.commit()
+                self._invalidate_active_gateways()
                 db.refresh(gateway)
 
                 tools = db.query(DbTool).filter(DbTool.gateway_id == gateway_id).all()
@@ -520,6 +486,7 @@ class GatewayService:
             # Hard delete gateway
             db.delete(gateway)
             db.commit()
+            self._invalidate_active_gateways()
 
             # Update tracking
             self._active_gateways.discard(gateway.url)
@@ -552,14 +519,18 @@ class GatewayService:
             raise GatewayConnectionError(f"Cannot forward request to inactive gateway: {gateway.name}")
 
         try:
+            # Shares the gateway's token bucket with the forwarding service
+            await rate_limiter.hit("gateway", gateway.url, settings.gateway_rate_limit)
+
             # Build RPC request
             request = {"jsonrpc": "2.0", "id": 1, "method": method}
             if params:
                 request["params"] = params
 
             # Directly use the persistent HTTP client (no async with)
-            response = await self._http_client.post(f"{gateway.url}/rpc", json=request, headers=self._get_auth_headers())
-            response.raise_for_status()
+            with circuit_breakers.for_gateway(gateway.id).guard():
+                response = await self._http_client.post(f"{gateway.url}/rpc", json=request, headers=self._get_auth_headers())
+                response.raise_for_status()
             result = response.json()
 
             # Update last seen timestamp
@@ -599,7 +570,9 @@ class GatewayService:
     async def check_health_of_gateways(self, gateways: List[DbGateway]) -> bool:
         """Health check for a list of gateways.
 
-        Deactivates gateway if gateway is not healthy.
+        Gateways are probed concurrently, at most ``health_check_concurrency``
+        at a time, over the service's pooled HTTP client. Deactivates gateway
+        if gateway is not healthy.
 
         Args:
             gateways (List[DbGateway]): List of gateways to check if healthy
@@ -607,39 +580,162 @@ class GatewayService:
         Returns:
             bool: True if all  active gateways are healthy
         """
-        # Reuse a single HTTP client for all requests
-        async with httpx.AsyncClient() as client:
-            for gateway in gateways:
-                # Inactive gateways are unhealthy
-                if not gateway.is_active:
-                    continue
 
-                try:
-                    # Ensure auth_value is a dict
-                    auth_data = gateway.auth_value or {}
-                    headers = decode_auth(auth_data)
-
-                    # Perform the GET and raise on 4xx/5xx
-                    if (gateway.transport).lower() == "sse":
-                        timeout = httpx.Timeout(settings.health_check_timeout)
-                        async with client.stream("GET", gateway.url, headers=headers, timeout=timeout) as response:
-                            # This will raise immediately if status is 4xx/5xx
-                            response.raise_for_status()
-                    elif (gateway.transport).lower() == "streamablehttp":
-                        async with streamablehttp_client(url=gateway.url, headers=headers, timeout=settings.health_check_timeout) as (read_stream, write_stream, _get_session_id):
-                            async with ClientSession(read_stream, write_stream) as session:
-                                # Initialize the session
-                                response = await session.initialize()
-
-                    # Mark successful check
-                    gateway.last_seen = datetime.now(timezone.utc)
+        async def _bounded(gateway: DbGateway) -> None:
+            async with self._health_probe_slots:
+                await self._check_gateway_health(gateway)
 
-                except Exception:
-                    await self._handle_gateway_failure(gateway)
+        # Inactive gateways are unhealthy
+        await asyncio.gather(*(_bounded(gateway) for gateway in gateways if gateway.is_active))
 
         # All gateways passed
         return True
 
+    async def _check_gateway_health(self, gateway: DbGateway) -> None:
+        """Probe one gateway, record its latency, feed its circuit breaker and schedule the next probe.
+
+        Args:
+            gateway: Gateway to probe
+        """
+        breaker = circuit_breakers.for_gateway(gateway.id)
+        healthy = False
+        start = time.monotonic()
+        try:
+            # Ensure auth_value is a dict
+            auth_data = gateway.auth_value or {}
+            headers = decode_auth(auth_data)
+
+            # Perform the GET and raise on 4xx/5xx
+            if (gateway.transport).lower() == "sse":
+                timeout = httpx.Timeout(settings.health_check_timeout)
+                async with self._http_client.stream("GET", gateway.url, headers=headers, timeout=timeout) as response:
+                    # This will raise immediately if status is 4xx/5xx
+                    response.raise_for_status()
+            elif (gateway.transport).lower() == "streamablehttp":
+                async with streamablehttp_client(url=gateway.url, headers=headers, timeout=settings.health_check_timeout) as (read_stream, write_stream, _get_session_id):
+                    async with ClientSession(read_stream, write_stream) as session:
+                        # Initialize the session
+                        await session.initialize()
+
+            # Mark successful check
+            gateway.last_seen = datetime.now(timezone.utc)
+            healthy = True
+            breaker.record_success()
+
+        except Exception:
+            breaker.record_failure()
+            await self._handle_gateway_failure(gateway)
+
+        finally:
+            latency = time.monotonic() - start
+            self._gateway_health_latency[gateway.id] = latency
+            self._schedule_next_health_check(gateway.id, healthy)
+            logger.debug(f"Health check of gateway {gateway.name} took {latency * 1000:.1f} ms")
+
+    def _schedule_next_health_check(self, gateway_id: str, healthy: bool) -> None:
+        """Adapt a gateway's probe interval to its recent health.
+
+        Each healthy probe of a gateway whose circuit is closed doubles its
+        interval, up to ``GW_HEALTH_BACKOFF_MAX`` times the configured one. A
+        failed probe, or a circuit that is open or half-open (a flapping
+        target), tightens it to ``GW_HEALTH_TIGHTEN`` of the configured one.
+
+        Args:
+            gateway_id: Gateway ID
+            healthy: Outcome of the probe that just finished
+        """
+        if healthy and circuit_breakers.for_gateway(gateway_id).state == CircuitState.CLOSED:
+            factor = min(self._health_check_factor.get(gateway_id, 1.0) * 2, GW_HEALTH_BACKOFF_MAX)
+        else:
+            factor = GW_HEALTH_TIGHTEN
+        self._health_check_factor[gateway_id] = factor
+
+        jitter = settings.health_check_jitter
+        delay = self._health_check_interval * factor * random.uniform(1 - jitter, 1 + jitter)
+        self._health_check_due[gateway_id] = time.monotonic() + max(self._health_check_tick, delay)
+
+    def get_gateway_health_latencies(self) -> Dict[str, float]:
+        """Return the latency of the most recent health probe of each gateway.
+
+        Returns:
+            Dict[str, float]: Gateway id to latency in seconds
+        """
+        return dict(self._gateway_health_latency)
+
+    def _due_gateways(self, gateways: List[DbGateway]) -> List[DbGateway]:
+        """Select the gateways whose health probe is due and reschedule them.
+
+        Each gateway runs on its own schedule of ``health_check_interval`` plus
+        or minus ``health_check_jitter``, so probes are spread over time rather
+        than fired as one sweep. Newly seen gateways get a random first slot
+        within one interval.
+
+        Args:
+            gateways: Currently active gateways
+
+        Returns:
+            List[DbGateway]: Gateways to probe now
+        """
+        now = time.monotonic()
+        jitter = settings.health_check_jitter
+        active_ids = {gateway.id for gateway in gateways}
+        for gateway_id in list(self._health_check_due):
+            if gateway_id not in active_ids:
+                del self._health_check_due[gateway_id]
+                self._health_check_factor.pop(gateway_id, None)
+
+        due = []
+        for gateway in gateways:
+            next_check = self._health_check_due.setdefault(gateway.id, now + random.uniform(0, self._health_check_interval))
+            if next_check <= now:
+                due.append(gateway)
+                # Placeholder slot; replaced by an adaptive one once the probe finishes
+                self._health_check_due[gateway.id] = now + self._health_check_interval * random.uniform(1 - jitter, 1 + jitter)
+        return due
+
+    def _invalidate_active_gateways(self) -> None:
+        """Make the health scheduler reload the active gateways on its next tick."""
+        self._active_gateway_cache = None
+
+    async def _check_due_gateways(self) -> None:
+        """Start probes of the active gateways whose scheduled health check is due.
+
+        Probes run as background tasks, at most ``health_check_concurrency`` at
+        a time, and the call returns without waiting for them, so a slow
+        gateway does not delay the next tick. A gateway whose previous probe is
+        still running is skipped.
+
+        The active set is cached between ticks. It is reloaded after a
+        gateway is registered, updated, toggled or deleted in this process,
+        and at least once per ``health_check_interval`` to pick up changes
+        made by other workers.
+        """
+        now = time.monotonic()
+        if self._active_gateway_cache is None or now - self._active_gateways_loaded >= self._health_check_interval:
+            self._active_gateway_cache = await asyncio.to_thread(self._get_active_gateways)
+            self._active_gateways_loaded = now
+        for gateway in self._due_gateways(self._active_gateway_cache):
+            if gateway.id in self._health_probing:
+                continue
+            self._health_probing.add(gateway.id)
+            task = asyncio.create_task(self._probe_in_background(gateway))
+            self._health_probes.add(task)
+            task.add_done_callback(self._health_probes.discard)
+
+    async def _probe_in_background(self, gateway: DbGateway) -> None:
+        """Probe one gateway once a concurrency slot is free, then release its in-flight guard.
+
+        Args:
+            gateway: Gateway to probe
+        """
+        try:
+            async with self._health_probe_slots:
+                await self._check_gateway_health(gateway)
+        except Exception as e:
+            logger.error(f"Health check of gateway {gateway.name} failed: {e}")
+        finally:
+            self._health_probing.discard(gateway.id)
+
     async def aggregate_capabilities(self, db: Session) -> Dict[str, Any]:
         """Aggregate capabilities from all gateways.
 
@@ -803,23 +899,18 @@ class GatewayService:
                     self._redis_client.expire(self._leader_key, self._leader_ttl)
 
                     # Run health checks
-                    gateways = await asyncio.to_thread(self._get_active_gateways)
-                    if gateways:
-                        await self.check_health_of_gateways(gateways)
+                    await self._check_due_gateways()
 
-                    await asyncio.sleep(self._health_check_interval)
+                    await asyncio.sleep(self._health_check_tick)
 
                 elif settings.cache_type == "none":
                     try:
                         # For single worker mode, run health checks directly
-                        gateways = await asyncio.to_thread(self._get_active_gateways)
-
-                        if gateways:
-                            await self.check_health_of_gateways(gateways)
+                        await self._check_due_gateways()
                     except Exception as e:
                         logger.error(f"Health check run failed: {str(e)}")
 
-                    await asyncio.sleep(self._health_check_interval)
+                    await asyncio.sleep(self._health_check_tick)
 
                 else:
                     # FileLock-based leader fallback
@@ -828,10 +919,8 @@ class GatewayService:
                         logger.info("File lock acquired. Running health checks.")
 
                         while True:
-                            gateways = await asyncio.to_thread(self._get_active_gateways)
-                            if gateways:
-                                await self.check_health_of_gateways(gateways)
-                            await asyncio.sleep(self._health_check_interval)
+                            await self._check_due_gateways()
+                            await asyncio.sleep(self._health_check_tick)
 
                     except Timeout:
                         logger.debug("File lock already held. Retrying later.")
@@ -19,17 +19,17 @@ import asyncio
 from datetime import datetime, timezone
 import logging
 from string import Formatter
-from typing import Any, AsyncGenerator, Dict, List, Optional, Set
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
 # First-Party
 from mcpgateway.db import Prompt as DbPrompt
 from mcpgateway.db import PromptMetric, server_prompt_association
-from mcpgateway.schemas import PromptCreate, PromptRead, PromptUpdate
+from mcpgateway.schemas import BulkItemResult, BulkRegistrationResult, PromptCreate, PromptRead, PromptUpdate
 from mcpgateway.types import Message, PromptResult, Role, TextContent
 
 # Third-Party
 from jinja2 import Environment, meta, select_autoescape
-from sqlalchemy import delete, func, not_, select
+from sqlalchemy import delete, func, insert, not_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -181,27 +181,12 @@ class PromptService:
             # Validate template syntax
             self._validate_template(prompt.template)
 
-            # Extract required arguments from template
-            required_args = self._get_required_arguments(prompt.template)
-
-            # Create argument schema
-            argument_schema = {
-                "type": "object",
-                "properties": {},
-                "required": list(required_args),
-            }
-            for arg in prompt.arguments:
-                schema = {"type": "string"}
-                if arg.description is not None:
-                    schema["description"] = arg.description
-                argument_schema["properties"][arg.name] = schema
-
             # Create DB model
             db_prompt = DbPrompt(
                 name=prompt.name,
                 description=prompt.description,
                 template=prompt.template,
-                argument_schema=argument_schema,
+                argument_schema=self._build_argument_schema(prompt),
             )
 
             # Add to DB
@@ -223,6 +208,93 @@ class PromptService:
             db.rollback()
             raise PromptError(f"Failed to register prompt: {str(e)}")
 
+    def _build_argument_schema(self, prompt: PromptCreate) -> Dict[str, Any]:
+        """Build the JSON argument schema for a prompt template.
+
+        Args:
+            prompt: Prompt creation schema
+
+        Returns:
+            JSON schema with the template's required arguments and declared argument descriptions
+        """
+        # Extract required arguments from template
+        required_args = self._get_required_arguments(prompt.template)
+
+        argument_schema = {
+            "type": "object",
+            "properties": {},
+            "required": list(required_args),
+        }
+        for arg in prompt.arguments:
+            schema = {"type": "string"}
+            if arg.description is not None:
+                schema["description"] = arg.description
+            argument_schema["properties"][arg.name] = schema
+        return argument_schema
+
+    async def register_prompts_bulk(self, db: Session, prompts: List[PromptCreate]) -> BulkRegistrationResult:
+        """Register many prompt templates in a single transaction.
+
+        All templates are validated in one pass, name conflicts are detected with
+        one ``IN`` query and the remaining rows are inserted with a single
+        executemany. One aggregated ``prompts_added`` event is published.
+
+        Args:
+            db: Database session
+            prompts: Prompt creation schemas
+
+        Returns:
+            Per-item outcome plus created/failed totals
+
+        Raises:
+            PromptError: If the batch insert fails; nothing is persisted in that case
+        """
+        items: List[Optional[BulkItemResult]] = [None] * len(prompts)
+        pending: List[Tuple[int, PromptCreate, Dict[str, Any]]] = []
+        seen: Set[str] = set()
+
+        for index, prompt in enumerate(prompts):
+            try:
+                self._validate_template(prompt.template)
+                argument_schema = self._build_argument_schema(prompt)
+            except Exception as e:
+                items[index] = BulkItemResult(index=index, key=prompt.name, status="invalid", error=str(e))
+                continue
+            if prompt.name in seen:
+                items[index] = BulkItemResult(index=index, key=prompt.name, status="conflict", error="Duplicate prompt name in request")
+                continue
+            seen.add(prompt.name)
+            pending.append((index, prompt, argument_schema))
+
+        if pending:
+            rows = db.execute(select(DbPrompt.id, DbPrompt.name, DbPrompt.is_active).where(DbPrompt.name.in_(seen))).all()
+            existing = {row.name: row for row in rows}
+            to_insert = []
+            for index, prompt, argument_schema in pending:
+                row = existing.get(prompt.name)
+                if row:
+                    items[index] = BulkItemResult(index=index, key=prompt.name, status="conflict", id=row.id, error=str(PromptNameConflictError(prompt.name, is_active=row.is_active, prompt_id=row.id)))
+                else:
+                    to_insert.append((index, prompt, argument_schema))
+            pending = to_insert
+
+        created = []
+        if pending:
+            values = [{"name": prompt.name, "description": prompt.description, "template": prompt.template, "argument_schema": argument_schema} for _, prompt, argument_schema in pending]
+            try:
+                ids = db.scalars(insert(DbPrompt).returning(DbPrompt.id, sort_by_parameter_order=True), values).all()
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                raise PromptError(f"Failed to register prompts: {str(e)}")
+            for (index, prompt, _), prompt_id in zip(pending, ids):
+                items[index] = BulkItemResult(index=index, key=prompt.name, status="created", id=prompt_id)
+                created.append({"id": prompt_id, "name": prompt.name, "description": prompt.description, "is_active": True})
+            await self._notify_prompts_added(created)
+            logger.info(f"Bulk registered {len(created)} prompts")
+
+        return BulkRegistrationResult(created=len(created), failed=len(prompts) - len(created), items=items)
+
     async def list_prompts(self, db: Session, include_inactive: bool = False, cursor: Optional[str] = None) -> List[PromptRead]:
         """
         Retrieve a list of prompt templates from the database.
@@ -606,6 +678,20 @@ class PromptService:
         }
         await self._publish_event(event)
 
+    async def _notify_prompts_added(self, prompts: List[Dict[str, Any]]) -> None:
+        """
+        Notify subscribers of a bulk prompt addition with a single event.
+
+        Args:
+            prompts: Summaries of the prompts added
+        """
+        event = {
+            "type": "prompts_added",
+            "data": {"count": len(prompts), "prompts": prompts},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        await self._publish_event(event)
+
     async def _notify_prompt_updated(self, prompt: DbPrompt) -> None:
         """
         Notify subscribers of prompt update.
@@ -20,7 +20,7 @@ from datetime import datetime, timezone
 import logging
 import mimetypes
 import re
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
 # First-Party
@@ -29,6 +29,8 @@ from mcpgateway.db import ResourceMetric
 from mcpgateway.db import ResourceSubscription as DbSubscription
 from mcpgateway.db import server_resource_association
 from mcpgateway.schemas import (
+    BulkItemResult,
+    BulkRegistrationResult,
     ResourceCreate,
     ResourceMetrics,
     ResourceRead,
@@ -39,7 +41,7 @@ from mcpgateway.types import ResourceContent, ResourceTemplate, TextContent
 
 # Third-Party
 import parse
-from sqlalchemy import delete, func, not_, select
+from sqlalchemy import delete, func, insert, not_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -174,25 +176,8 @@ class ResourceService:
             if not self._is_valid_uri(resource.uri):
                 raise ResourceValidationError(f"Invalid URI: {resource.uri}")
 
-            # Detect mime type if not provided
-            mime_type = resource.mime_type
-            if not mime_type:
-                mime_type = self._detect_mime_type(resource.uri, resource.content)
-
-            # Determine content storage
-            is_text = mime_type and mime_type.startswith("text/") or isinstance(resource.content, str)
-
             # Create DB model
-            db_resource = DbResource(
-                uri=resource.uri,
-                name=resource.name,
-                description=resource.description,
-                mime_type=mime_type,
-                template=resource.template,
-                text_content=resource.content if is_text else None,
-                binary_content=(resource.content.encode() if is_text and isinstance(resource.content, str) else resource.content if isinstance(resource.content, bytes) else None),
-                size=len(resource.content) if resource.content else 0,
-            )
+            db_resource = DbResource(**self._build_resource_values(resource))
 
             # Add to DB
             db.add(db_resource)
@@ -212,6 +197,93 @@ class ResourceService:
             db.rollback()
             raise ResourceError(f"Failed to register resource: {str(e)}")
 
+    def _build_resource_values(self, resource: ResourceCreate) -> Dict[str, Any]:
+        """Build the column values for a new resource row.
+
+        Args:
+            resource: Resource creation schema
+
+        Returns:
+            Column values keyed by DbResource attribute name
+        """
+        # Detect mime type if not provided
+        mime_type = resource.mime_type
+        if not mime_type:
+            mime_type = self._detect_mime_type(resource.uri, resource.content)
+
+        # Determine content storage
+        is_text = mime_type and mime_type.startswith("text/") or isinstance(resource.content, str)
+
+        return {
+            "uri": resource.uri,
+            "name": resource.name,
+            "description": resource.description,
+            "mime_type": mime_type,
+            "template": resource.template,
+            "text_content": resource.content if is_text else None,
+            "binary_content": (resource.content.encode() if is_text and isinstance(resource.content, str) else resource.content if isinstance(resource.content, bytes) else None),
+            "size": len(resource.content) if resource.content else 0,
+        }
+
+    async def register_resources_bulk(self, db: Session, resources: List[ResourceCreate]) -> BulkRegistrationResult:
+        """Register many resources in a single transaction.
+
+        All items are validated in one pass, URI conflicts are detected with one
+        ``IN`` query and the remaining rows are inserted with a single
+        executemany. One aggregated ``resources_added`` event is published.
+
+        Args:
+            db: Database session
+            resources: Resource creation schemas
+
+        Returns:
+            Per-item outcome plus created/failed totals
+
+        Raises:
+            ResourceError: If the batch insert fails; nothing is persisted in that case
+        """
+        items: List[Optional[BulkItemResult]] = [None] * len(resources)
+        pending: List[Tuple[int, ResourceCreate]] = []
+        seen: Set[str] = set()
+
+        for index, resource in enumerate(resources):
+            if not self._is_valid_uri(resource.uri):
+                items[index] = BulkItemResult(index=index, key=resource.uri, status="invalid", error=f"Invalid URI: {resource.uri}")
+            elif resource.uri in seen:
+                items[index] = BulkItemResult(index=index, key=resource.uri, status="conflict", error="Duplicate resource URI in request")
+            else:
+                seen.add(resource.uri)
+                pending.append((index, resource))
+
+        if pending:
+            rows = db.execute(select(DbResource.id, DbResource.uri, DbResource.is_active).where(DbResource.uri.in_(seen))).all()
+            existing = {row.uri: row for row in rows}
+            to_insert = []
+            for index, resource in pending:
+                row = existing.get(resource.uri)
+                if row:
+                    items[index] = BulkItemResult(index=index, key=resource.uri, status="conflict", id=row.id, error=str(ResourceURIConflictError(resource.uri, is_active=row.is_active, resource_id=row.id)))
+                else:
+                    to_insert.append((index, resource))
+            pending = to_insert
+
+        created = []
+        if pending:
+            values = [self._build_resource_values(resource) for _, resource in pending]
+            try:
+                ids = db.scalars(insert(DbResource).returning(DbResource.id, sort_by_parameter_order=True), values).all()
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                raise ResourceError(f"Failed to register resources: {str(e)}")
+            for (index, resource), resource_id in zip(pending, ids):
+                items[index] = BulkItemResult(index=index, key=resource.uri, status="created", id=resource_id)
+                created.append({"id": resource_id, "uri": resource.uri, "name": resource.name, "description": resource.description, "is_active": True})
+            await self._notify_resources_added(created)
+            logger.info(f"Bulk registered {len(created)} resources")
+
+        return BulkRegistrationResult(created=len(created), failed=len(resources) - len(created), items=items)
+
     async def list_resources(self, db: Session, include_inactive: bool = False) -> List[ResourceRead]:
         """
         Retrieve a list of registered resources from the database.
@@ -766,6 +838,21 @@ class ResourceService:
         }
         await self._publish_event(resource.uri, event)
 
+    async def _notify_resources_added(self, resources: List[Dict[str, Any]]) -> None:
+        """
+        Notify global subscribers of a bulk resource addition with a single event.
+
+        Args:
+            resources: Summaries of the resources added
+        """
+        event = {
+            "type": "resources_added",
+            "data": {"count": len(resources), "resources": resources},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        for queue in self._event_subscribers.get("*", []):
+            await queue.put(event)
+
     async def _notify_resource_updated(self, resource: DbResource) -> None:
         """
         Notify subscribers of resource update.
@@ -16,40 +16,49 @@ It handles:
 
 # Standard
 import asyncio
-import base64
 from datetime import datetime, timezone
 import json
 import logging
 import re
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.db import Gateway as DbGateway
-from mcpgateway.db import server_tool_association
+from mcpgateway.db import server_tool_association, SessionLocal
 from mcpgateway.db import Tool as DbTool
-from mcpgateway.db import ToolMetric
+from mcpgateway.db import ToolMetric, validate_tool_name, validate_tool_schema
+from mcpgateway.federation.sync import invalidate_catalog
 from mcpgateway.schemas import (
+    BulkItemResult,
+    BulkRegistrationResult,
     ToolCreate,
     ToolRead,
     ToolUpdate,
 )
 from mcpgateway.types import TextContent, ToolResult
+from mcpgateway.utils.circuit_breaker import circuit_breakers
 from mcpgateway.utils.create_slug import slugify
-from mcpgateway.utils.services_auth import decode_auth
+from mcpgateway.utils.http_pool import HostPoolManager, ResponseTooLargeError
+from mcpgateway.utils.invocation_scheduler import InvocationScheduler, InvocationTimeoutError, SchedulerOverloadError
+from mcpgateway.utils.rate_limiter import rate_limiter
+from mcpgateway.utils.services_auth import decode_auth, mask_auth
+from mcpgateway.utils.single_flight import SingleFlight
+from mcpgateway.utils.tool_result_cache import CachedToolResult, CachePolicy, ToolResultCache
 
 # Third-Party
 import httpx
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
-from sqlalchemy import case, delete, func, literal, not_, select
+from sqlalchemy import case, delete, func, insert, literal, not_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # Local
-from ..config import extract_using_jq
+from ..config import compile_jq, extract_using_jq
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +99,193 @@ class ToolInvocationError(ToolError):
     """Raised when tool invocation fails."""
 
 
+def _is_upstream_failure(exc: BaseException) -> bool:
+    """Decide whether an invocation error should count against the upstream's circuit.
+
+    Client errors (HTTP 4xx) say nothing about the health of the upstream.
+
+    Args:
+        exc: Exception raised by the invocation
+
+    Returns:
+        bool: True if the error indicates an unhealthy upstream
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return True
+
+
+# Same shape as the MCP SDK's progress callback: (progress, total, message)
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+
+class _ProgressStream:
+    """Consumes a REST response body while it is received, reporting progress.
+
+    Bytes received are reported as progress, against ``Content-Length`` when
+    known, and chunks are dropped once handled. JSON Lines bodies are parsed
+    record by record: each complete record becomes a content item of its own
+    (or, when the tool has a jq filter, an input to it), and the progress
+    message only counts the records so far. Any other body is kept in a
+    single buffer bounded by ``limit`` until the response is complete.
+
+    Progress is throttled: a report is sent at most every ``REPORT_INTERVAL``
+    seconds unless another ``REPORT_STEP`` of the expected total has
+    arrived, and ``end()`` always sends the final one.
+    """
+
+    JSON_LINES_TYPES = ("application/x-ndjson", "application/jsonl", "application/x-jsonlines")
+    # Seconds between progress reports, and the share of Content-Length that warrants one sooner
+    REPORT_INTERVAL = 0.1
+    REPORT_STEP = 0.1
+
+    def __init__(self, progress: ProgressCallback, keep_records: bool = False, limit: int = 0):
+        """Initialize the stream.
+
+        Args:
+            progress: Callback receiving (progress, total, message)
+            keep_records: Collect parsed JSON Lines records (for a jq filter) instead of content items
+            limit: Largest body, or unfinished JSON Lines record, kept in memory (bytes); 0 for no limit
+        """
+        self._progress = progress
+        self._keep_records = keep_records
+        self._limit = limit
+        self._buffer = bytearray()
+        self.json_lines: Optional[bool] = None
+        self.encoding = "utf-8"
+        self.received = 0
+        self.count = 0
+        self.items: List[TextContent] = []
+        self.records: List[Any] = []
+        self._total: Optional[float] = None
+        self._reported: Optional[Tuple[int, int]] = None  # (bytes, records) of the last report
+        self._reported_at = 0.0
+
+    async def feed(self, response: httpx.Response, received: int, chunk: bytes) -> None:
+        """Handle one chunk of the response body.
+
+        Args:
+            response: Response being received
+            received: Bytes received so far
+            chunk: The new chunk
+
+        Raises:
+            ResponseTooLargeError: If the buffered data exceeds the limit
+        """
+        if self.json_lines is None:
+            content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+            self.json_lines = content_type in self.JSON_LINES_TYPES
+            self.encoding = response.charset_encoding or "utf-8"
+        length = response.headers.get("content-length")
+        self._total = float(length) if length and length.isdigit() else None
+        self.received = received
+        self._buffer += chunk
+        if self.json_lines:
+            end = self._buffer.rfind(b"\n")
+            if end >= 0:
+                lines = self._buffer[:end].split(b"\n")
+                del self._buffer[: end + 1]
+                for line in lines:
+                    self._add(line)
+        if self._limit and len(self._buffer) > self._limit:
+            raise ResponseTooLargeError(str(response.url), self._limit)
+        now = time.monotonic()
+        if self._reported is not None and now - self._reported_at < self.REPORT_INTERVAL:
+            if not self._total or received - self._reported[0] < self._total * self.REPORT_STEP:
+                return
+        await self._report(now)
+
+    async def _report(self, now: float) -> None:
+        """Send the progress received so far.
+
+        Args:
+            now: Current monotonic time
+        """
+        self._reported = (self.received, self.count)
+        self._reported_at = now
+        message = f"{self.count} record{'' if self.count == 1 else 's'}" if self.json_lines else None
+        await self._progress(self.received, self._total, message)
+
+    async def end(self) -> None:
+        """Finish the body and send the final progress report, unless the last one already was.
+
+        Examples:
+            >>> import asyncio
+            >>> seen = []
+            >>> async def progress(done, total, message):
+            ...     seen.append((done, message))
+            >>> stream = _ProgressStream(progress)
+            >>> response = httpx.Response(200, headers={"content-type": "application/x-ndjson"})
+            >>> async def receive():
+            ...     for n in range(1, 101):
+            ...         await stream.feed(response, n * 9, b'{"n": 1}\\n')
+            ...     await stream.end()
+            >>> asyncio.run(receive())
+            >>> seen[0], seen[-1], len(seen) < 10
+            ((9, '1 record'), (900, '100 records'), True)
+        """
+        self.finish()
+        if self._reported != (self.received, self.count):
+            await self._report(time.monotonic())
+
+    def _add(self, line: bytes) -> None:
+        """Parse one JSON Lines record.
+
+        Args:
+            line: Raw record
+        """
+        line = line.strip()
+        if not line:
+            return
+        record = json.loads(line)
+        self.count += 1
+        if self._keep_records:
+            self.records.append(record)
+        else:
+            # The record is valid JSON, so its text is passed on as received
+            self.items.append(TextContent(type="text", text=line.decode(self.encoding)))
+
+    def finish(self) -> None:
+        """Parse any trailing JSON Lines record.
+
+        Examples:
+            >>> import asyncio
+            >>> seen = []
+            >>> async def progress(done, total, message):
+            ...     seen.append(message)
+            >>> stream = _ProgressStream(progress)
+            >>> response = httpx.Response(200, headers={"content-type": "application/x-ndjson"})
+            >>> asyncio.run(stream.feed(response, 12, b'{"a": 1}\\n{"b"'))
+            >>> asyncio.run(stream.feed(response, 17, b': 2}'))
+            >>> stream.finish()
+            >>> seen, [item.text for item in stream.items]
+            (['1 record'], ['{"a": 1}', '{"b": 2}'])
+        """
+        if self.json_lines:
+            self._add(bytes(self._buffer))
+            self._buffer = bytearray()
+
+    def take_body(self) -> bytearray:
+        """Hand over the buffered body of a response that is not JSON Lines.
+
+        Returns:
+            bytearray: The body; the stream no longer references it
+        """
+        body, self._buffer = self._buffer, bytearray()
+        return body
+
+    def json(self) -> Any:
+        """Parse the whole body as JSON.
+
+        Returns:
+            Any: The document, or the list of records of a JSON Lines body
+        """
+        self.finish()
+        if self.json_lines:
+            return self.records if self._keep_records else [json.loads(item.text) for item in self.items]
+        return json.loads(self.take_body() or b"null")
+
+
 class ToolService:
     """Service for managing and invoking tools.
 
@@ -104,12 +300,63 @@ class ToolService:
     def __init__(self):
         """Initialize the tool service."""
         self._event_subscribers: List[asyncio.Queue] = []
-        self._http_client = httpx.AsyncClient(timeout=settings.federation_timeout, verify=not settings.skip_ssl_verify)
+        # One connection pool per upstream host, so a slow REST API cannot starve the others
+        self._http_client = HostPoolManager(
+            max_connections=settings.rest_pool_max_connections,
+            max_keepalive_connections=settings.rest_pool_max_keepalive,
+            keepalive_expiry=settings.rest_pool_keepalive_expiry,
+            http2=settings.rest_http2,
+            timeout=settings.federation_timeout,
+            verify=not settings.skip_ssl_verify,
+            max_response_size=settings.tool_max_response_size,
+            max_hosts=settings.rest_pool_max_hosts,
+        )
+        self._result_cache = ToolResultCache(max_size=settings.tool_result_cache_size)
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._single_flight = SingleFlight()
+        self._scheduler = InvocationScheduler(
+            tool_limit=settings.tool_concurrent_limit,
+            gateway_limit=settings.gateway_concurrent_limit,
+            max_queue=settings.tool_queue_limit,
+            timeout=settings.tool_timeout,
+        )
 
     async def initialize(self) -> None:
         """Initialize the service."""
         logger.info("Initializing tool service")
 
+    def get_pool_occupancy(self) -> Dict[str, Dict[str, Any]]:
+        """Report the occupancy of each REST upstream host's connection pool.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per origin, requests in flight, the connection limit and the protocol
+        """
+        return self._http_client.occupancy()
+
+    def get_result_cache_stats(self) -> Dict[str, int]:
+        """Report the effectiveness of the tool result cache.
+
+        Returns:
+            Dict[str, int]: Entry count and hit / stale-hit / miss counters
+        """
+        return self._result_cache.stats()
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """Report how often identical concurrent invocations shared one upstream call.
+
+        Returns:
+            Dict[str, int]: Calls in flight, leader calls and coalesced calls
+        """
+        return self._single_flight.stats()
+
+    def get_scheduler_metrics(self) -> Dict[str, Any]:
+        """Report active and queued invocations per tool and per gateway.
+
+        Returns:
+            Dict[str, Any]: Scheduler counters
+        """
+        return self._scheduler.metrics()
+
     async def shutdown(self) -> None:
         """Shutdown the service."""
         await self._http_client.aclose()
@@ -133,28 +380,8 @@ class ToolService:
         tool_dict["request_type"] = tool.request_type
         tool_dict["annotations"] = tool.annotations or {}
 
-        decoded_auth_value = decode_auth(tool.auth_value)
-        if tool.auth_type == "basic":
-            decoded_bytes = base64.b64decode(decoded_auth_value["Authorization"].split("Basic ")[1])
-            username, password = decoded_bytes.decode("utf-8").split(":")
-            tool_dict["auth"] = {
-                "auth_type": "basic",
-                "username": username,
-                "password": "********" if password else None,
-            }
-        elif tool.auth_type == "bearer":
-            tool_dict["auth"] = {
-                "auth_type": "bearer",
-                "token": "********" if decoded_auth_value["Authorization"] else None,
-            }
-        elif tool.auth_type == "authheaders":
-            tool_dict["auth"] = {
-                "auth_type": "authheaders",
-                "auth_header_key": next(iter(decoded_auth_value)),
-                "auth_header_value": "********" if decoded_auth_value[next(iter(decoded_auth_value))] else None,
-            }
-        else:
-            tool_dict["auth"] = None
+        # Rows saved before auth summaries were stored fall back to decrypting (cached)
+        tool_dict["auth"] = tool.auth_summary if tool.auth_summary is not None else mask_auth(tool.auth_type, tool.auth_value)
 
         tool_dict["name"] = tool.name
         tool_dict["gateway_slug"] = tool.gateway_slug if tool.gateway_slug else ""
@@ -200,8 +427,10 @@ class ToolService:
 
         Raises:
             ToolNameConflictError: If tool name already exists.
+            ToolValidationError: If the jsonpath filter is not valid jq.
             ToolError: For other tool registration errors.
         """
+        self._validate_jsonpath_filter(tool.jsonpath_filter)
         try:
             if not tool.gateway_id:
                 existing_tool = db.execute(select(DbTool).where(DbTool.name == tool.name)).scalar_one_or_none()
@@ -232,6 +461,9 @@ class ToolService:
                 input_schema=tool.input_schema,
                 annotations=tool.annotations,
                 jsonpath_filter=tool.jsonpath_filter,
+                request_timeout=tool.request_timeout,
+                cache_ttl=tool.cache_ttl,
+                stale_while_revalidate=tool.stale_while_revalidate,
                 auth_type=auth_type,
                 auth_value=auth_value,
                 gateway_id=tool.gateway_id,
@@ -249,6 +481,93 @@ class ToolService:
             db.rollback()
             raise ToolError(f"Failed to register tool: {str(e)}")
 
+    async def register_tools_bulk(self, db: Session, tools: List[ToolCreate]) -> BulkRegistrationResult:
+        """Register many tools in a single transaction.
+
+        All items are validated in one pass, conflicts with existing tools are
+        detected with one ``IN`` query and the remaining rows are inserted with a
+        single executemany. One aggregated ``tools_added`` event is published.
+
+        Args:
+            db: Database session.
+            tools: Tool creation schemas.
+
+        Returns:
+            Per-item outcome plus created/failed totals.
+
+        Raises:
+            ToolError: If the batch insert fails; nothing is persisted in that case.
+        """
+        items: List[Optional[BulkItemResult]] = [None] * len(tools)
+        pending: List[Tuple[int, ToolCreate]] = []
+        seen: Set[Tuple[Optional[str], str]] = set()
+
+        for index, tool in enumerate(tools):
+            key = (tool.gateway_id, tool.name)
+            try:
+                validate_tool_schema(None, None, tool)
+                validate_tool_name(None, None, SimpleNamespace(name=slugify(tool.name)))
+                self._validate_jsonpath_filter(tool.jsonpath_filter)
+            except (ValueError, ToolValidationError) as e:
+                items[index] = BulkItemResult(index=index, key=tool.name, status="invalid", error=str(e))
+                continue
+            if key in seen:
+                items[index] = BulkItemResult(index=index, key=tool.name, status="conflict", error="Duplicate tool name in request")
+                continue
+            seen.add(key)
+            pending.append((index, tool))
+
+        if pending:
+            names = {tool.name for _, tool in pending}
+            rows = db.execute(select(DbTool.id, DbTool.original_name, DbTool.gateway_id, DbTool.is_active).where(DbTool.original_name.in_(names))).all()
+            existing = {(row.gateway_id, row.original_name): row for row in rows}
+            to_insert = []
+            for index, tool in pending:
+                row = existing.get((tool.gateway_id, tool.name))
+                if row:
+                    items[index] = BulkItemResult(index=index, key=tool.name, status="conflict", id=row.id, error=str(ToolNameConflictError(tool.name, is_active=row.is_active, tool_id=row.id)))
+                else:
+                    to_insert.append((index, tool))
+            pending = to_insert
+
+        created = []
+        if pending:
+            values = [
+                {
+                    "original_name": tool.name,
+                    "original_name_slug": slugify(tool.name),
+                    "url": str(tool.url),
+                    "description": tool.description,
+                    "integration_type": tool.integration_type,
+                    "request_type": tool.request_type,
+                    "headers": tool.headers,
+                    "input_schema": tool.input_schema,
+                    "annotations": tool.annotations,
+                    "jsonpath_filter": tool.jsonpath_filter,
+                    "request_timeout": tool.request_timeout,
+                    "cache_ttl": tool.cache_ttl,
+                    "stale_while_revalidate": tool.stale_while_revalidate,
+                    "auth_type": tool.auth.auth_type if tool.auth else None,
+                    "auth_value": tool.auth.auth_value if tool.auth else None,
+                    "auth_summary": mask_auth(tool.auth.auth_type, tool.auth.auth_value) if tool.auth else None,
+                    "gateway_id": tool.gateway_id,
+                }
+                for _, tool in pending
+            ]
+            try:
+                ids = db.scalars(insert(DbTool).returning(DbTool.id, sort_by_parameter_order=True), values).all()
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                raise ToolError(f"Failed to register tools: {str(e)}")
+            for (index, tool), tool_id in zip(pending, ids):
+                items[index] = BulkItemResult(index=index, key=tool.name, status="created", id=tool_id)
+                created.append({"id": tool_id, "name": slugify(tool.name), "url": str(tool.url), "description": tool.description, "is_active": True})
+            await self._notify_tools_added(created)
+            logger.info(f"Bulk registered {len(created)} tools")
+
+        return BulkRegistrationResult(created=len(created), failed=len(tools) - len(created), items=items)
+
     async def list_tools(self, db: Session, include_inactive: bool = False, cursor: Optional[str] = None) -> List[ToolRead]:
         """
         Retrieve a list of registered tools from the database.
@@ -328,8 +647,10 @@ class ToolService:
             if not tool:
                 raise ToolNotFoundError(f"Tool not found: {tool_id}")
             tool_info = {"id": tool.id, "name": tool.name}
+            invalidate_catalog(db, tool.gateway_id)
             db.delete(tool)
             db.commit()
+            self._result_cache.invalidate_tool(tool_info["id"])
             await self._notify_tool_deleted(tool_info)
             logger.info(f"Permanently deleted tool: {tool_info['name']}")
         except Exception as e:
@@ -360,6 +681,7 @@ class ToolService:
                 tool.updated_at = datetime.now(timezone.utc)
                 db.commit()
                 db.refresh(tool)
+                self._result_cache.invalidate_tool(tool.id)
                 if activate:
                     await self._notify_tool_activated(tool)
                 else:
@@ -370,14 +692,45 @@ class ToolService:
             db.rollback()
             raise ToolError(f"Failed to toggle tool status: {str(e)}")
 
-    async def invoke_tool(self, db: Session, name: str, arguments: Dict[str, Any]) -> ToolResult:
+    @staticmethod
+    def _rest_timeout(tool: DbTool) -> Optional[float]:
+        """Read a tool's own request timeout.
+
+        Args:
+            tool: Tool being invoked.
+
+        Returns:
+            Timeout in seconds, or None to use the pool default.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> ToolService._rest_timeout(SimpleNamespace(request_timeout=2.5))
+            2.5
+            >>> ToolService._rest_timeout(SimpleNamespace(request_timeout=None)) is None
+            True
+        """
+        timeout = tool.request_timeout
+        return timeout if timeout and timeout > 0 else None
+
+    async def invoke_tool(
+        self, db: Session, name: str, arguments: Dict[str, Any], client_id: Optional[str] = None, progress: Optional[ProgressCallback] = None
+    ) -> ToolResult:
         """
         Invoke a registered tool and record execution metrics.
 
+        Calls are admitted by the invocation scheduler, which enforces
+        ``tool_concurrent_limit``, ``gateway_concurrent_limit`` and the
+        ``tool_timeout`` deadline. Tools that opt in to result caching are
+        answered from the cache while their results are fresh, and identical
+        concurrent calls of idempotent tools share one upstream call.
+
         Args:
             db: Database session.
             name: Name of tool to invoke.
             arguments: Tool arguments.
+            client_id: Identity of the caller, used for fair queueing.
+            progress: Streaming mode: awaited as the result arrives, with bytes received,
+                the expected total and, for JSON Lines bodies, the number of records parsed.
 
         Returns:
             Tool invocation result.
@@ -385,6 +738,9 @@ class ToolService:
         Raises:
             ToolNotFoundError: If tool not found.
             ToolInvocationError: If invocation fails.
+            RateLimitExceeded: If the tool's rate limit is exhausted.
+            SchedulerOverloadError: If too many invocations of the tool or its gateway are queued.
+            InvocationTimeoutError: If the invocation missed its deadline.
         """
         separator = literal(settings.gateway_tool_name_separator)
         slug_expr = case(
@@ -400,124 +756,404 @@ class ToolService:
             if inactive_tool:
                 raise ToolNotFoundError(f"Tool '{name}' exists but is inactive")
             raise ToolNotFoundError(f"Tool not found: {name}")
+        # Rejected calls never reach the upstream, so they are not recorded as failed invocations
+        await rate_limiter.hit("tool", name, settings.tool_rate_limit)
+
+        policy = self._result_cache.policy(tool)
+        if policy is None:
+            return await self._invoke_coalesced(db, tool, name, arguments, client_id, progress=progress)
+        key = self._result_cache.key(tool.id, arguments)
+        cached = self._result_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and cached.is_fresh(now):
+            self._result_cache.hits += 1
+            return cached.result
+        if cached is not None and cached.is_servable(now):
+            self._result_cache.stale_hits += 1
+            self._refresh_in_background(tool.id, name, arguments, client_id, key, policy, cached)
+            return cached.result
+        self._result_cache.misses += 1
+        return await self._invoke_coalesced(db, tool, name, arguments, client_id, cache_key=key, policy=policy, cached=cached, progress=progress)
+
+    @staticmethod
+    def _validate_jsonpath_filter(jq_filter: Optional[str]) -> None:
+        """Compile a tool's jq filter so that invalid filters are rejected when the tool is saved.
+
+        The compiled program is cached and reused by every invocation.
+
+        Args:
+            jq_filter: Filter to check; empty means no filtering.
+
+        Raises:
+            ToolValidationError: If the filter is not valid jq.
+
+        Examples:
+            >>> ToolService._validate_jsonpath_filter(".items[] | .id")
+            >>> ToolService._validate_jsonpath_filter(".items[")
+            Traceback (most recent call last):
+            ...
+            mcpgateway.services.tool_service.ToolValidationError: Invalid jsonpath_filter '.items[': ...
+        """
+        if not jq_filter:
+            return
+        try:
+            compile_jq(jq_filter)
+        except ValueError as e:
+            raise ToolValidationError(f"Invalid jsonpath_filter '{jq_filter}': {e}")
+
+    @staticmethod
+    async def _apply_jsonpath_filter(data: Any, jq_filter: str, size: int) -> Any:
+        """Apply a tool's jq filter, off the event loop when the result is large.
+
+        Args:
+            data: Upstream result.
+            jq_filter: The tool's filter; empty returns ``data`` unchanged.
+            size: Approximate size of ``data`` in bytes.
+
+        Returns:
+            The filtered result.
+        """
+        if jq_filter and size >= settings.jsonpath_filter_thread_threshold:
+            return await asyncio.to_thread(extract_using_jq, data, jq_filter)
+        return extract_using_jq(data, jq_filter)
+
+    @staticmethod
+    def _is_idempotent(tool: DbTool) -> bool:
+        """Decide whether identical concurrent calls of a tool may share one upstream call.
+
+        MCP tool annotations decide when present; otherwise only REST ``GET``
+        tools are considered idempotent.
+
+        Args:
+            tool: Tool being invoked.
+
+        Returns:
+            True if calls with identical arguments can be coalesced.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> ToolService._is_idempotent(SimpleNamespace(annotations={}, integration_type="REST", request_type="GET"))
+            True
+            >>> ToolService._is_idempotent(SimpleNamespace(annotations={}, integration_type="REST", request_type="POST"))
+            False
+            >>> ToolService._is_idempotent(SimpleNamespace(annotations={"readOnlyHint": True}, integration_type="MCP", request_type="SSE"))
+            True
+            >>> ToolService._is_idempotent(SimpleNamespace(annotations={"destructiveHint": True}, integration_type="REST", request_type="GET"))
+            False
+        """
+        annotations = tool.annotations if isinstance(tool.annotations, dict) else {}
+        if annotations.get("readOnlyHint") or annotations.get("idempotentHint"):
+            return True
+        if annotations.get("destructiveHint"):
+            return False
+        return tool.integration_type == "REST" and (tool.request_type or "").upper() in ("GET", "HEAD")
+
+    async def _invoke_coalesced(
+        self,
+        db: Session,
+        tool: DbTool,
+        name: str,
+        arguments: Dict[str, Any],
+        client_id: Optional[str],
+        cache_key: Optional[str] = None,
+        policy: Optional[CachePolicy] = None,
+        cached: Optional[CachedToolResult] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> ToolResult:
+        """
+        Invoke the tool, sharing one upstream call among identical concurrent invocations.
+
+        Only idempotent tools are coalesced; the others, and streaming calls,
+        always get a call of their own.
+
+        Args:
+            db: Database session.
+            tool: Tool to invoke.
+            name: Name of the tool.
+            arguments: Tool arguments.
+            client_id: Identity of the caller, used for fair queueing.
+            cache_key: Cache key when the tool's results are cached.
+            policy: Tool's caching policy, None if results are not cached.
+            cached: Expired cache entry to revalidate with a conditional request.
+            progress: Streaming mode progress callback.
+
+        Returns:
+            Tool invocation result.
+
+        Raises:
+            ToolNotFoundError: If the tool was removed or deactivated before the shared call started.
+        """
+        if progress is not None or not settings.tool_coalescing or not self._is_idempotent(tool):
+            return await self._invoke(db, tool, name, arguments, client_id, cache_key=cache_key, policy=policy, cached=cached, progress=progress)
+        key = cache_key or self._result_cache.key(tool.id, arguments)
+        tool_id = tool.id
+
+        async def _shared() -> ToolResult:
+            """Run the shared call in a session of its own; the leader's request may end while others still wait on it."""
+            with SessionLocal() as own_db:
+                own_tool = own_db.get(DbTool, tool_id)
+                if own_tool is None or not own_tool.is_active:
+                    raise ToolNotFoundError(f"Tool not found: {name}")
+                return await self._invoke(own_db, own_tool, name, arguments, client_id, cache_key=cache_key, policy=policy, cached=cached)
+
+        return await self._single_flight.do(key, _shared)
+
+    def _refresh_in_background(
+        self, tool_id: str, name: str, arguments: Dict[str, Any], client_id: Optional[str], key: str, policy: CachePolicy, cached: CachedToolResult
+    ) -> None:
+        """Revalidate a stale cached result without making the caller wait.
+
+        At most one refresh per cache entry runs at a time.
+
+        Args:
+            tool_id: ID of the tool.
+            name: Name of the tool.
+            arguments: Tool arguments.
+            client_id: Identity of the caller.
+            key: Cache key of the entry.
+            policy: Tool's caching policy.
+            cached: The stale entry, whose validators are sent upstream.
+        """
+        if not self._result_cache.begin_refresh(key):
+            return
+        # An update or deletion of the tool while the refresh runs must not be overwritten by its result
+        generation = self._result_cache.generation(tool_id)
+
+        async def _refresh() -> None:
+            """Invoke the tool in a session of its own and update the cache."""
+            try:
+                with SessionLocal() as db:
+                    tool = db.get(DbTool, tool_id)
+                    if tool is not None and tool.is_active:
+                        await self._invoke(db, tool, name, arguments, client_id, cache_key=key, policy=policy, cached=cached, generation=generation)
+            except Exception as e:
+                logger.debug(f"Background refresh of cached result for tool {name} failed: {e}")
+            finally:
+                self._result_cache.end_refresh(key)
+
+        task = asyncio.create_task(_refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _invoke(
+        self,
+        db: Session,
+        tool: DbTool,
+        name: str,
+        arguments: Dict[str, Any],
+        client_id: Optional[str],
+        cache_key: Optional[str] = None,
+        policy: Optional[CachePolicy] = None,
+        cached: Optional[CachedToolResult] = None,
+        progress: Optional[ProgressCallback] = None,
+        generation: Optional[int] = None,
+    ) -> ToolResult:
+        """
+        Call the tool's upstream and record execution metrics.
+
+        Args:
+            db: Database session.
+            tool: Tool to invoke.
+            name: Name of the tool.
+            arguments: Tool arguments.
+            client_id: Identity of the caller, used for fair queueing.
+            cache_key: Cache key when the tool's results are cached.
+            policy: Tool's caching policy, None if results are not cached.
+            cached: Expired cache entry to revalidate with a conditional request.
+            progress: Streaming mode progress callback; upstream progress is relayed to it.
+            generation: Tool's cache generation when the invocation was requested; defaults to the current one.
+
+        Returns:
+            Tool invocation result.
+
+        Raises:
+            ToolInvocationError: If invocation fails.
+            SchedulerOverloadError: If too many invocations of the tool or its gateway are queued.
+            InvocationTimeoutError: If the invocation missed its deadline.
+        """
         start_time = time.monotonic()
         success = False
         error_message = None
+        if policy is not None and generation is None:
+            generation = self._result_cache.generation(tool.id)
         try:
-            # tool.validate_arguments(arguments)
-            # Build headers with auth if necessary.
-            headers = tool.headers or {}
-            if tool.integration_type == "REST":
-                credentials = decode_auth(tool.auth_value)
-                headers.update(credentials)
-
-                # Build the payload based on integration type.
-                payload = arguments.copy()
-
-                # Handle URL path parameter substitution
-                final_url = tool.url
-                if "{" in tool.url and "}" in tool.url:
-                    # Extract path parameters from URL template and arguments
-                    url_params = re.findall(r"\{(\w+)\}", tool.url)
-                    url_substitutions = {}
-
-                    for param in url_params:
-                        if param in payload:
-                            url_substitutions[param] = payload.pop(param)  # Remove from payload
-                            final_url = final_url.replace(f"{{{param}}}", str(url_substitutions[param]))
+            # Queue behind the tool's and gateway's concurrency limits; the deadline cancels upstream work
+            async with self._scheduler.slot(name, gateway=tool.gateway_id, client=client_id) as deadline:
+                # tool.validate_arguments(arguments)
+                # Build headers with auth if necessary (copied, so credentials never leak into the tool's own headers).
+                headers = dict(tool.headers or {})
+                if tool.integration_type == "REST":
+                    credentials = decode_auth(tool.auth_value)
+                    headers.update(credentials)
+                    if cached is not None:
+                        headers.update(cached.validators)
+
+                    # Build the payload based on integration type.
+                    payload = arguments.copy()
+
+                    # Handle URL path parameter substitution
+                    final_url = tool.url
+                    if "{" in tool.url and "}" in tool.url:
+                        # Extract path parameters from URL template and arguments
+                        url_params = re.findall(r"\{(\w+)\}", tool.url)
+                        url_substitutions = {}
+
+                        for param in url_params:
+                            if param in payload:
+                                url_substitutions[param] = payload.pop(param)  # Remove from payload
+                                final_url = final_url.replace(f"{{{param}}}", str(url_substitutions[param]))
+                            else:
+                                raise ToolInvocationError(f"Required URL parameter '{param}' not found in arguments")
+
+                    # Use the tool's request_type rather than defaulting to POST.
+                    method = tool.request_type.upper()
+                    request_options = {}
+                    timeout = self._rest_timeout(tool)
+                    if timeout is not None:
+                        request_options["timeout"] = timeout
+                    stream = None
+                    if progress is not None:
+                        stream = _ProgressStream(progress, keep_records=bool(tool.jsonpath_filter), limit=settings.tool_max_response_size)
+                        request_options["on_chunk"] = stream.feed
+                    with circuit_breakers.for_url(final_url).guard(is_failure=_is_upstream_failure, deadline=deadline):
+                        if method == "GET":
+                            response = await self._http_client.get(final_url, params=payload, headers=headers, **request_options)
                         else:
-                            raise ToolInvocationError(f"Required URL parameter '{param}' not found in arguments")
-
-                # Use the tool's request_type rather than defaulting to POST.
-                method = tool.request_type.upper()
-                if method == "GET":
-                    response = await self._http_client.get(final_url, params=payload, headers=headers)
-                else:
-                    response = await self._http_client.request(method, final_url, json=payload, headers=headers)
-                await response.raise_for_status()
-
-                # Handle 204 No Content responses that have no body
-                if response.status_code == 204:
-                    tool_result = ToolResult(content=[TextContent(type="text", text="Request completed successfully (No Content)")])
-                elif response.status_code not in [200, 201, 202, 206]:
-                    result = response.json()
-                    tool_result = ToolResult(
-                        content=[TextContent(type="text", text=str(result["error"]) if "error" in result else "Tool error encountered")],
-                        is_error=True,
-                    )
+                            response = await self._http_client.request(method, final_url, json=payload, headers=headers, **request_options)
+                        if not (cached is not None and response.status_code == 304):
+                            response.raise_for_status()
+                    if stream is not None:
+                        await stream.end()
+
+                    if response.status_code == 304:
+                        # Not Modified: the cached result is still valid
+                        tool_result = cached.result
+                    # Handle 204 No Content responses that have no body
+                    elif response.status_code == 204:
+                        tool_result = ToolResult(content=[TextContent(type="text", text="Request completed successfully (No Content)")])
+                    elif response.status_code not in [200, 201, 202, 206]:
+                        result = stream.json() if stream is not None else response.json()
+                        tool_result = ToolResult(
+                            content=[TextContent(type="text", text=str(result["error"]) if "error" in result else "Tool error encountered")],
+                            is_error=True,
+                        )
+                    elif stream is not None:
+                        tool_result = await self._streamed_result(stream, tool.jsonpath_filter)
+                    else:
+                        result = response.json()
+                        filtered_response = await self._apply_jsonpath_filter(result, tool.jsonpath_filter, len(response.content))
+                        tool_result = ToolResult(content=[TextContent(type="text", text=json.dumps(filtered_response, indent=2))])
+
+                    success = True
+                    if policy is not None:
+                        # A 304 may omit the validators; the entry keeps the ones it was revalidated with
+                        previous = cached if response.status_code == 304 else None
+                        self._result_cache.store(cache_key, tool_result, policy, response.headers, previous=previous, generation=generation)
+                elif tool.integration_type == "MCP":
+                    transport = tool.request_type.lower()
+                    gateway = db.execute(select(DbGateway).where(DbGateway.id == tool.gateway_id).where(DbGateway.is_active)).scalar_one_or_none()
+                    if gateway.auth_type == "bearer":
+                        headers = decode_auth(gateway.auth_value)
+                    else:
+                        headers = {}
+
+                    # Relay the upstream server's progress notifications in streaming mode
+                    call_options = {"progress_callback": progress} if progress is not None else {}
+
+                    async def connect_to_sse_server(server_url: str) -> str:
+                        """
+                        Connect to an MCP server running with SSE transport
+
+                        Args:
+                            server_url (str): MCP Server SSE URL
+
+                        Returns:
+                            str: Result of tool call
+                        """
+                        # Use async with directly to manage the context
+                        async with sse_client(url=server_url, headers=headers) as streams:
+                            async with ClientSession(*streams) as session:
+                                # Initialize the session
+                                await session.initialize()
+                                tool_call_result = await session.call_tool(tool.original_name, arguments, **call_options)
+                        return tool_call_result
+
+                    async def connect_to_streamablehttp_server(server_url: str) -> str:
+                        """
+                        Connect to an MCP server running with Streamable HTTP transport
+
+                        Args:
+                            server_url (str): MCP Server URL
+
+                        Returns:
+                            str: Result of tool call
+                        """
+                        # Use async with directly to manage the context
+                        async with streamablehttp_client(url=server_url, headers=headers) as (read_stream, write_stream, _get_session_id):
+                            async with ClientSession(read_stream, write_stream) as session:
+                                # Initialize the session
+                                await session.initialize()
+                                tool_call_result = await session.call_tool(tool.original_name, arguments, **call_options)
+                        return tool_call_result
+
+                    tool_gateway_id = tool.gateway_id
+                    tool_gateway = db.execute(select(DbGateway).where(DbGateway.id == tool_gateway_id).where(DbGateway.is_active)).scalar_one_or_none()
+
+                    tool_call_result = ToolResult(content=[TextContent(text="", type="text")])
+                    with circuit_breakers.for_gateway(tool_gateway_id).guard(deadline=deadline):
+                        if transport == "sse":
+                            tool_call_result = await connect_to_sse_server(tool_gateway.url)
+                        elif transport == "streamablehttp":
+                            tool_call_result = await connect_to_streamablehttp_server(tool_gateway.url)
+                    content = tool_call_result.model_dump(by_alias=True).get("content", [])
+
+                    success = True
+                    size = sum(len(item.get("text") or item.get("data") or "") for item in content)
+                    filtered_response = await self._apply_jsonpath_filter(content, tool.jsonpath_filter, size)
+                    tool_result = ToolResult(content=filtered_response)
+                    if policy is not None:
+                        self._result_cache.store(cache_key, tool_result, policy, generation=generation)
                 else:
-                    result = response.json()
-                    filtered_response = extract_using_jq(result, tool.jsonpath_filter)
-                    tool_result = ToolResult(content=[TextContent(type="text", text=json.dumps(filtered_response, indent=2))])
-
-                success = True
-            elif tool.integration_type == "MCP":
-                transport = tool.request_type.lower()
-                gateway = db.execute(select(DbGateway).where(DbGateway.id == tool.gateway_id).where(DbGateway.is_active)).scalar_one_or_none()
-                if gateway.auth_type == "bearer":
-                    headers = decode_auth(gateway.auth_value)
-                else:
-                    headers = {}
-
-                async def connect_to_sse_server(server_url: str) -> str:
-                    """
-                    Connect to an MCP server running with SSE transport
-
-                    Args:
-                        server_url (str): MCP Server SSE URL
-
-                    Returns:
-                        str: Result of tool call
-                    """
-                    # Use async with directly to manage the context
-                    async with sse_client(url=server_url, headers=headers) as streams:
-                        async with ClientSession(*streams) as session:
-                            # Initialize the session
-                            await session.initialize()
-                            tool_call_result = await session.call_tool(tool.original_name, arguments)
-                    return tool_call_result
-
-                async def connect_to_streamablehttp_server(server_url: str) -> str:
-                    """
-                    Connect to an MCP server running with Streamable HTTP transport
-
-                    Args:
-                        server_url (str): MCP Server URL
-
-                    Returns:
-                        str: Result of tool call
-                    """
-                    # Use async with directly to manage the context
-                    async with streamablehttp_client(url=server_url, headers=headers) as (read_stream, write_stream, _get_session_id):
-                        async with ClientSession(read_stream, write_stream) as session:
-                            # Initialize the session
-                            await session.initialize()
-                            tool_call_result = await session.call_tool(tool.original_name, arguments)
-                    return tool_call_result
-
-                tool_gateway_id = tool.gateway_id
-                tool_gateway = db.execute(select(DbGateway).where(DbGateway.id == tool_gateway_id).where(DbGateway.is_active)).scalar_one_or_none()
-
-                tool_call_result = ToolResult(content=[TextContent(text="", type="text")])
-                if transport == "sse":
-                    tool_call_result = await connect_to_sse_server(tool_gateway.url)
-                elif transport == "streamablehttp":
-                    tool_call_result = await connect_to_streamablehttp_server(tool_gateway.url)
-                content = tool_call_result.model_dump(by_alias=True).get("content", [])
-
-                success = True
-                filtered_response = extract_using_jq(content, tool.jsonpath_filter)
-                tool_result = ToolResult(content=filtered_response)
-            else:
-                return ToolResult(content="Invalid tool type")
+                    return ToolResult(content="Invalid tool type")
 
             return tool_result
+        except (SchedulerOverloadError, InvocationTimeoutError) as e:
+            # Kept distinct so callers can tell overload and deadlines from upstream failures
+            error_message = str(e)
+            raise
         except Exception as e:
             error_message = str(e)
             raise ToolInvocationError(f"Tool invocation failed: {error_message}")
         finally:
             await self._record_tool_metric(db, tool, start_time, success, error_message)
 
+    async def _streamed_result(self, stream: _ProgressStream, jq_filter: Optional[str]) -> ToolResult:
+        """Build the result of a REST call whose body was consumed by a progress stream.
+
+        Without a jq filter nothing is re-serialised: JSON Lines records are
+        returned as one content item each, and other bodies as received.
+
+        Args:
+            stream: Stream that received the body.
+            jq_filter: The tool's jq filter, if any.
+
+        Returns:
+            Tool invocation result.
+        """
+        stream.finish()
+        if stream.json_lines and not jq_filter:
+            return ToolResult(content=stream.items)
+        if stream.json_lines:
+            data = stream.records
+        else:
+            body = stream.take_body()
+            if not jq_filter:
+                return ToolResult(content=[TextContent(type="text", text=body.decode(stream.encoding))])
+            data = json.loads(body)
+            del body
+        filtered_response = await self._apply_jsonpath_filter(data, jq_filter, stream.received)
+        return ToolResult(content=[TextContent(type="text", text=json.dumps(filtered_response, indent=2))])
+
     async def update_tool(self, db: Session, tool_id: str, tool_update: ToolUpdate) -> ToolRead:
         """Update an existing tool.
 
@@ -531,9 +1167,11 @@ class ToolService:
 
         Raises:
             ToolNotFoundError: If tool not found.
+            ToolValidationError: If the jsonpath filter is not valid jq.
             ToolError: For other tool update errors.
             ToolNameConflictError: If tool name conflict occurs
         """
+        self._validate_jsonpath_filter(tool_update.jsonpath_filter)
         try:
             tool = db.get(DbTool, tool_id)
             if not tool:
@@ -565,6 +1203,9 @@ class ToolService:
                 tool.annotations = tool_update.annotations
             if tool_update.jsonpath_filter is not None:
                 tool.jsonpath_filter = tool_update.jsonpath_filter
+            for setting in ("request_timeout", "cache_ttl", "stale_while_revalidate"):
+                if setting in tool_update.model_fields_set:
+                    setattr(tool, setting, getattr(tool_update, setting))
 
             if tool_update.auth is not None:
                 if tool_update.auth.auth_type is not None:
@@ -575,8 +1216,10 @@ class ToolService:
                 tool.auth_type = None
 
             tool.updated_at = datetime.now(timezone.utc)
+            invalidate_catalog(db, tool.gateway_id)
             db.commit()
             db.refresh(tool)
+            self._result_cache.invalidate_tool(tool.id)
             await self._notify_tool_updated(tool)
             logger.info(f"Updated tool: {tool.name}")
             return self._convert_tool_to_read(tool)
@@ -681,6 +1324,20 @@ class ToolService:
         }
         await self._publish_event(event)
 
+    async def _notify_tools_added(self, tools: List[Dict[str, Any]]) -> None:
+        """
+        Notify subscribers of a bulk tool addition with a single event.
+
+        Args:
+            tools: Summaries of the tools added
+        """
+        event = {
+            "type": "tools_added",
+            "data": {"count": len(tools), "tools": tools},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        await self._publish_event(event)
+
     async def _notify_tool_removed(self, tool: DbTool) -> None:
         """
         Notify subscribers of tool removal (soft delete/deactivation).
@@ -37,6 +37,15 @@ The SSE stream now emits JSON-RPC responses as `event: message` frames and sends
 regular `event: keepalive` frames (default every 30s) so that proxies and
 clients never time out.  Each client receives a unique *session-id* that is
 appended as a query parameter to the back-channel `/message` URL.
+
+Many clients can share one bridge: requests posted with a session-id are
+given bridge-wide ids before they reach the child, and each response is
+delivered only to the session that asked for it (with its original id).
+Notifications and server-initiated requests go to every session.
+
+In the other direction (`--sse URL`) the bridge reads JSON-RPC lines from its
+own stdin, POSTs them concurrently to the endpoint announced by the remote
+server, and writes every `message` event to stdout.
 """
 
 # Future
@@ -46,12 +55,14 @@ from __future__ import annotations
 import argparse
 import asyncio
 from contextlib import suppress
+import itertools
 import json
 import logging
 import shlex
 import signal
 import sys
-from typing import AsyncIterator, List, Optional, Sequence
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin
 import uuid
 
 # Third-Party
@@ -60,6 +71,9 @@ from fastapi.responses import PlainTextResponse
 from sse_starlette.sse import EventSourceResponse
 import uvicorn
 
+# First-Party
+from mcpgateway import __version__
+
 # Conditional imports
 try:
     # Third-Party
@@ -75,66 +89,324 @@ except ImportError:
 
 LOGGER = logging.getLogger("mcpgateway.translate")
 KEEP_ALIVE_INTERVAL = 30  # seconds - matches the reference implementation
+READ_CHUNK_SIZE = 256 * 1024  # bytes per pipe read; lines may be longer than this
+MAX_PENDING_REQUESTS = 10000  # unanswered requests remembered for routing
+DRAIN_TIMEOUT = 30  # seconds to wait for outstanding responses once stdin closes
+RESTART_BACKOFF_INITIAL = 1.0  # seconds before restarting a crashed pool child
+RESTART_BACKOFF_MAX = 30.0  # backoff cap; a child that ran this long resets it
+QUEUE_SIZE = 1024  # messages buffered per SSE client
+SLOW_CONSUMER_POLICIES = ("disconnect", "drop-oldest", "block")
+BLOCK_TIMEOUT = 30  # seconds a "block" publish waits for a full client before disconnecting it
+BRIDGE_SESSION = "bridge"  # pseudo-session of the pool's own handshakes; replies are discarded uncounted
+# Messages that depend on per-connection state and must reach the session's own child
+SESSION_METHODS = frozenset(
+    {
+        "initialize",
+        "notifications/initialized",
+        "notifications/roots/list_changed",
+        "resources/subscribe",
+        "resources/unsubscribe",
+        "logging/setLevel",
+    }
+)
 __all__ = ["main"]  # for console-script entry-point
 
 
+# ---------------------------------------------------------------------------#
+# Helpers - line framing & JSON-RPC inspection                               #
+# ---------------------------------------------------------------------------#
+async def _read_lines(reader: asyncio.StreamReader, chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield the lines of a stream using large reads.
+
+    Unlike ``StreamReader.readline`` there is no line-length limit, and one
+    read frames every line it contains: lines are sliced out of a single
+    buffer that is compacted once per read rather than once per line. A
+    final line without a trailing newline is yielded at EOF.
+
+    Args:
+        reader: Stream to read from.
+        chunk_size: Bytes requested per read.
+
+    Yields:
+        bytes: One line, without its trailing newline.
+
+    Examples:
+        >>> async def demo():
+        ...     reader = asyncio.StreamReader()
+        ...     reader.feed_data(b'{"id":1}\\n{"id"')
+        ...     reader.feed_data(b':2}\\n{"id":3}')
+        ...     reader.feed_eof()
+        ...     return [line async for line in _read_lines(reader, chunk_size=4)]
+        >>> asyncio.run(demo())
+        [b'{"id":1}', b'{"id":2}', b'{"id":3}']
+    """
+    buf = bytearray()
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            break
+        scan = len(buf)  # the buffered tail holds no newline
+        buf += chunk
+        start = 0
+        while (end := buf.find(b"\n", scan)) != -1:
+            yield bytes(buf[start:end])
+            start = scan = end + 1
+        if start:
+            del buf[:start]
+    if buf:
+        yield bytes(buf)
+
+
+def _frames(message: Any) -> List[Dict[str, Any]]:
+    """Return the JSON-RPC objects in a message or batch.
+
+    Args:
+        message: A decoded JSON-RPC message or batch.
+
+    Returns:
+        List[Dict[str, Any]]: The message objects.
+
+    Examples:
+        >>> _frames({"id": 1})
+        [{'id': 1}]
+        >>> _frames([{"id": 1}, "junk", {"id": 2}])
+        [{'id': 1}, {'id': 2}]
+    """
+    items = message if isinstance(message, list) else [message]
+    return [item for item in items if isinstance(item, dict)]
+
+
+def _request_ids(message: Any) -> List[Any]:
+    """Return the ids of the requests (not notifications or responses) in a message.
+
+    Args:
+        message: A decoded JSON-RPC message or batch.
+
+    Returns:
+        List[Any]: Request ids.
+
+    Examples:
+        >>> _request_ids([{"id": 1, "method": "a"}, {"method": "notifications/x"}, {"id": 2, "result": {}}])
+        [1]
+    """
+    return [item["id"] for item in _frames(message) if "method" in item and isinstance(item.get("id"), (str, int))]
+
+
+def _session_bound(message: Any) -> bool:
+    """Whether a message must go to the child that holds the session's state.
+
+    Args:
+        message: A decoded JSON-RPC message or batch.
+
+    Returns:
+        bool: True for session methods and for responses to server requests.
+
+    Examples:
+        >>> _session_bound({"id": 1, "method": "initialize"}), _session_bound({"id": 1, "method": "tools/call"})
+        (True, False)
+        >>> _session_bound({"id": 7, "result": {}})
+        True
+    """
+    return any(item.get("method") is None or item["method"] in SESSION_METHODS for item in _frames(message))
+
+
+def _error_response(request_id: Any, message: str) -> str:
+    """Serialise a JSON-RPC error answering ``request_id``.
+
+    Args:
+        request_id: Id of the failed request.
+        message: Error message.
+
+    Returns:
+        str: The JSON-RPC error response.
+
+    Examples:
+        >>> _error_response(3, "gone")
+        '{"jsonrpc": "2.0", "id": 3, "error": {"code": -32000, "message": "gone"}}'
+    """
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "error": {"code": -32000, "message": message}})
+
+
 # ---------------------------------------------------------------------------#
 # Helpers - trivial in-process Pub/Sub                                       #
 # ---------------------------------------------------------------------------#
 class _PubSub:
-    """Very small fan-out helper - one async Queue per subscriber."""
+    """Very small fan-out helper - one async Queue per subscriber.
+
+    Subscribers may register under a session id so that messages meant for a
+    single client (JSON-RPC responses) are delivered to that client only.
+
+    Each queue holds at most ``maxsize`` messages. When a client falls that far
+    behind, ``policy`` decides what happens:
+
+    - ``disconnect``: the client's stream is closed (the client may reconnect)
+    - ``drop-oldest``: the oldest queued message is discarded to make room
+    - ``block``: the publisher waits for room, up to ``block_timeout`` seconds,
+      then disconnects the client. Waiting pushes back on the stdio server.
+
+    Examples:
+        >>> import asyncio
+        >>> ps = _PubSub(policy="drop-oldest", maxsize=2)
+        >>> q = ps.subscribe("s1")
+        >>> for n in range(3):
+        ...     asyncio.run(ps.publish(str(n)))
+        >>> [q.get_nowait() for _ in range(q.qsize())], ps.stats()["dropped"]
+        (['1', '2'], 1)
+    """
 
-    def __init__(self) -> None:
-        self._subscribers: List[asyncio.Queue[str]] = []
+    def __init__(self, policy: str = "disconnect", maxsize: int = QUEUE_SIZE, block_timeout: float = BLOCK_TIMEOUT) -> None:
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+        self._policy = policy
+        self._maxsize = maxsize
+        self._block_timeout = block_timeout
+        self._subscribers: List[asyncio.Queue[Optional[str]]] = []
+        self._sessions: Dict[str, asyncio.Queue[Optional[str]]] = {}
+        self.dropped = 0
+        self.disconnected = 0
 
-    async def publish(self, data: str) -> None:
-        """Publish data to all subscribers.
+    async def publish(self, data: str, session_id: Optional[str] = None) -> None:
+        """Publish data to one session, or to all subscribers.
 
         Args:
-            data: The data string to publish to all subscribers.
+            data: The data string to publish.
+            session_id: Session to deliver to; None broadcasts to every subscriber.
         """
-        dead: List[asyncio.Queue[str]] = []
-        for q in self._subscribers:
+        if session_id is None:
+            targets = list(self._subscribers)
+        elif session_id in self._sessions:
+            targets = [self._sessions[session_id]]
+        else:
+            LOGGER.debug("Dropping message for closed session %s", session_id)
+            self.dropped += 1
+            return
+        blocked: List[asyncio.Queue[Optional[str]]] = []
+        for q in targets:
             try:
                 q.put_nowait(data)
+                continue
             except asyncio.QueueFull:
-                dead.append(q)
-        for q in dead:
-            with suppress(ValueError):
-                self._subscribers.remove(q)
+                pass
+            if self._policy == "drop-oldest":
+                q.get_nowait()
+                q.put_nowait(data)
+                self.dropped += 1
+            elif self._policy == "block":
+                blocked.append(q)
+            else:
+                self._disconnect(q)
+        if blocked:
+            await asyncio.gather(*(self._put_waiting(q, data) for q in blocked))
+
+    async def _put_waiting(self, q: "asyncio.Queue[Optional[str]]", data: str) -> None:
+        """Wait for room in a full queue, disconnecting the client if none appears in time.
+
+        Args:
+            q: The full queue.
+            data: The data string to publish.
+        """
+        try:
+            await asyncio.wait_for(q.put(data), self._block_timeout)
+        except asyncio.TimeoutError:
+            self._disconnect(q)
+
+    def _disconnect(self, q: "asyncio.Queue[Optional[str]]") -> None:
+        """Drop a subscriber that fell too far behind and tell its stream to close.
 
-    def subscribe(self) -> "asyncio.Queue[str]":
+        Args:
+            q: The subscriber's queue.
+        """
+        LOGGER.warning("Disconnecting slow SSE client (%d messages queued)", q.qsize())
+        self.dropped += q.qsize() + 1
+        self.disconnected += 1
+        self.unsubscribe(q)
+        with suppress(asyncio.QueueFull):
+            q.put_nowait(None)  # end-of-stream marker for the SSE generator
+
+    def subscribe(self, session_id: Optional[str] = None) -> "asyncio.Queue[Optional[str]]":
         """Subscribe to published data.
 
+        Args:
+            session_id: Optional session id to receive session-addressed messages under.
+
         Returns:
-            asyncio.Queue[str]: A queue that will receive published data.
+            asyncio.Queue[Optional[str]]: A queue that will receive published data; None means the stream was closed.
         """
-        q: asyncio.Queue[str] = asyncio.Queue(maxsize=1024)
+        q: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=self._maxsize)
         self._subscribers.append(q)
+        if session_id is not None:
+            self._sessions[session_id] = q
         return q
 
-    def unsubscribe(self, q: "asyncio.Queue[str]") -> None:
+    def unsubscribe(self, q: "asyncio.Queue[Optional[str]]") -> None:
         """Unsubscribe from published data.
 
+        Any queued messages are discarded, which also releases a publisher
+        blocked on the queue.
+
         Args:
             q: The queue to unsubscribe from published data.
         """
         with suppress(ValueError):
             self._subscribers.remove(q)
+        for session_id in [sid for sid, sq in self._sessions.items() if sq is q]:
+            del self._sessions[session_id]
+        while not q.empty():
+            q.get_nowait()
+
+    def is_subscribed(self, session_id: str) -> bool:
+        """Whether a session still has a subscriber.
+
+        Args:
+            session_id: Session to look up.
+
+        Returns:
+            bool: True if messages for the session would be delivered.
+        """
+        return session_id in self._sessions
+
+    def stats(self) -> Dict[str, Any]:
+        """Report subscribers and slow-consumer counters.
+
+        Returns:
+            Dict[str, Any]: Subscriber and session counts, the policy, messages dropped and clients disconnected.
+        """
+        return {
+            "subscribers": len(self._subscribers),
+            "sessions": len(self._sessions),
+            "policy": self._policy,
+            "dropped": self.dropped,
+            "disconnected": self.disconnected,
+        }
 
 
 # ---------------------------------------------------------------------------#
 # StdIO endpoint (child process ↔ async queues)                              #
 # ---------------------------------------------------------------------------#
 class StdIOEndpoint:
-    """Wrap a child process whose stdin/stdout speak line-delimited JSON-RPC."""
+    """Wrap a child process whose stdin/stdout speak line-delimited JSON-RPC.
 
-    def __init__(self, cmd: str, pubsub: _PubSub) -> None:
+    Requests forwarded on behalf of a session get bridge-wide ids, so clients
+    that reuse the same ids cannot collide; the child's responses are routed
+    back to the originating session with the client's id restored, and
+    cancellations are translated to the bridge id of the request they cancel.
+
+    A named endpoint (a pool child) prefixes the ids of requests the
+    subprocess sends to clients with its name, so replies from clients can be
+    told apart from other children's and returned to this one.
+    """
+
+    def __init__(self, cmd: str, pubsub: _PubSub, name: Optional[str] = None) -> None:
         self._cmd = cmd
+        self._name = name
         self._pubsub = pubsub
         self._proc: Optional[asyncio.subprocess.Process] = None
         self._stdin: Optional[asyncio.StreamWriter] = None
         self._pump_task: Optional[asyncio.Task[None]] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Tuple[str, Any]] = {}  # bridge id -> (session id, client id)
+        self._bridge_ids: Dict[Tuple[str, Any], int] = {}  # (session id, client id) -> bridge id
+        self._server_requests: Dict[str, Any] = {}  # prefixed id -> the subprocess's own request id
 
     async def start(self) -> None:
         """Start the stdio subprocess.
@@ -181,31 +453,340 @@ class StdIOEndpoint:
         self._stdin.write(raw.encode())
         await self._stdin.drain()
 
+    @property
+    def alive(self) -> bool:
+        """Whether the subprocess is running.
+
+        Returns:
+            bool: True between a successful start and the process exiting.
+        """
+        return self._proc is not None and self._proc.returncode is None
+
+    @property
+    def in_flight(self) -> int:
+        """Requests forwarded to the subprocess and not yet answered.
+
+        Returns:
+            int: Number of outstanding requests.
+        """
+        return len(self._pending)
+
+    async def wait(self) -> Optional[int]:
+        """Wait for the subprocess to exit.
+
+        Returns:
+            Optional[int]: Its exit code, or None if it was never started.
+        """
+        if self._proc is None:
+            return None
+        return await self._proc.wait()
+
+    async def fail_pending(self, reason: str) -> None:
+        """Answer every outstanding request with an error, e.g. after the subprocess died.
+
+        Args:
+            reason: Error message sent to the waiting sessions.
+        """
+        pending, self._pending = self._pending, {}
+        self._bridge_ids.clear()
+        for session_id, request_id in pending.values():
+            await self._pubsub.publish(_error_response(request_id, reason), session_id)
+
+    async def forward(self, message: Any, session_id: str) -> None:
+        """Send a client's JSON-RPC message (or batch) to the subprocess.
+
+        Requests are renumbered with bridge-wide ids and remembered, so their
+        responses can be returned to ``session_id``; ``notifications/cancelled``
+        is rewritten to name the bridge id of the request it cancels. The call
+        does not wait for a response, so any number of requests can be in
+        flight at once.
+
+        Args:
+            message: The decoded JSON-RPC message or batch.
+            session_id: Session the message was posted for.
+        """
+        for item in _frames(message):
+            if "method" in item and item.get("id") is not None:
+                bridge_id = next(self._ids)
+                if len(self._pending) >= MAX_PENDING_REQUESTS:
+                    # Forget the oldest unanswered request rather than grow without bound
+                    self._bridge_ids.pop(self._pending.pop(next(iter(self._pending))), None)
+                self._pending[bridge_id] = (session_id, item["id"])
+                self._bridge_ids[(session_id, item["id"])] = bridge_id
+                item["id"] = bridge_id
+            elif item.get("method") == "notifications/cancelled" and isinstance(item.get("params"), dict):
+                bridge_id = self.bridge_id(session_id, item["params"].get("requestId"))
+                if bridge_id is not None:
+                    item["params"]["requestId"] = bridge_id
+            elif "method" not in item and self.owns_server_request(item.get("id")):
+                item["id"] = self._server_requests.pop(item["id"])
+        await self.send(json.dumps(message, separators=(",", ":")) + "\n")
+
+    def bridge_id(self, session_id: str, request_id: Any) -> Optional[int]:
+        """Find the bridge id of a session's unanswered request.
+
+        Args:
+            session_id: Session that sent the request.
+            request_id: The client's id for it.
+
+        Returns:
+            Optional[int]: The id the subprocess knows it by, or None if it is not pending here.
+        """
+        if not isinstance(request_id, (str, int)):
+            return None
+        return self._bridge_ids.get((session_id, request_id))
+
+    def owns_server_request(self, request_id: Any) -> bool:
+        """Whether a client's reply answers a request this subprocess sent.
+
+        Args:
+            request_id: Id of the reply.
+
+        Returns:
+            bool: True if the id was issued by this endpoint and not answered yet.
+        """
+        return isinstance(request_id, str) and request_id in self._server_requests
+
+    def _tag_server_requests(self, message: Any) -> bool:
+        """Prefix the ids of the subprocess's own requests with the endpoint name.
+
+        Args:
+            message: A decoded message from the subprocess.
+
+        Returns:
+            bool: True if any id was rewritten.
+        """
+        tagged = False
+        for item in _frames(message):
+            if "method" in item and isinstance(item.get("id"), (str, int)):
+                if len(self._server_requests) >= MAX_PENDING_REQUESTS:
+                    self._server_requests.pop(next(iter(self._server_requests)))
+                prefixed = f"{self._name}/{item['id']}"
+                self._server_requests[prefixed] = item["id"]
+                item["id"] = prefixed
+                tagged = True
+        return tagged
+
+    def _route(self, message: Any) -> Optional[str]:
+        """Restore the client ids in a response (or batch) and find its session.
+
+        Args:
+            message: A decoded message from the subprocess.
+
+        Returns:
+            Optional[str]: Session the message answers, or None if it should be broadcast.
+        """
+        session_id = None
+        for item in _frames(message):
+            bridge_id = item.get("id")
+            if "method" not in item and isinstance(bridge_id, int) and bridge_id in self._pending:
+                session_id, item["id"] = self._pending.pop(bridge_id)
+                self._bridge_ids.pop((session_id, item["id"]), None)
+        return session_id
+
     async def _pump_stdout(self) -> None:
         """Pump stdout from subprocess to pubsub.
 
         Continuously reads lines from the subprocess stdout and publishes them
-        to the pubsub system.
+        to the pubsub system: responses to the session that sent the request,
+        everything else to all subscribers. Replies to the bridge's own
+        handshakes are discarded.
 
         Raises:
             asyncio.CancelledError: If the pump task is cancelled.
         """
         assert self._proc and self._proc.stdout
-        reader = self._proc.stdout
         try:
-            while True:
-                line = await reader.readline()
-                if not line:  # EOF
-                    break
+            async for line in _read_lines(self._proc.stdout):
+                if not line.strip():
+                    continue
+                session_id = None
+                if self._pending or (self._name is not None and b'"method"' in line and b'"id"' in line):
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        message = None
+                    if message is not None:
+                        session_id = self._route(message)
+                        tagged = self._name is not None and self._tag_server_requests(message)
+                        if session_id is not None or tagged:
+                            line = json.dumps(message, separators=(",", ":")).encode()
                 text = line.decode(errors="replace")
-                LOGGER.debug("← stdio: %s", text.strip())
-                await self._pubsub.publish(text)
+                LOGGER.debug("← stdio: %s", text)
+                if session_id == BRIDGE_SESSION:
+                    # Reply to the bridge's own handshake: nobody waits for it, and it is not a lost message
+                    continue
+                await self._pubsub.publish(text, session_id)
         except asyncio.CancelledError:
             raise
         except Exception:  # pragma: no cover --best-effort logging
             LOGGER.exception("stdout pump crashed - terminating bridge")
 
 
+# ---------------------------------------------------------------------------#
+# StdIO pool (N children behind one bridge)                                  #
+# ---------------------------------------------------------------------------#
+class StdIOPool:
+    """Several copies of a stdio server behind one bridge.
+
+    Session-bound messages (``initialize``, subscriptions, log level, ...) go
+    to the child the session is pinned to; it is pinned to the least busy
+    child on first contact. Stateless calls go to whichever live child has the
+    fewest requests in flight. Cancellations, and replies to requests a child
+    sent to clients, go to the child that owns the request they refer to. The bridge runs
+    the MCP handshake itself on every child it starts, so any child can serve
+    a stateless call. A child that exits is restarted with exponential
+    backoff, and its outstanding requests are answered with an error.
+
+    Exposes the same ``start``/``stop``/``send``/``forward`` interface as
+    ``StdIOEndpoint``.
+    """
+
+    def __init__(self, cmd: str, pubsub: _PubSub, size: int) -> None:
+        self._pubsub = pubsub
+        self._children = [StdIOEndpoint(cmd, pubsub, name=str(index)) for index in range(max(1, size))]
+        self._affinity: Dict[str, StdIOEndpoint] = {}
+        self._supervisors: List[asyncio.Task[None]] = []
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Start every child and a supervisor task for each."""
+        for child in self._children:
+            await self._launch(child)
+        self._supervisors = [asyncio.create_task(self._supervise(child)) for child in self._children]
+
+    async def stop(self) -> None:
+        """Stop the supervisors, then every child."""
+        self._stopping = True
+        for task in self._supervisors:
+            task.cancel()
+        for child in self._children:
+            await child.stop()
+
+    async def _launch(self, child: StdIOEndpoint) -> None:
+        """Start a child and run the MCP handshake on it.
+
+        Args:
+            child: The child to start.
+        """
+        await child.start()
+        initialize = {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "initialize",
+            "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "mcpgateway-translate", "version": __version__}},
+        }
+        await child.forward(initialize, BRIDGE_SESSION)
+        await child.send('{"jsonrpc":"2.0","method":"notifications/initialized"}\n')
+
+    async def _supervise(self, child: StdIOEndpoint) -> None:
+        """Restart a child whenever it exits, backing off while it keeps crashing.
+
+        Args:
+            child: The child to watch.
+        """
+        loop = asyncio.get_running_loop()
+        delay = RESTART_BACKOFF_INITIAL
+        while not self._stopping:
+            started = loop.time()
+            code = await child.wait()
+            if self._stopping:
+                return
+            await child.fail_pending(f"stdio server exited with code {code}")
+            if loop.time() - started >= RESTART_BACKOFF_MAX:
+                delay = RESTART_BACKOFF_INITIAL
+            LOGGER.warning("stdio server exited with code %s; restarting in %.1fs", code, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RESTART_BACKOFF_MAX)
+            try:
+                await self._launch(child)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.error("Failed to restart stdio server: %s", exc)
+
+    def _owner(self, item: Dict[str, Any], session_id: str) -> Optional[StdIOEndpoint]:
+        """Find the child a cancellation or a reply to a server request belongs to.
+
+        Args:
+            item: One JSON-RPC object posted by the client.
+            session_id: Session it was posted for.
+
+        Returns:
+            Optional[StdIOEndpoint]: The child holding the referenced request, or None.
+        """
+        if "method" not in item:
+            return next((child for child in self._children if child.owns_server_request(item.get("id"))), None)
+        if item["method"] == "notifications/cancelled" and isinstance(item.get("params"), dict):
+            request_id = item["params"].get("requestId")
+            return next((child for child in self._children if child.bridge_id(session_id, request_id) is not None), None)
+        return None
+
+    def _pick(self, message: Any, session_id: Optional[str]) -> Optional[StdIOEndpoint]:
+        """Choose the child for a message.
+
+        Args:
+            message: The decoded JSON-RPC message or batch.
+            session_id: Session the message was posted for, if any.
+
+        Returns:
+            Optional[StdIOEndpoint]: The child, or None if no child is running.
+        """
+        live = [child for child in self._children if child.alive]
+        if not live:
+            return None
+        if session_id is None or not _session_bound(message):
+            return min(live, key=lambda child: child.in_flight)
+        child = self._affinity.get(session_id)
+        if child is None or not child.alive:
+            if len(self._affinity) >= MAX_PENDING_REQUESTS:
+                self._affinity = {sid: c for sid, c in self._affinity.items() if self._pubsub.is_subscribed(sid)}
+            child = self._affinity[session_id] = min(live, key=lambda c: c.in_flight)
+        return child
+
+    async def send(self, raw: str) -> None:
+        """Send a message that belongs to no session to the least busy child.
+
+        Args:
+            raw: The raw data string to send.
+
+        Raises:
+            RuntimeError: If no child is running.
+        """
+        child = self._pick(None, None)
+        if child is None:
+            raise RuntimeError("no stdio server running")
+        await child.send(raw)
+
+    async def forward(self, message: Any, session_id: str) -> None:
+        """Send a client's JSON-RPC message to the child chosen for it.
+
+        Cancellations and replies to server requests are split out of a batch
+        and sent to the child that owns the request they refer to; they get no
+        response, so the rest of the batch is answered as before.
+
+        Args:
+            message: The decoded JSON-RPC message or batch.
+            session_id: Session the message was posted for.
+        """
+        frames = _frames(message)
+        rest = []
+        for item in frames:
+            owner = self._owner(item, session_id)
+            if owner is not None:
+                await owner.forward(item, session_id)
+            else:
+                rest.append(item)
+        if len(rest) < len(frames):
+            if not rest:
+                return
+            message = rest
+        child = self._pick(message, session_id)
+        if child is None:
+            for request_id in _request_ids(message):
+                await self._pubsub.publish(_error_response(request_id, "No stdio server is running"), session_id)
+            return
+        await child.forward(message, session_id)
+
+
 # ---------------------------------------------------------------------------#
 # FastAPI app exposing /sse  &  /message                                     #
 # ---------------------------------------------------------------------------#
@@ -213,7 +794,7 @@ class StdIOEndpoint:
 
 def _build_fastapi(
     pubsub: _PubSub,
-    stdio: StdIOEndpoint,
+    stdio: StdIOEndpoint | StdIOPool,
     keep_alive: int = KEEP_ALIVE_INTERVAL,
     sse_path: str = "/sse",
     message_path: str = "/message",
@@ -223,7 +804,7 @@ def _build_fastapi(
 
     Args:
         pubsub: The publish/subscribe system for message routing.
-        stdio: The stdio endpoint for subprocess communication.
+        stdio: The stdio endpoint (or pool) for subprocess communication.
         keep_alive: Interval in seconds for keepalive messages. Defaults to KEEP_ALIVE_INTERVAL.
         sse_path: Path for the SSE endpoint. Defaults to "/sse".
         message_path: Path for the message endpoint. Defaults to "/message".
@@ -258,8 +839,8 @@ def _build_fastapi(
             messages from the child process and emits periodic ``keepalive``
             frames so that clients and proxies do not time out.
         """
-        queue = pubsub.subscribe()
         session_id = uuid.uuid4().hex
+        queue = pubsub.subscribe(session_id)
 
         async def event_gen() -> AsyncIterator[dict]:
             # 1️⃣ Mandatory "endpoint" bootstrap required by the MCP spec
@@ -280,6 +861,8 @@ def _build_fastapi(
 
                     try:
                         msg = await asyncio.wait_for(queue.get(), keep_alive)
+                        if msg is None:  # closed by the slow-consumer policy
+                            break
                         yield {"event": "message", "data": msg.rstrip()}
                     except asyncio.TimeoutError:
                         yield {
@@ -315,16 +898,19 @@ def _build_fastapi(
             Response: ``202 Accepted`` if the payload is forwarded successfully,
             or ``400 Bad Request`` when the body is not valid JSON.
         """
-        _ = session_id  # Unused but required for API compatibility
         payload = await raw.body()
         try:
-            json.loads(payload)  # validate
+            message = json.loads(payload)
         except Exception as exc:  # noqa: BLE001
             return PlainTextResponse(
                 f"Invalid JSON payload: {exc}",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
-        await stdio.send(payload.decode().rstrip() + "\n")
+        if session_id:
+            # Responses are routed back to this session's SSE stream
+            await stdio.forward(message, session_id)
+        else:
+            await stdio.send(payload.decode().rstrip() + "\n")
         return PlainTextResponse("forwarded", status_code=status.HTTP_202_ACCEPTED)
 
     # ----- Liveness ---------------------------------------------------------#
@@ -337,6 +923,15 @@ def _build_fastapi(
         """
         return PlainTextResponse("ok")
 
+    @app.get("/stats")
+    async def stats() -> Dict[str, Any]:  # noqa: D401
+        """Fan-out statistics.
+
+        Returns:
+            Dict[str, Any]: Connected clients and slow-consumer counters.
+        """
+        return pubsub.stats()
+
     return app
 
 
@@ -363,10 +958,23 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
     )
     src = p.add_mutually_exclusive_group(required=True)
     src.add_argument("--stdio", help='Command to run, e.g. "uv run mcp-server-git"')
-    src.add_argument("--sse", help="Remote SSE endpoint URL")
+    src.add_argument("--sse", help="Remote SSE endpoint URL to serve on stdin/stdout")
     src.add_argument("--streamableHttp", help="[NOT IMPLEMENTED]")
 
     p.add_argument("--port", type=int, default=8000, help="HTTP port to bind")
+    p.add_argument(
+        "--poolSize",
+        type=int,
+        default=1,
+        help="Number of copies of the --stdio command to run behind the bridge",
+    )
+    p.add_argument(
+        "--slowConsumer",
+        default="disconnect",
+        choices=SLOW_CONSUMER_POLICIES,
+        help="What to do when an SSE client falls --queueSize messages behind",
+    )
+    p.add_argument("--queueSize", type=int, default=QUEUE_SIZE, help="Messages buffered per SSE client")
     p.add_argument(
         "--logLevel",
         default="info",
@@ -389,7 +997,15 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
     return args
 
 
-async def _run_stdio_to_sse(cmd: str, port: int, log_level: str = "info", cors: Optional[List[str]] = None) -> None:
+async def _run_stdio_to_sse(
+    cmd: str,
+    port: int,
+    log_level: str = "info",
+    cors: Optional[List[str]] = None,
+    pool_size: int = 1,
+    slow_consumer: str = "disconnect",
+    queue_size: int = QUEUE_SIZE,
+) -> None:
     """Run stdio to SSE bridge.
 
     Args:
@@ -397,9 +1013,12 @@ async def _run_stdio_to_sse(cmd: str, port: int, log_level: str = "info", cors:
         port: The port to bind the HTTP server to.
         log_level: The logging level to use. Defaults to "info".
         cors: Optional list of CORS allowed origins.
+        pool_size: Number of copies of the command to run. Defaults to 1.
+        slow_consumer: Policy for SSE clients whose queue is full. Defaults to "disconnect".
+        queue_size: Messages buffered per SSE client. Defaults to QUEUE_SIZE.
     """
-    pubsub = _PubSub()
-    stdio = StdIOEndpoint(cmd, pubsub)
+    pubsub = _PubSub(slow_consumer, queue_size)
+    stdio = StdIOPool(cmd, pubsub, pool_size) if pool_size > 1 else StdIOEndpoint(cmd, pubsub)
     await stdio.start()
 
     app = _build_fastapi(pubsub, stdio, cors_origins=cors)
@@ -432,12 +1051,44 @@ async def _run_stdio_to_sse(cmd: str, port: int, log_level: str = "info", cors:
     await _shutdown()  # final cleanup
 
 
-async def _run_sse_to_stdio(url: str, oauth2_bearer: Optional[str]) -> None:
+async def _stdin_reader() -> asyncio.StreamReader:
+    """Wrap this process' stdin in an asyncio stream.
+
+    Returns:
+        asyncio.StreamReader: Reader over stdin.
+    """
+    reader = asyncio.StreamReader()
+    loop = asyncio.get_running_loop()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    return reader
+
+
+def _emit(data: str) -> None:
+    """Write one JSON-RPC message to stdout.
+
+    Args:
+        data: The serialised message.
+    """
+    sys.stdout.write(data + "\n")
+    sys.stdout.flush()
+
+
+async def _run_sse_to_stdio(url: str, oauth2_bearer: Optional[str], stdin: Optional[asyncio.StreamReader] = None) -> None:
     """Run SSE to stdio bridge.
 
+    Subscribes to a remote MCP SSE endpoint and serves it on this process'
+    stdin/stdout. The ``endpoint`` event names the URL that JSON-RPC lines
+    read from stdin are POSTed to, and every ``message`` event is written to
+    stdout. Lines are posted concurrently, so a slow request does not hold up
+    the ones behind it; responses arrive over the SSE stream in whatever order
+    the server completes them. A request whose POST fails is answered locally
+    with a JSON-RPC error. Once stdin closes, the bridge waits up to
+    ``DRAIN_TIMEOUT`` seconds for outstanding responses before returning.
+
     Args:
         url: The SSE endpoint URL to connect to.
         oauth2_bearer: Optional OAuth2 bearer token for authentication.
+        stdin: Stream to read JSON-RPC lines from. Defaults to this process' stdin.
 
     Raises:
         ImportError: If httpx package is not available.
@@ -449,36 +1100,88 @@ async def _run_sse_to_stdio(url: str, oauth2_bearer: Optional[str]) -> None:
     if oauth2_bearer:
         headers["Authorization"] = f"Bearer {oauth2_bearer}"
 
-    async with httpx.AsyncClient(headers=headers, timeout=None) as client:
-        process = await asyncio.create_subprocess_shell(
-            "cat",  # Placeholder command; replace with actual stdio server command if needed
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=sys.stderr,
-        )
+    endpoint: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    pending: set = set()  # ids of requests still waiting for a response
+    drained = asyncio.Event()
 
-        async def read_stdout():
-            assert process.stdout
-            while True:
-                line = await process.stdout.readline()
-                if not line:
-                    break
-                print(line.decode().rstrip())
+    def settle(ids: List[Any]) -> None:
+        for request_id in ids:
+            pending.discard(request_id)
+        if not pending:
+            drained.set()
 
-        async def pump_sse_to_stdio():
+    async with httpx.AsyncClient(headers=headers, timeout=None) as client:
+
+        async def post(line: bytes, ids: List[Any]) -> None:
+            try:
+                response = await client.post(endpoint.result(), content=line, headers={"Content-Type": "application/json"})
+                response.raise_for_status()
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("POST to %s failed: %s", endpoint.result(), exc)
+                for request_id in ids:
+                    _emit(_error_response(request_id, f"Bridge could not deliver request: {exc}"))
+                settle(ids)
+
+        async def pump_sse_to_stdout() -> None:
             async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                event, data = "message", []
                 async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        if data and data != "{}":
-                            if process.stdin:
-                                process.stdin.write((data + "\n").encode())
-                                await process.stdin.drain()
-
-        await asyncio.gather(read_stdout(), pump_sse_to_stdio())
-
-
-def start_stdio(cmd, port, log_level, cors):
+                    if line:
+                        field, _, value = line.partition(":")
+                        value = value[1:] if value.startswith(" ") else value
+                        if field == "event":
+                            event = value
+                        elif field == "data":
+                            data.append(value)
+                        continue
+                    payload = "\n".join(data)
+                    if event == "endpoint" and not endpoint.done():
+                        endpoint.set_result(urljoin(url, payload.strip()))
+                        LOGGER.info("Posting messages to %s", endpoint.result())
+                    elif event == "message" and payload:
+                        if pending:
+                            with suppress(ValueError):
+                                message = json.loads(payload)
+                                settle([item.get("id") for item in _frames(message) if "method" not in item and isinstance(item.get("id"), (str, int))])
+                        _emit(payload)
+                    event, data = "message", []
+            LOGGER.info("SSE stream closed")
+
+        async def pump_stdin_to_sse() -> None:
+            await endpoint
+            reader = stdin or await _stdin_reader()
+            posts: set = set()
+            async for line in _read_lines(reader):
+                if not line.strip():
+                    continue
+                try:
+                    ids = _request_ids(json.loads(line))
+                except ValueError:
+                    LOGGER.warning("Ignoring invalid JSON on stdin: %r", line[:200])
+                    continue
+                pending.update(ids)
+                if ids:
+                    drained.clear()
+                task = asyncio.create_task(post(line, ids))
+                posts.add(task)
+                task.add_done_callback(posts.discard)
+            if posts:
+                await asyncio.gather(*posts)
+            if pending:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(drained.wait(), DRAIN_TIMEOUT)
+
+        tasks = [asyncio.create_task(pump_sse_to_stdout()), asyncio.create_task(pump_stdin_to_sse())]
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            task.result()  # surface connection errors
+
+
+def start_stdio(cmd, port, log_level, cors, pool_size=1, slow_consumer="disconnect", queue_size=QUEUE_SIZE):
     """Start stdio bridge.
 
     Args:
@@ -486,11 +1189,14 @@ def start_stdio(cmd, port, log_level, cors):
         port: The port to bind the HTTP server to.
         log_level: The logging level to use.
         cors: Optional list of CORS allowed origins.
+        pool_size: Number of copies of the command to run.
+        slow_consumer: Policy for SSE clients whose queue is full.
+        queue_size: Messages buffered per SSE client.
 
     Returns:
         None: This function does not return a value.
     """
-    return asyncio.run(_run_stdio_to_sse(cmd, port, log_level, cors))
+    return asyncio.run(_run_stdio_to_sse(cmd, port, log_level, cors, pool_size, slow_consumer, queue_size))
 
 
 def start_sse(url, bearer):
@@ -519,7 +1225,7 @@ def main(argv: Optional[Sequence[str]] | None = None) -> None:
     )
     try:
         if args.stdio:
-            start_stdio(args.stdio, args.port, args.logLevel, args.cors)
+            start_stdio(args.stdio, args.port, args.logLevel, args.cors, args.poolSize, args.slowConsumer, args.queueSize)
         elif args.sse:
             start_sse(args.sse, args.oauth2Bearer)
     except KeyboardInterrupt:
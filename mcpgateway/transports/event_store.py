@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""Event Stores for Streamable HTTP Resumability.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Keval Mahajan
+
+A stateful streamable HTTP session stores every server message in an event
+store before sending it, so that a client which lost its SSE stream can
+reconnect with ``Last-Event-ID`` and have the missed messages replayed.
+
+Two stores are available, selected with ``EVENT_STORE_TYPE``:
+- memory: events live in this process (default, no dependencies)
+- redis: events live in Redis Streams, shared by every worker and replica,
+  and survive a worker restart
+
+Event IDs have the form ``<namespace>:<stream id>:<sequence>``. The
+namespace identifies the MCP session (the SDK's stream IDs, such as
+``_GET_stream`` or a request id, repeat across sessions), and the sequence
+increases within a stream. Replay therefore goes straight to the stream
+and position the ID names instead of scanning for it: O(1) in memory and
+O(log n) in a Redis Stream. Both stores keep at most
+``EVENT_STORE_MAX_EVENTS`` events per stream and forget streams that have
+been idle for ``EVENT_STORE_TTL`` seconds.
+
+Examples:
+    >>> import asyncio
+    >>> store = InMemoryEventStore(max_events_per_stream=10)
+    >>> async def demo():
+    ...     first = await store.store_event("s", {"n": 1})
+    ...     await store.store_event("s", {"n": 2})
+    ...     replayed = []
+    ...     async def collect(event):
+    ...         replayed.append(event.message)
+    ...     stream = await store.replay_events_after(first, collect)
+    ...     return first, stream, replayed
+    >>> asyncio.run(demo())
+    ('_:s:1', 's', [{'n': 2}])
+"""
+
+# Standard
+from collections import deque
+import contextvars
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# Third-Party
+from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.types import JSONRPCMessage
+
+try:
+    # Third-Party
+    from redis.asyncio import Redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Namespace of the events stored by the current MCP session. It is set when a
+# request creates a session and inherited by the tasks serving that session.
+event_namespace: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("event_namespace", default=None)
+
+# Streams are swept for expiry at most this often (seconds)
+SWEEP_INTERVAL = 60.0
+
+
+def format_event_id(namespace: str, stream_id: StreamId, sequence: Any) -> EventId:
+    """Build an event ID.
+
+    Args:
+        namespace: Session namespace
+        stream_id: Stream the event belongs to
+        sequence: Position of the event in the stream
+
+    Returns:
+        EventId: ``<namespace>:<stream id>:<sequence>``
+
+    Examples:
+        >>> format_event_id("ab12", "_GET_stream", 7)
+        'ab12:_GET_stream:7'
+    """
+    return f"{namespace}:{stream_id}:{sequence}"
+
+
+def parse_event_id(event_id: EventId) -> Optional[Tuple[str, StreamId, str]]:
+    """Split an event ID into namespace, stream ID and sequence.
+
+    Stream IDs may themselves contain colons; namespaces and sequences never do.
+
+    Args:
+        event_id: Event ID as sent to the client
+
+    Returns:
+        Optional[Tuple[str, StreamId, str]]: The parts, or None if the ID is malformed
+
+    Examples:
+        >>> parse_event_id("ab12:req:1:42")
+        ('ab12', 'req:1', '42')
+        >>> parse_event_id("not-an-event-id") is None
+        True
+    """
+    namespace, sep, rest = event_id.partition(":")
+    stream_id, sep2, sequence = rest.rpartition(":")
+    if not (sep and sep2 and sequence):
+        return None
+    return namespace, stream_id, sequence
+
+
+def _namespace() -> str:
+    """Namespace for events stored in the current context.
+
+    Returns:
+        str: The session's namespace, or "_" outside a session
+    """
+    return event_namespace.get() or "_"
+
+
+@dataclass
+class _Stream:
+    """Events of one stream held in memory."""
+
+    events: Deque[Tuple[int, Any]] = field(default_factory=deque)
+    next_sequence: int = 1
+    touched: float = field(default_factory=time.monotonic)
+
+
+class InMemoryEventStore(EventStore):
+    """Event store holding the most recent events of each stream in this process.
+
+    Resumption only works on the worker that stored the events; use
+    :class:`RedisEventStore` when requests may reach other workers.
+    """
+
+    def __init__(self, max_events_per_stream: int = 100, ttl: float = 3600.0):
+        """Initialize the event store.
+
+        Args:
+            max_events_per_stream: Maximum number of events to keep per stream
+            ttl: Seconds a stream may be idle before it is forgotten
+        """
+        self.max_events_per_stream = max_events_per_stream
+        self.ttl = ttl
+        self.streams: Dict[Tuple[str, StreamId], _Stream] = {}
+        self._last_sweep = time.monotonic()
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        """Store an event under the next sequence number of its stream.
+
+        Args:
+            stream_id: The ID of the stream
+            message: The message to store
+
+        Returns:
+            EventId: The ID of the stored event
+        """
+        now = time.monotonic()
+        self._expire(now)
+        namespace = _namespace()
+        stream = self.streams.get((namespace, stream_id))
+        if stream is None:
+            stream = self.streams[(namespace, stream_id)] = _Stream()
+        sequence = stream.next_sequence
+        stream.next_sequence += 1
+        stream.touched = now
+        stream.events.append((sequence, message))
+        if len(stream.events) > self.max_events_per_stream:
+            stream.events.popleft()
+        return format_event_id(namespace, stream_id, sequence)
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> StreamId | None:
+        """Replay the events of a stream that follow the given event.
+
+        Args:
+            last_event_id: The ID of the last received event
+            send_callback: Async callback to send each replayed event
+
+        Returns:
+            StreamId | None: The stream ID, or None if the event is unknown or has been evicted
+        """
+        parts = parse_event_id(last_event_id)
+        stream = self.streams.get(parts[:2]) if parts and parts[2].isdigit() else None
+        if stream is None or not stream.events or not stream.events[0][0] <= int(parts[2]) < stream.next_sequence:
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+
+        namespace, stream_id, sequence = parts
+        stream.touched = time.monotonic()
+        # Sequences within a stream are consecutive, so the position is computed, not searched for
+        start = int(sequence) - stream.events[0][0] + 1
+        for i in range(start, len(stream.events)):
+            event_sequence, message = stream.events[i]
+            await send_callback(EventMessage(message, format_event_id(namespace, stream_id, event_sequence)))
+        return stream_id
+
+    def _expire(self, now: float) -> None:
+        """Forget streams idle for longer than the TTL, checking at most once per sweep interval.
+
+        Args:
+            now: Current monotonic time
+        """
+        if now - self._last_sweep < min(self.ttl, SWEEP_INTERVAL):
+            return
+        self._last_sweep = now
+        cutoff = now - self.ttl
+        for key in [key for key, stream in self.streams.items() if stream.touched < cutoff]:
+            del self.streams[key]
+
+
+class RedisEventStore(EventStore):
+    """Event store keeping each stream in a Redis Stream shared by all workers.
+
+    Every stream is a Redis Stream capped at roughly ``max_events_per_stream``
+    entries, whose key expires once it has been idle for ``ttl`` seconds.
+    Event sequences are the Redis entry IDs, which increase within a stream.
+
+    If Redis cannot be reached, events are kept in a local
+    :class:`InMemoryEventStore` instead (their sequence is a plain number, so
+    replay knows where to look) and the store logs a warning.
+    """
+
+    def __init__(self, redis_url: str, max_events_per_stream: int = 100, ttl: float = 3600.0, prefix: str = "mcp:events"):
+        """Initialize the event store.
+
+        Args:
+            redis_url: Redis connection URL
+            max_events_per_stream: Maximum number of events to keep per stream
+            ttl: Seconds a stream may be idle before Redis drops it
+            prefix: Key prefix for the Redis Streams
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("The redis event store requires the 'redis' package")
+        self._redis = Redis.from_url(redis_url)
+        self.max_events_per_stream = max_events_per_stream
+        self.ttl = int(ttl)
+        self.prefix = prefix
+        self._fallback = InMemoryEventStore(max_events_per_stream, ttl)
+
+    def _key(self, namespace: str, stream_id: StreamId) -> str:
+        """Redis key of a stream.
+
+        Args:
+            namespace: Session namespace
+            stream_id: Stream ID
+
+        Returns:
+            str: The key
+        """
+        return f"{self.prefix}:{namespace}:{stream_id}"
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        """Append an event to the stream's Redis Stream.
+
+        Args:
+            stream_id: The ID of the stream
+            message: The message to store
+
+        Returns:
+            EventId: The ID of the stored event
+        """
+        namespace = _namespace()
+        key = self._key(namespace, stream_id)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.xadd(key, {"message": message.model_dump_json(by_alias=True, exclude_none=True)}, maxlen=self.max_events_per_stream, approximate=True)
+                pipe.expire(key, self.ttl)
+                entry_id, _ = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis event store unavailable, keeping the event in this worker: {e}")
+            return await self._fallback.store_event(stream_id, message)
+        return format_event_id(namespace, stream_id, entry_id.decode() if isinstance(entry_id, bytes) else entry_id)
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> StreamId | None:
+        """Replay the entries of a Redis Stream that follow the given event.
+
+        Args:
+            last_event_id: The ID of the last received event
+            send_callback: Async callback to send each replayed event
+
+        Returns:
+            StreamId | None: The stream ID, or None if the event is unknown or has been trimmed
+        """
+        parts = parse_event_id(last_event_id)
+        if parts is None:
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+        namespace, stream_id, sequence = parts
+        if "-" not in sequence:
+            return await self._fallback.replay_events_after(last_event_id, send_callback)
+
+        key = self._key(namespace, stream_id)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.xrange(key, min="-", max="+", count=1)
+                pipe.xrange(key, min=f"({sequence}", max="+")
+                pipe.expire(key, self.ttl)
+                oldest, entries, _ = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis event store unavailable, cannot replay after {last_event_id}: {e}")
+            return None
+
+        # Resuming is only correct if nothing between the client's last event and the replay was trimmed
+        if not oldest or _entry_order(oldest[0][0]) > _entry_order(sequence):
+            logger.warning(f"Event ID {last_event_id} not found in store")
+            return None
+
+        for entry_id, fields in entries:
+            entry_id = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+            data = fields.get(b"message", fields.get("message"))
+            await send_callback(EventMessage(JSONRPCMessage.model_validate_json(data), format_event_id(namespace, stream_id, entry_id)))
+        return stream_id
+
+    async def aclose(self) -> None:
+        """Close the Redis connection."""
+        await self._redis.aclose()
+
+
+def _entry_order(entry_id: Any) -> Tuple[int, int]:
+    """Sort key of a Redis Stream entry ID.
+
+    Args:
+        entry_id: ``<milliseconds>-<sequence>`` as str or bytes
+
+    Returns:
+        Tuple[int, int]: Milliseconds and sequence
+
+    Examples:
+        >>> _entry_order(b"1700000000000-2") < _entry_order("1700000000001-0")
+        True
+    """
+    if isinstance(entry_id, bytes):
+        entry_id = entry_id.decode()
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def create_event_store(store_type: str, redis_url: Optional[str] = None, max_events_per_stream: int = 100, ttl: float = 3600.0) -> EventStore:
+    """Create the configured event store.
+
+    Args:
+        store_type: "memory" or "redis"
+        redis_url: Redis connection URL (required for the redis store)
+        max_events_per_stream: Maximum number of events to keep per stream
+        ttl: Seconds a stream may be idle before it is forgotten
+
+    Returns:
+        EventStore: A Redis store when requested and available, otherwise an in-memory store
+
+    Examples:
+        >>> type(create_event_store("memory")).__name__
+        'InMemoryEventStore'
+        >>> type(create_event_store("redis", redis_url=None)).__name__
+        'InMemoryEventStore'
+    """
+    if store_type == "redis":
+        if REDIS_AVAILABLE and redis_url:
+            return RedisEventStore(redis_url, max_events_per_stream, ttl)
+        logger.warning("Redis event store requested but redis is not installed or REDIS_URL is unset; events are kept per process")
+    return InMemoryEventStore(max_events_per_stream, ttl)
@@ -7,29 +7,316 @@ Authors: Mihai Criveti
 
 This module implements Server-Sent Events (SSE) transport for MCP,
 providing server-to-client streaming with proper session management.
+
+Messages are serialised once, straight to bytes (with orjson when it is
+installed), and framed as complete ``event:``/``data:`` chunks that are
+passed to the ASGI server untouched. When several messages are queued they
+are written with a single send.
+
+Nothing polls: the stream waits on its queue, ``receive_message`` waits on
+the disconnect event, and idle streams are woken for a keepalive by the
+process-wide keepalive wheel rather than a per-session timeout.
+
+Each session's outbound queue is bounded by ``SSE_QUEUE_SIZE`` messages and
+``SSE_QUEUE_MAX_BYTES`` bytes. When a client stops reading and its queue
+fills up, ``SSE_SLOW_CONSUMER_POLICY`` decides what happens:
+
+- ``block``: the producer waits for room, up to ``SSE_BLOCK_TIMEOUT``
+  seconds, then the client is disconnected
+- ``drop-oldest``: the oldest queued notifications are discarded to make
+  room; responses are never dropped, so with only responses queued the
+  producer blocks as above
+- ``disconnect``: the client is disconnected straight away (it may reconnect)
 """
 
 # Standard
 import asyncio
+from collections import deque
 from datetime import datetime
 import json
 import logging
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Tuple
 import uuid
+import weakref
 
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.transports.base import Transport
+from mcpgateway.utils.keepalive import keepalive_wheel
 
 # Third-Party
 from fastapi import Request
 from sse_starlette.sse import EventSourceResponse
 
+try:
+    # Third-Party
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Queued messages written together in one chunk
+MAX_COALESCED_MESSAGES = 64
+
+SLOW_CONSUMER_POLICIES = ("block", "drop-oldest", "disconnect")
+
+
+def _json_default(obj: Any) -> str:
+    """Serialise values JSON has no type for.
+
+    Args:
+        obj: Value to serialise
+
+    Returns:
+        str: Datetimes as ``YYYY-MM-DD HH:MM:SS``
+
+    Raises:
+        TypeError: For any other type
+    """
+    if isinstance(obj, datetime):
+        return obj.strftime("%Y-%m-%d %H:%M:%S")
+    raise TypeError(f"Type not serializable: {type(obj).__name__}")
+
+
+def encode_json(obj: Any) -> bytes:
+    """Serialise a message to compact UTF-8 JSON, using orjson when it is installed.
+
+    Both encoders produce the same output, including for datetimes.
+
+    Args:
+        obj: Message to serialise
+
+    Returns:
+        bytes: The JSON document
+
+    Examples:
+        >>> encode_json({"id": 1, "at": datetime(2025, 1, 2, 3, 4, 5), "text": "é"}).decode()
+        '{"id":1,"at":"2025-01-02 03:04:05","text":"é"}'
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits: let the json module decide
+    return json.dumps(obj, default=_json_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def sse_frame(event: str, data: bytes, retry: Optional[int] = None) -> bytes:
+    """Frame one Server-Sent Event.
+
+    Args:
+        event: Event name
+        data: Event payload; line breaks become separate ``data:`` lines
+        retry: Optional reconnection delay in milliseconds
+
+    Returns:
+        bytes: The complete event, ready to write to the stream
+
+    Examples:
+        >>> sse_frame("message", b'{"id":1}')
+        b'event: message\\r\\ndata: {"id":1}\\r\\n\\r\\n'
+        >>> sse_frame("keepalive", b"{}", retry=5000)
+        b'event: keepalive\\r\\ndata: {}\\r\\nretry: 5000\\r\\n\\r\\n'
+    """
+    parts = [b"event: ", event.encode(), b"\r\n"]
+    for line in data.splitlines() or [b""]:
+        parts += (b"data: ", line, b"\r\n")
+    if retry is not None:
+        parts.append(b"retry: %d\r\n" % retry)
+    parts.append(b"\r\n")
+    return b"".join(parts)
+
+
+class OutboundQueue:
+    """Bounded queue of framed SSE events waiting to be written to one client.
+
+    Memory is accounted per queue: ``bytes`` is the size of the frames
+    currently queued, and the high-water marks record the most the queue
+    has ever held.
+
+    Attributes:
+        bytes: Bytes currently queued
+        high_water: Most messages ever queued at once
+        high_water_bytes: Most bytes ever queued at once
+        dropped: Notifications discarded to make room
+
+    Examples:
+        >>> import asyncio
+        >>> q = OutboundQueue(maxsize=2, policy="drop-oldest")
+        >>> async def fill():
+        ...     for frame, droppable in [(b"n1", True), (b"r1", False), (b"n2", True)]:
+        ...         await q.put(frame, droppable)
+        ...     return await q.get(10)
+        >>> asyncio.run(fill())
+        [b'r1', b'n2']
+        >>> q.dropped, q.high_water, q.bytes
+        (1, 2, 0)
+    """
+
+    def __init__(self, maxsize: int = 1024, max_bytes: int = 0, policy: str = "block", block_timeout: float = 30.0):
+        """Initialize an empty queue.
+
+        Args:
+            maxsize: Most messages queued at once
+            max_bytes: Most bytes queued at once; 0 for no byte limit
+            policy: What to do when full: "block", "drop-oldest" or "disconnect"
+            block_timeout: Seconds a producer waits for room before giving up
+
+        Raises:
+            ValueError: If the policy is unknown
+        """
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._policy = policy
+        self._block_timeout = block_timeout
+        self._frames: Deque[Tuple[bytes, bool]] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._closed = False
+        self.bytes = 0
+        self.high_water = 0
+        self.high_water_bytes = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Number of queued frames.
+
+        Returns:
+            int: Queued frames
+        """
+        return len(self._frames)
+
+    def _full(self, size: int) -> bool:
+        """Whether a frame of ``size`` bytes would exceed a limit.
+
+        A frame larger than the byte limit is still accepted into an empty queue.
+
+        Args:
+            size: Size of the frame to add
+
+        Returns:
+            bool: True if there is no room
+        """
+        if len(self._frames) >= self._maxsize:
+            return True
+        return bool(self._max_bytes and self._frames and self.bytes + size > self._max_bytes)
+
+    def _drop_oldest_notification(self) -> bool:
+        """Discard the oldest queued notification.
+
+        Returns:
+            bool: False if only responses are queued
+        """
+        for i, (frame, droppable) in enumerate(self._frames):
+            if droppable:
+                del self._frames[i]
+                self.bytes -= len(frame)
+                self.dropped += 1
+                return True
+        return False
+
+    async def put(self, frame: bytes, droppable: bool = False) -> bool:
+        """Queue a frame, applying the overflow policy if the queue is full.
+
+        Args:
+            frame: Framed SSE event
+            droppable: Whether the policy may discard it (notifications) or not (responses)
+
+        Returns:
+            bool: True if queued; False if there was no room and the client should be disconnected
+        """
+        size = len(frame)
+        if self._full(size):
+            if self._policy == "disconnect":
+                return False
+            if self._policy == "drop-oldest":
+                while self._full(size) and self._drop_oldest_notification():
+                    pass
+            if self._full(size) and not await self._wait_for_room(size):
+                return False
+        self._frames.append((frame, droppable))
+        self.bytes += size
+        self.high_water = max(self.high_water, len(self._frames))
+        self.high_water_bytes = max(self.high_water_bytes, self.bytes)
+        self._readable.set()
+        return True
+
+    async def _wait_for_room(self, size: int) -> bool:
+        """Wait until a frame of ``size`` bytes fits, up to the block timeout.
+
+        Args:
+            size: Size of the frame to add
+
+        Returns:
+            bool: True if there is room; False on timeout or if the queue was closed
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._block_timeout
+        while self._full(size) and not self._closed:
+            self._writable.clear()
+            try:
+                await asyncio.wait_for(self._writable.wait(), max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                return False
+        return not self._closed
+
+    async def get(self, limit: int) -> List[bytes]:
+        """Wait for frames and take up to ``limit`` of them.
+
+        Args:
+            limit: Most frames to take
+
+        Returns:
+            List[bytes]: Frames in order; empty if woken by ``wake()`` or ``close()`` with nothing queued
+        """
+        if not self._frames:
+            self._readable.clear()
+            await self._readable.wait()
+        batch = []
+        while self._frames and len(batch) < limit:
+            frame, _ = self._frames.popleft()
+            self.bytes -= len(frame)
+            batch.append(frame)
+        if batch:
+            self._writable.set()
+        return batch
+
+    def wake(self) -> None:
+        """Make a waiting ``get()`` return, even with nothing queued."""
+        self._readable.set()
+
+    def close(self) -> None:
+        """Discard queued frames and release the reader and any blocked producers."""
+        self._closed = True
+        self._frames.clear()
+        self.bytes = 0
+        self._readable.set()
+        self._writable.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Report the queue's occupancy.
+
+        Returns:
+            Dict[str, int]: Queued messages and bytes, their high-water marks and dropped notifications
+        """
+        return {"queued": len(self._frames), "queued_bytes": self.bytes, "high_water": self.high_water, "high_water_bytes": self.high_water_bytes, "dropped": self.dropped}
+
 
 class SSETransport(Transport):
-    """Transport implementation using Server-Sent Events with proper session management."""
+    """Transport implementation using Server-Sent Events with proper session management.
+
+    Attributes:
+        totals: Process-wide counters over every session: notifications dropped,
+            slow clients disconnected and the largest queue high-water marks
+    """
+
+    totals: Dict[str, int] = {"dropped": 0, "disconnected": 0, "high_water": 0, "high_water_bytes": 0}
+    _live: "weakref.WeakSet[SSETransport]" = weakref.WeakSet()
 
     def __init__(self, base_url: str = None):
         """Initialize SSE transport.
@@ -39,8 +326,9 @@ class SSETransport(Transport):
         """
         self._base_url = base_url or f"http://{settings.host}:{settings.port}"
         self._connected = False
-        self._message_queue = asyncio.Queue()
+        self._outbound = OutboundQueue(settings.sse_queue_size, settings.sse_queue_max_bytes, settings.sse_slow_consumer_policy, settings.sse_block_timeout)
         self._client_gone = asyncio.Event()
+        self._dropped_reported = 0
         self._session_id = str(uuid.uuid4())
 
         logger.info(f"Creating SSE transport with base_url={self._base_url}, session_id={self._session_id}")
@@ -48,6 +336,7 @@ class SSETransport(Transport):
     async def connect(self) -> None:
         """Set up SSE connection."""
         self._connected = True
+        SSETransport._live.add(self)
         logger.info(f"SSE transport connected: {self._session_id}")
 
     async def disconnect(self) -> None:
@@ -55,6 +344,9 @@ class SSETransport(Transport):
         if self._connected:
             self._connected = False
             self._client_gone.set()
+            # Release memory and wake the event generator so the stream closes now
+            self._outbound.close()
+            SSETransport._live.discard(self)
             logger.info(f"SSE transport disconnected: {self._session_id}")
 
     async def send_message(self, message: Dict[str, Any]) -> None:
@@ -64,18 +356,28 @@ class SSETransport(Transport):
             message: Message to send
 
         Raises:
-            RuntimeError: If transport is not connected
+            RuntimeError: If transport is not connected, or the client was disconnected for falling behind
             Exception: If unable to put message to queue
         """
         if not self._connected:
             raise RuntimeError("Transport not connected")
 
         try:
-            await self._message_queue.put(message)
+            # Notifications may be dropped to make room; responses may not
+            queued = await self._outbound.put(self._message_frame(message), "id" not in message)
             logger.debug(f"Message queued for SSE: {self._session_id}, method={message.get('method', '(response)')}")
         except Exception as e:
             logger.error(f"Failed to queue message: {e}")
             raise
+        finally:
+            self._record_stats()
+        if not queued:
+            if not self._connected:
+                raise RuntimeError("Transport not connected")
+            logger.warning(f"Disconnecting slow SSE client {self._session_id} ({len(self._outbound)} messages, {self._outbound.bytes} bytes queued)")
+            SSETransport.totals["disconnected"] += 1
+            await self.disconnect()
+            raise RuntimeError("SSE client too slow, disconnected")
 
     async def receive_message(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Receive messages from the client over SSE transport.
@@ -107,10 +409,9 @@ class SSETransport(Transport):
         # to keep the receive loop running
         yield {"jsonrpc": "2.0", "method": "initialize", "id": 1}
 
-        # Continue waiting for cancellation
+        # Wait for the client to go away
         try:
-            while not self._client_gone.is_set():
-                await asyncio.sleep(1.0)
+            await self._client_gone.wait()
         except asyncio.CancelledError:
             logger.info(f"SSE receive loop cancelled for session {self._session_id}")
             raise
@@ -135,65 +436,45 @@ class SSETransport(Transport):
             SSE response object
         """
         endpoint_url = f"{self._base_url}/message?session_id={self._session_id}"
+        retry = settings.sse_retry_timeout
+        keepalive = sse_frame("keepalive", b"{}", retry)
 
         async def event_generator():
-            """Generate SSE events.
+            """Generate SSE events as pre-framed bytes.
 
             Yields:
-                SSE event
+                bytes: One or more complete SSE events
             """
             # Send the endpoint event first
-            yield {
-                "event": "endpoint",
-                "data": endpoint_url,
-                "retry": settings.sse_retry_timeout,
-            }
+            yield sse_frame("endpoint", endpoint_url.encode(), retry)
 
             # Send keepalive immediately to help establish connection
-            yield {
-                "event": "keepalive",
-                "data": "{}",
-                "retry": settings.sse_retry_timeout,
-            }
+            yield keepalive
 
+            # The shared wheel wakes this generator when the stream has been idle
+            keepalive_handle = keepalive_wheel.register(self._wake, settings.sse_keepalive_interval)
             try:
                 while not self._client_gone.is_set():
                     try:
-                        # Wait for messages with a timeout for keepalives
-                        message = await asyncio.wait_for(
-                            self._message_queue.get(),
-                            timeout=30.0,  # 30 second timeout for keepalives (some tools require more timeout for execution)
-                        )
-
-                        data = json.dumps(message, default=lambda obj: (obj.strftime("%Y-%m-%d %H:%M:%S") if isinstance(obj, datetime) else TypeError("Type not serializable")))
-
-                        # logger.info(f"Sending SSE message: {data[:100]}...")
-                        logger.debug(f"Sending SSE message: {data}")
-
-                        yield {
-                            "event": "message",
-                            "data": data,
-                            "retry": settings.sse_retry_timeout,
-                        }
-                    except asyncio.TimeoutError:
-                        # Send keepalive on timeout
-                        yield {
-                            "event": "keepalive",
-                            "data": "{}",
-                            "retry": settings.sse_retry_timeout,
-                        }
+                        # Everything already queued is written in the same chunk
+                        frames = await self._outbound.get(MAX_COALESCED_MESSAGES)
+                        if self._client_gone.is_set():
+                            break
+                        if not frames:
+                            # Woken by the keepalive wheel
+                            yield keepalive
+                            continue
+                        keepalive_handle.touch()
+                        yield b"".join(frames)
                     except Exception as e:
                         logger.error(f"Error processing SSE message: {e}")
-                        yield {
-                            "event": "error",
-                            "data": json.dumps({"error": str(e)}),
-                            "retry": settings.sse_retry_timeout,
-                        }
+                        yield sse_frame("error", encode_json({"error": str(e)}), retry)
             except asyncio.CancelledError:
                 logger.info(f"SSE event generator cancelled: {self._session_id}")
             except Exception as e:
                 logger.error(f"SSE event generator error: {e}")
             finally:
+                keepalive_handle.cancel()
                 logger.info(f"SSE event generator completed: {self._session_id}")
                 # We intentionally don't set client_gone here to allow queued messages to be processed
 
@@ -208,6 +489,59 @@ class SSETransport(Transport):
             },
         )
 
+    def _wake(self) -> None:
+        """Wake the event generator to write a keepalive (called by the keepalive wheel)."""
+        self._outbound.wake()
+
+    def _record_stats(self) -> None:
+        """Fold this session's queue counters into the process-wide totals."""
+        totals = SSETransport.totals
+        totals["dropped"] += self._outbound.dropped - self._dropped_reported
+        self._dropped_reported = self._outbound.dropped
+        totals["high_water"] = max(totals["high_water"], self._outbound.high_water)
+        totals["high_water_bytes"] = max(totals["high_water_bytes"], self._outbound.high_water_bytes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Report this session's outbound queue.
+
+        Returns:
+            Dict[str, Any]: Queued messages and bytes, high-water marks, dropped notifications and the policy
+        """
+        return {**self._outbound.stats(), "policy": settings.sse_slow_consumer_policy}
+
+    @classmethod
+    def metrics(cls) -> Dict[str, Any]:
+        """Report outbound queue usage across the connected sessions of this process.
+
+        Returns:
+            Dict[str, Any]: Per-session queue stats, the bytes queued in total and the process-wide totals
+        """
+        sessions = {transport.session_id: transport.stats() for transport in list(cls._live)}
+        return {
+            "sessions": sessions,
+            "queued_bytes": sum(s["queued_bytes"] for s in sessions.values()),
+            "policy": settings.sse_slow_consumer_policy,
+            **cls.totals,
+        }
+
+    def _message_frame(self, message: Dict[str, Any]) -> bytes:
+        """Serialise and frame one queued message.
+
+        Args:
+            message: Message to send
+
+        Returns:
+            bytes: A ``message`` event, or an ``error`` event if the message cannot be serialised
+        """
+        try:
+            data = encode_json(message)
+        except Exception as e:
+            logger.error(f"Error processing SSE message: {e}")
+            return sse_frame("error", encode_json({"error": str(e)}), settings.sse_retry_timeout)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending SSE message: {data.decode()}")
+        return sse_frame("message", data)
+
     async def _client_disconnected(self, _request: Request) -> bool:
         """Check if client has disconnected.
 
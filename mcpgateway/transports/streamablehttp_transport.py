@@ -12,170 +12,173 @@ Key components include:
 - Configuration options for:
         1. stateful/stateless operation
         2. JSON response mode or SSE streams
-- InMemoryEventStore: A simple in-memory event storage system for maintaining session state
+- Event stores (see ``event_store``) that let clients resume a stateful session's streams,
+  in memory or shared across workers in Redis
+
+The MCP server answers tools (list/call), resources (list, templates, read),
+prompts (list/get) and completion by calling the gateway services in-process,
+and logging/setLevel through the application's logging service once it is
+passed to ``SessionManagerWrapper``. Tool results and prompt messages
+keep all of their content items, converted to MCP content types.
 
 """
 
 # Standard
-from collections import deque
+import base64
 from contextlib import asynccontextmanager, AsyncExitStack
 import contextvars
-from dataclasses import dataclass
+import json
 import logging
 import re
-from typing import List, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from uuid import uuid4
 
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.db import SessionLocal
-from mcpgateway.services.tool_service import ToolService
+from mcpgateway.services.completion_service import CompletionService
+from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.prompt_service import PromptService
+from mcpgateway.services.resource_service import ResourceService
+from mcpgateway.services.tool_service import ProgressCallback, ToolService
+from mcpgateway.transports.event_store import create_event_store, event_namespace, InMemoryEventStore  # noqa: F401  # pylint: disable=unused-import
+from mcpgateway.types import LogLevel
+from mcpgateway.utils.rate_limiter import rate_limit_subject, rate_limiter, RateLimitExceeded
 from mcpgateway.utils.verify_credentials import verify_credentials
 
 # Third-Party
 from fastapi.security.utils import get_authorization_scheme_param
 from mcp import types
 from mcp.server.lowlevel import Server
-from mcp.server.streamable_http import (
-    EventCallback,
-    EventId,
-    EventMessage,
-    EventStore,
-    StreamId,
-)
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
-from mcp.types import JSONRPCMessage
+from pydantic import AnyUrl
 from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
-from starlette.status import HTTP_401_UNAUTHORIZED
+from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_429_TOO_MANY_REQUESTS
 from starlette.types import Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-# Initialize ToolService and MCP Server
+# Initialize services and MCP Server
 tool_service = ToolService()
+resource_service = ResourceService()
+prompt_service = PromptService()
+completion_service = CompletionService()
 mcp_app = Server("mcp-streamable-http-stateless")
 
 server_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("server_id", default=None)
 
-# ------------------------------ Event store ------------------------------
+# ------------------------------ Streamable HTTP Transport ------------------------------
 
 
-@dataclass
-class EventEntry:
-    """
-    Represents an event entry in the event store.
+@asynccontextmanager
+async def get_db():
     """
+    Asynchronous context manager for database sessions.
 
-    event_id: EventId
-    stream_id: StreamId
-    message: JSONRPCMessage
-
-
-class InMemoryEventStore(EventStore):
+    Yields:
+        A database session instance from SessionLocal.
+        Ensures the session is closed after use.
     """
-    Simple in-memory implementation of the EventStore interface for resumability.
-    This is primarily intended for examples and testing, not for production use
-    where a persistent storage solution would be more appropriate.
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
 
-    This implementation keeps only the last N events per stream for memory efficiency.
+
+def _progress_reporter() -> Optional[ProgressCallback]:
     """
+    Build a callback that streams tool progress to the client, if it asked for progress.
 
-    def __init__(self, max_events_per_stream: int = 100):
-        """Initialize the event store.
+    Progress notifications are tied to the originating request, so they travel on
+    that request's stream while the tool result is still being received.
 
-        Args:
-            max_events_per_stream: Maximum number of events to keep per stream
-        """
-        self.max_events_per_stream = max_events_per_stream
-        # for maintaining last N events per stream
-        self.streams: dict[StreamId, deque[EventEntry]] = {}
-        # event_id -> EventEntry for quick lookup
-        self.event_index: dict[EventId, EventEntry] = {}
+    Returns:
+        A progress callback, or None when the request carries no progress token.
+    """
+    ctx = mcp_app.request_context
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return None
 
-    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+    async def report(progress: float, total: Optional[float], message: Optional[str]) -> None:
         """
-        Stores an event with a generated event ID.
+        Send one progress notification.
 
         Args:
-            stream_id (StreamId): The ID of the stream.
-            message (JSONRPCMessage): The message to store.
-
-        Returns:
-            EventId: The ID of the stored event.
+            progress: Bytes received so far
+            total: Expected total, if known
+            message: Partial result, if any
         """
-        event_id = str(uuid4())
-        event_entry = EventEntry(event_id=event_id, stream_id=stream_id, message=message)
-
-        # Get or create deque for this stream
-        if stream_id not in self.streams:
-            self.streams[stream_id] = deque(maxlen=self.max_events_per_stream)
-
-        # If deque is full, the oldest event will be automatically removed
-        # We need to remove it from the event_index as well
-        if len(self.streams[stream_id]) == self.max_events_per_stream:
-            oldest_event = self.streams[stream_id][0]
-            self.event_index.pop(oldest_event.event_id, None)
-
-        # Add new event
-        self.streams[stream_id].append(event_entry)
-        self.event_index[event_id] = event_entry
-
-        return event_id
-
-    async def replay_events_after(
-        self,
-        last_event_id: EventId,
-        send_callback: EventCallback,
-    ) -> StreamId | None:
-        """
-        Replays events that occurred after the specified event ID.
+        await ctx.session.send_progress_notification(token, progress, total=total, message=message, related_request_id=str(ctx.request_id))
 
-        Args:
-            last_event_id (EventId): The ID of the last received event. Replay starts after this event.
-            send_callback (EventCallback): Async callback to send each replayed event.
+    return report
 
-        Returns:
-            StreamId | None: The stream ID if the event is found and replayed, otherwise None.
-        """
-        if last_event_id not in self.event_index:
-            logger.warning(f"Event ID {last_event_id} not found in store")
-            return None
 
-        # Get the stream and find events after the last one
-        last_event = self.event_index[last_event_id]
-        stream_id = last_event.stream_id
-        stream_events = self.streams.get(last_event.stream_id, deque())
+def _base64(data: Union[str, bytes]) -> str:
+    """Base64 text for MCP binary fields.
 
-        # Events in deque are already in chronological order
-        found_last = False
-        for event in stream_events:
-            if found_last:
-                await send_callback(EventMessage(event.message, event.event_id))
-            elif event.event_id == last_event_id:
-                found_last = True
+    Content relayed from MCP servers already holds base64 text (stored as
+    bytes); anything else is encoded.
 
-        return stream_id
+    Args:
+        data: Base64 text, or raw bytes
 
+    Returns:
+        str: Base64 text
 
-# ------------------------------ Streamable HTTP Transport ------------------------------
+    Examples:
+        >>> _base64(b"aGk="), _base64(b"\\xff\\xfe")
+        ('aGk=', '//4=')
+    """
+    if isinstance(data, str):
+        return data
+    try:
+        text = data.decode("ascii")
+        base64.b64decode(text, validate=True)
+        return text
+    except ValueError:
+        return base64.b64encode(data).decode()
 
 
-@asynccontextmanager
-async def get_db():
+def _content_block(item: Any) -> Union[types.TextContent, types.ImageContent, types.EmbeddedResource]:
     """
-    Asynchronous context manager for database sessions.
+    Convert a gateway content item to the MCP content type it stands for.
 
-    Yields:
-        A database session instance from SessionLocal.
-        Ensures the session is closed after use.
+    Args:
+        item: Content item from a tool result or prompt message (model or dict)
+
+    Returns:
+        The MCP content block. Structured text is serialised to JSON, and items of
+        unknown type are passed on as their JSON text.
+
+    Examples:
+        >>> _content_block({"type": "text", "text": {"a": 1}}).text
+        '{"a": 1}'
+        >>> _content_block({"type": "resource", "uri": "file:///a.txt", "text": "hi"}).resource.text
+        'hi'
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    data = item.model_dump(by_alias=True, exclude_none=True) if hasattr(item, "model_dump") else dict(item)
+    kind = data.get("type")
+    if kind == "text":
+        text = data.get("text", "")
+        return types.TextContent(type="text", text=text if isinstance(text, str) else json.dumps(text))
+    if kind == "image":
+        return types.ImageContent(type="image", data=_base64(data.get("data", b"")), mimeType=data.get("mimeType") or data.get("mime_type") or "application/octet-stream")
+    if kind == "resource":
+        if "resource" in data:
+            return types.EmbeddedResource.model_validate(data)
+        mime_type = data.get("mimeType") or data.get("mime_type")
+        if data.get("text") is None and data.get("blob") is not None:
+            resource = types.BlobResourceContents(uri=data["uri"], mimeType=mime_type, blob=_base64(data["blob"]))
+        else:
+            resource = types.TextResourceContents(uri=data["uri"], mimeType=mime_type, text=data.get("text") or "")
+        return types.EmbeddedResource(type="resource", resource=resource)
+    return types.TextContent(type="text", text=json.dumps(data, default=str))
 
 
 @mcp_app.call_tool()
@@ -188,21 +191,27 @@ async def call_tool(name: str, arguments: dict) -> List[Union[types.TextContent,
         arguments (dict): A dictionary of arguments to pass to the tool.
 
     Returns:
-        List of content (TextContent, ImageContent, or EmbeddedResource) from the tool response.
-        Logs and returns an empty list on failure.
+        Every content item of the tool response (TextContent, ImageContent or EmbeddedResource), in order.
+
+    Raises:
+        RuntimeError: If the tool reported an error; the MCP server returns it as an ``isError`` result.
+        Exception: If the invocation failed; likewise returned as an ``isError`` result.
     """
     try:
         async with get_db() as db:
-            result = await tool_service.invoke_tool(db=db, name=name, arguments=arguments)
-            if not result or not result.content:
-                logger.warning(f"No content returned by tool: {name}")
-                return []
-
-            return [types.TextContent(type=result.content[0].type, text=result.content[0].text)]
+            result = await tool_service.invoke_tool(db=db, name=name, arguments=arguments, progress=_progress_reporter())
     except Exception as e:
         logger.exception(f"Error calling tool '{name}': {e}")
+        raise
+    if not result or not result.content:
+        logger.warning(f"No content returned by tool: {name}")
         return []
 
+    content = [_content_block(item) for item in result.content]
+    if result.is_error:
+        raise RuntimeError("\n".join(block.text for block in content if isinstance(block, types.TextContent)) or f"Tool '{name}' reported an error")
+    return content
+
 
 @mcp_app.list_tools()
 async def list_tools() -> List[types.Tool]:
@@ -233,19 +242,174 @@ async def list_tools() -> List[types.Tool]:
             return []
 
 
+@mcp_app.list_resources()
+async def list_resources() -> List[types.Resource]:
+    """
+    Lists the resources of the virtual server in the request path, or all resources.
+
+    Returns:
+        A list of Resource objects. Logs and returns an empty list on failure.
+    """
+    server_id = server_id_var.get()
+    try:
+        async with get_db() as db:
+            if server_id:
+                resources = await resource_service.list_server_resources(db, server_id)
+            else:
+                resources = await resource_service.list_resources(db)
+            return [types.Resource(uri=r.uri, name=r.name, description=r.description, mimeType=r.mime_type, size=r.size) for r in resources]
+    except Exception as e:
+        logger.exception(f"Error listing resources: {e}")
+        return []
+
+
+@mcp_app.list_resource_templates()
+async def list_resource_templates() -> List[types.ResourceTemplate]:
+    """
+    Lists the resource templates.
+
+    Returns:
+        A list of ResourceTemplate objects. Logs and returns an empty list on failure.
+    """
+    try:
+        async with get_db() as db:
+            templates = await resource_service.list_resource_templates(db)
+            return [types.ResourceTemplate(uriTemplate=t.uri_template, name=t.name, description=t.description, mimeType=t.mime_type) for t in templates]
+    except Exception as e:
+        logger.exception(f"Error listing resource templates: {e}")
+        return []
+
+
+@mcp_app.read_resource()
+async def read_resource(uri: AnyUrl) -> Iterable[ReadResourceContents]:
+    """
+    Reads a resource's content.
+
+    Args:
+        uri: URI of the resource
+
+    Returns:
+        The content, as text or bytes with its MIME type.
+
+    Raises:
+        ResourceNotFoundError: If the resource does not exist; the MCP server returns it as a JSON-RPC error.
+    """
+    async with get_db() as db:
+        content = await resource_service.read_resource(db, str(uri))
+    data = content.text if content.text is not None else content.blob or b""
+    return [ReadResourceContents(content=data, mime_type=content.mime_type)]
+
+
+@mcp_app.list_prompts()
+async def list_prompts() -> List[types.Prompt]:
+    """
+    Lists the prompts of the virtual server in the request path, or all prompts.
+
+    Returns:
+        A list of Prompt objects with their arguments. Logs and returns an empty list on failure.
+    """
+    server_id = server_id_var.get()
+    try:
+        async with get_db() as db:
+            if server_id:
+                prompts = await prompt_service.list_server_prompts(db, server_id)
+            else:
+                prompts = await prompt_service.list_prompts(db)
+            return [
+                types.Prompt(
+                    name=p.name,
+                    description=p.description,
+                    arguments=[types.PromptArgument(name=a.name, description=a.description, required=a.required) for a in p.arguments],
+                )
+                for p in prompts
+            ]
+    except Exception as e:
+        logger.exception(f"Error listing prompts: {e}")
+        return []
+
+
+@mcp_app.get_prompt()
+async def get_prompt(name: str, arguments: Optional[Dict[str, str]]) -> types.GetPromptResult:
+    """
+    Renders a prompt.
+
+    Args:
+        name: Name of the prompt
+        arguments: Values for the prompt's arguments
+
+    Returns:
+        The rendered messages.
+
+    Raises:
+        PromptNotFoundError: If the prompt does not exist; the MCP server returns it as a JSON-RPC error.
+    """
+    async with get_db() as db:
+        result = await prompt_service.get_prompt(db, name, arguments)
+    return types.GetPromptResult(
+        description=result.description,
+        messages=[types.PromptMessage(role=m.role.value, content=_content_block(m.content)) for m in result.messages],
+    )
+
+
+@mcp_app.completion()
+async def complete(ref: Union[types.PromptReference, types.ResourceTemplateReference], argument: types.CompletionArgument, _context: Optional[types.CompletionContext]) -> types.Completion:
+    """
+    Suggests values for a prompt argument or resource template URI.
+
+    Args:
+        ref: The prompt or resource template being completed
+        argument: Name and partial value of the argument
+        _context: Previously resolved arguments (unused)
+
+    Returns:
+        The suggested values.
+    """
+    async with get_db() as db:
+        result = await completion_service.handle_completion(db, {"ref": ref.model_dump(by_alias=True, exclude_none=True), "argument": argument.model_dump(by_alias=True, exclude_none=True)})
+    return types.Completion.model_validate(result.completion)
+
+
+def register_logging_handler(service: LoggingService) -> None:
+    """
+    Answer logging/setLevel with the application's logging service.
+
+    The handler, and with it the MCP ``logging`` capability, is only
+    registered once an initialised service is supplied: a private instance
+    has no loggers, so setting its level would change nothing.
+
+    Args:
+        service: The application's logging service
+    """
+
+    @mcp_app.set_logging_level()
+    async def set_logging_level(level: types.LoggingLevel) -> None:
+        """
+        Sets the minimum log level.
+
+        Args:
+            level: New log level
+        """
+        await service.set_level(LogLevel(level))
+
+
 class SessionManagerWrapper:
     """
     Wrapper class for managing the lifecycle of a StreamableHTTPSessionManager instance.
     Provides start, stop, and request handling methods.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, logging_service: Optional[LoggingService] = None) -> None:
         """
         Initializes the session manager and the exit stack used for managing its lifecycle.
+
+        Args:
+            logging_service: The application's logging service; when given, logging/setLevel is served
         """
+        if logging_service is not None:
+            register_logging_handler(logging_service)
 
         if settings.use_stateful_sessions:
-            event_store = InMemoryEventStore()
+            event_store = create_event_store(settings.event_store_type, settings.redis_url, settings.event_store_max_events, settings.event_store_ttl)
             stateless = False
         else:
             event_store = None
@@ -272,6 +436,10 @@ class SessionManagerWrapper:
         """
         logger.info("Stopping Streamable HTTP Session Manager...")
         await self.stack.aclose()
+        # The Redis event store holds a connection pool
+        close = getattr(self.session_manager.event_store, "aclose", None)
+        if close is not None:
+            await close()
 
     async def handle_streamable_http(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
@@ -295,6 +463,10 @@ class SessionManagerWrapper:
             server_id = match.group("server_id")
             server_id_var.set(server_id)
 
+        if MCP_SESSION_ID_HEADER not in Headers(scope=scope):
+            # This request may open a session; the tasks serving it inherit the namespace its events are stored under
+            event_namespace.set(uuid4().hex)
+
         try:
             await self.session_manager.handle_request(scope, receive, send)
         except Exception as e:
@@ -317,6 +489,8 @@ async def streamable_http_auth(scope, receive, send):
     - If there is no Authorization header, the request is allowed.
     - If a Bearer token is present, it is verified using `verify_credentials`.
     - If verification fails, a 401 Unauthorized JSON response is sent.
+    - If the user's or the virtual server's rate limit is exhausted, a 429
+      response with a ``Retry-After`` header is sent.
 
     Args:
         scope: The ASGI scope dictionary, which includes request metadata.
@@ -325,7 +499,7 @@ async def streamable_http_auth(scope, receive, send):
 
     Returns:
         bool: True if authentication passes or is skipped.
-              False if authentication fails and a 401 response is sent.
+              False if authentication fails or the request is rate limited and an error response is sent.
     """
 
     path = scope.get("path", "")
@@ -342,7 +516,7 @@ async def streamable_http_auth(scope, receive, send):
         if scheme.lower() == "bearer" and credentials:
             token = credentials
     try:
-        await verify_credentials(token)
+        user = await verify_credentials(token)
     except Exception:
         response = JSONResponse(
             {"detail": "Authentication failed"},
@@ -352,4 +526,14 @@ async def streamable_http_auth(scope, receive, send):
         await response(scope, receive, send)
         return False
 
+    try:
+        await rate_limiter.hit("user", rate_limit_subject(user), settings.user_rate_limit)
+        match = re.search(r"/servers/(?P<server_id>[^/]+)/mcp", path)
+        if match:
+            await rate_limiter.hit("server", match.group("server_id"), settings.server_rate_limit)
+    except RateLimitExceeded as e:
+        response = JSONResponse({"detail": str(e)}, status_code=HTTP_429_TOO_MANY_REQUESTS, headers=e.headers)
+        await response(scope, receive, send)
+        return False
+
     return True
@@ -7,16 +7,24 @@ Authors: Mihai Criveti
 
 This module implements WebSocket transport for MCP, providing
 full-duplex communication between client and server.
+
+Liveness is checked through the process-wide keepalive wheel: a connection
+that has been silent for ``WEBSOCKET_PING_INTERVAL`` seconds is sent a
+``ping`` and is closed if it is still silent when its next turn comes.
+Pongs are read by the same loop that reads messages, so there is only ever
+one reader on the socket.
 """
 
 # Standard
 import asyncio
+import json
 import logging
 from typing import Any, AsyncGenerator, Dict, Optional
 
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.transports.base import Transport
+from mcpgateway.utils.keepalive import keepalive_wheel, KeepaliveHandle
 
 # Third-Party
 from fastapi import WebSocket, WebSocketDisconnect
@@ -35,16 +43,18 @@ class WebSocketTransport(Transport):
         """
         self._websocket = websocket
         self._connected = False
+        self._keepalive: Optional[KeepaliveHandle] = None
         self._ping_task: Optional[asyncio.Task] = None
+        self._awaiting_pong = False
 
     async def connect(self) -> None:
         """Set up WebSocket connection."""
         await self._websocket.accept()
         self._connected = True
 
-        # Start ping task
+        # Ping through the shared keepalive wheel when the connection goes quiet
         if settings.websocket_ping_interval > 0:
-            self._ping_task = asyncio.create_task(self._ping_loop())
+            self._keepalive = keepalive_wheel.register(self._on_idle, settings.websocket_ping_interval)
 
         logger.info("WebSocket transport connected")
 
@@ -60,6 +70,10 @@ class WebSocketTransport(Transport):
             # The loop is already closed – further asyncio calls are illegal
             return
 
+        keepalive = getattr(self, "_keepalive", None)
+        if keepalive is not None:
+            keepalive.cancel()
+
         ping_task = getattr(self, "_ping_task", None)
 
         should_cancel = ping_task and not ping_task.done() and ping_task is not asyncio.current_task()  # task exists  # still running  # not *this* coroutine
@@ -103,19 +117,31 @@ class WebSocketTransport(Transport):
     async def receive_message(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Receive messages from WebSocket.
 
+        Any frame counts as activity for the keepalive; ``pong`` frames
+        answer our pings and are not yielded.
+
         Yields:
             Received messages
 
         Raises:
             RuntimeError: If transport is not connected
+            WebSocketDisconnect: If the client closes the connection
         """
         if not self._connected:
             raise RuntimeError("Transport not connected")
 
         try:
             while True:
-                message = await self._websocket.receive_json()
-                yield message
+                frame = await self._websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+                self._awaiting_pong = False
+                if self._keepalive is not None:
+                    self._keepalive.touch()
+                if frame.get("text") is not None:
+                    yield json.loads(frame["text"])
+                elif frame.get("bytes") not in (None, b"pong"):
+                    yield json.loads(frame["bytes"])
 
         except WebSocketDisconnect:
             logger.info("WebSocket client disconnected")
@@ -134,25 +160,23 @@ class WebSocketTransport(Transport):
         """
         return self._connected
 
-    async def _ping_loop(self) -> None:
-        """Send periodic ping messages to keep connection alive."""
+    def _on_idle(self) -> None:
+        """Ping an idle connection, or close it if the last ping went unanswered (called by the keepalive wheel)."""
+        if not self._connected or (self._ping_task is not None and not self._ping_task.done()):
+            return
+        if self._awaiting_pong:
+            logger.warning("Ping timeout")
+            self._ping_task = asyncio.create_task(self.disconnect())
+        else:
+            self._awaiting_pong = True
+            self._ping_task = asyncio.create_task(self._ping())
+
+    async def _ping(self) -> None:
+        """Send a keepalive ping, closing the connection if that fails."""
         try:
-            while self._connected:
-                await asyncio.sleep(settings.websocket_ping_interval)
-                await self._websocket.send_bytes(b"ping")
-                try:
-                    resp = await asyncio.wait_for(
-                        self._websocket.receive_bytes(),
-                        timeout=settings.websocket_ping_interval / 2,
-                    )
-                    if resp != b"pong":
-                        logger.warning("Invalid ping response")
-                except asyncio.TimeoutError:
-                    logger.warning("Ping timeout")
-                    break
+            await self._websocket.send_bytes(b"ping")
         except Exception as e:
-            logger.error(f"Ping loop error: {e}")
-        finally:
+            logger.error(f"Ping failed: {e}")
             await self.disconnect()
 
     async def send_ping(self) -> None:
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""Circuit Breakers for upstream gateways and REST hosts.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Each upstream target (a federated gateway or the host of a REST tool) gets a
+circuit breaker with three states:
+- closed: calls flow; consecutive failures are counted
+- open: calls fail fast until the recovery timeout has elapsed
+- half-open: a limited number of trial calls are let through; enough
+  successes close the circuit, any failure re-opens it
+
+Breakers are fed by both tool invocation outcomes and gateway health checks,
+and live in the process-wide ``circuit_breakers`` registry.
+
+Examples:
+    >>> breaker = CircuitBreaker("host:api.example.com", failure_threshold=2, recovery_timeout=60)
+    >>> breaker.record_failure(); breaker.record_failure()
+    >>> breaker.state
+    <CircuitState.OPEN: 'open'>
+    >>> try:
+    ...     breaker.before_call()
+    ... except CircuitOpenError as e:
+    ...     print(e)
+    Circuit open for host:api.example.com, retry in 60.0s
+"""
+
+# Standard
+import asyncio
+from contextlib import contextmanager
+from enum import Enum
+import logging
+import time
+from typing import Callable, Dict, Generator, Optional
+from urllib.parse import urlparse
+
+# First-Party
+from mcpgateway.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the target's circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        """Initialize the error.
+
+        Args:
+            name: Breaker name
+            retry_after: Seconds until the circuit admits a trial call
+        """
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit open for {name}, retry in {retry_after:.1f}s")
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one upstream target.
+
+    Attributes:
+        name: Target identifier, e.g. ``gateway:<id>`` or ``host:<netloc>``
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds an open circuit waits before going half-open
+        half_open_max_calls: Trial calls allowed concurrently while half-open
+        success_threshold: Successful trials needed to close the circuit
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            name: Target identifier
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds an open circuit waits before going half-open
+            half_open_max_calls: Trial calls allowed concurrently while half-open
+            success_threshold: Successful trials needed to close the circuit
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._half_open_successes = 0
+        self._half_open_in_flight = 0
+        self._opened_at = 0.0
+        self.transitions = 0  # number of state changes, used to spot flapping targets
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit whose recovery timeout elapsed reports half-open.
+
+        Returns:
+            CircuitState: Current state
+        """
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        """Switch state and reset the per-state counters.
+
+        Args:
+            state: New state
+        """
+        if state == self._state:
+            return
+        logger.info(f"Circuit {self.name}: {self._state.value} -> {state.value}")
+        self._state = state
+        self.transitions += 1
+        self._failures = 0
+        self._half_open_successes = 0
+        self._half_open_in_flight = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+
+    def before_call(self) -> Optional[int]:
+        """Admit a call or reject it.
+
+        Returns:
+            Optional[int]: A half-open trial slot token to hand back via the
+            ``slot`` argument of the ``record_*`` methods, or None when closed
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all trial slots taken
+        """
+        state = self.state
+        if state == CircuitState.OPEN:
+            raise CircuitOpenError(self.name, self.recovery_timeout - (time.monotonic() - self._opened_at))
+        if state == CircuitState.HALF_OPEN:
+            if self._half_open_in_flight >= self.half_open_max_calls:
+                raise CircuitOpenError(self.name, 0.0)
+            self._half_open_in_flight += 1
+            return self.transitions
+        return None
+
+    def _release(self, slot: Optional[int]) -> None:
+        """Free a half-open trial slot, unless the circuit has changed state since it was taken.
+
+        Args:
+            slot: Token returned by :meth:`before_call`
+        """
+        if slot is not None and slot == self.transitions and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    def record_success(self, slot: Optional[int] = None) -> None:
+        """Record a successful call or health probe.
+
+        Args:
+            slot: Token returned by :meth:`before_call`, if any
+        """
+        state = self.state
+        self._release(slot)
+        if state == CircuitState.CLOSED:
+            self._failures = 0
+        elif state == CircuitState.OPEN:
+            # A passing health probe lets trial traffic through early
+            self._transition(CircuitState.HALF_OPEN)
+        else:
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.success_threshold:
+                self._transition(CircuitState.CLOSED)
+
+    def record_failure(self, slot: Optional[int] = None) -> None:
+        """Record a failed call or health probe.
+
+        Args:
+            slot: Token returned by :meth:`before_call`, if any
+        """
+        state = self.state
+        self._release(slot)
+        if state == CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN)
+        elif state == CircuitState.CLOSED:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._transition(CircuitState.OPEN)
+        else:
+            # Still failing while open: restart the recovery timer
+            self._opened_at = time.monotonic()
+
+    @contextmanager
+    def guard(self, is_failure: Optional[Callable[[BaseException], bool]] = None, deadline: Optional[asyncio.Timeout] = None) -> Generator[None, None, None]:
+        """Wrap one call: admit it, then record its outcome.
+
+        Args:
+            is_failure: Decides whether an exception counts against the target.
+                Defaults to every ``Exception``.
+            deadline: Deadline the call runs under. A cancellation caused by
+                its expiry counts as a failure, so a hanging target still
+                opens the circuit; any other cancellation never counts.
+
+        Yields:
+            None
+
+        Raises:
+            BaseException: Whatever the wrapped block raised
+        """
+        slot = self.before_call()
+        try:
+            yield
+        except Exception as e:
+            if is_failure is None or is_failure(e):
+                self.record_failure(slot)
+            else:
+                self.record_success(slot)
+            raise
+        except BaseException:
+            if deadline is not None and deadline.expired():
+                self.record_failure(slot)
+            else:
+                self._release(slot)
+            raise
+        self.record_success(slot)
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers, one per upstream target."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Return the breaker for ``name``, creating it from settings if needed.
+
+        Args:
+            name: Target identifier
+
+        Returns:
+            CircuitBreaker: Breaker for the target
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                recovery_timeout=settings.circuit_breaker_recovery_timeout,
+                half_open_max_calls=settings.circuit_breaker_half_open_max_calls,
+            )
+            self._breakers[name] = breaker
+        return breaker
+
+    def for_gateway(self, gateway_id: str) -> CircuitBreaker:
+        """Return the breaker for a federated gateway.
+
+        Args:
+            gateway_id: Gateway ID
+
+        Returns:
+            CircuitBreaker: Breaker for the gateway
+        """
+        return self.get(f"gateway:{gateway_id}")
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        """Return the breaker for the host serving ``url``.
+
+        Args:
+            url: Any URL on the host
+
+        Returns:
+            CircuitBreaker: Breaker for the host
+
+        Examples:
+            >>> CircuitBreakerRegistry().for_url("https://api.example.com:8443/v1/items?q=1").name
+            'host:api.example.com:8443'
+        """
+        return self.get(f"host:{urlparse(url).netloc}")
+
+    def snapshot(self) -> Dict[str, str]:
+        """Return the current state of every known breaker.
+
+        Returns:
+            Dict[str, str]: Breaker name to state value
+        """
+        return {name: breaker.state.value for name, breaker in self._breakers.items()}
+
+    def clear(self) -> None:
+        """Forget all breakers."""
+        self._breakers.clear()
+
+
+# Process-wide registry shared by the tool and gateway services
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""Per-host HTTP connection pools.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+A single shared ``httpx.AsyncClient`` lets one slow upstream occupy every
+pooled connection and starve all other hosts. ``HostPoolManager`` keeps one
+client, and therefore one connection pool, per upstream origin (scheme, host
+and port), each with its own limits:
+- Bounded connections and keepalive connections per host
+- Keepalive expiry so idle sockets are recycled
+- HTTP/2 multiplexing when the optional ``h2`` package is installed
+- Per-request timeout overrides
+- A response size guard, enforced while the body is being received
+- Optional per-chunk callbacks, so callers can report progress or parse
+  the body incrementally as it arrives, without the pool keeping a copy
+- Occupancy counters (in-flight requests per host) for observability
+- A cap on the number of host pools; the least recently used idle pool is
+  closed when a new host would exceed it
+
+The manager exposes ``get``/``request``/``aclose`` so it can stand in for an
+``httpx.AsyncClient`` in existing call sites.
+
+Examples:
+    >>> HostPoolManager.origin("https://api.example.com:8443/v1/items?q=1")
+    'https://api.example.com:8443'
+    >>> HostPoolManager.origin("http://Example.com/path")
+    'http://example.com'
+"""
+
+# Standard
+from collections import OrderedDict
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+# Third-Party
+import httpx
+
+try:
+    # Third-Party
+    import h2  # noqa: F401  # pylint: disable=unused-import
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Called with (response, bytes received so far, chunk) for every chunk of a body
+ChunkCallback = Callable[[httpx.Response, int, bytes], Awaitable[None]]
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the configured size limit."""
+
+    def __init__(self, url: str, limit: int):
+        """Initialize the error.
+
+        Args:
+            url: Request URL
+            limit: Size limit in bytes
+        """
+        self.url = url
+        self.limit = limit
+        super().__init__(f"Response from {url} exceeds the {limit} byte limit")
+
+
+class HostPoolManager:
+    """One pooled ``httpx.AsyncClient`` per upstream origin.
+
+    Attributes:
+        limits: Connection limits applied to each host's pool
+        http2: Whether HTTP/2 is negotiated with upstreams that support it
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        timeout: float = 30.0,
+        verify: bool = True,
+        max_response_size: int = 0,
+        max_hosts: int = 100,
+    ):
+        """Initialize the manager; pools are created lazily per host.
+
+        Args:
+            max_connections: Maximum concurrent connections per host
+            max_keepalive_connections: Idle connections kept open per host
+            keepalive_expiry: Seconds an idle connection is kept
+            http2: Enable HTTP/2 (only honoured if ``h2`` is installed)
+            timeout: Default request timeout in seconds
+            verify: Verify TLS certificates
+            max_response_size: Largest response body accepted, in bytes; 0 for no limit
+            max_hosts: Host pools kept open; beyond this the least recently used idle pool is closed (0 for no cap)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("HTTP/2 requested for REST tool pools but the 'h2' package is not installed; using HTTP/1.1")
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._timeout = timeout
+        self._verify = verify
+        self.max_response_size = max_response_size
+        self.max_hosts = max_hosts
+        self._clients: OrderedDict[str, httpx.AsyncClient] = OrderedDict()
+        self._in_flight: Dict[str, int] = {}
+
+    @staticmethod
+    def origin(url: str) -> str:
+        """Return the pool key (scheme://host[:port]) for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            str: Normalised origin
+        """
+        parts = urlsplit(url)
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        """Return the pooled client for the host serving ``url``.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            httpx.AsyncClient: Client bound to that host's pool
+        """
+        key = self.origin(url)
+        client = self._clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(limits=self.limits, http2=self.http2, timeout=self._timeout, verify=self._verify)
+            self._clients[key] = client
+            self._in_flight.setdefault(key, 0)
+            logger.debug(f"Created connection pool for {key}")
+        else:
+            self._clients.move_to_end(key)
+        return client
+
+    async def _evict_idle(self) -> None:
+        """Close the least recently used idle pools while there are more than ``max_hosts``.
+
+        Pools with requests in flight are skipped, so the cap may be exceeded
+        while every pool is busy.
+        """
+        excess = len(self._clients) - self.max_hosts
+        if self.max_hosts <= 0 or excess <= 0:
+            return
+        idle = [key for key in self._clients if not self._in_flight.get(key)][:excess]
+        for key in idle:
+            client = self._clients.pop(key)
+            self._in_flight.pop(key, None)
+            logger.debug(f"Closing idle connection pool for {key}")
+            await client.aclose()
+
+    async def request(self, method: str, url: str, on_chunk: Optional[ChunkCallback] = None, **kwargs: Any) -> httpx.Response:
+        """Send a request through the pool of the target host.
+
+        The body is received chunk by chunk, so an oversized response is
+        abandoned as soon as it crosses the size limit rather than after it
+        has been buffered. With ``on_chunk`` the body is handed over chunk by
+        chunk and not kept: the returned response carries the status and
+        headers only, and reading its content raises ``httpx.ResponseNotRead``.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            on_chunk: Awaited for each body chunk as it arrives; the chunks are not retained
+            **kwargs: Passed to ``httpx.AsyncClient.stream`` (``timeout`` overrides the default)
+
+        Returns:
+            httpx.Response: Response, with its body read unless ``on_chunk`` consumed it
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds ``max_response_size``
+        """
+        client = self.client_for(url)
+        key = self.origin(url)
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        await self._evict_idle()
+        try:
+            async with client.stream(method, url, **kwargs) as response:
+                length = response.headers.get("content-length")
+                total = int(length) if length and length.isdigit() else None
+                limit = self.max_response_size
+                if limit and total is not None and total > limit:
+                    raise ResponseTooLargeError(url, limit)
+                chunks = []
+                received = 0
+                async for chunk in response.aiter_bytes():
+                    received += len(chunk)
+                    if limit and received > limit:
+                        raise ResponseTooLargeError(url, limit)
+                    if on_chunk is not None:
+                        await on_chunk(response, received, chunk)
+                    else:
+                        chunks.append(chunk)
+            if on_chunk is not None:
+                return response
+            # The chunks are already decoded, so the copy must not decode them again
+            headers = httpx.Headers(response.headers)
+            for name in ("content-encoding", "content-length", "transfer-encoding"):
+                headers.pop(name, None)
+            return httpx.Response(response.status_code, headers=headers, content=b"".join(chunks), request=response.request, extensions=response.extensions)
+        finally:
+            # The pool may have been closed meanwhile; aclose() keeps counts of busy hosts
+            remaining = self._in_flight.get(key, 1) - 1
+            if remaining or key in self._clients:
+                self._in_flight[key] = remaining
+            else:
+                self._in_flight.pop(key, None)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request through the pool of the target host.
+
+        Args:
+            url: Request URL
+            **kwargs: Passed to ``httpx.AsyncClient.request``
+
+        Returns:
+            httpx.Response: Response
+        """
+        return await self.request("GET", url, **kwargs)
+
+    def occupancy(self) -> Dict[str, Dict[str, Any]]:
+        """Report how busy each host's pool is.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per origin, requests in flight, the connection limit and the protocol
+        """
+        return {
+            key: {
+                "in_flight": self._in_flight.get(key, 0),
+                "max_connections": self.limits.max_connections,
+                "http2": self.http2,
+            }
+            for key in self._clients
+        }
+
+    async def aclose(self, url: Optional[str] = None) -> None:
+        """Close one host's pool, or all of them.
+
+        Requests still running on a closed pool keep their in-flight count
+        until they finish.
+
+        Args:
+            url: Any URL on the host whose pool to close; None closes every pool
+        """
+        keys = [self.origin(url)] if url else list(self._clients)
+        for key in keys:
+            client = self._clients.pop(key, None)
+            if not self._in_flight.get(key):
+                self._in_flight.pop(key, None)
+            if client is not None:
+                await client.aclose()
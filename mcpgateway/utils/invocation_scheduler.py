@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""Tool Invocation Scheduler.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Bounds how much upstream work tool invocations may start at once, so that
+overload degrades predictably instead of piling up coroutines:
+- A concurrency limit per tool and per federated gateway
+- Fair queueing: waiters are served round-robin across clients, so one busy
+  client cannot monopolise a tool
+- A bounded queue per tool/gateway; calls beyond it are rejected immediately
+- A per-call deadline covering queueing and execution; when it expires the
+  upstream work is cancelled
+- Active / queued counters per tool and gateway for observability
+
+Examples:
+    >>> import asyncio
+    >>> scheduler = InvocationScheduler(tool_limit=1, gateway_limit=1, max_queue=10, timeout=5)
+    >>> async def call():
+    ...     async with scheduler.slot("echo", gateway="gw1", client="alice"):
+    ...         return scheduler.metrics()["tools"]["echo"]["active"]
+    >>> asyncio.run(call())
+    1
+    >>> scheduler.metrics()["tools"]["echo"]["active"]
+    0
+"""
+
+# Standard
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+import logging
+import math
+from typing import Any, AsyncGenerator, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerOverloadError(Exception):
+    """Raised when a call is rejected because its queue is full."""
+
+    def __init__(self, scope: str, key: str, queued: int, retry_after: float = 1.0):
+        """Initialize the error.
+
+        Args:
+            scope: "tool" or "gateway"
+            key: Tool name or gateway ID
+            queued: Number of calls already waiting
+            retry_after: Seconds the caller should wait before retrying
+        """
+        self.scope = scope
+        self.key = key
+        self.queued = queued
+        self.retry_after = retry_after
+        super().__init__(f"Too many pending invocations for {scope} '{key}' ({queued} queued)")
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """HTTP headers for a 503 response.
+
+        Returns:
+            Dict[str, str]: ``Retry-After`` in whole seconds, rounded up
+
+        Examples:
+            >>> SchedulerOverloadError("tool", "echo", 100).headers
+            {'Retry-After': '1'}
+        """
+        return {"Retry-After": str(max(1, math.ceil(self.retry_after)))}
+
+
+class InvocationTimeoutError(Exception):
+    """Raised when a call misses its deadline; its upstream work has been cancelled."""
+
+    def __init__(self, tool: str, timeout: float):
+        """Initialize the error.
+
+        Args:
+            tool: Tool name
+            timeout: Deadline in seconds
+        """
+        self.tool = tool
+        self.timeout = timeout
+        super().__init__(f"Tool '{tool}' did not complete within {timeout:g}s")
+
+
+class _Lane:
+    """Concurrency limit with a fair, bounded wait queue.
+
+    Waiters are kept in one FIFO per client and served round-robin across
+    clients. A released slot is handed directly to the next waiter, so a
+    newcomer can never jump the queue.
+    """
+
+    def __init__(self, limit: int, max_queue: int):
+        """Initialize an idle lane.
+
+        Args:
+            limit: Concurrent calls allowed
+            max_queue: Calls allowed to wait for a slot
+        """
+        self.limit = max(1, limit)
+        self.max_queue = max_queue
+        self.active = 0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {}
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot.
+
+        Returns:
+            int: Queue depth
+        """
+        return sum(len(q) for q in self._waiters.values())
+
+    async def acquire(self, client: str) -> None:
+        """Take a slot, waiting in the client's queue if the lane is full.
+
+        Args:
+            client: Identity used for fair queueing
+
+        Raises:
+            OverflowError: If the queue is full
+            CancelledError: If the waiting task was cancelled
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        if self.queued >= self.max_queue:
+            raise OverflowError(self.queued)
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(client, deque()).append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # The slot was handed over just as we were cancelled: pass it on
+                self.release()
+            else:
+                queue = self._waiters.get(client)
+                if queue is not None and fut in queue:
+                    queue.remove(fut)
+                    if not queue:
+                        del self._waiters[client]
+            raise
+
+    def release(self) -> None:
+        """Hand the slot to the next waiting client, or free it."""
+        while self._waiters:
+            client = next(iter(self._waiters))
+            queue = self._waiters.pop(client)
+            fut = queue.popleft()
+            if queue:
+                # Rotate the client to the back so others get a turn
+                self._waiters[client] = queue
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self.active -= 1
+
+
+class InvocationScheduler:
+    """Admission control for tool invocations.
+
+    Attributes:
+        tool_limit: Concurrent calls per tool
+        gateway_limit: Concurrent calls per federated gateway
+        max_queue: Calls allowed to wait per tool or gateway
+        timeout: Default per-call deadline in seconds
+    """
+
+    def __init__(self, tool_limit: int = 10, gateway_limit: int = 50, max_queue: int = 100, timeout: Optional[float] = 60.0):
+        """Initialize the scheduler; lanes are created lazily.
+
+        Args:
+            tool_limit: Concurrent calls per tool
+            gateway_limit: Concurrent calls per federated gateway
+            max_queue: Calls allowed to wait per tool or gateway
+            timeout: Default per-call deadline in seconds, None for no deadline
+        """
+        self.tool_limit = tool_limit
+        self.gateway_limit = gateway_limit
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._tools: Dict[str, _Lane] = {}
+        self._gateways: Dict[str, _Lane] = {}
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _lane(self, lanes: Dict[str, _Lane], key: str, limit: int) -> _Lane:
+        """Return the lane for ``key``, creating it if needed.
+
+        Args:
+            lanes: Tool or gateway lanes
+            key: Tool name or gateway ID
+            limit: Concurrency limit for a new lane
+
+        Returns:
+            _Lane: The lane
+        """
+        lane = lanes.get(key)
+        if lane is None:
+            lane = lanes[key] = _Lane(limit, self.max_queue)
+        return lane
+
+    async def _acquire(self, scope: str, lane: _Lane, key: str, client: str) -> None:
+        """Take a slot on a lane, translating a full queue into a rejection.
+
+        Args:
+            scope: "tool" or "gateway"
+            lane: Lane to acquire
+            key: Tool name or gateway ID
+            client: Identity used for fair queueing
+
+        Raises:
+            SchedulerOverloadError: If the lane's queue is full
+        """
+        try:
+            await lane.acquire(client)
+        except OverflowError:
+            self.rejected += 1
+            logger.warning(f"Rejecting invocation: {scope} '{key}' has {lane.queued} calls queued")
+            raise SchedulerOverloadError(scope, key, lane.queued)
+
+    @asynccontextmanager
+    async def slot(self, tool: str, gateway: Optional[str] = None, client: Optional[str] = None, timeout: Optional[float] = None) -> AsyncGenerator[asyncio.Timeout, None]:
+        """Run one invocation under the tool's (and gateway's) limits and deadline.
+
+        The deadline covers time spent queueing as well as the call itself.
+
+        Args:
+            tool: Tool name
+            gateway: Federated gateway ID, None for tools that are not federated
+            client: Identity of the caller, used for fair queueing
+            timeout: Deadline in seconds, defaults to the scheduler's
+
+        Yields:
+            asyncio.Timeout: The deadline, so wrapped code can tell its expiry from other cancellations
+
+        Raises:
+            InvocationTimeoutError: If the deadline expired; the wrapped work is cancelled
+            SchedulerOverloadError: If the tool's or gateway's queue is full
+
+        Examples:
+            >>> import asyncio
+            >>> scheduler = InvocationScheduler(timeout=0.01)
+            >>> async def slow():
+            ...     async with scheduler.slot("sleepy"):
+            ...         await asyncio.sleep(1)
+            >>> try:
+            ...     asyncio.run(slow())
+            ... except InvocationTimeoutError as e:
+            ...     print(e)
+            Tool 'sleepy' did not complete within 0.01s
+        """
+        client = client or "anonymous"
+        deadline = self.timeout if timeout is None else timeout
+        tool_lane = self._lane(self._tools, tool, self.tool_limit)
+        gateway_lane = self._lane(self._gateways, gateway, self.gateway_limit) if gateway else None
+
+        cm = asyncio.timeout(deadline)
+        try:
+            async with cm:
+                await self._acquire("tool", tool_lane, tool, client)
+                try:
+                    if gateway_lane is not None:
+                        await self._acquire("gateway", gateway_lane, gateway, client)
+                    try:
+                        yield cm
+                    finally:
+                        if gateway_lane is not None:
+                            gateway_lane.release()
+                finally:
+                    tool_lane.release()
+        except TimeoutError:
+            if not cm.expired():
+                raise
+            self.timed_out += 1
+            raise InvocationTimeoutError(tool, deadline)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Report active and queued calls per tool and gateway.
+
+        Returns:
+            Dict[str, Any]: Per-lane counters plus totals for rejected and timed-out calls
+        """
+
+        def _snapshot(lanes: Dict[str, _Lane]) -> Dict[str, Dict[str, int]]:
+            return {key: {"active": lane.active, "queued": lane.queued, "limit": lane.limit} for key, lane in lanes.items()}
+
+        return {
+            "tools": _snapshot(self._tools),
+            "gateways": _snapshot(self._gateways),
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Shared Keepalive Timer Wheel.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Long-lived connections (SSE streams, WebSockets) need something written to
+them when they have been idle for a while. Rather than giving every session
+its own timer task, sessions register a callback with one hashed timer
+wheel: a single task advances the wheel once per tick and only visits the
+sessions whose deadline falls in that slot, so the cost of a tick does not
+grow with the number of idle connections.
+
+Activity is recorded with ``touch()``, which only stores a timestamp; a
+session found to have been active when its slot comes round is simply
+rescheduled. The wheel's task stops when the last session unregisters.
+
+Examples:
+    >>> import asyncio
+    >>> wheel = KeepaliveWheel(tick=0.01)
+    >>> fired = []
+    >>> async def main():
+    ...     handle = wheel.register(lambda: fired.append("ping"), interval=0.03)
+    ...     await asyncio.sleep(0.1)
+    ...     handle.cancel()
+    ...     await asyncio.sleep(0.02)
+    >>> asyncio.run(main())
+    >>> 2 <= len(fired) <= 4, wheel.stats()["sessions"]
+    (True, 0)
+"""
+
+# Standard
+import asyncio
+import logging
+import math
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class KeepaliveHandle:
+    """A session registered with a :class:`KeepaliveWheel`.
+
+    Attributes:
+        interval: Idle seconds after which the callback fires
+        last_active: Monotonic time of the last activity or keepalive
+    """
+
+    __slots__ = ("_wheel", "_callback", "interval", "last_active", "rounds", "cancelled")
+
+    def __init__(self, wheel: "KeepaliveWheel", callback: Callable[[], None], interval: float):
+        """Initialize the handle.
+
+        Args:
+            wheel: Wheel the handle belongs to
+            callback: Called when the session has been idle for ``interval`` seconds
+            interval: Idle seconds between keepalives
+        """
+        self._wheel = wheel
+        self._callback = callback
+        self.interval = interval
+        self.last_active = time.monotonic()
+        self.rounds = 0
+        self.cancelled = False
+
+    def touch(self) -> None:
+        """Record activity, postponing the next keepalive."""
+        self.last_active = time.monotonic()
+
+    def cancel(self) -> None:
+        """Unregister the session; safe to call more than once."""
+        self.cancelled = True
+        # A no-op for handles of an event loop the wheel has since been reset for
+        self._wheel._handles.discard(self)
+
+
+class KeepaliveWheel:
+    """Hashed timer wheel firing per-session keepalive callbacks.
+
+    Callbacks run on the event loop and must not block; to do I/O they
+    should schedule it (put a sentinel on a queue, create a task, ...).
+
+    Attributes:
+        tick: Seconds between wheel advances, i.e. the timing resolution
+        slots: Number of slots in the wheel
+        fired: Keepalive callbacks run so far
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 64):
+        """Initialize an empty wheel.
+
+        Args:
+            tick: Seconds between wheel advances
+            slots: Number of slots; deadlines further out wrap around in rounds
+        """
+        self.tick = tick
+        self.slots = slots
+        self.fired = 0
+        self._wheel: List[List[KeepaliveHandle]] = [[] for _ in range(slots)]
+        self._cursor = 0
+        self._handles: Set[KeepaliveHandle] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, callback: Callable[[], None], interval: float) -> KeepaliveHandle:
+        """Register a session.
+
+        Must be called from a running event loop.
+
+        Args:
+            callback: Called whenever the session has been idle for ``interval`` seconds
+            interval: Idle seconds between keepalives
+
+        Returns:
+            KeepaliveHandle: Handle to ``touch()`` on activity and ``cancel()`` on close
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is not None and self._task.get_loop() is not loop:
+            # Sessions of another (finished) event loop cannot be served from this one
+            self._task.cancel()
+            # Its loop is no longer running, so the cancelled task may never finish
+            self._task = None
+            self._wheel = [[] for _ in range(self.slots)]
+            self._handles = set()
+        handle = KeepaliveHandle(self, callback, interval)
+        self._schedule(handle, interval)
+        self._handles.add(handle)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return handle
+
+    def _schedule(self, handle: KeepaliveHandle, delay: float) -> None:
+        """Place a handle in the slot ``delay`` seconds ahead.
+
+        Args:
+            handle: Handle to place
+            delay: Seconds until it should be looked at again
+        """
+        ticks = max(1, math.ceil(delay / self.tick))
+        handle.rounds = (ticks - 1) // self.slots
+        self._wheel[(self._cursor + ticks) % self.slots].append(handle)
+
+    def _advance(self, now: Optional[float] = None) -> None:
+        """Move to the next slot and fire the callbacks of the idle sessions in it.
+
+        Args:
+            now: Current monotonic time, defaults to ``time.monotonic()``
+        """
+        now = time.monotonic() if now is None else now
+        self._cursor = (self._cursor + 1) % self.slots
+        due, self._wheel[self._cursor] = self._wheel[self._cursor], []
+        for handle in due:
+            if handle.cancelled:
+                continue
+            if handle.rounds:
+                handle.rounds -= 1
+                self._wheel[self._cursor].append(handle)
+                continue
+            # Half a tick of slack so a slot reached marginally early still fires
+            remaining = handle.interval - (now - handle.last_active)
+            if remaining > self.tick / 2:
+                self._schedule(handle, remaining)
+                continue
+            try:
+                handle._callback()
+            except Exception as e:
+                logger.warning(f"Keepalive callback failed, unregistering session: {e}")
+                handle.cancel()
+                continue
+            self.fired += 1
+            handle.last_active = now
+            self._schedule(handle, handle.interval)
+
+    async def _run(self) -> None:
+        """Advance the wheel every tick while sessions are registered."""
+        while self._handles:
+            await asyncio.sleep(self.tick)
+            self._advance()
+
+    def stats(self) -> Dict[str, float]:
+        """Report the wheel's state.
+
+        Returns:
+            Dict[str, float]: Registered sessions, keepalives fired and the tick length
+        """
+        return {"sessions": len(self._handles), "fired": self.fired, "tick": self.tick}
+
+
+# Process-wide wheel shared by every SSE and WebSocket session
+keepalive_wheel = KeepaliveWheel()
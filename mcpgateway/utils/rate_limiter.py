@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""Token-bucket Rate Limiting.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Limits are expressed as requests per period (a minute by default) and
+enforced with token buckets: each key holds up to ``limit`` tokens, refilled
+continuously at ``limit / period`` tokens per second, and every request takes
+one. Checking a bucket is O(1) regardless of traffic.
+
+Two backends are available:
+- memory: buckets live in this process (default, no dependencies)
+- redis: buckets live in Redis and are updated by an atomic Lua script, so
+  the limit holds across all workers and replicas
+
+Buckets are keyed by scope and identity, e.g. ``tool:<name>``,
+``gateway:<url>``, ``user:<jwt sub>`` or ``server:<id>``. A rejected request
+raises ``RateLimitExceeded``, which carries a ready-made ``Retry-After``
+header.
+
+Examples:
+    >>> bucket = TokenBucket(capacity=2, refill_rate=1.0, now=0.0)
+    >>> bucket.consume(now=0.0), bucket.consume(now=0.0), bucket.consume(now=0.0)
+    (0.0, 0.0, 1.0)
+    >>> bucket.consume(now=1.0)
+    0.0
+"""
+
+# Standard
+import logging
+import math
+import time
+from typing import Any, Dict, Optional
+
+# First-Party
+from mcpgateway.config import settings
+
+try:
+    # Third-Party
+    from redis.asyncio import Redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Refill and take ``cost`` tokens atomically. Redis' own clock is used so
+# that workers with skewed clocks share one notion of time.
+# KEYS[1] = bucket key; ARGV = capacity, refill rate (tokens/s), cost
+# Returns {allowed (0/1), seconds until enough tokens (as a string)}
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return {allowed, tostring(retry_after)}
+"""
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request exceeds its rate limit."""
+
+    def __init__(self, scope: str, key: str, limit: int, retry_after: float):
+        """Initialize the error.
+
+        Args:
+            scope: What the limit applies to: "tool", "gateway", "user" or "server"
+            key: Identity within the scope
+            limit: Configured requests per period
+            retry_after: Seconds until a request would be admitted
+        """
+        self.scope = scope
+        self.key = key
+        self.limit = limit
+        self.retry_after = retry_after
+        super().__init__(f"Rate limit exceeded for {scope} '{key}', retry in {retry_after:.1f}s")
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """HTTP headers for a 429 response.
+
+        Returns:
+            Dict[str, str]: ``Retry-After`` in whole seconds, rounded up
+
+        Examples:
+            >>> RateLimitExceeded("tool", "echo", 10, 0.2).headers
+            {'Retry-After': '1'}
+        """
+        return {"Retry-After": str(max(1, math.ceil(self.retry_after)))}
+
+
+class TokenBucket:
+    """In-process token bucket.
+
+    Attributes:
+        capacity: Maximum tokens (the allowed burst)
+        refill_rate: Tokens added per second
+    """
+
+    __slots__ = ("capacity", "refill_rate", "_tokens", "_updated")
+
+    def __init__(self, capacity: float, refill_rate: float, now: Optional[float] = None):
+        """Initialize a full bucket.
+
+        Args:
+            capacity: Maximum tokens
+            refill_rate: Tokens added per second
+            now: Current monotonic time, defaults to ``time.monotonic()``
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic() if now is None else now
+
+    def consume(self, cost: float = 1.0, now: Optional[float] = None) -> float:
+        """Refill, then take ``cost`` tokens if available.
+
+        Args:
+            cost: Tokens to take
+            now: Current monotonic time, defaults to ``time.monotonic()``
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise seconds until they would be
+        """
+        now = time.monotonic() if now is None else now
+        self._tokens = min(self.capacity, self._tokens + max(0.0, now - self._updated) * self.refill_rate)
+        self._updated = now
+        if self._tokens >= cost:
+            self._tokens -= cost
+            return 0.0
+        return (cost - self._tokens) / self.refill_rate
+
+    def is_full(self, now: Optional[float] = None) -> bool:
+        """Whether the bucket has refilled completely, i.e. carries no state worth keeping.
+
+        Args:
+            now: Current monotonic time, defaults to ``time.monotonic()``
+
+        Returns:
+            bool: True if the bucket is full
+        """
+        now = time.monotonic() if now is None else now
+        return self._tokens + (now - self._updated) * self.refill_rate >= self.capacity
+
+
+class RateLimiter:
+    """Token-bucket rate limiter with an in-process or Redis backend."""
+
+    # Idle buckets are dropped once this many keys are tracked in memory
+    MAX_LOCAL_BUCKETS = 10000
+
+    def __init__(self, backend: str = "memory", redis_url: Optional[str] = None):
+        """Initialize the limiter.
+
+        Args:
+            backend: "memory" or "redis"
+            redis_url: Redis connection URL (required for the redis backend)
+        """
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._redis = None
+        self._script = None
+        if backend == "redis":
+            if not REDIS_AVAILABLE or not redis_url:
+                logger.warning("Redis rate limiting requested but redis is not installed or REDIS_URL is unset; limits are per process")
+            else:
+                self._redis = Redis.from_url(redis_url)
+                self._script = self._redis.register_script(TOKEN_BUCKET_LUA)
+
+    def _consume_local(self, key: str, capacity: float, rate: float) -> float:
+        """Take a token from the in-process bucket for ``key``.
+
+        Args:
+            key: Bucket key
+            capacity: Bucket capacity
+            rate: Refill rate in tokens per second
+
+        Returns:
+            float: 0.0 if admitted, otherwise seconds until a token is available
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.capacity != capacity:
+            if len(self._buckets) >= self.MAX_LOCAL_BUCKETS:
+                now = time.monotonic()
+                self._buckets = {k: b for k, b in self._buckets.items() if not b.is_full(now)}
+            bucket = self._buckets[key] = TokenBucket(capacity, rate)
+        return bucket.consume()
+
+    async def hit(self, scope: str, key: str, limit: int, period: float = 60.0) -> None:
+        """Count one request against ``scope:key``.
+
+        Args:
+            scope: What the limit applies to: "tool", "gateway", "user" or "server"
+            key: Identity within the scope
+            limit: Requests allowed per period; 0 or less disables the check
+            period: Period in seconds
+
+        Raises:
+            RateLimitExceeded: If the bucket is empty
+
+        Examples:
+            >>> import asyncio
+            >>> limiter = RateLimiter()
+            >>> asyncio.run(limiter.hit("tool", "echo", 1))
+            >>> try:
+            ...     asyncio.run(limiter.hit("tool", "echo", 1))
+            ... except RateLimitExceeded as e:
+            ...     print(e.scope, e.key, e.headers)
+            tool echo {'Retry-After': '60'}
+        """
+        if limit <= 0:
+            return
+        bucket_key = f"ratelimit:{scope}:{key}"
+        rate = limit / period
+        retry_after = None
+        if self._script is not None:
+            try:
+                allowed, wait = await self._script(keys=[bucket_key], args=[limit, rate, 1])
+                retry_after = 0.0 if int(allowed) else float(wait)
+            except Exception as e:
+                logger.warning(f"Redis rate limiter unavailable, using the local bucket: {e}")
+        if retry_after is None:
+            retry_after = self._consume_local(bucket_key, limit, rate)
+        if retry_after > 0:
+            raise RateLimitExceeded(scope, key, limit, retry_after)
+
+    def clear(self) -> None:
+        """Forget all in-process buckets."""
+        self._buckets.clear()
+
+
+def rate_limit_subject(user: Any) -> str:
+    """Derive the per-user rate-limit key from authentication results.
+
+    Args:
+        user: What ``require_auth`` returned: a decoded JWT payload or a username
+
+    Returns:
+        str: The JWT ``sub`` (or ``username``) claim, the username, or "anonymous"
+
+    Examples:
+        >>> rate_limit_subject({"sub": "alice", "exp": 1})
+        'alice'
+        >>> rate_limit_subject("admin")
+        'admin'
+        >>> rate_limit_subject(None)
+        'anonymous'
+    """
+    if isinstance(user, dict):
+        return str(user.get("sub") or user.get("username") or "anonymous")
+    return str(user) if user else "anonymous"
+
+
+# Process-wide limiter; with the redis backend its buckets are shared cluster-wide
+rate_limiter = RateLimiter(settings.rate_limit_backend, settings.redis_url)
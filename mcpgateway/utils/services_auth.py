@@ -5,13 +5,19 @@ Copyright 2025
 SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
+Credentials are stored AES-GCM encrypted. The key is derived once per
+passphrase, and decrypted values are kept in a bounded LRU keyed by
+ciphertext, so repeated invocations of the same tool do not decrypt again.
 """
 
 # Standard
 import base64
+from collections import OrderedDict
+from functools import lru_cache
 import hashlib
 import json
 import os
+from typing import Dict, Optional, Tuple
 
 # First-Party
 from mcpgateway.config import settings
@@ -19,6 +25,55 @@ from mcpgateway.config import settings
 # Third-Party
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+# Decrypted auth values kept in memory, keyed by (passphrase, ciphertext)
+MAX_DECRYPTED_AUTH = 4096
+_decrypted: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+
+MASK = "********"
+
+
+@lru_cache(maxsize=4)
+def _derive_key(passphrase: str) -> bytes:
+    """
+    Derive the 32-byte AES key for a passphrase (once per passphrase).
+
+    Args:
+        passphrase (str): The encryption secret.
+
+    Returns:
+        bytes: A 32-byte encryption key.
+    """
+    return hashlib.sha256(passphrase.encode()).digest()
+
+
+@lru_cache(maxsize=4)
+def _cipher(passphrase: str) -> AESGCM:
+    """
+    Return the AES-GCM cipher for a passphrase (once per passphrase).
+
+    Args:
+        passphrase (str): The encryption secret.
+
+    Returns:
+        AESGCM: The cipher.
+    """
+    return AESGCM(_derive_key(passphrase))
+
+
+def _remember(passphrase: str, encoded_value: str, auth_value: Dict) -> None:
+    """
+    Store a decrypted auth value, evicting the least recently used one if full.
+
+    Args:
+        passphrase (str): The encryption secret the value was encrypted with.
+        encoded_value (str): The encrypted value.
+        auth_value (Dict): The decrypted value.
+    """
+    _decrypted[(passphrase, encoded_value)] = auth_value
+    _decrypted.move_to_end((passphrase, encoded_value))
+    if len(_decrypted) > MAX_DECRYPTED_AUTH:
+        _decrypted.popitem(last=False)
+
 
 def get_key() -> bytes:
     """
@@ -33,7 +88,7 @@ def get_key() -> bytes:
     passphrase = settings.auth_encryption_secret
     if not passphrase:
         raise ValueError("AUTH_ENCRPYPTION_SECRET not set in environment.")
-    return hashlib.sha256(passphrase.encode()).digest()  # 32-byte key
+    return _derive_key(passphrase)  # 32-byte key
 
 
 def encode_auth(auth_value: dict) -> str:
@@ -49,13 +104,15 @@ def encode_auth(auth_value: dict) -> str:
     if not auth_value:
         return None
     plaintext = json.dumps(auth_value)
-    key = get_key()
-    aesgcm = AESGCM(key)
+    get_key()
+    passphrase = settings.auth_encryption_secret
     nonce = os.urandom(12)
-    ciphertext = aesgcm.encrypt(nonce, plaintext.encode(), None)
+    ciphertext = _cipher(passphrase).encrypt(nonce, plaintext.encode(), None)
     combined = nonce + ciphertext
-    encoded = base64.urlsafe_b64encode(combined).rstrip(b"=")
-    return encoded.decode()
+    encoded = base64.urlsafe_b64encode(combined).rstrip(b"=").decode()
+    # The plaintext is at hand, so the first use of this value need not decrypt it
+    _remember(passphrase, encoded, json.loads(plaintext))
+    return encoded
 
 
 def decode_auth(encoded_value: str) -> dict:
@@ -70,12 +127,61 @@ def decode_auth(encoded_value: str) -> dict:
     """
     if not encoded_value:
         return {}
-    key = get_key()
-    aesgcm = AESGCM(key)
+    get_key()
+    passphrase = settings.auth_encryption_secret
+    cached = _decrypted.get((passphrase, encoded_value))
+    if cached is not None:
+        _decrypted.move_to_end((passphrase, encoded_value))
+        return dict(cached)
     # Fix base64 padding
     padded = encoded_value + "=" * (-len(encoded_value) % 4)
     combined = base64.urlsafe_b64decode(padded)
     nonce = combined[:12]
     ciphertext = combined[12:]
-    plaintext = aesgcm.decrypt(nonce, ciphertext, None)
-    return json.loads(plaintext.decode())
+    plaintext = _cipher(passphrase).decrypt(nonce, ciphertext, None)
+    auth_value = json.loads(plaintext.decode())
+    _remember(passphrase, encoded_value, auth_value)
+    return dict(auth_value)
+
+
+def mask_auth(auth_type: Optional[str], encoded_value: Optional[str]) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Summarise stored credentials for display, with secrets masked.
+
+    Args:
+        auth_type (Optional[str]): "basic", "bearer", "authheaders" or None.
+        encoded_value (Optional[str]): The encrypted authentication dictionary.
+
+    Returns:
+        Optional[Dict[str, Optional[str]]]: The masked summary, or None if there is no authentication.
+
+    Examples:
+        >>> mask_auth("bearer", encode_auth({"Authorization": "Bearer abc"}))
+        {'auth_type': 'bearer', 'token': '********'}
+        >>> mask_auth("authheaders", encode_auth({"X-Key": "abc"}))
+        {'auth_type': 'authheaders', 'auth_header_key': 'X-Key', 'auth_header_value': '********'}
+        >>> mask_auth(None, None) is None
+        True
+    """
+    if auth_type not in ("basic", "bearer", "authheaders"):
+        return None
+    decoded_auth_value = decode_auth(encoded_value)
+    if auth_type == "basic":
+        decoded_bytes = base64.b64decode(decoded_auth_value["Authorization"].split("Basic ")[1])
+        username, password = decoded_bytes.decode("utf-8").split(":")
+        return {
+            "auth_type": "basic",
+            "username": username,
+            "password": MASK if password else None,
+        }
+    if auth_type == "bearer":
+        return {
+            "auth_type": "bearer",
+            "token": MASK if decoded_auth_value["Authorization"] else None,
+        }
+    header_key = next(iter(decoded_auth_value))
+    return {
+        "auth_type": "authheaders",
+        "auth_header_key": header_key,
+        "auth_header_value": MASK if decoded_auth_value[header_key] else None,
+    }
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Single-flight Request Coalescing.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+When several callers ask for the same thing at the same moment, only the
+first (the leader) does the work; the others join its in-flight call and
+receive the same result or exception. Nothing is kept once the call
+completes, so there are no time-based caching semantics.
+
+The shared call runs in a task of its own: a joining caller that is
+cancelled simply stops waiting, and the call is only cancelled once every
+caller waiting on it has gone. Because it can outlive the leader, the work
+must not borrow the leader's request-scoped resources (such as its database
+session); it should open its own.
+
+Examples:
+    >>> import asyncio
+    >>> flight = SingleFlight()
+    >>> calls = []
+    >>> async def fetch():
+    ...     calls.append(1)
+    ...     await asyncio.sleep(0.01)
+    ...     return "data"
+    >>> async def burst():
+    ...     return await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+    >>> asyncio.run(burst())
+    ['data', 'data', 'data', 'data', 'data']
+    >>> len(calls), flight.stats()
+    (1, {'in_flight': 0, 'leaders': 1, 'coalesced': 4})
+"""
+
+# Standard
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+class _Call:
+    """An in-flight call and the number of callers waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        """Initialize the call.
+
+        Args:
+            task: Task running the shared work
+        """
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key.
+
+    Attributes:
+        leaders: Calls that did the work
+        coalesced: Calls that joined an in-flight call instead
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, _Call] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn`` unless a call with the same key is in flight, in which case join it.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function doing the work; only called by the leader, and may outlive its request
+
+        Returns:
+            Any: Result of the shared call
+
+        Raises:
+            asyncio.CancelledError: If this caller was cancelled
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.create_task(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _t: self._forget(key, call))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if not call.task.done() and call.waiters == 1:
+                # Last caller gone: nobody needs the result any more
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: str, call: _Call) -> None:
+        """Drop a completed call so the next caller starts a fresh one.
+
+        Args:
+            key: Identity of the call
+            call: The completed call
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            # Mark the exception as retrieved; every waiter has already seen it
+            call.task.exception()
+
+    def in_flight(self) -> List[str]:
+        """Keys of the calls currently in flight.
+
+        Returns:
+            List[str]: Keys
+        """
+        return list(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """Report how often calls were coalesced.
+
+        Returns:
+            Dict[str, int]: Calls in flight, leader calls and coalesced calls
+        """
+        return {"in_flight": len(self._calls), "leaders": self.leaders, "coalesced": self.coalesced}
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""Tool Result Cache Implementation.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+This module implements an opt-in in-memory cache for the results of
+idempotent tool invocations. Features:
+- Keys built from the tool ID and canonicalised arguments
+- Per-tool TTL from the tool's settings, overridden by upstream ``Cache-Control``
+- Stale-while-revalidate: slightly stale results are served while a refresh runs
+- Conditional revalidation with ``ETag`` / ``Last-Modified`` validators
+- Error results are never cached
+- Invalidation of every entry of a tool when the tool changes
+- Maximum size limit with LRU eviction
+
+A tool opts in by setting its ``cache_ttl`` (seconds), and optionally
+``stale_while_revalidate`` (seconds). These are gateway settings of the tool,
+not MCP annotations, so they are not shown to MCP clients.
+
+Examples:
+    >>> from types import SimpleNamespace
+    >>> ToolResultCache.policy(SimpleNamespace(cache_ttl=60, stale_while_revalidate=None))
+    CachePolicy(ttl=60.0, stale_while_revalidate=0.0)
+    >>> ToolResultCache.policy(SimpleNamespace(cache_ttl=None, stale_while_revalidate=None)) is None
+    True
+    >>> ToolResultCache.key("t1", {"b": 1, "a": [1, 2]}) == ToolResultCache.key("t1", {"a": [1, 2], "b": 1})
+    True
+"""
+
+# Standard
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Mapping, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachePolicy:
+    """Caching parameters of one tool."""
+
+    ttl: float
+    stale_while_revalidate: float = 0.0
+
+
+@dataclass
+class CachedToolResult:
+    """Cached tool result with freshness information and validators."""
+
+    result: Any
+    fresh_until: float
+    stale_until: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: float) -> bool:
+        """Whether the result can be served without contacting the upstream.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            bool: True if fresh
+        """
+        return now < self.fresh_until
+
+    def is_servable(self, now: float) -> bool:
+        """Whether the result can be served while it is refreshed in the background.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            bool: True if within the stale-while-revalidate window
+        """
+        return now < self.stale_until
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating the result upstream.
+
+        Returns:
+            Dict[str, str]: ``If-None-Match`` / ``If-Modified-Since`` headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a ``Cache-Control`` header into its directives.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Dict[str, Optional[str]]: Lower-cased directive names to their values (None for flags)
+
+    Examples:
+        >>> parse_cache_control('public, max-age=300, stale-while-revalidate="30"')
+        {'public': None, 'max-age': '300', 'stale-while-revalidate': '30'}
+        >>> parse_cache_control(None)
+        {}
+    """
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _seconds(value: Any) -> Optional[float]:
+    """Parse a non-negative number of seconds.
+
+    Args:
+        value: Raw value
+
+    Returns:
+        Optional[float]: Seconds, or None if missing or invalid
+    """
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds >= 0 else None
+
+
+class ToolResultCache:
+    """LRU cache of tool results.
+
+    Attributes:
+        max_size: Maximum number of entries
+        hits: Results served fresh from the cache
+        stale_hits: Stale results served while being revalidated
+        misses: Lookups that had to invoke the tool
+    """
+
+    def __init__(self, max_size: int = 1000):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CachedToolResult]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._generations: Dict[str, int] = {}  # tool id -> number of times its results were invalidated
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def policy(tool: Any) -> Optional[CachePolicy]:
+        """Read a tool's caching policy from its settings.
+
+        Args:
+            tool: Tool (anything with ``cache_ttl`` and ``stale_while_revalidate`` attributes)
+
+        Returns:
+            Optional[CachePolicy]: The policy, or None if the tool does not opt in
+        """
+        ttl = _seconds(tool.cache_ttl)
+        if not ttl:
+            return None
+        return CachePolicy(ttl=ttl, stale_while_revalidate=_seconds(tool.stale_while_revalidate) or 0.0)
+
+    @staticmethod
+    def key(tool_id: Any, arguments: Optional[Mapping[str, Any]]) -> str:
+        """Build the cache key for one invocation.
+
+        Args:
+            tool_id: Tool ID
+            arguments: Invocation arguments
+
+        Returns:
+            str: ``<tool_id>:<sha256 of the canonical JSON arguments>``
+        """
+        canonical = json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{tool_id}:{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    def get(self, key: str) -> Optional[CachedToolResult]:
+        """Look up an entry that is still fresh, servable while stale, or revalidatable.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[CachedToolResult]: The entry, or None if missing or unusable
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_servable(time.monotonic()) and not entry.validators:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def store(
+        self,
+        key: str,
+        result: Any,
+        policy: CachePolicy,
+        headers: Optional[Mapping[str, str]] = None,
+        previous: Optional[CachedToolResult] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Cache a result, honouring upstream caching headers when present.
+
+        ``Cache-Control: no-store`` prevents caching; ``max-age`` and
+        ``stale-while-revalidate`` override the tool's policy.
+
+        Args:
+            key: Cache key
+            result: Tool result (results with ``is_error`` set are not cached)
+            policy: Tool's caching policy
+            headers: Upstream response headers, for REST tools
+            previous: Entry just revalidated (on a 304); its validators are kept unless the response sends new ones
+            generation: The tool's :meth:`generation` when the call started; if
+                the tool has been invalidated since, the result is not cached
+
+        Examples:
+            >>> cache = ToolResultCache()
+            >>> started = cache.generation("t")
+            >>> cache.invalidate_tool("t")
+            >>> cache.store("t:1", "old", CachePolicy(ttl=60), generation=started)
+            >>> cache.get("t:1") is None
+            True
+        """
+        if getattr(result, "is_error", False):
+            return
+        if generation is not None and generation != self.generation(key.partition(":")[0]):
+            return
+        headers = headers or {}
+        directives = parse_cache_control(headers.get("cache-control"))
+        if "no-store" in directives:
+            self.invalidate(key)
+            return
+        ttl = _seconds(directives.get("max-age"))
+        ttl = policy.ttl if ttl is None else ttl
+        swr = _seconds(directives.get("stale-while-revalidate"))
+        swr = policy.stale_while_revalidate if swr is None else swr
+        if "no-cache" in directives:
+            ttl = 0.0  # must be revalidated before every use
+        etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        if previous is not None:
+            etag, last_modified = etag or previous.etag, last_modified or previous.last_modified
+        if ttl + swr <= 0 and not (etag or last_modified):
+            return
+
+        now = time.monotonic()
+        self._entries[key] = CachedToolResult(result=result, fresh_until=now + ttl, stale_until=now + ttl + swr, etag=etag, last_modified=last_modified)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Drop one entry.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def generation(self, tool_id: Any) -> int:
+        """Count the invalidations of a tool's results, so callers can tell a result went stale in flight.
+
+        Args:
+            tool_id: Tool ID
+
+        Returns:
+            int: Incremented by every :meth:`invalidate_tool`
+        """
+        return self._generations.get(str(tool_id), 0)
+
+    def invalidate_tool(self, tool_id: Any) -> None:
+        """Drop every cached result of a tool, and keep calls already in flight from caching theirs.
+
+        Args:
+            tool_id: Tool ID
+        """
+        self._generations[str(tool_id)] = self.generation(tool_id) + 1
+        prefix = f"{tool_id}:"
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+    def begin_refresh(self, key: str) -> bool:
+        """Claim the background refresh of an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: False if a refresh of that entry is already running
+        """
+        if key in self._refreshing:
+            return False
+        self._refreshing.add(key)
+        return True
+
+    def end_refresh(self, key: str) -> None:
+        """Release a claim taken with :meth:`begin_refresh`.
+
+        Args:
+            key: Cache key
+        """
+        self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Report cache effectiveness.
+
+        Returns:
+            Dict[str, int]: Entry count and hit / stale-hit / miss counters
+        """
+        return {"entries": len(self._entries), "hits": self.hits, "stale_hits": self.stale_hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        self._entries.clear()
+        self._refreshing.clear()
@@ -5,10 +5,23 @@ Copyright 2025
 SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
+Verified JWTs are cached by token hash for ``JWT_CACHE_TTL`` seconds (never
+past their ``exp``), so clients that reuse one token for many requests pay
+for signature verification once. ``revoke_token`` evicts a token and rejects
+it until its ``exp``. Revocations are always checked in process. With
+``CACHE_TYPE=redis`` they are also published through Redis, and every
+worker's ``RevocationSync`` copies them into its own list: at once through
+pub/sub, and by a full reload every ``JWT_REVOCATION_SYNC_INTERVAL`` seconds
+that bounds how long a missed message can go unnoticed.
 """
 
 # Standard
-from typing import Optional
+import asyncio
+from collections import OrderedDict
+import hashlib
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
 
 # First-Party
 from mcpgateway.config import settings
@@ -25,13 +38,314 @@ from fastapi.security.utils import get_authorization_scheme_param
 import jwt
 from jwt import PyJWTError
 
+try:
+    # Third-Party
+    from redis.asyncio import Redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 basic_security = HTTPBasic(auto_error=False)
 security = HTTPBearer(auto_error=False)
 
 
+class TokenCache:
+    """Verified JWT payloads keyed by token hash, plus revoked token hashes.
+
+    Entries are dropped when the verification settings change, so a token is
+    never trusted under a key other than the one that verified it.
+    """
+
+    # Least recently used tokens are dropped beyond this many entries
+    MAX_ENTRIES = 10000
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._revoked: Dict[str, float] = {}
+        self._config: Optional[Tuple[str, ...]] = None
+
+    @staticmethod
+    def key(token: str) -> str:
+        """Hash a token so raw credentials are not kept as dictionary keys.
+
+        Args:
+            token: The JWT
+
+        Returns:
+            str: SHA-256 hex digest of the token
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token_key: str, config: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Return the cached payload of a token that is still trusted.
+
+        Args:
+            token_key: Hash of the token
+            config: Current verification settings
+
+        Returns:
+            Optional[Dict[str, Any]]: A copy of the payload, or None on a miss
+        """
+        if config != self._config:
+            self._entries.clear()
+            self._config = config
+            return None
+        entry = self._entries.get(token_key)
+        if entry is None:
+            return None
+        payload, valid_until = entry
+        if time.time() >= valid_until:
+            del self._entries[token_key]
+            return None
+        self._entries.move_to_end(token_key)
+        return dict(payload)
+
+    def put(self, token_key: str, payload: Dict[str, Any], ttl: float) -> None:
+        """Cache a verified payload for ``ttl`` seconds, capped at its ``exp`` claim.
+
+        Args:
+            token_key: Hash of the token
+            payload: Verified claims
+            ttl: Seconds to trust the token
+        """
+        valid_until = time.time() + ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            valid_until = min(valid_until, exp)
+        self._entries[token_key] = (dict(payload), valid_until)
+        self._entries.move_to_end(token_key)
+        if len(self._entries) > self.MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def revoke(self, token_key: str, until: float) -> None:
+        """Evict a token and reject it until ``until``.
+
+        Args:
+            token_key: Hash of the token
+            until: Epoch seconds after which the token is expired anyway
+        """
+        self._entries.pop(token_key, None)
+        now = time.time()
+        if len(self._revoked) >= self.MAX_ENTRIES:
+            self._revoked = {k: t for k, t in self._revoked.items() if t > now}
+        self._revoked[token_key] = until
+
+    def is_revoked(self, token_key: str) -> bool:
+        """Whether a token has been revoked and has not yet expired.
+
+        Args:
+            token_key: Hash of the token
+
+        Returns:
+            bool: True if the token must be rejected
+        """
+        until = self._revoked.get(token_key)
+        if until is None:
+            return False
+        if time.time() >= until:
+            del self._revoked[token_key]
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Forget all cached and revoked tokens."""
+        self._entries.clear()
+        self._revoked.clear()
+
+
+# Process-wide cache of verified tokens
+token_cache = TokenCache()
+
+
+class RevocationSync:
+    """Shares token revocations between workers through Redis.
+
+    Revoked token hashes live in a sorted set scored by expiry, and each new
+    revocation is also published. A background task applies published
+    revocations to ``token_cache`` and reloads the whole set periodically, so
+    request handling never waits on Redis.
+    """
+
+    KEY = "revoked_tokens"
+    CHANNEL = "revoked_tokens"
+
+    def __init__(self):
+        """Initialize without a Redis connection; ``initialize()`` opens it."""
+        self._redis = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Connect and start syncing when Redis is the configured cache."""
+        if settings.cache_type != "redis" or not settings.redis_url:
+            return
+        if not REDIS_AVAILABLE:
+            logger.warning("CACHE_TYPE=redis but redis is not installed; token revocations apply to one worker only")
+            return
+        self._redis = Redis.from_url(settings.redis_url)
+        self._task = asyncio.create_task(self._run())
+
+    async def shutdown(self) -> None:
+        """Stop syncing and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def publish(self, token_key: str, until: float) -> None:
+        """Share a revocation with the other workers.
+
+        Args:
+            token_key: Hash of the token
+            until: Epoch seconds after which the token is expired anyway
+        """
+        if self._redis is None:
+            return
+        try:
+            await self._redis.zadd(self.KEY, {token_key: until})
+            await self._redis.publish(self.CHANNEL, f"{token_key} {until}")
+        except Exception as e:
+            logger.warning(f"Could not share the revocation of a token through Redis; other workers still accept it: {e}")
+
+    @staticmethod
+    def apply(message: Any) -> None:
+        """Record a published revocation locally.
+
+        Args:
+            message: "<token hash> <until>", as bytes or str
+
+        Examples:
+            >>> RevocationSync.apply(b"abc 4102444800")
+            >>> token_cache.is_revoked("abc")
+            True
+            >>> token_cache.clear()
+        """
+        if isinstance(message, bytes):
+            message = message.decode()
+        token_key, _, until = message.partition(" ")
+        token_cache.revoke(token_key, float(until))
+
+    async def load(self) -> None:
+        """Drop expired revocations from Redis and copy the others into ``token_cache``."""
+        now = time.time()
+        await self._redis.zremrangebyscore(self.KEY, "-inf", now)
+        for token_key, until in await self._redis.zrange(self.KEY, 0, -1, withscores=True):
+            token_cache.revoke(token_key.decode() if isinstance(token_key, bytes) else token_key, float(until))
+
+    async def _run(self) -> None:
+        """Apply published revocations, reloading the full set every sync interval."""
+        interval = settings.jwt_revocation_sync_interval
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                # Subscribe before loading, so nothing published in between is missed
+                await pubsub.subscribe(self.CHANNEL)
+                await self.load()
+                reload_at = time.monotonic() + interval
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=max(0.0, reload_at - time.monotonic()))
+                    if message is not None:
+                        self.apply(message["data"])
+                    if time.monotonic() >= reload_at:
+                        await self.load()
+                        reload_at = time.monotonic() + interval
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Token revocation sync with Redis failed, retrying: {e}")
+                await asyncio.sleep(interval)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:  # nosec B110 - the connection is being discarded anyway
+                    pass
+
+
+# Process-wide revocation sync; started and stopped with the app
+token_revocations = RevocationSync()
+
+_jwks_clients: Dict[str, jwt.PyJWKClient] = {}
+
+
+async def revoke_token(token: str) -> float:
+    """Stop accepting a token until it expires, even if it is cached.
+
+    Only tokens with an ``exp`` claim can be revoked, so that no revocation
+    has to be kept forever; tokens without one are rejected only after
+    ``JWT_SECRET_KEY`` is rotated.
+
+    Args:
+        token: The JWT to revoke
+
+    Returns:
+        float: The token's ``exp``, until which it is rejected
+
+    Raises:
+        ValueError: If the token cannot be decoded or has no ``exp`` claim
+
+    Examples:
+        >>> import asyncio
+        >>> t = jwt.encode({"sub": "a", "exp": int(time.time()) + 60}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+        >>> until = asyncio.run(revoke_token(t))
+        >>> token_cache.is_revoked(TokenCache.key(t))
+        True
+        >>> asyncio.run(revoke_token(jwt.encode({"sub": "a"}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)))
+        Traceback (most recent call last):
+        ...
+        ValueError: Token has no exp claim; rotate JWT_SECRET_KEY to revoke it
+    """
+    try:
+        exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+    except PyJWTError as e:
+        raise ValueError(f"Not a valid JWT: {e}")
+    if not isinstance(exp, (int, float)):
+        raise ValueError("Token has no exp claim; rotate JWT_SECRET_KEY to revoke it")
+    token_key = TokenCache.key(token)
+    token_cache.revoke(token_key, float(exp))
+    if exp > time.time():
+        await token_revocations.publish(token_key, float(exp))
+    return float(exp)
+
+
+async def _verification_key(token: str) -> Any:
+    """Resolve the key that verifies ``token`` under the configured algorithm.
+
+    HMAC algorithms use ``JWT_SECRET_KEY``. Asymmetric algorithms use the key
+    from ``JWT_JWKS_URL`` matching the token's ``kid`` (the key set is fetched
+    in a worker thread and cached) or ``JWT_PUBLIC_KEY``.
+
+    Args:
+        token: The JWT to verify
+
+    Returns:
+        Any: Secret or public key
+    """
+    if settings.jwt_algorithm.upper().startswith("HS"):
+        return settings.jwt_secret_key
+    if settings.jwt_jwks_url:
+        client = _jwks_clients.get(settings.jwt_jwks_url)
+        if client is None:
+            client = _jwks_clients[settings.jwt_jwks_url] = jwt.PyJWKClient(settings.jwt_jwks_url, cache_keys=True)
+        signing_key = await asyncio.to_thread(client.get_signing_key_from_jwt, token)
+        return signing_key.key
+    return settings.jwt_public_key
+
+
 async def verify_jwt_token(token: str) -> dict:
     """Verify and decode a JWT token.
 
+    Tokens verified within the last ``JWT_CACHE_TTL`` seconds are served from
+    the cache without re-checking their signature.
+
     Args:
         token: The JWT token to verify.
 
@@ -39,16 +353,30 @@ async def verify_jwt_token(token: str) -> dict:
         dict: The decoded token payload containing claims.
 
     Raises:
-        HTTPException: If the token has expired or is invalid.
+        HTTPException: If the token has expired, been revoked or is invalid.
     """
+    token_key = TokenCache.key(token)
+    if token_cache.is_revoked(token_key):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    config = (settings.jwt_algorithm, settings.jwt_secret_key, settings.jwt_public_key, settings.jwt_jwks_url)
+    cached = token_cache.get(token_key, config)
+    if cached is not None:
+        return cached
+
     try:
         # Decode and validate token
         payload = jwt.decode(
             token,
-            settings.jwt_secret_key,
+            await _verification_key(token),
             algorithms=[settings.jwt_algorithm],
             # options={"require": ["exp"]},  # Require expiration
         )
+        if settings.jwt_cache_ttl > 0:
+            token_cache.put(token_key, payload, settings.jwt_cache_ttl)
         return payload  # Contains the claims (e.g., user info)
     except jwt.ExpiredSignatureError:
         raise HTTPException(
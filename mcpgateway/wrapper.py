@@ -22,7 +22,16 @@ Environment variables:
 - MCP_SERVER_CATALOG_URLS: Comma-separated list of gateway catalog URLs (required)
 - MCP_AUTH_TOKEN: Bearer token for the gateway (optional)
 - MCP_TOOL_CALL_TIMEOUT: Seconds to wait for a gateway RPC call (default 90)
+- MCP_CATALOG_TTL: Seconds a fetched tool/prompt/resource listing is served
+  from memory; listings are revalidated with ETags in the background (default 30, 0 disables)
 - MCP_WRAPPER_LOG_LEVEL: Python log level name or OFF/NONE to disable logging (default INFO)
+- MCP_WRAPPER_MODE: "rest" (default) translates each MCP request into gateway
+  REST calls; "streamablehttp" holds one MCP session to the first catalog's
+  ``/servers/{id}/mcp`` endpoint and relays JSON-RPC frames unchanged, with
+  concurrent requests pipelined over it
+
+In rest mode, all gateway calls share one keep-alive HTTP client. Listings are fetched
+per server (``/servers/{id}/tools`` etc.) so filtering happens server-side.
 
 Example:
     $ export MCPGATEWAY_BEARER_TOKEN=$(python3 -m mcpgateway.utils.create_jwt_token --username admin --exp 10080 --secret my-test-key)
@@ -38,13 +47,15 @@ import asyncio
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 # First-Party
 from mcpgateway import __version__
 
 # Third-Party
+import anyio
 import httpx
 from mcp import types
 from mcp.server import NotificationOptions, Server
@@ -58,13 +69,17 @@ from pydantic import AnyUrl
 ENV_SERVER_CATALOGS = "MCP_SERVER_CATALOG_URLS"
 ENV_AUTH_TOKEN = "MCP_AUTH_TOKEN"  # nosec B105 – this is an *environment variable name*, not a secret
 ENV_TIMEOUT = "MCP_TOOL_CALL_TIMEOUT"
+ENV_CATALOG_TTL = "MCP_CATALOG_TTL"
 ENV_LOG_LEVEL = "MCP_WRAPPER_LOG_LEVEL"
+ENV_MODE = "MCP_WRAPPER_MODE"
 
 RAW_CATALOGS: str = os.getenv(ENV_SERVER_CATALOGS, "")
 SERVER_CATALOG_URLS: List[str] = [u.strip() for u in RAW_CATALOGS.split(",") if u.strip()]
 
 AUTH_TOKEN: str = os.getenv(ENV_AUTH_TOKEN, "")
 TOOL_CALL_TIMEOUT: int = int(os.getenv(ENV_TIMEOUT, "90"))
+CATALOG_TTL: float = float(os.getenv(ENV_CATALOG_TTL, "30"))
+WRAPPER_MODE: str = os.getenv(ENV_MODE, "rest").lower()
 
 # Validate required configuration
 if not SERVER_CATALOG_URLS:
@@ -140,165 +155,155 @@ else:
     )
 
 logger = logging.getLogger("mcpgateway.wrapper")
-logger.info(f"Starting MCP wrapper {__version__}: base_url={BASE_URL}, timeout={TOOL_CALL_TIMEOUT}")
+logger.info(f"Starting MCP wrapper {__version__}: base_url={BASE_URL}, timeout={TOOL_CALL_TIMEOUT}, mode={WRAPPER_MODE}")
 
 
 # -----------------------------------------------------------------------------
 # HTTP Helpers
 # -----------------------------------------------------------------------------
-async def fetch_url(url: str) -> httpx.Response:
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the wrapper's shared HTTP client, creating it on first use.
+
+    Connections to the gateway are kept alive between calls instead of being
+    re-established for every request.
+
+    Returns:
+        httpx.AsyncClient: Client carrying the gateway bearer token.
+    """
+    global _http_client
+    if _http_client is None:
+        headers = {"Authorization": f"Bearer {AUTH_TOKEN}"} if AUTH_TOKEN else {}
+        _http_client = httpx.AsyncClient(
+            timeout=TOOL_CALL_TIMEOUT,
+            headers=headers,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def fetch_url(url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
     """
     Perform an asynchronous HTTP GET request and return the response.
 
     Args:
         url: The target URL to fetch.
+        headers: Extra request headers, e.g. ``If-None-Match``.
 
     Returns:
-        The successful ``httpx.Response`` object.
+        The ``httpx.Response`` object; successful, or 304 for a conditional request.
 
     Raises:
         httpx.RequestError:    If a network problem occurs while making the request.
         httpx.HTTPStatusError: If the server returns a 4xx or 5xx response.
     """
-    headers = {"Authorization": f"Bearer {AUTH_TOKEN}"} if AUTH_TOKEN else {}
-    async with httpx.AsyncClient(timeout=TOOL_CALL_TIMEOUT) as client:
-        try:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
+    try:
+        response = await get_http_client().get(url, headers=headers or {})
+        if response.status_code == 304:
             return response
-        except httpx.RequestError as err:
-            logger.error(f"Network error while fetching {url}: {err}")
-            raise
-        except httpx.HTTPStatusError as err:
-            logger.error(f"HTTP {err.response.status_code} returned for {url}: {err}")
-            raise
+        response.raise_for_status()
+        return response
+    except httpx.RequestError as err:
+        logger.error(f"Network error while fetching {url}: {err}")
+        raise
+    except httpx.HTTPStatusError as err:
+        logger.error(f"HTTP {err.response.status_code} returned for {url}: {err}")
+        raise
 
 
 # -----------------------------------------------------------------------------
-# Metadata Helpers
+# Catalog Cache
 # -----------------------------------------------------------------------------
-async def get_tools_from_mcp_server(catalog_urls: List[str]) -> List[str]:
-    """
-    Retrieve associated tool IDs from the MCP gateway server catalogs.
+# url -> (ETag, parsed listing, monotonic time of the last successful check)
+_catalog: Dict[str, Tuple[Optional[str], List[Dict[str, Any]], float]] = {}
 
-    Args:
-        catalog_urls (List[str]): List of catalog endpoint URLs.
 
-    Returns:
-        List[str]: A list of tool ID strings extracted from the server catalog.
+async def fetch_listing(url: str, force: bool = False) -> List[Dict[str, Any]]:
     """
-    server_ids = [url.split("/")[-1] for url in catalog_urls]
-    url = f"{BASE_URL}/servers/"
-    response = await fetch_url(url)
-    catalog = response.json()
-    tool_ids: List[str] = []
-    for entry in catalog:
-        if str(entry.get("id")) in server_ids:
-            tool_ids.extend(entry.get("associatedTools", []))
-    return tool_ids
-
-
-async def tools_metadata(tool_ids: List[str]) -> List[Dict[str, Any]]:
-    """
-    Fetch metadata for a list of MCP tools by their IDs.
+    Fetch a JSON listing, serving it from memory while it is fresh.
+
+    Stale listings are revalidated with ``If-None-Match``; a 304 reuses the
+    cached copy without downloading or parsing it again.
 
     Args:
-        tool_ids (List[str]): List of tool ID strings.
+        url: Listing endpoint.
+        force: Revalidate even if the cached copy is fresh.
 
     Returns:
-        List[Dict[str, Any]]: A list of metadata dictionaries for each tool.
+        List[Dict[str, Any]]: The listing.
     """
-    if not tool_ids:
-        return []
-    url = f"{BASE_URL}/tools/"
-    response = await fetch_url(url)
+    cached = _catalog.get(url)
+    if cached is not None and not force and time.monotonic() - cached[2] < CATALOG_TTL:
+        return cached[1]
+    headers = {"If-None-Match": cached[0]} if cached is not None and cached[0] else {}
+    response = await fetch_url(url, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        _catalog[url] = (cached[0], cached[1], time.monotonic())
+        return cached[1]
     data: List[Dict[str, Any]] = response.json()
-    if tool_ids == ["0"]:
-        return data
+    _catalog[url] = (response.headers.get("etag"), data, time.monotonic())
+    return data
 
-    return [tool for tool in data if tool["id"] in tool_ids]
 
+async def refresh_catalog() -> None:
+    """Revalidate every cached listing once per ``CATALOG_TTL``, so list calls are served from memory."""
+    while True:
+        await asyncio.sleep(CATALOG_TTL)
+        for url in list(_catalog):
+            try:
+                await fetch_listing(url, force=True)
+            except Exception as exc:
+                logger.warning(f"Background refresh of {url} failed: {exc}")
 
-async def get_prompts_from_mcp_server(catalog_urls: List[str]) -> List[str]:
-    """
-    Retrieve associated prompt IDs from the MCP gateway server catalogs.
-
-    Args:
-        catalog_urls (List[str]): List of catalog endpoint URLs.
 
-    Returns:
-        List[str]: A list of prompt ID strings.
-    """
-    server_ids = [url.split("/")[-1] for url in catalog_urls]
-    url = f"{BASE_URL}/servers/"
-    response = await fetch_url(url)
-    catalog = response.json()
-    prompt_ids: List[str] = []
-    for entry in catalog:
-        if str(entry.get("id")) in server_ids:
-            prompt_ids.extend(entry.get("associatedPrompts", []))
-    return prompt_ids
-
-
-async def prompts_metadata(prompt_ids: List[str]) -> List[Dict[str, Any]]:
+def listing_urls(kind: str) -> List[str]:
     """
-    Fetch metadata for a list of MCP prompts by their IDs.
+    Return the endpoints listing ``kind`` for the configured catalogs.
 
     Args:
-        prompt_ids (List[str]): List of prompt ID strings.
+        kind: "tools", "prompts" or "resources".
 
     Returns:
-        List[Dict[str, Any]]: A list of metadata dictionaries for each prompt.
+        List[str]: ``/servers/{id}/{kind}`` for each catalog, or ``/{kind}/`` if the
+        catalog URL is the gateway itself.
     """
-    if not prompt_ids:
-        return []
-    url = f"{BASE_URL}/prompts/"
-    response = await fetch_url(url)
-    data: List[Dict[str, Any]] = response.json()
-    if prompt_ids == ["0"]:
-        return data
-    return [pr for pr in data if str(pr.get("id")) in prompt_ids]
+    if SERVER_CATALOG_URLS[0] == BASE_URL:
+        return [f"{BASE_URL}/{kind}/"]
+    return [f"{BASE_URL}/servers/{url.rstrip('/').split('/')[-1]}/{kind}" for url in SERVER_CATALOG_URLS]
 
 
-async def get_resources_from_mcp_server(catalog_urls: List[str]) -> List[str]:
+async def catalog_items(kind: str) -> List[Dict[str, Any]]:
     """
-    Retrieve associated resource IDs from the MCP gateway server catalogs.
+    Fetch the tools, prompts or resources exposed by the configured catalogs.
 
     Args:
-        catalog_urls (List[str]): List of catalog endpoint URLs.
+        kind: "tools", "prompts" or "resources".
 
     Returns:
-        List[str]: A list of resource ID strings.
+        List[Dict[str, Any]]: Metadata of each item, without duplicates across servers.
     """
-    server_ids = [url.split("/")[-1] for url in catalog_urls]
-    url = f"{BASE_URL}/servers/"
-    response = await fetch_url(url)
-    catalog = response.json()
-    resource_ids: List[str] = []
-    for entry in catalog:
-        if str(entry.get("id")) in server_ids:
-            resource_ids.extend(entry.get("associatedResources", []))
-    return resource_ids
-
-
-async def resources_metadata(resource_ids: List[str]) -> List[Dict[str, Any]]:
-    """
-    Fetch metadata for a list of MCP resources by their IDs.
-
-    Args:
-        resource_ids (List[str]): List of resource ID strings.
-
-    Returns:
-        List[Dict[str, Any]]: A list of metadata dictionaries for each resource.
-    """
-    if not resource_ids:
-        return []
-    url = f"{BASE_URL}/resources/"
-    response = await fetch_url(url)
-    data: List[Dict[str, Any]] = response.json()
-    if resource_ids == ["0"]:
-        return data
-    return [res for res in data if str(res.get("id")) in resource_ids]
+    listings = await asyncio.gather(*(fetch_listing(url) for url in listing_urls(kind)))
+    seen = set()
+    items: List[Dict[str, Any]] = []
+    for listing in listings:
+        for item in listing:
+            key = item.get("id")
+            if key is not None and key in seen:
+                continue
+            seen.add(key)
+            items.append(item)
+    return items
 
 
 # -----------------------------------------------------------------------------
@@ -312,8 +317,8 @@ async def handle_list_tools() -> List[types.Tool]:
     """
     List all available MCP tools exposed by the gateway.
 
-    Queries the configured server catalogs to retrieve tool IDs and then
-    fetches metadata for each tool to construct a list of Tool objects.
+    Fetches the tools of each configured server (from the catalog cache) to
+    construct a list of Tool objects.
 
     Returns:
         List[types.Tool]: A list of Tool instances including name, description, and input schema.
@@ -322,8 +327,7 @@ async def handle_list_tools() -> List[types.Tool]:
         RuntimeError: If an error occurs during fetching or processing.
     """
     try:
-        tool_ids = ["0"] if SERVER_CATALOG_URLS[0] == BASE_URL else await get_tools_from_mcp_server(SERVER_CATALOG_URLS)
-        metadata = await tools_metadata(tool_ids)
+        metadata = await catalog_items("tools")
         tools = []
         for tool in metadata:
             tool_name = tool.get("name")
@@ -364,20 +368,18 @@ async def handle_call_tool(name: str, arguments: Optional[Dict[str, Any]] = None
 
     logger.info(f"Calling tool {name} with args {arguments}")
     payload = {"jsonrpc": "2.0", "id": 2, "method": name, "params": arguments}
-    headers = {"Authorization": f"Bearer {AUTH_TOKEN}"} if AUTH_TOKEN else {}
 
     try:
-        async with httpx.AsyncClient(timeout=TOOL_CALL_TIMEOUT) as client:
-            resp = await client.post(f"{BASE_URL}/rpc/", json=payload, headers=headers)
-            resp.raise_for_status()
-            result = resp.json()
+        resp = await get_http_client().post(f"{BASE_URL}/rpc/", json=payload)
+        resp.raise_for_status()
+        result = resp.json()
 
-            if "error" in result:
-                error_msg = result["error"].get("message", "Unknown error")
-                raise ValueError(f"Tool call failed: {error_msg}")
+        if "error" in result:
+            error_msg = result["error"].get("message", "Unknown error")
+            raise ValueError(f"Tool call failed: {error_msg}")
 
-            tool_result = result.get("result", result)
-            return [types.TextContent(type="text", text=str(tool_result))]
+        tool_result = result.get("result", result)
+        return [types.TextContent(type="text", text=str(tool_result))]
 
     except httpx.TimeoutException as exc:
         logger.error(f"Timeout calling tool {name}: {exc}")
@@ -392,8 +394,8 @@ async def handle_list_resources() -> List[types.Resource]:
     """
     List all available MCP resources exposed by the gateway.
 
-    Fetches resource IDs from the configured catalogs and retrieves
-    metadata to construct Resource instances.
+    Fetches the resources of each configured server (from the catalog cache)
+    to construct Resource instances.
 
     Returns:
         List[types.Resource]: A list of Resource objects including URI, name, description, and MIME type.
@@ -402,8 +404,7 @@ async def handle_list_resources() -> List[types.Resource]:
         RuntimeError: If an error occurs during fetching or processing.
     """
     try:
-        ids = ["0"] if SERVER_CATALOG_URLS[0] == BASE_URL else await get_resources_from_mcp_server(SERVER_CATALOG_URLS)
-        meta = await resources_metadata(ids)
+        meta = await catalog_items("resources")
         resources = []
         for r in meta:
             uri = r.get("uri")
@@ -455,7 +456,7 @@ async def handle_list_prompts() -> List[types.Prompt]:
     """
     List all available MCP prompts exposed by the gateway.
 
-    Retrieves prompt IDs from the catalogs and fetches metadata
+    Fetches the prompts of each configured server (from the catalog cache)
     to create Prompt instances.
 
     Returns:
@@ -465,8 +466,7 @@ async def handle_list_prompts() -> List[types.Prompt]:
         RuntimeError: If an error occurs during fetching or processing.
     """
     try:
-        ids = ["0"] if SERVER_CATALOG_URLS[0] == BASE_URL else await get_prompts_from_mcp_server(SERVER_CATALOG_URLS)
-        meta = await prompts_metadata(ids)
+        meta = await catalog_items("prompts")
         prompts = []
         for p in meta:
             prompt_name = p.get("name")
@@ -531,22 +531,132 @@ async def handle_get_prompt(name: str, arguments: Optional[Dict[str, str]] = Non
         raise ValueError(f"Failed to fetch prompt '{name}': {exc}")
 
 
+# -----------------------------------------------------------------------------
+# Streamable HTTP Relay
+# -----------------------------------------------------------------------------
+def mcp_endpoint_url() -> str:
+    """
+    Return the streamable HTTP MCP endpoint of the first configured catalog.
+
+    Returns:
+        str: ``<catalog>/mcp``, e.g. ``https://host.com/servers/1/mcp``.
+    """
+    if len(SERVER_CATALOG_URLS) > 1:
+        logger.warning(f"{ENV_MODE}=streamablehttp relays a single server; using {SERVER_CATALOG_URLS[0]}")
+    return f"{SERVER_CATALOG_URLS[0].rstrip('/')}/mcp"
+
+
+async def relay(client_reader: Any, client_writer: Any, upstream_reader: Any, upstream_writer: Any) -> None:
+    """
+    Copy JSON-RPC frames between the MCP client and the gateway until either side closes.
+
+    Frames are forwarded as-is in both directions, so results keep their full
+    structure, and requests are not awaited before the next one is sent, so
+    concurrent requests share the session. When the client closes its end,
+    responses to requests still in flight are delivered (for up to
+    ``TOOL_CALL_TIMEOUT`` seconds) before the relay stops.
+
+    Args:
+        client_reader: Stream of messages from the stdio client.
+        client_writer: Stream of messages to the stdio client.
+        upstream_reader: Stream of messages from the gateway session.
+        upstream_writer: Stream of messages to the gateway session.
+    """
+    pending = set()
+    client_done = False
+
+    def frame(message: Any) -> Any:
+        """Return the JSON-RPC request/response inside a session message.
+
+        Args:
+            message: Session message
+
+        Returns:
+            Any: The JSON-RPC frame
+        """
+        return getattr(getattr(message, "message", message), "root", message)
+
+    async with anyio.create_task_group() as tg:
+
+        async def from_client() -> None:
+            """Forward client requests and notifications to the gateway."""
+            nonlocal client_done
+            async for message in client_reader:
+                if isinstance(message, Exception):
+                    logger.warning(f"Dropping unparsable client message: {message}")
+                    continue
+                msg = frame(message)
+                if getattr(msg, "method", None) is not None and getattr(msg, "id", None) is not None:
+                    pending.add(msg.id)
+                await upstream_writer.send(message)
+            logger.info(f"client closed the stream with {len(pending)} requests in flight")
+            client_done = True
+            if pending:
+                await anyio.sleep(TOOL_CALL_TIMEOUT)
+            tg.cancel_scope.cancel()
+
+        async def from_gateway() -> None:
+            """Forward gateway responses, requests and notifications to the client."""
+            async for message in upstream_reader:
+                if isinstance(message, Exception):
+                    logger.warning(f"Dropping unparsable gateway message: {message}")
+                    continue
+                msg = frame(message)
+                if getattr(msg, "method", None) is None:
+                    pending.discard(getattr(msg, "id", None))
+                await client_writer.send(message)
+                if client_done and not pending:
+                    break
+            logger.info("gateway stream finished")
+            tg.cancel_scope.cancel()
+
+        tg.start_soon(from_client)
+        tg.start_soon(from_gateway)
+
+    # Closing the outbound streams lets the stdio server and the HTTP session shut down
+    await client_writer.aclose()
+    await upstream_writer.aclose()
+
+
+async def run_streamable_http_relay() -> None:
+    """Relay the stdio client over one persistent streamable HTTP session to the gateway."""
+    # Third-Party
+    from mcp.client.streamable_http import streamablehttp_client  # imported here: rest mode does not need the client stack
+
+    url = mcp_endpoint_url()
+    headers = {"Authorization": f"Bearer {AUTH_TOKEN}"} if AUTH_TOKEN else {}
+    logger.info(f"Relaying stdio to {url}")
+    async with mcp.server.stdio.stdio_server() as (stdin_reader, stdout_writer):
+        async with streamablehttp_client(url=url, headers=headers, timeout=TOOL_CALL_TIMEOUT) as (upstream_reader, upstream_writer, _get_session_id):
+            await relay(stdin_reader, stdout_writer, upstream_reader, upstream_writer)
+
+
 async def main() -> None:
     """
     Main entry point to start the MCP stdio server.
 
     Initializes the server over standard IO, registers capabilities,
-    and begins listening for JSON-RPC messages.
+    and begins listening for JSON-RPC messages. In streamablehttp mode the
+    messages are relayed to the gateway's MCP endpoint instead.
 
     This function should only be called in a script context.
 
     Raises:
-        RuntimeError: If the server fails to start.
+        RuntimeError: If the server fails to start or the relay fails.
 
     Example:
         if __name__ == "__main__":
             asyncio.run(main())
     """
+    if WRAPPER_MODE == "streamablehttp":
+        try:
+            await run_streamable_http_relay()
+        except Exception as exc:
+            logger.exception("Relay failed")
+            raise RuntimeError(f"Relay failed: {exc}")
+        return
+
+    refresher = asyncio.create_task(refresh_catalog()) if CATALOG_TTL > 0 else None
     try:
         async with mcp.server.stdio.stdio_server() as (reader, writer):
             await server.run(
@@ -561,6 +671,10 @@ async def main() -> None:
     except Exception as exc:
         logger.exception("Server failed to start")
         raise RuntimeError(f"Server startup failed: {exc}")
+    finally:
+        if refresher is not None:
+            refresher.cancel()
+        await close_http_client()
 
 
 if __name__ == "__main__":
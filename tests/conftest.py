@@ -87,6 +87,39 @@ def mock_http_client():
     return mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_circuit_breakers():
+    """Start every test with closed circuits; breakers are process-wide state."""
+    # First-Party
+    from mcpgateway.utils.circuit_breaker import circuit_breakers
+
+    circuit_breakers.clear()
+    yield
+    circuit_breakers.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limiter():
+    """Start every test with full token buckets; the limiter is process-wide state."""
+    # First-Party
+    from mcpgateway.utils.rate_limiter import rate_limiter
+
+    rate_limiter.clear()
+    yield
+    rate_limiter.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_token_cache():
+    """Start every test without cached or revoked JWTs; the cache is process-wide state."""
+    # First-Party
+    from mcpgateway.utils.verify_credentials import token_cache
+
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
 @pytest.fixture
 def mock_websocket():
     """Create a mock WebSocket."""
@@ -244,7 +244,7 @@ class TestIntegrationScenarios:
         resp = test_client.post("/rpc/", json=rpc_body, headers=auth_headers)
         assert resp.status_code == 200
         assert resp.json()["content"][0]["text"] == "ok"
-        mock_invoke.assert_awaited_once_with(db=ANY, name="test_tool", arguments={"foo": "bar"})
+        mock_invoke.assert_awaited_once_with(db=ANY, name="test_tool", arguments={"foo": "bar"}, client_id=ANY)
 
     # --------------------------------------------------------------------- #
     # 5. Metrics aggregation endpoint                                       #
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""db_index_benchmark - Query plans and timings for the hot lookup indexes
+========================================================================
+Seeds a scratch database with the gateway schema and a large number of
+``tool_metrics`` rows, then runs the hot lookup queries twice: once without
+the indexes added in alembic revision ``a599280e1fac`` and once with them.
+For every query the database query plan and the best-of-N wall time are
+printed side by side.
+
+Usage
+-----
+Shell ::
+
+    python tests/performance/db_index_benchmark.py                    # 1M metric rows, SQLite
+    python tests/performance/db_index_benchmark.py --metric-rows 200000 --repeat 10
+    python tests/performance/db_index_benchmark.py \\
+        --database-url "postgresql://user:pw@localhost:5432/mcp_bench"
+
+The target database is dropped and re-created, so never point it at a real
+installation.
+"""
+
+# Standard
+import argparse
+from datetime import datetime, timedelta, timezone
+import os
+import random
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# Third-Party
+from sqlalchemy import create_engine, Index, insert, text
+from sqlalchemy.engine import Connection, Engine
+
+# First-Party
+from mcpgateway.db import (
+    Base,
+    Prompt,
+    Resource,
+    server_prompt_association,
+    server_resource_association,
+    server_tool_association,
+    SessionMessageRecord,
+    SessionRecord,
+    Tool,
+    ToolMetric,
+)
+
+NOW = datetime.now(timezone.utc)
+
+# name, SQL, parameter factory
+QUERIES: List[Tuple[str, str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = [
+    (
+        "tool metrics for one tool in a time window",
+        "SELECT count(*), avg(response_time) FROM tool_metrics WHERE tool_id = :tool_id AND timestamp >= :since",
+        lambda s: {"tool_id": s["tool_ids"][7], "since": NOW - timedelta(hours=1)},
+    ),
+    (
+        "last execution time of one tool",
+        "SELECT max(timestamp) FROM tool_metrics WHERE tool_id = :tool_id",
+        lambda s: {"tool_id": s["tool_ids"][7]},
+    ),
+    (
+        "pending messages of one session",
+        "SELECT id, message FROM mcp_messages WHERE session_id = :session_id",
+        lambda s: {"session_id": s["session_ids"][42]},
+    ),
+    (
+        "expired sessions",
+        "SELECT count(*) FROM mcp_sessions WHERE last_accessed < :expiry",
+        lambda s: {"expiry": NOW - timedelta(days=29)},
+    ),
+    # resources.uri and prompts.name are unique, so these are served by the
+    # unique index both before and after; kept as a regression guard.
+    (
+        "active resource by URI",
+        "SELECT id FROM resources WHERE uri = :uri AND is_active = 1",
+        lambda s: {"uri": "file:///bench/resource-123.txt"},
+    ),
+    (
+        "active prompt by name",
+        "SELECT id FROM prompts WHERE name = :name AND is_active = 1",
+        lambda s: {"name": "prompt-123"},
+    ),
+    (
+        "servers exposing one tool",
+        "SELECT server_id FROM server_tool_association WHERE tool_id = :tool_id",
+        lambda s: {"tool_id": s["tool_ids"][7]},
+    ),
+]
+
+
+def hot_indexes() -> List[Index]:
+    """Return the indexes under test, as declared on the ORM models.
+
+    Returns:
+        List[Index]: Indexes added for the hot lookup paths.
+    """
+    tables = [
+        ToolMetric.__table__,
+        SessionMessageRecord.__table__,
+        SessionRecord.__table__,
+        server_tool_association,
+        server_resource_association,
+        server_prompt_association,
+    ]
+    return [ix for table in tables for ix in table.indexes if ix.name and ix.name.startswith("ix_")]
+
+
+def seed(conn: Connection, metric_rows: int, tools: int, sessions: int, catalog: int) -> Dict[str, Any]:
+    """Populate the scratch database.
+
+    Args:
+        conn: Open connection inside a transaction.
+        metric_rows: Number of tool_metrics rows to insert.
+        tools: Number of tools the metrics are spread over.
+        sessions: Number of SSE sessions (each gets 10 messages).
+        catalog: Number of resources, prompts and servers.
+
+    Returns:
+        Dict[str, Any]: Generated identifiers used by the query parameter factories.
+    """
+    rnd = random.Random(1234)
+    tool_ids = [f"{i:032x}" for i in range(tools)]
+    server_ids = [f"{i:032x}" for i in range(catalog)]
+    session_ids = [f"session-{i}" for i in range(sessions)]
+    schema = {"type": "object", "properties": {}}
+
+    conn.execute(
+        insert(Tool.__table__),
+        [{"id": t, "original_name": f"tool-{i}", "original_name_slug": f"tool-{i}", "name": f"tool-{i}", "input_schema": schema, "annotations": {}, "is_active": True} for i, t in enumerate(tool_ids)],
+    )
+    conn.execute(insert(Base.metadata.tables["servers"]), [{"id": s, "name": f"server-{i}", "is_active": True} for i, s in enumerate(server_ids)])
+    conn.execute(
+        insert(Resource.__table__),
+        [{"id": i + 1, "uri": f"file:///bench/resource-{i}.txt", "name": f"resource-{i}", "text_content": "x", "is_active": i % 10 != 0} for i in range(catalog)],
+    )
+    conn.execute(insert(Prompt.__table__), [{"id": i + 1, "name": f"prompt-{i}", "template": "{{ x }}", "argument_schema": schema, "is_active": i % 10 != 0} for i in range(catalog)])
+    conn.execute(insert(server_tool_association), [{"server_id": server_ids[i % catalog], "tool_id": t} for i, t in enumerate(tool_ids)])
+    conn.execute(insert(server_resource_association), [{"server_id": server_ids[i], "resource_id": i + 1} for i in range(catalog)])
+    conn.execute(insert(server_prompt_association), [{"server_id": server_ids[i], "prompt_id": i + 1} for i in range(catalog)])
+
+    conn.execute(insert(SessionRecord.__table__), [{"session_id": s, "created_at": NOW, "last_accessed": NOW - timedelta(days=rnd.randint(0, 60))} for s in session_ids])
+    conn.execute(insert(SessionMessageRecord.__table__), [{"session_id": s, "message": "{}", "created_at": NOW, "last_accessed": NOW} for s in session_ids for _ in range(10)])
+
+    chunk = 50_000
+    for start in range(0, metric_rows, chunk):
+        conn.execute(
+            insert(ToolMetric.__table__),
+            [
+                {
+                    "tool_id": tool_ids[rnd.randrange(tools)],
+                    "timestamp": NOW - timedelta(seconds=rnd.randint(0, 30 * 24 * 3600)),
+                    "response_time": rnd.random(),
+                    "is_success": rnd.random() > 0.05,
+                }
+                for _ in range(min(chunk, metric_rows - start))
+            ],
+        )
+    return {"tool_ids": tool_ids, "session_ids": session_ids}
+
+
+def query_plan(conn: Connection, sql: str, params: Dict[str, Any]) -> str:
+    """Return the database query plan for ``sql`` as a single string.
+
+    Args:
+        conn: Open connection.
+        sql: Query text.
+        params: Bound parameters.
+
+    Returns:
+        str: Human-readable plan.
+    """
+    if conn.dialect.name == "sqlite":
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).all()
+        return " | ".join(str(r[-1]) for r in rows)
+    rows = conn.execute(text(f"EXPLAIN {sql}"), params).all()
+    return " | ".join(str(r[0]).strip() for r in rows)
+
+
+def time_query(conn: Connection, sql: str, params: Dict[str, Any], repeat: int) -> float:
+    """Return the best wall time in milliseconds over ``repeat`` runs.
+
+    Args:
+        conn: Open connection.
+        sql: Query text.
+        params: Bound parameters.
+        repeat: Number of runs.
+
+    Returns:
+        float: Best run in milliseconds.
+    """
+    best = float("inf")
+    stmt = text(sql)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(stmt, params).all()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_queries(engine: Engine, state: Dict[str, Any], repeat: int) -> List[Tuple[str, str, float]]:
+    """Run every benchmark query and collect plans and timings.
+
+    Args:
+        engine: Target engine.
+        state: Identifiers returned by :func:`seed`.
+        repeat: Runs per query.
+
+    Returns:
+        List[Tuple[str, str, float]]: (label, plan, best milliseconds) per query.
+    """
+    results = []
+    with engine.connect() as conn:
+        if conn.dialect.name != "sqlite":
+            conn.execute(text("ANALYZE"))
+        for label, sql, params_factory in QUERIES:
+            params = params_factory(state)
+            results.append((label, query_plan(conn, sql, params), time_query(conn, sql, params, repeat)))
+    return results
+
+
+def main() -> None:
+    """Seed the database, benchmark without and with the indexes and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--database-url", default=None, help="Scratch database URL (default: temporary SQLite file)")
+    parser.add_argument("--metric-rows", type=int, default=1_000_000)
+    parser.add_argument("--tools", type=int, default=5_000)
+    parser.add_argument("--sessions", type=int, default=20_000)
+    parser.add_argument("--catalog", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tmp_path = None
+    if args.database_url is None:
+        fd, tmp_path = tempfile.mkstemp(suffix=".db", prefix="mcpgw-bench-")
+        os.close(fd)
+        args.database_url = f"sqlite:///{tmp_path}"
+
+    engine = create_engine(args.database_url)
+    indexes = hot_indexes()
+    try:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for ix in indexes:
+                ix.drop(conn)
+            print(f"Seeding {args.metric_rows:,} metric rows into {engine.url.render_as_string(hide_password=True)} ...")
+            start = time.perf_counter()
+            state = seed(conn, args.metric_rows, args.tools, args.sessions, args.catalog)
+            print(f"Seeded in {time.perf_counter() - start:.1f}s")
+
+        before = run_queries(engine, state, args.repeat)
+
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            for ix in indexes:
+                ix.create(conn)
+            if conn.dialect.name == "sqlite":
+                conn.execute(text("ANALYZE"))
+        print(f"Created {len(indexes)} indexes in {time.perf_counter() - start:.1f}s\n")
+
+        after = run_queries(engine, state, args.repeat)
+
+        for (label, plan_before, ms_before), (_, plan_after, ms_after) in zip(before, after):
+            speedup = ms_before / ms_after if ms_after else float("inf")
+            print(f"== {label}")
+            print(f"   before: {ms_before:10.3f} ms  {plan_before}")
+            print(f"   after:  {ms_after:10.3f} ms  {plan_after}")
+            print(f"   speedup: {speedup:.1f}x\n")
+    finally:
+        engine.dispose()
+        if tmp_path:
+            os.unlink(tmp_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -403,6 +403,35 @@ async def test_generate_response_tools_call(registry: SessionRegistry, stub_db,
     assert reply["result"]["result"] == "tool_executed"
 
 
+@pytest.mark.asyncio
+async def test_generate_response_tools_call_with_progress(registry: SessionRegistry, stub_db, monkeypatch):
+    """*tools/call* with a progress token streams progress notifications before the result."""
+    tr = FakeSSETransport("tools_progress")
+    await registry.add_session("tools_progress", tr)
+
+    class _Result:
+        def model_dump(self, *_, **__):
+            return {"content": [{"type": "text", "text": "done"}], "isError": False}
+
+    async def fake_invoke(db, name, arguments, client_id=None, progress=None):
+        await progress(10, 20, None)
+        await progress(20, 20, '{"row": 1}')
+        return _Result()
+
+    monkeypatch.setattr("mcpgateway.cache.session_registry.tool_service.invoke_tool", fake_invoke)
+
+    msg = {"method": "tools/call", "id": 46, "params": {"name": "report", "arguments": {}, "_meta": {"progressToken": "p1"}}}
+    await registry.generate_response(message=msg, transport=tr, server_id=None, user={"token": "t"}, base_url="http://host")
+
+    notifications = [m for m in tr.sent if m.get("method") == "notifications/progress"]
+    assert [n["params"] for n in notifications] == [
+        {"progressToken": "p1", "progress": 10, "total": 20},
+        {"progressToken": "p1", "progress": 20, "total": 20, "message": '{"row": 1}'},
+    ]
+    assert tr.sent[-1]["id"] == 46
+    assert tr.sent[-1]["result"]["content"][0]["text"] == "done"
+
+
 @pytest.mark.asyncio
 async def test_generate_response_server_specific_tools_list(registry: SessionRegistry, stub_db, stub_services):
     """*tools/list* with server_id calls server-specific method."""
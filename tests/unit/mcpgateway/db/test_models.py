@@ -6,3 +6,70 @@ SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
 """
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.db import Base, Tool
+from mcpgateway.utils import services_auth
+from mcpgateway.utils.services_auth import encode_auth
+
+
+@pytest.mark.parametrize(
+    "table, index_name, columns",
+    [
+        ("tool_metrics", "ix_tool_metrics_tool_id_timestamp", ["tool_id", "timestamp"]),
+        ("mcp_messages", "ix_mcp_messages_session_id", ["session_id"]),
+        ("mcp_sessions", "ix_mcp_sessions_last_accessed", ["last_accessed"]),
+        ("server_tool_association", "ix_server_tool_association_tool_id", ["tool_id"]),
+        ("server_resource_association", "ix_server_resource_association_resource_id", ["resource_id"]),
+        ("server_prompt_association", "ix_server_prompt_association_prompt_id", ["prompt_id"]),
+    ],
+)
+def test_hot_lookup_indexes_created(table, index_name, columns):
+    """create_all() must emit the indexes used by the hot lookup queries."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    indexes = {ix["name"]: ix["column_names"] for ix in inspect(engine).get_indexes(table)}
+    assert indexes[index_name] == columns
+
+
+def test_tool_auth_summary_maintained_on_save():
+    """Saving a tool stores its masked credentials so listings need not decrypt them."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        tool = Tool(original_name="t", original_name_slug="t", input_schema={"type": "object"}, auth_type="bearer", auth_value=encode_auth({"Authorization": "Bearer s3cret"}))
+        db.add(tool)
+        db.commit()
+        assert tool.auth_summary == {"auth_type": "bearer", "token": "********"}
+
+        tool.auth_type = None
+        db.commit()
+        assert tool.auth_summary is None
+
+
+def test_tool_auth_summary_not_recomputed_without_credential_changes(monkeypatch):
+    """Updates that leave the credentials alone must not decrypt them, and undecryptable ones still save."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        tool = Tool(original_name="t", original_name_slug="t", input_schema={"type": "object"}, auth_type="bearer", auth_value=encode_auth({"Authorization": "Bearer s3cret"}))
+        db.add(tool)
+        db.commit()
+
+        def undecryptable(_value):
+            raise ValueError("bad tag")
+
+        # e.g. AUTH_ENCRYPTION_SECRET was rotated
+        monkeypatch.setattr(services_auth, "decode_auth", undecryptable)
+        tool.is_active = False
+        db.commit()
+        assert tool.auth_summary == {"auth_type": "bearer", "token": "********"}
+
+        tool.auth_value = "not-decryptable"
+        db.commit()
+        assert tool.auth_summary == {"auth_type": "bearer"}
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the federated catalog sync engine.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+
+Exercises fingerprinting, diffing and ETag short-circuiting against real
+(unsaved) ORM objects; no database is needed.
+"""
+
+# First-Party
+from mcpgateway.db import Gateway as DbGateway
+from mcpgateway.federation.sync import catalog_etag, diff_catalog, fingerprint, invalidate_catalog, sync_gateway_tools
+from mcpgateway.schemas import ToolCreate
+
+# Third-Party
+import pytest
+
+
+def _tool(name: str, description: str = "desc", schema: dict | None = None) -> ToolCreate:
+    return ToolCreate(name=name, description=description, input_schema=schema or {"type": "object", "properties": {}})
+
+
+@pytest.fixture
+def gateway():
+    return DbGateway(name="peer", slug="peer", url="http://peer.example.com/sse", capabilities={}, auth_type=None, auth_value={})
+
+
+def test_fingerprint_matches_local_row(gateway):
+    remote = _tool("echo", schema={"type": "object", "properties": {"x": {"type": "string"}}})
+    sync_gateway_tools(gateway, [remote])
+    assert fingerprint(gateway.tools[0]) == fingerprint(remote)
+
+
+def test_fingerprint_changes_with_schema_and_description():
+    base = fingerprint(_tool("echo"))
+    assert fingerprint(_tool("echo", description="other")) != base
+    assert fingerprint(_tool("echo", schema={"type": "object", "properties": {"y": {}}})) != base
+
+
+def test_diff_and_etag():
+    diff = diff_catalog({"a": "1", "b": "2"}, {"a": "1", "c": "3"})
+    assert (diff.added, diff.updated, diff.removed, diff.unchanged) == (["b"], [], ["c"], 1)
+    assert diff.changed
+    assert not diff_catalog({"a": "1"}, {"a": "1"}).changed
+    assert catalog_etag({}) == catalog_etag({})
+
+
+def test_initial_sync_adds_everything(gateway):
+    diff = sync_gateway_tools(gateway, [_tool("a"), _tool("b")])
+
+    assert sorted(diff.added) == ["a", "b"]
+    assert sorted(t.original_name for t in gateway.tools) == ["a", "b"]
+    assert all(t.url == gateway.url for t in gateway.tools)
+    assert gateway.catalog_etag
+
+
+def test_incremental_sync_touches_only_changes(gateway):
+    sync_gateway_tools(gateway, [_tool("keep"), _tool("change"), _tool("drop")])
+    kept = next(t for t in gateway.tools if t.original_name == "keep")
+    changed = next(t for t in gateway.tools if t.original_name == "change")
+
+    diff = sync_gateway_tools(gateway, [_tool("keep"), _tool("change", description="new"), _tool("add")])
+
+    assert (diff.added, diff.updated, diff.removed, diff.unchanged) == (["add"], ["change"], ["drop"], 1)
+    assert sorted(t.original_name for t in gateway.tools) == ["add", "change", "keep"]
+    # existing rows are updated in place, not re-created
+    assert next(t for t in gateway.tools if t.original_name == "keep") is kept
+    assert next(t for t in gateway.tools if t.original_name == "change") is changed
+    assert changed.description == "new"
+
+
+def test_unchanged_catalog_is_skipped(gateway):
+    sync_gateway_tools(gateway, [_tool("a"), _tool("b")])
+    etag = gateway.catalog_etag
+
+    diff = sync_gateway_tools(gateway, [_tool("b"), _tool("a")])
+
+    assert diff.skipped
+    assert not diff.changed
+    assert gateway.catalog_etag == etag
+
+
+def test_force_rediffs_when_local_rows_drifted(gateway):
+    sync_gateway_tools(gateway, [_tool("a")])
+    gateway.tools[0].description = "edited locally"
+
+    assert sync_gateway_tools(gateway, [_tool("a")]).skipped
+    diff = sync_gateway_tools(gateway, [_tool("a")], force=True)
+
+    assert diff.updated == ["a"]
+    assert gateway.tools[0].description == "desc"
+
+
+def test_local_edit_clears_etag_so_next_sync_repairs(test_db):
+    gateway = DbGateway(name="local-edit", slug="local-edit", url="http://local-edit.example.com/sse", capabilities={}, auth_type=None, auth_value=None)
+    sync_gateway_tools(gateway, [_tool("a"), _tool("b")])
+    test_db.add(gateway)
+    test_db.commit()
+    try:
+        row = next(t for t in gateway.tools if t.original_name == "b")
+        invalidate_catalog(test_db, row.gateway_id)
+        test_db.delete(row)
+        test_db.commit()
+        test_db.refresh(gateway)
+        assert gateway.catalog_etag is None
+
+        diff = sync_gateway_tools(gateway, [_tool("a"), _tool("b")])
+        assert not diff.skipped and diff.added == ["b"]
+    finally:
+        test_db.delete(gateway)
+        test_db.commit()
@@ -16,6 +16,8 @@ Authors: Mihai Criveti
 from __future__ import annotations
 
 # Standard
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock
 
@@ -23,6 +25,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 # ---------------------------------------------------------------------------
 # Application imports
 # ---------------------------------------------------------------------------
+from mcpgateway.config import settings
 from mcpgateway.db import Gateway as DbGateway
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.schemas import GatewayCreate, GatewayUpdate
@@ -446,3 +449,213 @@ class TestGatewayService:
         gateway_service._initialize_gateway = AsyncMock(side_effect=Exception("fail"))
         ok = await gateway_service.check_gateway_health(mock_gateway)
         assert ok is False
+
+    # ────────────────────────────────────────────────────────────────────
+    # CONCURRENT HEALTH CHECKS
+    # ────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _sse_gateways(n):
+        return [MagicMock(spec=DbGateway, id=f"gw{i}", name=f"gw{i}", url=f"http://gw{i}/sse", transport="SSE", auth_value={}, is_active=True) for i in range(n)]
+
+    @pytest.mark.asyncio
+    async def test_check_health_of_gateways_is_concurrent_and_bounded(self, gateway_service, monkeypatch):
+        """Probes overlap, never exceed the concurrency limit and record latency."""
+        monkeypatch.setattr(settings, "health_check_concurrency", 3)
+        now = [1000.0]
+        monkeypatch.setattr("mcpgateway.services.gateway_service.time.monotonic", lambda: now[0])
+        gateways = self._sse_gateways(9)
+        in_flight = peak = started = 0
+
+        @asynccontextmanager
+        async def fake_stream(*_args, **_kwargs):
+            nonlocal in_flight, peak, started
+            in_flight += 1
+            started += 1
+            peak = max(peak, in_flight)
+            # Hold the slot until every slot is taken, so overlap does not depend on timing
+            while in_flight < 3 and started < len(gateways):
+                await asyncio.sleep(0)
+            now[0] += 0.5
+            in_flight -= 1
+            yield MagicMock(raise_for_status=Mock())
+
+        gateway_service._http_client.stream = fake_stream
+
+        assert await gateway_service.check_health_of_gateways(gateways) is True
+
+        assert peak == 3
+        latencies = gateway_service.get_gateway_health_latencies()
+        assert set(latencies) == {g.id for g in gateways}
+        assert all(latency >= 0.5 for latency in latencies.values())
+
+    @pytest.mark.asyncio
+    async def test_check_health_of_gateways_failure_is_isolated(self, gateway_service):
+        """One failing gateway does not stop the others from being checked."""
+        ok, bad = self._sse_gateways(2)
+        bad.url = "http://down/sse"
+
+        @asynccontextmanager
+        async def fake_stream(_method, url, **_kwargs):
+            if url == bad.url:
+                raise ConnectionError("down")
+            yield MagicMock(raise_for_status=Mock())
+
+        gateway_service._http_client.stream = fake_stream
+        gateway_service._handle_gateway_failure = AsyncMock()
+
+        await gateway_service.check_health_of_gateways([ok, bad])
+
+        gateway_service._handle_gateway_failure.assert_awaited_once_with(bad)
+        assert isinstance(ok.last_seen, datetime)
+
+    def test_due_gateways_spreads_and_reschedules(self, gateway_service, monkeypatch):
+        """New gateways get a slot within one interval; probed ones are rescheduled with jitter."""
+        gateways = self._sse_gateways(50)
+        now = [1000.0]
+        monkeypatch.setattr("mcpgateway.services.gateway_service.time.monotonic", lambda: now[0])
+        interval = gateway_service._health_check_interval
+
+        first = gateway_service._due_gateways(gateways)
+        slots = list(gateway_service._health_check_due.values())
+        assert all(1000.0 <= slot <= 1000.0 + interval for slot in slots)
+        assert len(set(slots)) > 1
+        assert len(first) < len(gateways)
+
+        now[0] += interval
+        due = gateway_service._due_gateways(gateways)
+        assert len(first) + len(due) == len(gateways)
+        jitter = settings.health_check_jitter
+        for gateway in due:
+            assert now[0] + interval * (1 - jitter) <= gateway_service._health_check_due[gateway.id] <= now[0] + interval * (1 + jitter)
+
+        # Gateways that are no longer active are forgotten
+        gateway_service._due_gateways(gateways[:1])
+        assert set(gateway_service._health_check_due) == {gateways[0].id}
+
+    @pytest.mark.asyncio
+    async def test_check_due_gateways_caches_active_set(self, gateway_service, monkeypatch):
+        """Ticks reuse the active gateways; edits and each elapsed interval reload them."""
+        now = [1000.0]
+        monkeypatch.setattr("mcpgateway.services.gateway_service.time.monotonic", lambda: now[0])
+        gateway_service._get_active_gateways = Mock(return_value=[])
+        interval = gateway_service._health_check_interval
+
+        for _ in range(5):
+            await gateway_service._check_due_gateways()
+            now[0] += gateway_service._health_check_tick / 2
+        assert gateway_service._get_active_gateways.call_count == 1
+
+        gateway_service._invalidate_active_gateways()
+        await gateway_service._check_due_gateways()
+        assert gateway_service._get_active_gateways.call_count == 2
+
+        now[0] += interval
+        await gateway_service._check_due_gateways()
+        assert gateway_service._get_active_gateways.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_check_due_gateways_does_not_wait_for_slow_probes(self, gateway_service, monkeypatch):
+        """Probes run in the background; a gateway still being probed is not probed again."""
+        now = [1000.0]
+        monkeypatch.setattr("mcpgateway.services.gateway_service.time.monotonic", lambda: now[0])
+        slow, fast = self._sse_gateways(2)
+        gateway_service._get_active_gateways = Mock(return_value=[slow, fast])
+        release = asyncio.Event()
+        probed = []
+
+        async def probe(gateway):
+            probed.append(gateway.id)
+            if gateway is slow:
+                await release.wait()
+
+        gateway_service._check_gateway_health = probe
+        gateway_service._health_check_due = {slow.id: now[0], fast.id: now[0]}
+
+        await gateway_service._check_due_gateways()
+        await asyncio.sleep(0)
+        assert sorted(probed) == sorted([slow.id, fast.id])
+        assert gateway_service._health_probing == {slow.id}
+
+        # Next ticks: the fast gateway is probed again, the hanging one is not
+        gateway_service._health_check_due = {slow.id: now[0], fast.id: now[0]}
+        await gateway_service._check_due_gateways()
+        await asyncio.sleep(0)
+        assert probed.count(fast.id) == 2
+        assert probed.count(slow.id) == 1
+
+        release.set()
+        await asyncio.gather(*gateway_service._health_probes)
+        assert gateway_service._health_probing == set()
+        assert gateway_service._health_probes == set()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_health_probes(self, gateway_service):
+        """Probes still running when the service stops are cancelled."""
+        (gateway,) = self._sse_gateways(1)
+        gateway_service._get_active_gateways = Mock(return_value=[gateway])
+        gateway_service._health_check_due = {gateway.id: 0.0}
+        started = asyncio.Event()
+
+        async def hang(_gateway):
+            started.set()
+            await asyncio.sleep(10)
+
+        gateway_service._check_gateway_health = hang
+        await gateway_service._check_due_gateways()
+        await started.wait()
+        (probe,) = gateway_service._health_probes
+
+        await gateway_service.shutdown()
+        assert probe.cancelled()
+        assert gateway_service._health_probing == set()
+
+    # ────────────────────────────────────────────────────────────────────
+    # CIRCUIT BREAKERS / ADAPTIVE HEALTH INTERVALS
+    # ────────────────────────────────────────────────────────────────────
+
+    @pytest.mark.asyncio
+    async def test_health_checks_feed_breaker_and_adapt_interval(self, gateway_service, monkeypatch):
+        """Healthy gateways back off, failing ones are probed more often and their circuit opens."""
+        # First-Party
+        from mcpgateway.utils.circuit_breaker import circuit_breakers, CircuitState
+
+        monkeypatch.setattr(settings, "health_check_jitter", 0.0)
+        monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 2)
+        now = [1000.0]
+        monkeypatch.setattr("mcpgateway.services.gateway_service.time.monotonic", lambda: now[0])
+        interval = gateway_service._health_check_interval
+        healthy, failing = self._sse_gateways(2)
+        failing.url = "http://down/sse"
+
+        @asynccontextmanager
+        async def fake_stream(_method, url, **_kwargs):
+            if url == failing.url:
+                raise ConnectionError("down")
+            yield MagicMock(raise_for_status=Mock())
+
+        gateway_service._http_client.stream = fake_stream
+        gateway_service._handle_gateway_failure = AsyncMock()
+
+        for _ in range(3):
+            await gateway_service.check_health_of_gateways([healthy, failing])
+
+        assert gateway_service._health_check_due[healthy.id] == 1000.0 + interval * 4
+        assert gateway_service._health_check_due[failing.id] == 1000.0 + max(gateway_service._health_check_tick, interval * 0.25)
+        assert circuit_breakers.for_gateway(failing.id).state == CircuitState.OPEN
+        assert circuit_breakers.for_gateway(healthy.id).state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_forward_request_fails_fast_when_circuit_open(self, gateway_service, mock_gateway):
+        """Once a gateway's circuit is open no HTTP request is attempted."""
+        # First-Party
+        from mcpgateway.utils.circuit_breaker import circuit_breakers
+
+        breaker = circuit_breakers.for_gateway(mock_gateway.id)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+        with pytest.raises(GatewayConnectionError) as exc_info:
+            await gateway_service.forward_request(mock_gateway, "method", {})
+        assert "Circuit open" in str(exc_info.value)
+        gateway_service._http_client.post.assert_not_called()
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 # Standard
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from typing import Any, List, Optional
 from unittest.mock import AsyncMock, MagicMock, Mock
 
@@ -286,3 +287,43 @@ class TestPromptService:
         await prompt_service.reset_metrics(test_db)
         test_db.execute.assert_called()
         test_db.commit.assert_called_once()
+
+    # ──────────────────────────────────────────────────────────────────
+    #   register_prompts_bulk
+    # ──────────────────────────────────────────────────────────────────
+
+    @pytest.mark.asyncio
+    async def test_register_prompts_bulk(self, prompt_service, test_db):
+        """Valid prompts are inserted in one batch; conflicts and bad templates are reported per item."""
+        test_db.execute = Mock(return_value=MagicMock(all=Mock(return_value=[SimpleNamespace(id=7, name="taken", is_active=True)])))
+        test_db.scalars = Mock(return_value=MagicMock(all=Mock(return_value=[11, 12])))
+        test_db.commit = Mock()
+        prompt_service._notify_prompts_added = AsyncMock()
+
+        batch = [
+            PromptCreate(name="a", template="Hi {{ x }}", arguments=[]),
+            PromptCreate(name="taken", template="X", arguments=[]),
+            PromptCreate(name="bad", template="{{ unclosed", arguments=[]),
+            PromptCreate(name="a", template="dup", arguments=[]),
+            PromptCreate(name="b", template="Bye", arguments=[]),
+        ]
+        res = await prompt_service.register_prompts_bulk(test_db, batch)
+
+        assert (res.created, res.failed) == (2, 3)
+        assert [i.status for i in res.items] == ["created", "conflict", "invalid", "conflict", "created"]
+        assert [res.items[0].id, res.items[1].id, res.items[4].id] == [11, 7, 12]
+        test_db.execute.assert_called_once()
+        test_db.scalars.assert_called_once()
+        assert len(test_db.scalars.call_args.args[1]) == 2
+        test_db.commit.assert_called_once()
+        prompt_service._notify_prompts_added.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_register_prompts_bulk_insert_failure(self, prompt_service, test_db):
+        test_db.execute = Mock(return_value=MagicMock(all=Mock(return_value=[])))
+        test_db.scalars = Mock(side_effect=Exception("boom"))
+        test_db.rollback = Mock()
+
+        with pytest.raises(PromptError):
+            await prompt_service.register_prompts_bulk(test_db, [PromptCreate(name="a", template="X", arguments=[])])
+        test_db.rollback.assert_called_once()
@@ -316,6 +316,47 @@ class TestResourceRegistration:
             # Should handle binary content correctly
             mock_db.add.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_register_resources_bulk(self, resource_service, mock_db):
+        """Test bulk registration reports per-item outcomes and publishes one event."""
+        existing = MagicMock(id=5, uri="file:///taken.txt", is_active=False)
+        mock_db.execute.return_value.all.return_value = [existing]
+        mock_db.scalars.return_value.all.return_value = [21, 22]
+
+        batch = [
+            ResourceCreate(uri="file:///a.txt", name="a", content="A"),
+            ResourceCreate(uri="file:///taken.txt", name="t", content="T"),
+            ResourceCreate(uri="not a uri", name="bad", content="B"),
+            ResourceCreate(uri="file:///a.txt", name="dup", content="D"),
+            ResourceCreate(uri="file:///b.bin", name="b", content=b"\x00\x01"),
+        ]
+        queue: asyncio.Queue = asyncio.Queue()
+        resource_service._event_subscribers["*"] = [queue]
+        with patch.object(resource_service, "_is_valid_uri", side_effect=lambda uri: uri != "not a uri"):
+            result = await resource_service.register_resources_bulk(mock_db, batch)
+
+        assert (result.created, result.failed) == (2, 3)
+        assert [i.status for i in result.items] == ["created", "conflict", "invalid", "conflict", "created"]
+        assert result.items[1].id == 5
+        mock_db.execute.assert_called_once()
+        mock_db.scalars.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+        assert queue.qsize() == 1
+        event = queue.get_nowait()
+        assert event["type"] == "resources_added"
+        assert event["data"]["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_register_resources_bulk_insert_failure(self, resource_service, mock_db):
+        """Test a failing batch insert rolls back and raises ResourceError."""
+        mock_db.execute.return_value.all.return_value = []
+        mock_db.scalars.side_effect = Exception("disk full")
+
+        with pytest.raises(ResourceError):
+            await resource_service.register_resources_bulk(mock_db, [ResourceCreate(uri="file:///a.txt", name="a", content="A")])
+        mock_db.rollback.assert_called_once()
+
 
 # --------------------------------------------------------------------------- #
 # Resource listing tests                                                      #
@@ -9,9 +9,12 @@ Tests for tool service implementation.
 """
 
 # Standard
+import asyncio
+import json
 from unittest.mock import ANY, AsyncMock, MagicMock, Mock, patch
 
 # First-Party
+from mcpgateway.config import settings
 from mcpgateway.db import Gateway as DbGateway
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.schemas import ToolCreate, ToolRead, ToolUpdate
@@ -20,10 +23,16 @@ from mcpgateway.services.tool_service import (
     ToolInvocationError,
     ToolNotFoundError,
     ToolService,
+    ToolValidationError,
 )
+from mcpgateway.types import ToolResult
+from mcpgateway.utils.invocation_scheduler import InvocationScheduler, InvocationTimeoutError
+from mcpgateway.utils.tool_result_cache import CachePolicy
 
 # Third-Party
+import httpx
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 
@@ -52,6 +61,15 @@ def mock_gateway():
     return gw
 
 
+@pytest.fixture
+def tool_session(monkeypatch, mock_tool):
+    """Session opened by calls that outlive the caller's request (shared and background calls)."""
+    session = MagicMock()
+    session.__enter__.return_value.get.return_value = mock_tool
+    monkeypatch.setattr("mcpgateway.services.tool_service.SessionLocal", Mock(return_value=session))
+    return session.__enter__.return_value
+
+
 @pytest.fixture
 def mock_tool():
     """Create a mock tool model."""
@@ -66,6 +84,9 @@ def mock_tool():
     tool.headers = {"Content-Type": "application/json"}
     tool.input_schema = {"type": "object", "properties": {"param": {"type": "string"}}}
     tool.jsonpath_filter = ""
+    tool.request_timeout = None
+    tool.cache_ttl = None
+    tool.stale_while_revalidate = None
     tool.created_at = "2023-01-01T00:00:00"
     tool.updated_at = "2023-01-01T00:00:00"
     tool.is_active = True
@@ -74,6 +95,7 @@ def mock_tool():
     tool.auth_password = None
     tool.auth_token = None
     tool.auth_value = None  # Add this field
+    tool.auth_summary = None
     tool.gateway_id = "1"
     tool.gateway = mock_gateway
 
@@ -230,6 +252,23 @@ class TestToolService:
         assert "Tool already exists" in str(exc_info.value)
         test_db.rollback.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_register_tool_invalid_jsonpath_filter(self, tool_service, test_db):
+        """Test that a filter which is not valid jq is rejected before anything is stored."""
+        test_db.add = Mock()
+        tool_create = ToolCreate(
+            name="test_tool",
+            url="http://example.com/tools/test",
+            integration_type="REST",
+            request_type="GET",
+            jsonpath_filter=".items[",
+        )
+
+        with pytest.raises(ToolValidationError, match="Invalid jsonpath_filter"):
+            await tool_service.register_tool(test_db, tool_create)
+
+        test_db.add.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_list_tools(self, tool_service, mock_tool, test_db):
         """Test listing tools."""
@@ -621,7 +660,7 @@ class TestToolService:
 
         # Mock HTTP client response
         mock_response = AsyncMock()
-        mock_response.raise_for_status = AsyncMock()
+        mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value={"result": "REST tool response"})  # Make json() synchronous
         tool_service._http_client.request.return_value = mock_response
@@ -655,6 +694,30 @@ class TestToolService:
             None,  # No error
         )
 
+    @pytest.mark.asyncio
+    async def test_invoke_tool_rest_filters_large_results_in_thread(self, tool_service, mock_tool, test_db):
+        """Test that large REST results are run through the jq filter off the event loop."""
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.jsonpath_filter = ".items[].id"
+        mock_tool.auth_value = None
+
+        mock_scalar = Mock()
+        mock_scalar.scalar_one_or_none.return_value = mock_tool
+        test_db.execute = Mock(return_value=mock_scalar)
+
+        body = {"items": [{"id": i, "name": "x" * 100} for i in range(3)]}
+        mock_response = Mock(status_code=200, content=json.dumps(body).encode(), headers={})
+        mock_response.json = Mock(return_value=body)
+        tool_service._http_client.request.return_value = mock_response
+        tool_service._record_tool_metric = AsyncMock()
+
+        with patch.object(settings, "jsonpath_filter_thread_threshold", 100), patch("mcpgateway.services.tool_service.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+            result = await tool_service.invoke_tool(test_db, "test_tool", {})
+
+        mock_to_thread.assert_called_once()
+        assert json.loads(result.content[0].text) == [0, 1, 2]
+
     @pytest.mark.asyncio
     async def test_invoke_tool_error(self, tool_service, mock_tool, test_db):
         """Test invoking a tool that returns an error."""
@@ -691,6 +754,338 @@ class TestToolService:
                 "HTTP error",  # Error message
             )
 
+    @pytest.mark.asyncio
+    async def test_invoke_tool_rest_circuit_opens(self, tool_service, mock_tool, test_db, monkeypatch):
+        """Repeated upstream failures open the host's circuit and later calls fail fast."""
+        monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 2)
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.auth_value = None
+        mock_scalar = Mock()
+        mock_scalar.scalar_one_or_none.return_value = mock_tool
+        test_db.execute = Mock(return_value=mock_scalar)
+        tool_service._record_tool_metric = AsyncMock()
+        tool_service._http_client.request.side_effect = httpx.ConnectError("refused")
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            for _ in range(2):
+                with pytest.raises(ToolInvocationError):
+                    await tool_service.invoke_tool(test_db, "test_tool", {})
+            with pytest.raises(ToolInvocationError) as exc_info:
+                await tool_service.invoke_tool(test_db, "test_tool", {})
+
+        assert "Circuit open" in str(exc_info.value)
+        assert tool_service._http_client.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_rest_client_error_keeps_circuit_closed(self, tool_service, mock_tool, test_db, monkeypatch):
+        """HTTP 4xx responses do not count against the upstream."""
+        monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 1)
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.auth_value = None
+        mock_scalar = Mock()
+        mock_scalar.scalar_one_or_none.return_value = mock_tool
+        test_db.execute = Mock(return_value=mock_scalar)
+        tool_service._record_tool_metric = AsyncMock()
+        request = httpx.Request("POST", mock_tool.url)
+        tool_service._http_client.request.return_value = httpx.Response(404, request=request)
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            for _ in range(2):
+                with pytest.raises(ToolInvocationError):
+                    await tool_service.invoke_tool(test_db, "test_tool", {})
+
+        assert tool_service._http_client.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_deadline_cancels_upstream(self, tool_service, mock_tool, test_db):
+        """A call exceeding the tool deadline is cancelled and reported as a failure."""
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.auth_value = None
+        mock_scalar = Mock()
+        mock_scalar.scalar_one_or_none.return_value = mock_tool
+        test_db.execute = Mock(return_value=mock_scalar)
+        tool_service._record_tool_metric = AsyncMock()
+        tool_service._scheduler = InvocationScheduler(timeout=0.05)
+        cancelled = asyncio.Event()
+
+        async def hang(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        tool_service._http_client.request.side_effect = hang
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            with pytest.raises(InvocationTimeoutError) as exc_info:
+                await tool_service.invoke_tool(test_db, "test_tool", {}, client_id="alice")
+
+        assert "did not complete within" in str(exc_info.value)
+        assert cancelled.is_set()
+        assert tool_service._record_tool_metric.call_args[0][3] is False
+        assert tool_service.get_scheduler_metrics()["timed_out"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_hanging_upstream_opens_circuit(self, tool_service, mock_tool, test_db, monkeypatch):
+        """Calls cut off by the deadline count against the upstream, so a hanging host is failed fast."""
+        monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 2)
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.auth_value = None
+        mock_scalar = Mock()
+        mock_scalar.scalar_one_or_none.return_value = mock_tool
+        test_db.execute = Mock(return_value=mock_scalar)
+        tool_service._record_tool_metric = AsyncMock()
+        tool_service._scheduler = InvocationScheduler(timeout=0.02)
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        tool_service._http_client.request.side_effect = hang
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            for _ in range(2):
+                with pytest.raises(InvocationTimeoutError):
+                    await tool_service.invoke_tool(test_db, "test_tool", {})
+            with pytest.raises(ToolInvocationError) as exc_info:
+                await tool_service.invoke_tool(test_db, "test_tool", {})
+
+        assert "Circuit open" in str(exc_info.value)
+        assert tool_service._http_client.request.call_count == 2
+
+    @staticmethod
+    def _cached_rest_tool(mock_tool, test_db, invocation):
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "GET"
+        mock_tool.auth_value = None
+        mock_tool.annotations = {}
+        mock_tool.request_timeout = None
+        mock_tool.cache_ttl = invocation.get("cache_ttl")
+        mock_tool.stale_while_revalidate = invocation.get("stale_while_revalidate")
+        mock_scalar = Mock()
+        mock_scalar.scalar_one_or_none.return_value = mock_tool
+        test_db.execute = Mock(return_value=mock_scalar)
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_serves_cached_result(self, tool_service, mock_tool, test_db, tool_session):
+        """Tools opting in to caching reach the upstream once per TTL and arguments."""
+        self._cached_rest_tool(mock_tool, test_db, {"cache_ttl": 60})
+        tool_service._record_tool_metric = AsyncMock()
+        request = httpx.Request("GET", mock_tool.url)
+        tool_service._http_client.get.return_value = httpx.Response(200, json={"rate": 1.1}, request=request)
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            first = await tool_service.invoke_tool(test_db, "test_tool", {"pair": "EURUSD"})
+            second = await tool_service.invoke_tool(test_db, "test_tool", {"pair": "EURUSD"})
+            await tool_service.invoke_tool(test_db, "test_tool", {"pair": "GBPUSD"})
+
+        assert second is first
+        assert tool_service._http_client.get.call_count == 2
+        assert tool_service.get_result_cache_stats() == {"entries": 2, "hits": 1, "stale_hits": 0, "misses": 2}
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_revalidates_with_etag(self, tool_service, mock_tool, test_db, tool_session):
+        """An expired entry is revalidated with If-None-Match and reused on 304."""
+        self._cached_rest_tool(mock_tool, test_db, {"cache_ttl": 60})
+        tool_service._record_tool_metric = AsyncMock()
+        request = httpx.Request("GET", mock_tool.url)
+        tool_service._http_client.get.side_effect = [
+            httpx.Response(200, json={"rate": 1.1}, headers={"ETag": '"v1"', "Cache-Control": "no-cache"}, request=request),
+            httpx.Response(304, request=request),
+        ]
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            first = await tool_service.invoke_tool(test_db, "test_tool", {})
+            second = await tool_service.invoke_tool(test_db, "test_tool", {})
+
+        assert second is first
+        assert tool_service._http_client.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert "If-None-Match" not in mock_tool.headers
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_serves_stale_while_revalidating(self, tool_service, mock_tool, test_db, tool_session):
+        """Within the stale window the cached result is returned and refreshed in the background."""
+        self._cached_rest_tool(mock_tool, test_db, {"cache_ttl": 60, "stale_while_revalidate": 60})
+        tool_service._record_tool_metric = AsyncMock()
+        request = httpx.Request("GET", mock_tool.url)
+        tool_service._http_client.get.side_effect = [
+            httpx.Response(200, json={"v": 1}, headers={"Cache-Control": "max-age=0"}, request=request),
+            httpx.Response(200, json={"v": 2}, request=request),
+        ]
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            first = await tool_service.invoke_tool(test_db, "test_tool", {})
+            stale = await tool_service.invoke_tool(test_db, "test_tool", {})
+            await asyncio.gather(*tool_service._background_tasks)
+            fresh = await tool_service.invoke_tool(test_db, "test_tool", {})
+
+        assert stale is first
+        assert '"v": 2' in fresh.content[0].text
+        assert tool_service.get_result_cache_stats()["stale_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_finishing_after_invalidation_is_discarded(self, tool_service, mock_tool, test_db, tool_session):
+        """A background refresh that outlives an update of the tool does not cache its stale result."""
+        self._cached_rest_tool(mock_tool, test_db, {"cache_ttl": 60, "stale_while_revalidate": 60})
+        tool_service._record_tool_metric = AsyncMock()
+        request = httpx.Request("GET", mock_tool.url)
+        release = asyncio.Event()
+        responses = [httpx.Response(200, json={"v": 1}, headers={"Cache-Control": "max-age=0"}, request=request), httpx.Response(200, json={"v": 2}, request=request)]
+
+        async def get(*args, **kwargs):
+            response = responses.pop(0)
+            if not responses:
+                await release.wait()
+            return response
+
+        tool_service._http_client.get.side_effect = get
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            await tool_service.invoke_tool(test_db, "test_tool", {})
+            await tool_service.invoke_tool(test_db, "test_tool", {})  # stale: starts the refresh
+            await asyncio.sleep(0)
+            tool_service._result_cache.invalidate_tool(mock_tool.id)
+            release.set()
+            await asyncio.gather(*tool_service._background_tasks)
+
+        assert tool_service.get_result_cache_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_coalesces_identical_calls(self, tool_service, mock_tool, test_db, tool_session):
+        """Identical concurrent calls of a REST GET tool share one upstream request."""
+        self._cached_rest_tool(mock_tool, test_db, {})
+        tool_service._record_tool_metric = AsyncMock()
+        request = httpx.Request("GET", mock_tool.url)
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"rate": 1.1}, request=request)
+
+        tool_service._http_client.get.side_effect = slow_get
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            results = await asyncio.gather(*(tool_service.invoke_tool(test_db, "test_tool", {"pair": "EURUSD"}) for _ in range(4)))
+
+        assert tool_service._http_client.get.call_count == 1
+        assert all(r is results[0] for r in results)
+        assert tool_service.get_coalescing_stats() == {"in_flight": 0, "leaders": 1, "coalesced": 3}
+        # The shared call may outlive the leader's request, so it does not use the leader's session
+        tool_session.get.assert_called_once_with(DbTool, mock_tool.id)
+        assert tool_service._record_tool_metric.call_args[0][0] is tool_session
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_does_not_coalesce_non_idempotent_calls(self, tool_service, mock_tool, test_db):
+        """POST tools without idempotency hints always get a request of their own."""
+        self._cached_rest_tool(mock_tool, test_db, {})
+        mock_tool.request_type = "POST"
+        tool_service._record_tool_metric = AsyncMock()
+        request = httpx.Request("POST", mock_tool.url)
+        tool_service._http_client.request.return_value = httpx.Response(200, json={}, request=request)
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            await asyncio.gather(*(tool_service.invoke_tool(test_db, "test_tool", {}) for _ in range(2)))
+
+        assert tool_service._http_client.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_streams_json_lines_progress(self, tool_service, mock_tool, test_db):
+        """In streaming mode JSON Lines records become content items as they arrive; progress only counts them."""
+        self._cached_rest_tool(mock_tool, test_db, {})
+        mock_tool.jsonpath_filter = ""
+        tool_service._record_tool_metric = AsyncMock()
+        body = [b'{"row": 1}\n{"ro', b'w": 2}\n']
+
+        async def streamed_get(url, on_chunk=None, **kwargs):
+            # Like the pool: the body goes to on_chunk only, the response has no content
+            response = httpx.Response(200, headers={"content-type": "application/x-ndjson"}, stream=httpx.ByteStream(b""), request=httpx.Request("GET", url))
+            received = 0
+            for chunk in body:
+                received += len(chunk)
+                await on_chunk(response, received, chunk)
+            return response
+
+        tool_service._http_client.get.side_effect = streamed_get
+        updates = []
+
+        async def progress(done, total, message):
+            updates.append((done, message))
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            result = await tool_service.invoke_tool(test_db, "test_tool", {}, progress=progress)
+
+        assert updates == [(15, "1 record"), (22, "2 records")]
+        assert [item.text for item in result.content] == ['{"row": 1}', '{"row": 2}']
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_streaming_throttles_progress(self, tool_service, mock_tool, test_db, monkeypatch):
+        """Small chunks do not each produce a notification; the end of the body always does."""
+        self._cached_rest_tool(mock_tool, test_db, {})
+        tool_service._record_tool_metric = AsyncMock()
+        now = [0.0]
+        monkeypatch.setattr("mcpgateway.services.tool_service.time.monotonic", lambda: now[0])
+        body = b"x" * 1000
+
+        async def streamed_get(url, on_chunk=None, **kwargs):
+            response = httpx.Response(200, headers={"content-type": "text/plain", "content-length": str(len(body))}, stream=httpx.ByteStream(b""), request=httpx.Request("GET", url))
+            for received in range(10, len(body) + 1, 10):
+                now[0] += 0.001
+                await on_chunk(response, received, body[received - 10 : received])
+            return response
+
+        tool_service._http_client.get.side_effect = streamed_get
+        updates = []
+
+        async def progress(done, total, message):
+            updates.append(done)
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            result = await tool_service.invoke_tool(test_db, "test_tool", {}, progress=progress)
+
+        # 100 chunks: one report per 10% of Content-Length, plus the final one
+        assert updates == [10, 110, 210, 310, 410, 510, 610, 710, 810, 910, 1000]
+        assert result.content[0].text == body.decode()
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_streaming_bounds_buffered_body(self, tool_service, mock_tool, test_db):
+        """A streamed body that is not JSON Lines is buffered only up to the response size limit."""
+        self._cached_rest_tool(mock_tool, test_db, {})
+        mock_tool.jsonpath_filter = ""
+        tool_service._record_tool_metric = AsyncMock()
+
+        async def streamed_get(url, on_chunk=None, **kwargs):
+            response = httpx.Response(200, headers={"content-type": "application/json"}, stream=httpx.ByteStream(b""), request=httpx.Request("GET", url))
+            for received in (8, 16):
+                await on_chunk(response, received, b'{"a": 1}')
+            return response
+
+        tool_service._http_client.get.side_effect = streamed_get
+
+        async def progress(done, total, message):
+            pass
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}), patch.object(settings, "tool_max_response_size", 10):
+            with pytest.raises(ToolInvocationError, match="exceeds the 10 byte limit"):
+                await tool_service.invoke_tool(test_db, "test_tool", {}, progress=progress)
+
+    @pytest.mark.asyncio
+    async def test_update_tool_invalidates_cached_results(self, tool_service, mock_tool, test_db):
+        """Updating a tool drops its cached results."""
+        tool_service._result_cache.store(tool_service._result_cache.key(mock_tool.id, {}), ToolResult(content=[]), CachePolicy(ttl=60))
+        test_db.get = Mock(return_value=mock_tool)
+        test_db.execute = Mock(return_value=Mock(scalar_one_or_none=Mock(return_value=None)))
+        test_db.commit = Mock()
+        test_db.refresh = Mock()
+        tool_service._notify_tool_updated = AsyncMock()
+        tool_service._convert_tool_to_read = Mock()
+
+        await tool_service.update_tool(test_db, mock_tool.id, ToolUpdate(description="new"))
+
+        assert tool_service.get_result_cache_stats()["entries"] == 0
+
     @pytest.mark.asyncio
     async def test_reset_metrics(self, tool_service, test_db):
         """Test resetting metrics."""
@@ -714,3 +1109,43 @@ class TestToolService:
         # Verify DB operations with tool_id
         test_db.execute.assert_called_once()
         test_db.commit.assert_called_once()
+
+
+class TestToolServiceBulk:
+    """Tests for bulk tool registration against a real database."""
+
+    @pytest.mark.asyncio
+    async def test_register_tools_bulk_reports_per_item(self, tool_service, test_db):
+        """Valid items are inserted once; conflicts and invalid items are reported per index."""
+        await tool_service.register_tools_bulk(test_db, [ToolCreate(name="bulk_existing", url="http://example.com/a")])
+        tool_service._notify_tools_added = AsyncMock()
+
+        result = await tool_service.register_tools_bulk(
+            test_db,
+            [
+                ToolCreate(name="bulk_one", url="http://example.com/1", integration_type="REST", request_type="GET"),
+                ToolCreate(name="bulk_existing", url="http://example.com/a"),
+                ToolCreate(name="bulk_bad_schema", url="http://example.com/2", input_schema={"type": 5}),
+                ToolCreate(name="bulk_one", url="http://example.com/1"),
+                ToolCreate(name="bulk_two", url="http://example.com/2"),
+            ],
+        )
+
+        assert result.created == 2
+        assert result.failed == 3
+        assert [item.status for item in result.items] == ["created", "conflict", "invalid", "conflict", "created"]
+        assert result.items[1].id is not None
+        created = test_db.execute(select(DbTool).where(DbTool.original_name.in_(["bulk_one", "bulk_two"]))).scalars().all()
+        assert {t.id for t in created} == {result.items[0].id, result.items[4].id}
+        assert {t.request_type for t in created} == {"GET", "SSE"}
+        tool_service._notify_tools_added.assert_awaited_once()
+        assert len(tool_service._notify_tools_added.await_args.args[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_register_tools_bulk_nothing_to_insert(self, tool_service, test_db):
+        """A batch with only invalid items does not touch the database or publish events."""
+        tool_service._notify_tools_added = AsyncMock()
+        result = await tool_service.register_tools_bulk(test_db, [ToolCreate(name="bulk bad!", url="http://example.com", input_schema={"type": 5})])
+        assert result.created == 0
+        assert result.items[0].status == "invalid"
+        tool_service._notify_tools_added.assert_not_awaited()
@@ -44,12 +44,14 @@ from mcpgateway.admin import (
     admin_list_servers,
     admin_list_tools,
     admin_reset_metrics,
+    admin_revoke_token,
     admin_toggle_gateway,
     admin_toggle_prompt,
     admin_toggle_resource,
     admin_toggle_server,
     admin_toggle_tool,
 )
+from mcpgateway.config import settings
 from mcpgateway.services.gateway_service import GatewayService
 from mcpgateway.services.prompt_service import PromptService
 from mcpgateway.services.resource_service import ResourceService
@@ -62,6 +64,7 @@ from mcpgateway.services.tool_service import (
 # Third-Party
 from fastapi import HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+import jwt
 import pytest
 from sqlalchemy.orm import Session
 
@@ -699,3 +702,25 @@ class TestAdminMetricsRoutes:
         ResourceService.reset_metrics.assert_called_once()
         ServerService.reset_metrics.assert_called_once()
         PromptService.reset_metrics.assert_called_once()
+
+
+class TestAdminTokenRoutes:
+    """Test admin routes for token revocation."""
+
+    async def test_admin_revoke_token(self, mock_request):
+        """A revoked token is rejected until its exp; tokens without exp cannot be revoked."""
+        # First-Party
+        from mcpgateway.utils.verify_credentials import token_cache, TokenCache
+
+        token = jwt.encode({"sub": "alice", "exp": 4102444800}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+        mock_request.json = AsyncMock(return_value={"token": token})
+        response = await admin_revoke_token(mock_request, "test-user")
+
+        assert response.status_code == 200
+        assert json.loads(response.body)["revoked_until"] == 4102444800
+        assert token_cache.is_revoked(TokenCache.key(token))
+
+        mock_request.json = AsyncMock(return_value={"token": jwt.encode({"sub": "alice"}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)})
+        response = await admin_revoke_token(mock_request, "test-user")
+        assert response.status_code == 400
+        assert "no exp claim" in json.loads(response.body)["message"]
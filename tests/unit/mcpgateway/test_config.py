@@ -14,6 +14,8 @@ from unittest.mock import MagicMock, patch
 
 # First-Party
 from mcpgateway.config import (
+    compile_jq,
+    compile_jsonpath,
     extract_using_jq,
     get_settings,
     jsonpath_modifier,
@@ -22,6 +24,8 @@ from mcpgateway.config import (
 
 # Third-Party
 from fastapi import HTTPException
+import jq
+from jsonpath_ng.ext import parse
 
 # Third-party
 import pytest
@@ -105,11 +109,18 @@ def test_cors_settings_branches():
 # --------------------------------------------------------------------------- #
 def test_extract_using_jq_happy_path():
     data = {"a": 123}
+    assert extract_using_jq(data, ".a") == [123]
 
-    with patch("mcpgateway.config.jq.all", return_value=[123]) as mock_jq:
-        out = extract_using_jq(data, ".a")
-        mock_jq.assert_called_once_with(".a", data)
-        assert out == [123]
+
+def test_extract_using_jq_compiles_each_filter_once():
+    compile_jq.cache_clear()
+    with patch("mcpgateway.config.jq.compile", wraps=jq.compile) as mock_compile:
+        assert extract_using_jq({"a": 1}, ".a") == [1]
+        assert extract_using_jq({"a": 2}, ".a") == [2]
+        mock_compile.assert_called_once_with(".a")
+
+    # Invalid filters still produce an error message rather than raising
+    assert extract_using_jq({"a": 1}, ".a[").startswith("Error applying jsonpath filter")
 
 
 def test_extract_using_jq_short_circuits_and_errors():
@@ -159,6 +170,33 @@ def test_jsonpath_modifier_invalid_expressions(sample_people):
         jsonpath_modifier(sample_people, "$[*]", mappings={"bad": "$["})  # invalid mapping expr
 
 
+def test_jsonpath_modifier_parses_each_expression_once():
+    compile_jsonpath.cache_clear()
+    people = [{"name": f"p{i}", "owner": {"id": i}, "tags": ["a", "b"]} for i in range(50)]
+    mappings = {"n": "$.name", "owner": "$.owner.id", "tags": "$.tags[*]"}
+
+    with patch("mcpgateway.config.parse", wraps=parse) as mock_parse:
+        first = jsonpath_modifier(people, "$[*]", mappings)
+        second = jsonpath_modifier(people, "$[*]", mappings)
+
+    # One parse for the main expression and one per mapping, shared across requests
+    assert mock_parse.call_count == 4
+    assert first == second
+    assert first[3] == {"n": "p3", "owner": 3, "tags": ["a", "b"]}
+
+
+def test_jsonpath_modifier_field_mappings_match_engine():
+    items = [{"a": {"b": 1}}, {"a": [{"b": 1}]}, {"a": None}, {}, "text"]
+    out = jsonpath_modifier(items, "$[*]", {"x": "$.a.b", "y": "$.a"})
+    assert out == [
+        {"x": 1, "y": {"b": 1}},
+        {"x": None, "y": [{"b": 1}]},
+        {"x": None, "y": None},
+        {"x": None, "y": None},
+        {"x": None, "y": None},
+    ]
+
+
 # --------------------------------------------------------------------------- #
 #                           get_settings LRU cache                            #
 # --------------------------------------------------------------------------- #
@@ -150,13 +150,14 @@ async def test_rate_limit(monkeypatch):
     # First-Party
     from mcpgateway.config import settings
 
-    monkeypatch.setattr(settings, "tool_rate_limit", 2, raising=False)
+    monkeypatch.setattr(settings, "gateway_rate_limit", 2, raising=False)
 
     svc = ForwardingService()
     url = "http://beta"
-    assert svc._check_rate_limit(url)
-    assert svc._check_rate_limit(url)
-    assert svc._check_rate_limit(url) is False  # third call exceeds limit
+    assert await svc._check_rate_limit(url)
+    assert await svc._check_rate_limit(url)
+    assert await svc._check_rate_limit(url) is False  # third call exceeds limit
+    assert await svc._check_rate_limit("http://gamma")  # other gateways have their own bucket
 
 
 @pytest.mark.anyio
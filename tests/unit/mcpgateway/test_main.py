@@ -14,12 +14,14 @@ import os
 from unittest.mock import ANY, MagicMock, patch
 
 # First-Party
+from mcpgateway.config import settings
 from mcpgateway.schemas import (
     PromptRead,
     ResourceRead,
     ServerRead,
 )
 from mcpgateway.types import InitializeResult, ResourceContent, ServerCapabilities
+from mcpgateway.utils.invocation_scheduler import InvocationTimeoutError, SchedulerOverloadError
 
 # Third-Party
 from fastapi.testclient import TestClient
@@ -396,6 +398,45 @@ class TestServerEndpoints:
         assert len(data) == 1
         mock_list_tools.assert_called_once()
 
+    @patch("mcpgateway.main.tool_service.list_server_tools")
+    def test_server_get_tools_conditional(self, mock_list_tools, test_client, auth_headers):
+        """Test that an unchanged server tool listing is answered with 304."""
+        mock_tool = MagicMock()
+        mock_tool.model_dump.return_value = MOCK_TOOL_READ
+        mock_list_tools.return_value = [mock_tool]
+
+        first = test_client.get("/servers/1/tools", headers=auth_headers)
+        etag = first.headers["etag"]
+        second = test_client.get("/servers/1/tools", headers={**auth_headers, "If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+
+    @pytest.mark.parametrize(
+        "if_none_match, expected",
+        [
+            ('"stale", {etag}', 304),
+            ("W/{etag}", 304),
+            ("*", 304),
+            ('"stale"', 200),
+            ("{etag}-gzip", 200),
+            ('"x{etag_body}"', 200),
+        ],
+    )
+    @patch("mcpgateway.main.tool_service.list_server_tools")
+    def test_server_get_tools_if_none_match_list(self, mock_list_tools, if_none_match, expected, test_client, auth_headers):
+        """If-None-Match is parsed as a list of ETags compared whole, not as a substring."""
+        mock_tool = MagicMock()
+        mock_tool.model_dump.return_value = MOCK_TOOL_READ
+        mock_list_tools.return_value = [mock_tool]
+
+        etag = test_client.get("/servers/1/tools", headers=auth_headers).headers["etag"]
+        header = if_none_match.format(etag=etag, etag_body=etag.strip('"'))
+        response = test_client.get("/servers/1/tools", headers={**auth_headers, "If-None-Match": header})
+
+        assert response.status_code == expected
+
     @patch("mcpgateway.main.resource_service.list_server_resources")
     def test_server_get_resources(self, mock_list_resources, test_client, auth_headers):
         """Test listing resources associated with a server."""
@@ -791,7 +832,39 @@ class TestRPCEndpoints:
         assert response.status_code == 200
         body = response.json()
         assert body["content"][0]["text"] == "Tool response"
-        mock_invoke_tool.assert_called_once_with(db=ANY, name="test_tool", arguments={"param": "value"})
+        mock_invoke_tool.assert_called_once_with(db=ANY, name="test_tool", arguments={"param": "value"}, client_id=ANY)
+
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_rpc_user_rate_limit(self, mock_invoke_tool, test_client, auth_headers, monkeypatch):
+        """Requests beyond the user's limit get HTTP 429 with Retry-After."""
+        monkeypatch.setattr(settings, "user_rate_limit", 1)
+        mock_invoke_tool.return_value = {"content": [], "is_error": False}
+        req = {"jsonrpc": "2.0", "id": "rl", "method": "test_tool", "params": {}}
+
+        assert test_client.post("/rpc/", json=req, headers=auth_headers).status_code == 200
+        response = test_client.post("/rpc/", json=req, headers=auth_headers)
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.json()["error"]["message"] == "Rate limit exceeded"
+        assert mock_invoke_tool.call_count == 1
+
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_rpc_tool_overload_and_timeout(self, mock_invoke_tool, test_client, auth_headers):
+        """Overload maps to 503 with Retry-After and a missed deadline to 504, not a generic error."""
+        req = {"jsonrpc": "2.0", "id": "busy", "method": "test_tool", "params": {}}
+
+        mock_invoke_tool.side_effect = SchedulerOverloadError("tool", "test_tool", 100)
+        response = test_client.post("/rpc/", json=req, headers=auth_headers)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert response.json()["error"]["message"] == "Server overloaded"
+        assert response.json()["id"] == "busy"
+
+        mock_invoke_tool.side_effect = InvocationTimeoutError("test_tool", 60)
+        response = test_client.post("/rpc/", json=req, headers=auth_headers)
+        assert response.status_code == 504
+        assert response.json()["error"]["message"] == "Tool invocation timed out"
 
     @patch("mcpgateway.main.prompt_service.get_prompt")
     @patch("mcpgateway.main.validate_request")
@@ -944,6 +1017,43 @@ class TestMetricsEndpoints:
         assert "tools" in data and "resources" in data
         assert "servers" in data and "prompts" in data
 
+    @patch("mcpgateway.main.tool_service.get_pool_occupancy")
+    def test_get_pool_metrics(self, mock_occupancy, test_client, auth_headers):
+        """Test retrieving per-host REST connection pool occupancy."""
+        mock_occupancy.return_value = {"https://api.example.com": {"in_flight": 2, "max_connections": 20, "http2": False}}
+
+        response = test_client.get("/metrics/pools", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {"rest": mock_occupancy.return_value}
+
+    @patch("mcpgateway.main.tool_service.get_result_cache_stats")
+    def test_get_cache_metrics(self, mock_stats, test_client, auth_headers):
+        """Test retrieving tool result cache statistics."""
+        mock_stats.return_value = {"entries": 3, "hits": 10, "stale_hits": 1, "misses": 4}
+
+        with patch("mcpgateway.main.tool_service.get_coalescing_stats", return_value={"in_flight": 0, "leaders": 5, "coalesced": 7}):
+            response = test_client.get("/metrics/cache", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {"tool_results": mock_stats.return_value, "coalescing": {"in_flight": 0, "leaders": 5, "coalesced": 7}}
+
+    @patch("mcpgateway.main.tool_service.get_scheduler_metrics")
+    def test_get_scheduler_metrics(self, mock_scheduler_metrics, test_client, auth_headers):
+        """Test retrieving tool invocation queue depths."""
+        mock_scheduler_metrics.return_value = {"tools": {"echo": {"active": 1, "queued": 3, "limit": 10}}, "gateways": {}, "rejected": 0, "timed_out": 0}
+
+        response = test_client.get("/metrics/scheduler", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == mock_scheduler_metrics.return_value
+
+    @patch("mcpgateway.main.SSETransport.metrics")
+    def test_get_sse_metrics(self, mock_sse_metrics, test_client, auth_headers):
+        """Test retrieving SSE outbound queue usage."""
+        mock_sse_metrics.return_value = {"sessions": {}, "queued_bytes": 0, "policy": "block", "dropped": 2, "disconnected": 1, "high_water": 40, "high_water_bytes": 8192}
+
+        response = test_client.get("/metrics/sse", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == mock_sse_metrics.return_value
+
     @patch("mcpgateway.main.tool_service.reset_metrics")
     @patch("mcpgateway.main.resource_service.reset_metrics")
     @patch("mcpgateway.main.server_service.reset_metrics")
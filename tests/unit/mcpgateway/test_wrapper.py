@@ -17,8 +17,8 @@ from __future__ import annotations
 import asyncio
 import importlib
 import sys
-from types import ModuleType
-from typing import Any, Dict, List
+from types import ModuleType, SimpleNamespace
+from typing import Any
 
 # Third-Party
 import pytest
@@ -177,10 +177,11 @@ def wrapper(monkeypatch):
 class _Resp:
     """Bare-bones httpx.Response-like test double."""
 
-    def __init__(self, *, json_data=None, text="OK", status: int = 200):
+    def __init__(self, *, json_data=None, text="OK", status: int = 200, headers=None):
         self._json = json_data
         self.text = text
         self.status_code = status
+        self.headers = headers or {}
 
     # minimal surface used by wrapper
     def json(self):
@@ -219,18 +220,6 @@ def _patch_client(monkeypatch, wrapper, *, json=None, exc=None):
     monkeypatch.setattr(wrapper.httpx, "AsyncClient", _Client)
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Extra helper for fetch-json stubs used by metadata tests
-# ─────────────────────────────────────────────────────────────────────────────
-
-
-def _json_fetcher(payload: Any):
-    async def _fake(_url: str):
-        return _Resp(json_data=payload)
-
-    return _fake
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Unit tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -396,83 +385,90 @@ async def test_get_prompt_missing(monkeypatch, wrapper):
 
 @pytest.mark.asyncio
 async def test_handle_list_tools(monkeypatch, wrapper):
-    async def _ids(_):  # noqa: D401
-        return ["1"]
-
-    async def _meta(_):
+    async def _items(kind):
+        assert kind == "tools"
         return [{"name": "A", "description": "", "inputSchema": {}}]
 
-    monkeypatch.setattr(wrapper, "get_tools_from_mcp_server", _ids)
-    monkeypatch.setattr(wrapper, "tools_metadata", _meta)
+    monkeypatch.setattr(wrapper, "catalog_items", _items)
     tools = await wrapper.handle_list_tools()
     assert tools and tools[0].name == "A"
 
 
-# ––– get_tools_from_mcp_server & tools_metadata branches ––––––––––––––––––– #
+# ––– listing_urls / catalog_items: server-side filtered fetches ––––––––––– #
+
+
+def test_listing_urls(monkeypatch, wrapper):
+    assert wrapper.listing_urls("tools") == ["https://host.com/servers/1/tools"]
+
+    monkeypatch.setattr(wrapper, "SERVER_CATALOG_URLS", ["https://host.com"])
+    assert wrapper.listing_urls("prompts") == ["https://host.com/prompts/"]
 
 
 @pytest.mark.asyncio
-async def test_get_tools_and_metadata(monkeypatch, wrapper):
-    # fake catalog → two servers with associated tools
-    catalog = [
-        {"id": "1", "associatedTools": ["10", "11"]},
-        {"id": "2", "associatedTools": ["20"]},
-    ]
-    monkeypatch.setattr(wrapper, "fetch_url", _json_fetcher(catalog))
-    out = await wrapper.get_tools_from_mcp_server(["https://host.com/servers/1"])
-    assert out == ["10", "11"]
-
-    # now cover tools_metadata *filter* & *all* paths
-    tools_payload = [
-        {"id": "10", "name": "A"},
-        {"id": "11", "name": "B"},
-    ]
-    monkeypatch.setattr(wrapper, "fetch_url", _json_fetcher(tools_payload))
-    subset = await wrapper.tools_metadata(["10"])
-    assert subset == [{"id": "10", "name": "A"}]
+async def test_catalog_items_merges_servers(monkeypatch, wrapper):
+    monkeypatch.setattr(wrapper, "SERVER_CATALOG_URLS", ["https://host.com/servers/1", "https://host.com/servers/2"])
+    listings = {
+        "https://host.com/servers/1/tools": [{"id": "10", "name": "A"}, {"id": "11", "name": "B"}],
+        "https://host.com/servers/2/tools": [{"id": "11", "name": "B"}, {"id": "20", "name": "C"}],
+    }
+
+    async def _fetch(url, force=False):
+        return listings[url]
 
-    everything = await wrapper.tools_metadata(["0"])
-    assert everything == tools_payload
+    monkeypatch.setattr(wrapper, "fetch_listing", _fetch)
+    items = await wrapper.catalog_items("tools")
+    assert [i["name"] for i in items] == ["A", "B", "C"]
 
 
-# ––– get_resources_from_mcp_server & get_prompts_from_mcp_server ––––––––––– #
+# ––– fetch_listing: TTL and ETag revalidation –––––––––––––––––––––––––––––– #
 
 
 @pytest.mark.asyncio
-async def test_get_resources_and_prompts(monkeypatch, wrapper):
-    catalog = [
-        {"id": "1", "associatedResources": ["r1"]},
-        {"id": "2", "associatedPrompts": ["p1"]},
+async def test_fetch_listing_uses_ttl_and_etag(monkeypatch, wrapper):
+    calls = []
+    responses = [
+        _Resp(json_data=[{"id": "1"}], headers={"etag": '"v1"'}),
+        _Resp(status=304, headers={"etag": '"v1"'}),
     ]
-    monkeypatch.setattr(wrapper, "fetch_url", _json_fetcher(catalog))
 
-    r_ids = await wrapper.get_resources_from_mcp_server(["https://host.com/servers/1"])
-    assert r_ids == ["r1"]
+    async def _fetch(url, headers=None):
+        calls.append(headers)
+        return responses.pop(0)
 
-    p_ids = await wrapper.get_prompts_from_mcp_server(["https://host.com/servers/2"])
-    assert p_ids == ["p1"]
+    monkeypatch.setattr(wrapper, "fetch_url", _fetch)
+    monkeypatch.setattr(wrapper, "CATALOG_TTL", 30)
 
+    first = await wrapper.fetch_listing("https://host.com/servers/1/tools")
+    # Fresh: served from memory without a request
+    assert await wrapper.fetch_listing("https://host.com/servers/1/tools") == first
+    assert len(calls) == 1
 
-# ––– resources_metadata & prompts_metadata branches –––––––––––––––––––––––– #
+    # Stale: one conditional request, 304 reuses the cached listing
+    monkeypatch.setattr(wrapper, "CATALOG_TTL", 0)
+    assert await wrapper.fetch_listing("https://host.com/servers/1/tools") == [{"id": "1"}]
+    assert calls == [{}, {"If-None-Match": '"v1"'}]
+
+
+# ––– shared client ––––––––––––––––––––––––––––––––––––––––––––––––––––––––– #
 
 
 @pytest.mark.asyncio
-async def test_resources_and_prompts_metadata(monkeypatch, wrapper):
-    resources_payload: List[Dict[str, Any]] = [
-        {"id": "r1", "uri": "https://good.com/x", "name": "R"},
-        {"id": "r2", "uri": "https://good.com/y", "name": "S"},
-    ]
-    monkeypatch.setattr(wrapper, "fetch_url", _json_fetcher(resources_payload))
-    assert await wrapper.resources_metadata(["r1"]) == [resources_payload[0]]
-    assert await wrapper.resources_metadata(["0"]) == resources_payload
+async def test_http_client_is_shared(monkeypatch, wrapper):
+    created = []
 
-    prompts_payload = [
-        {"id": "p1", "name": "P", "description": "D", "arguments": []},
-        {"id": "p2", "name": "Q", "description": "", "arguments": []},
-    ]
-    monkeypatch.setattr(wrapper, "fetch_url", _json_fetcher(prompts_payload))
-    assert await wrapper.prompts_metadata(["p2"]) == [prompts_payload[1]]
-    assert await wrapper.prompts_metadata(["0"]) == prompts_payload
+    class _Client:
+        def __init__(self, *_, **kw):
+            created.append(kw)
+
+        async def aclose(self):
+            created.append("closed")
+
+    monkeypatch.setattr(wrapper.httpx, "AsyncClient", _Client)
+    assert wrapper.get_http_client() is wrapper.get_http_client()
+    assert len(created) == 1
+
+    await wrapper.close_http_client()
+    assert created[-1] == "closed"
 
 
 # ––– handle_list_resources – skip invalid URI & keep good one –––––––––––––– #
@@ -480,17 +476,13 @@ async def test_resources_and_prompts_metadata(monkeypatch, wrapper):
 
 @pytest.mark.asyncio
 async def test_handle_list_resources(monkeypatch, wrapper):
-    async def _ids(_catalog_urls):
-        return ["xyz"]
-
-    async def _meta(_ids):
+    async def _items(_kind):
         return [
             {"uri": "https://valid.com", "name": "OK", "description": "", "mimeType": "text/plain"},
             {"uri": "not-a-url", "name": "BAD", "description": "", "mimeType": "text/plain"},
         ]
 
-    monkeypatch.setattr(wrapper, "get_resources_from_mcp_server", _ids)
-    monkeypatch.setattr(wrapper, "resources_metadata", _meta)
+    monkeypatch.setattr(wrapper, "catalog_items", _items)
 
     out = await wrapper.handle_list_resources()
     assert len(out) == 1 and str(out[0].uri).rstrip("/") == "https://valid.com"
@@ -501,14 +493,10 @@ async def test_handle_list_resources(monkeypatch, wrapper):
 
 @pytest.mark.asyncio
 async def test_handle_list_prompts(monkeypatch, wrapper):
-    async def _ids(_):
-        return ["p1"]
-
-    async def _meta(_):
+    async def _items(_kind):
         return [{"name": "Hello", "description": "", "arguments": []}]
 
-    monkeypatch.setattr(wrapper, "get_prompts_from_mcp_server", _ids)
-    monkeypatch.setattr(wrapper, "prompts_metadata", _meta)
+    monkeypatch.setattr(wrapper, "catalog_items", _items)
 
     res = await wrapper.handle_list_prompts()
     assert res and res[0].name == "Hello"
@@ -521,3 +509,57 @@ def test_main_runs_ok(wrapper):
     wrapper.server.__class__.was_run = False  # reset flag
     asyncio.run(wrapper.main())
     assert wrapper.server.__class__.was_run
+
+
+# ––– streamablehttp mode: frames relayed unchanged –––––––––––––––––––––––– #
+
+
+@pytest.mark.asyncio
+async def test_relay_forwards_both_directions(wrapper):
+    # Third-Party
+    import anyio
+
+    to_upstream_w, to_upstream_r = anyio.create_memory_object_stream(10)
+    from_upstream_w, from_upstream_r = anyio.create_memory_object_stream(10)
+    stdin_w, stdin_r = anyio.create_memory_object_stream(10)
+    stdout_w, stdout_r = anyio.create_memory_object_stream(10)
+
+    def frame(**fields):
+        return SimpleNamespace(message=SimpleNamespace(root=SimpleNamespace(**fields)))
+
+    # Two requests are sent before either is answered (pipelined); a parse error is dropped
+    await stdin_w.send(frame(id=1, method="tools/call"))
+    await stdin_w.send(ValueError("bad json"))
+    await stdin_w.send(frame(id=2, method="tools/list"))
+    await stdin_w.aclose()
+
+    async def _answer():
+        # Responses arrive after the client closed stdin and are still delivered
+        await anyio.sleep(0.05)
+        await from_upstream_w.send(frame(id=2, result={"tools": []}))
+        await from_upstream_w.send(frame(id=1, result={"structuredContent": {"x": 1}}))
+
+    with anyio.fail_after(5):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(_answer)
+            await wrapper.relay(stdin_r, stdout_w, from_upstream_r, to_upstream_w)
+
+    assert [to_upstream_r.receive_nowait().message.root.id for _ in range(2)] == [1, 2]
+    assert stdout_r.receive_nowait().message.root.result == {"tools": []}
+    assert stdout_r.receive_nowait().message.root.result["structuredContent"] == {"x": 1}
+
+
+def test_main_streamablehttp_mode(monkeypatch, wrapper):
+    relayed = []
+
+    async def _relay():
+        relayed.append(wrapper.mcp_endpoint_url())
+
+    monkeypatch.setattr(wrapper, "WRAPPER_MODE", "streamablehttp")
+    monkeypatch.setattr(wrapper, "run_streamable_http_relay", _relay)
+    wrapper.server.__class__.was_run = False
+
+    asyncio.run(wrapper.main())
+
+    assert relayed == ["https://host.com/servers/1/mcp"]
+    assert not wrapper.server.__class__.was_run
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for mcpgateway.transports.event_store.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Keval Mahajan
+"""
+
+# Standard
+import asyncio
+import contextvars
+
+# Third-Party
+from mcp.types import JSONRPCMessage, JSONRPCNotification
+import pytest
+
+# First-Party
+from mcpgateway.transports import event_store as es
+from mcpgateway.transports.event_store import event_namespace, InMemoryEventStore, RedisEventStore
+
+
+def _message(n):
+    return JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/message", params={"n": n}))
+
+
+async def _replay(store, event_id):
+    replayed = []
+
+    async def collect(event):
+        replayed.append(event)
+
+    stream_id = await store.replay_events_after(event_id, collect)
+    return stream_id, replayed
+
+
+class _FakePipeline:
+    """Queues commands and runs them against a _FakeRedis on execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._calls.append((name, args, kwargs))
+
+    async def execute(self):
+        if self._redis.down:
+            raise ConnectionError("redis down")
+        return [getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+
+
+class _FakeRedis:
+    """Just enough of Redis Streams for the event store."""
+
+    def __init__(self):
+        self.streams = {}
+        self.ttls = {}
+        self.down = False
+        self._clock = 1000
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        self._clock += 1
+        entry_id = f"{self._clock}-0".encode()
+        entries = self.streams.setdefault(key, [])
+        entries.append((entry_id, {k.encode(): v.encode() for k, v in fields.items()}))
+        if maxlen is not None:
+            del entries[:-maxlen]
+        return entry_id
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+        return key in self.streams
+
+    def xrange(self, key, min="-", max="+", count=None):
+        entries = self.streams.get(key, [])
+        if min.startswith("("):
+            after = es._entry_order(min[1:])
+            entries = [e for e in entries if es._entry_order(e[0]) > after]
+        return entries[:count] if count else list(entries)
+
+
+@pytest.fixture
+def redis_store(monkeypatch):
+    monkeypatch.setattr(es, "REDIS_AVAILABLE", True)
+    monkeypatch.setattr(es, "Redis", type("Redis", (), {"from_url": staticmethod(lambda url: _FakeRedis())}), raising=False)
+    return RedisEventStore("redis://fake", max_events_per_stream=3, ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_sessions_with_the_same_stream_id_are_kept_apart():
+    store = InMemoryEventStore()
+
+    async def session(n):
+        event_namespace.set(f"session{n}")
+        return await store.store_event("_GET_stream", {"n": n})
+
+    first = await asyncio.create_task(session(1), context=contextvars.copy_context())
+    await asyncio.create_task(session(2), context=contextvars.copy_context())
+    await asyncio.create_task(session(1), context=contextvars.copy_context())
+
+    stream_id, replayed = await _replay(store, first)
+    assert stream_id == "_GET_stream"
+    assert [e.message for e in replayed] == [{"n": 1}]
+    assert replayed[0].event_id == "session1:_GET_stream:2"
+
+
+@pytest.mark.asyncio
+async def test_idle_streams_expire(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(es.time, "monotonic", lambda: clock[0])
+    store = InMemoryEventStore(ttl=10)
+    old = await store.store_event("old", {"n": 1})
+    clock[0] = 5.0
+    await store.store_event("busy", {"n": 2})
+
+    clock[0] = 12.0
+    await store.store_event("busy", {"n": 3})
+
+    assert [key[1] for key in store.streams] == ["busy"]
+    assert await _replay(store, old) == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_unknown_and_malformed_event_ids_are_not_replayed():
+    store = InMemoryEventStore()
+    await store.store_event("s", {"n": 1})
+    for event_id in ("garbage", "_:s:abc", "_:s:99", "_:other:1"):
+        assert await _replay(store, event_id) == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_redis_store_replays_from_any_worker(redis_store):
+    ids = [await redis_store.store_event("req-1", _message(n)) for n in range(3)]
+    # A second worker sharing the same Redis
+    other = RedisEventStore.__new__(RedisEventStore)
+    other.__dict__.update(redis_store.__dict__)
+    other._fallback = InMemoryEventStore()
+
+    stream_id, replayed = await _replay(other, ids[0])
+
+    assert stream_id == "req-1"
+    assert [e.message.root.params["n"] for e in replayed] == [1, 2]
+    assert [e.event_id for e in replayed] == ids[1:]
+    assert all(ttl == 60 for ttl in redis_store._redis.ttls.values())
+
+
+@pytest.mark.asyncio
+async def test_redis_store_refuses_to_resume_across_a_gap(redis_store):
+    first = await redis_store.store_event("s", _message(0))
+    for n in range(1, 5):
+        await redis_store.store_event("s", _message(n))
+
+    assert await _replay(redis_store, first) == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_falls_back_to_local_events(redis_store):
+    redis_store._redis.down = True
+    first = await redis_store.store_event("s", _message(1))
+    await redis_store.store_event("s", _message(2))
+
+    assert first == "_:s:1"
+    stream_id, replayed = await _replay(redis_store, first)
+    assert stream_id == "s"
+    assert [e.message.root.params["n"] for e in replayed] == [2]
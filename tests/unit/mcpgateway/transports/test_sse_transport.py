@@ -15,8 +15,13 @@ import json
 import types
 from unittest.mock import AsyncMock, Mock, patch
 
+# Standard
+from datetime import datetime
+
 # First-Party
-from mcpgateway.transports.sse_transport import SSETransport
+from mcpgateway.transports import sse_transport as sse_module
+from mcpgateway.transports.sse_transport import encode_json, OutboundQueue, SSETransport, sse_frame
+from mcpgateway.utils.keepalive import KeepaliveWheel
 
 # Third-Party
 from fastapi import Request
@@ -24,6 +29,19 @@ import pytest
 from sse_starlette.sse import EventSourceResponse
 
 
+def parse_events(chunk: bytes):
+    """Split a chunk of SSE bytes into {field: value} dicts."""
+    events = []
+    for block in chunk.decode().split("\r\n\r\n"):
+        if block:
+            fields = {}
+            for line in block.split("\r\n"):
+                name, _, value = line.partition(": ")
+                fields[name] = f"{fields[name]}\n{value}" if name in fields else value
+            events.append(fields)
+    return events
+
+
 @pytest.fixture
 def sse_transport():
     """Create an SSE transport instance."""
@@ -70,9 +88,10 @@ class TestSSETransport:
         await sse_transport.send_message(message)
 
         # Verify message was queued
-        assert sse_transport._message_queue.qsize() == 1
-        queued_message = await sse_transport._message_queue.get()
-        assert queued_message == message
+        assert len(sse_transport._outbound) == 1
+        (frame,) = await sse_transport._outbound.get(10)
+        (event,) = parse_events(frame)
+        assert json.loads(event["data"]) == message
 
     @pytest.mark.asyncio
     async def test_send_message_not_connected(self, sse_transport):
@@ -95,7 +114,7 @@ class TestSSETransport:
     async def test_send_message_queue_exception(self, sse_transport):
         """send_message should log and raise if queue.put fails."""
         await sse_transport.connect()
-        with patch.object(sse_transport._message_queue, "put", side_effect=Exception("fail")), patch("mcpgateway.transports.sse_transport.logger") as mock_logger:
+        with patch.object(sse_transport._outbound, "put", side_effect=Exception("fail")), patch("mcpgateway.transports.sse_transport.logger") as mock_logger:
             with pytest.raises(Exception, match="fail"):
                 await sse_transport.send_message({"foo": "bar"})
             assert mock_logger.error.called
@@ -104,7 +123,7 @@ class TestSSETransport:
     async def test_receive_message_cancelled(self, sse_transport):
         """Test receive_message handles CancelledError and logs."""
         await sse_transport.connect()
-        with patch("asyncio.sleep", side_effect=asyncio.CancelledError), patch("mcpgateway.transports.sse_transport.logger") as mock_logger:
+        with patch.object(sse_transport._client_gone, "wait", side_effect=asyncio.CancelledError), patch("mcpgateway.transports.sse_transport.logger") as mock_logger:
             gen = sse_transport.receive_message()
             await gen.__anext__()  # initialize message
             with pytest.raises(asyncio.CancelledError):
@@ -116,7 +135,7 @@ class TestSSETransport:
     async def test_receive_message_finally_logs(self, sse_transport):
         """Test receive_message logs in finally block."""
         await sse_transport.connect()
-        with patch("asyncio.sleep", side_effect=Exception("fail")), patch("mcpgateway.transports.sse_transport.logger") as mock_logger:
+        with patch.object(sse_transport._client_gone, "wait", side_effect=Exception("fail")), patch("mcpgateway.transports.sse_transport.logger") as mock_logger:
             gen = sse_transport.receive_message()
             await gen.__anext__()  # initialize message
             with pytest.raises(Exception):
@@ -145,14 +164,14 @@ class TestSSETransport:
     async def test_create_sse_response_event_generator_error(self, sse_transport, mock_request):
         """Test event_generator handles generic Exception and CancelledError."""
         await sse_transport.connect()
-        # Patch _message_queue.get to raise Exception, then CancelledError
-        with patch.object(sse_transport._message_queue, "get", side_effect=[Exception("fail"), asyncio.CancelledError()]), patch("mcpgateway.transports.sse_transport.logger") as mock_logger:
+        # Patch _outbound.get to raise Exception, then CancelledError
+        with patch.object(sse_transport._outbound, "get", side_effect=[Exception("fail"), asyncio.CancelledError()]), patch("mcpgateway.transports.sse_transport.logger") as mock_logger:
             response = await sse_transport.create_sse_response(mock_request)
             gen = response.body_iterator
             await gen.__anext__()  # endpoint
             await gen.__anext__()  # keepalive
             # Should yield error event
-            event = await gen.__anext__()
+            (event,) = parse_events(await gen.__anext__())
             assert event["event"] == "error"
             assert "fail" in event["data"]
             # Should handle CancelledError gracefully and stop
@@ -209,23 +228,149 @@ class TestSSETransport:
         generator = response.body_iterator
 
         # First event should be endpoint
-        event = await generator.__anext__()
+        (event,) = parse_events(await generator.__anext__())
         assert "event" in event
         assert event["event"] == "endpoint"
         assert sse_transport._session_id in event["data"]
 
         # Second event should be keepalive
-        event = await generator.__anext__()
+        (event,) = parse_events(await generator.__anext__())
         assert event["event"] == "keepalive"
 
         # Queue a test message
         test_message = {"jsonrpc": "2.0", "result": "test", "id": 1}
-        await sse_transport._message_queue.put(test_message)
+        await sse_transport.send_message(test_message)
 
         # Next event should be the message
-        event = await generator.__anext__()
+        (event,) = parse_events(await generator.__anext__())
         assert event["event"] == "message"
         assert json.loads(event["data"]) == test_message
 
         # Cancel the generator to clean up
         sse_transport._client_gone.set()
+
+    @pytest.mark.asyncio
+    async def test_event_generator_coalesces_queued_messages(self, sse_transport, mock_request):
+        """Messages already queued are written in one chunk, unserialisable ones as error events."""
+        await sse_transport.connect()
+        generator = (await sse_transport.create_sse_response(mock_request)).body_iterator
+        await generator.__anext__()  # endpoint
+        await generator.__anext__()  # keepalive
+
+        for i in range(3):
+            await sse_transport.send_message({"jsonrpc": "2.0", "id": i, "result": {}})
+        await sse_transport.send_message({"jsonrpc": "2.0", "id": 3, "result": object()})
+
+        events = parse_events(await generator.__anext__())
+
+        assert [e["event"] for e in events] == ["message", "message", "message", "error"]
+        assert [json.loads(e["data"])["id"] for e in events[:3]] == [0, 1, 2]
+        assert "not serializable" in events[3]["data"]
+        sse_transport._client_gone.set()
+
+    @pytest.mark.asyncio
+    async def test_event_generator_keepalive_comes_from_shared_wheel(self, sse_transport, mock_request, monkeypatch):
+        """An idle stream gets a keepalive when the wheel wakes it, and disconnect ends it at once."""
+        wheel = KeepaliveWheel(tick=0.01)
+        monkeypatch.setattr(sse_module, "keepalive_wheel", wheel)
+        monkeypatch.setattr(sse_module.settings, "sse_keepalive_interval", 0.05)
+        await sse_transport.connect()
+        generator = (await sse_transport.create_sse_response(mock_request)).body_iterator
+        await generator.__anext__()  # endpoint
+        await generator.__anext__()  # keepalive
+
+        (event,) = parse_events(await asyncio.wait_for(generator.__anext__(), timeout=1.0))
+        assert event["event"] == "keepalive"
+        assert wheel.stats()["sessions"] == 1
+
+        pending = asyncio.ensure_future(generator.__anext__())
+        await asyncio.sleep(0)
+        await sse_transport.disconnect()
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(pending, timeout=1.0)
+        assert wheel.stats()["sessions"] == 0
+
+
+class TestOutboundQueue:
+    """Tests for bounded per-session queues and slow-consumer policies."""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_discards_notifications_only(self):
+        queue = OutboundQueue(maxsize=2, policy="drop-oldest", block_timeout=0.05)
+        assert await queue.put(b"response", droppable=False)
+        assert await queue.put(b"note-1", droppable=True)
+        assert await queue.put(b"note-2", droppable=True)
+        assert queue.dropped == 1
+        assert await queue.get(10) == [b"response", b"note-2"]
+
+        # With only responses queued there is nothing to drop: the producer blocks, then gives up
+        await queue.put(b"r1")
+        await queue.put(b"r2")
+        assert await queue.put(b"note-3", droppable=True) is False
+
+    @pytest.mark.asyncio
+    async def test_block_waits_for_the_reader(self):
+        queue = OutboundQueue(maxsize=1, policy="block", block_timeout=1.0)
+        await queue.put(b"first")
+        producer = asyncio.ensure_future(queue.put(b"second"))
+        await asyncio.sleep(0.01)
+        assert not producer.done()
+
+        assert await queue.get(10) == [b"first"]
+        assert await producer is True
+        assert await queue.get(10) == [b"second"]
+
+    @pytest.mark.asyncio
+    async def test_byte_limit_and_high_water_marks(self):
+        queue = OutboundQueue(maxsize=100, max_bytes=10, policy="disconnect")
+        assert await queue.put(b"x" * 20)  # an oversized frame still fits an empty queue
+        assert await queue.put(b"y") is False
+        await queue.get(10)
+        assert await queue.put(b"a" * 6)
+        assert await queue.put(b"b" * 4)
+        assert queue.stats() == {"queued": 2, "queued_bytes": 10, "high_water": 2, "high_water_bytes": 20, "dropped": 0}
+
+    @pytest.mark.asyncio
+    async def test_close_releases_blocked_producer(self):
+        queue = OutboundQueue(maxsize=1, policy="block", block_timeout=5.0)
+        await queue.put(b"first")
+        producer = asyncio.ensure_future(queue.put(b"second"))
+        await asyncio.sleep(0)
+        queue.close()
+        assert await producer is False
+        assert queue.bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_client_is_disconnected_and_counted(self, sse_transport, monkeypatch):
+        monkeypatch.setattr(sse_transport, "_outbound", OutboundQueue(maxsize=1, policy="disconnect"))
+        monkeypatch.setattr(SSETransport, "totals", dict(SSETransport.totals, disconnected=0))
+        await sse_transport.connect()
+        await sse_transport.send_message({"jsonrpc": "2.0", "id": 1, "result": {}})
+        assert sse_transport.session_id in SSETransport.metrics()["sessions"]
+
+        with pytest.raises(RuntimeError, match="too slow"):
+            await sse_transport.send_message({"jsonrpc": "2.0", "id": 2, "result": {}})
+
+        assert await sse_transport.is_connected() is False
+        assert sse_transport._client_gone.is_set()
+        metrics = SSETransport.metrics()
+        assert metrics["disconnected"] == 1
+        assert sse_transport.session_id not in metrics["sessions"]
+
+
+class TestEncoding:
+    """Tests for the SSE encoding helpers."""
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_encode_json_is_identical_with_either_encoder(self, monkeypatch, orjson_available):
+        if orjson_available and not sse_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(sse_module, "ORJSON_AVAILABLE", orjson_available)
+        message = {"id": 1, "at": datetime(2025, 1, 2, 3, 4, 5), "text": "héllo\nworld", 5: 2**70}
+
+        assert encode_json(message) == b'{"id":1,"at":"2025-01-02 03:04:05","text":"h\xc3\xa9llo\\nworld","5":1180591620717411303424}'
+        with pytest.raises(TypeError):
+            encode_json({"x": object()})
+
+    def test_sse_frame_splits_multiline_data(self):
+        assert sse_frame("message", b"a\nb") == b"event: message\r\ndata: a\r\ndata: b\r\n\r\n"
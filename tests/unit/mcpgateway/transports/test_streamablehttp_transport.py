@@ -11,6 +11,8 @@ Focus areas
   max size is reached.
 * **streamable_http_auth** - behaviour on happy path (valid Bearer token) and
   when verification fails (returns 401 and False).
+* **MCP method handlers** - tool, resource, prompt, completion and logging
+  handlers against stubbed services.
 
 No external MCP server is started; we test the isolated utility pieces that
 have no heavy dependencies.
@@ -146,3 +148,156 @@ async def test_auth_failure(monkeypatch):
     assert result is False
     assert sent and sent[0]["type"] == "http.response.start"
     assert sent[0]["status"] == tr.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_auth_server_rate_limit(monkeypatch):
+    """Requests beyond a virtual server's limit get 429 with Retry-After."""
+
+    async def fake_verify(_):  # noqa: D401 – stub
+        return {"sub": "alice"}
+
+    monkeypatch.setattr(tr, "verify_credentials", fake_verify)
+    monkeypatch.setattr(tr.settings, "server_rate_limit", 1)
+
+    sent = []
+
+    async def send(msg):
+        sent.append(msg)
+
+    scope = _make_scope("/servers/7/mcp", headers=[(b"authorization", b"Bearer t")])
+
+    assert await streamable_http_auth(scope, None, send) is True
+    assert await streamable_http_auth(scope, None, send) is False
+    assert sent[0]["status"] == tr.HTTP_429_TOO_MANY_REQUESTS
+    assert (b"retry-after", b"60") in sent[0]["headers"]
+
+
+# ---------------------------------------------------------------------------
+# MCP method handlers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def no_db(monkeypatch):
+    """Run handlers without a database session."""
+
+    class _NoDb:
+        async def __aenter__(self):
+            return None
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(tr, "get_db", _NoDb)
+    monkeypatch.setattr(tr, "_progress_reporter", lambda: None)
+
+
+@pytest.mark.asyncio
+async def test_call_tool_keeps_every_content_item(monkeypatch, no_db):
+    # First-Party
+    from mcpgateway.types import ImageContent, ResourceContent, TextContent, ToolResult
+
+    result = ToolResult(
+        content=[
+            TextContent(type="text", text="one"),
+            ImageContent(type="image", data=b"aGk=", mime_type="image/png"),
+            ResourceContent(type="resource", uri="file:///a.bin", blob=b"\xff\xfe"),
+        ]
+    )
+
+    async def invoke_tool(**_):
+        return result
+
+    monkeypatch.setattr(tr.tool_service, "invoke_tool", invoke_tool)
+
+    content = await tr.call_tool("t", {})
+
+    assert [c.type for c in content] == ["text", "image", "resource"]
+    assert content[1].data == "aGk=" and content[1].mimeType == "image/png"
+    assert content[2].resource.blob == "//4="
+
+
+@pytest.mark.asyncio
+async def test_call_tool_surfaces_tool_errors(monkeypatch, no_db):
+    # First-Party
+    from mcpgateway.types import TextContent, ToolResult
+
+    async def invoke_tool(**_):
+        return ToolResult(content=[TextContent(type="text", text="bad input")], is_error=True)
+
+    monkeypatch.setattr(tr.tool_service, "invoke_tool", invoke_tool)
+
+    with pytest.raises(RuntimeError, match="bad input"):
+        await tr.call_tool("t", {})
+
+
+@pytest.mark.asyncio
+async def test_resource_handlers(monkeypatch, no_db):
+    # Standard
+    from types import SimpleNamespace
+
+    # First-Party
+    from mcpgateway.types import ResourceContent
+
+    server_ids = []
+
+    async def list_server_resources(_db, server_id):
+        server_ids.append(server_id)
+        return [SimpleNamespace(uri="file:///a.txt", name="a", description=None, mime_type="text/plain", size=3)]
+
+    async def read_resource(_db, uri):
+        return ResourceContent(type="resource", uri=uri, mime_type="text/plain", text="abc")
+
+    monkeypatch.setattr(tr.resource_service, "list_server_resources", list_server_resources)
+    monkeypatch.setattr(tr.resource_service, "read_resource", read_resource)
+
+    token = tr.server_id_var.set("7")
+    try:
+        resources = await tr.list_resources()
+    finally:
+        tr.server_id_var.reset(token)
+    contents = await tr.read_resource("file:///a.txt")
+
+    assert server_ids == ["7"]
+    assert str(resources[0].uri) == "file:///a.txt" and resources[0].mimeType == "text/plain"
+    assert [(c.content, c.mime_type) for c in contents] == [("abc", "text/plain")]
+    # Nothing would deliver resource updates on this transport, so subscriptions are not offered
+    assert tr.types.SubscribeRequest not in tr.mcp_app.request_handlers
+
+
+@pytest.mark.asyncio
+async def test_prompt_completion_and_logging_handlers(monkeypatch, no_db):
+    # Standard
+    from types import SimpleNamespace
+
+    # First-Party
+    from mcpgateway.types import CompleteResult, LogLevel, Message, PromptResult, Role, TextContent
+
+    async def get_prompt(_db, name, arguments):
+        return PromptResult(messages=[Message(role=Role.USER, content=TextContent(type="text", text=f"hi {arguments['who']}"))])
+
+    requests, levels = [], []
+
+    async def handle_completion(_db, request):
+        requests.append(request)
+        return CompleteResult(completion={"values": ["alice"], "total": 1, "hasMore": False})
+
+    async def set_level(level):
+        levels.append(level)
+
+    monkeypatch.setattr(tr.prompt_service, "get_prompt", get_prompt)
+    monkeypatch.setattr(tr.completion_service, "handle_completion", handle_completion)
+    monkeypatch.setitem(tr.mcp_app.request_handlers, tr.types.SetLevelRequest, None)
+    tr.register_logging_handler(SimpleNamespace(set_level=set_level))
+
+    prompt = await tr.get_prompt("greet", {"who": "bob"})
+    types = tr.types  # the real SDK module; other suites stub "mcp" in sys.modules
+    completion = await tr.complete(types.PromptReference(type="ref/prompt", name="greet"), types.CompletionArgument(name="who", value="a"), None)
+    handler = tr.mcp_app.request_handlers[types.SetLevelRequest]
+    await handler(types.SetLevelRequest(method="logging/setLevel", params=types.SetLevelRequestParams(level="warning")))
+
+    assert prompt.messages[0].role == "user" and prompt.messages[0].content.text == "hi bob"
+    assert requests == [{"ref": {"type": "ref/prompt", "name": "greet"}, "argument": {"name": "who", "value": "a"}}]
+    assert completion.values == ["alice"]
+    assert levels == [LogLevel.WARNING]
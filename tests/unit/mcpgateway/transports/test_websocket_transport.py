@@ -10,12 +10,15 @@ Tests for the MCP Gateway WebSocket transport implementation.
 
 # Standard
 import asyncio
+import json
 import logging
 import types
 from unittest.mock import AsyncMock
 
 # First-Party
+from mcpgateway.transports import websocket_transport as ws_module
 from mcpgateway.transports.websocket_transport import WebSocketTransport
+from mcpgateway.utils.keepalive import KeepaliveWheel
 
 # Third-Party
 from fastapi import WebSocket, WebSocketDisconnect
@@ -29,8 +32,7 @@ def mock_websocket():
     mock.accept = AsyncMock()
     mock.send_json = AsyncMock()
     mock.send_bytes = AsyncMock()
-    mock.receive_json = AsyncMock()
-    mock.receive_bytes = AsyncMock()
+    mock.receive = AsyncMock()
     mock.close = AsyncMock()
     return mock
 
@@ -107,10 +109,11 @@ class TestWebSocketTransport:
             WebSocketDisconnect(),  # Raise this after the second message
         ]
 
-        mock_websocket.receive_json.side_effect = [
-            test_messages[0],
-            test_messages[1],
-            WebSocketDisconnect(),
+        mock_websocket.receive.side_effect = [
+            {"type": "websocket.receive", "text": json.dumps(test_messages[0])},
+            {"type": "websocket.receive", "bytes": b"pong"},
+            {"type": "websocket.receive", "text": json.dumps(test_messages[1])},
+            {"type": "websocket.disconnect", "code": 1000},
         ]
 
         # Get message generator
@@ -164,7 +167,7 @@ class TestWebSocketTransport:
     async def test_receive_message_logs_and_disconnects_on_error(self, websocket_transport, mock_websocket, caplog):
         """Test receive_message logs error and disconnects on generic error."""
         await websocket_transport.connect()
-        mock_websocket.receive_json.side_effect = Exception("unexpected error")
+        mock_websocket.receive.side_effect = Exception("unexpected error")
         gen = websocket_transport.receive_message()
         with caplog.at_level(logging.ERROR):
             with pytest.raises(StopAsyncIteration):
@@ -183,28 +186,40 @@ class TestWebSocketTransport:
         await websocket_transport.send_ping()
         mock_websocket.send_bytes.assert_called_with(b"ping")
 
-    # @pytest.mark.asyncio
-    # async def test_ping_loop(websocket_transport, mock_websocket):
-    #     """Test the ping loop with valid response."""
-
-    #     # Patch the interval before import is used
-    #     with patch("mcpgateway.transports.websocket_transport.settings.websocket_ping_interval", 0.05), \
-    #         patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-
-    #         # Make the client respond with pong
-    #         mock_websocket.receive_bytes.return_value = b"pong"
+    @pytest.mark.asyncio
+    async def test_idle_connection_is_pinged_then_closed(self, websocket_transport, mock_websocket, monkeypatch):
+        """The shared wheel pings a silent connection and closes it if the ping goes unanswered."""
+        wheel = KeepaliveWheel(tick=0.01)
+        monkeypatch.setattr(ws_module, "keepalive_wheel", wheel)
+        monkeypatch.setattr(ws_module.settings, "websocket_ping_interval", 0.05)
+        await websocket_transport.connect()
+        assert wheel.stats()["sessions"] == 1
 
-    #         # Call connect (this starts the ping loop internally)
-    #         await websocket_transport.connect()
+        await asyncio.sleep(0.09)
+        mock_websocket.send_bytes.assert_called_once_with(b"ping")
+        assert await websocket_transport.is_connected() is True
 
-    #         # Wait briefly to let ping loop run (via mocked asyncio.sleep)
-    #         await asyncio.sleep(0.15)
+        await asyncio.sleep(0.1)
+        mock_websocket.close.assert_called_once()
+        assert await websocket_transport.is_connected() is False
+        assert wheel.stats()["sessions"] == 0
 
-    #         # Now assert that at least one ping was sent
-    #         assert mock_websocket.send_bytes.call_count >= 1
-    #         mock_websocket.send_bytes.assert_called_with(b"ping")
+    @pytest.mark.asyncio
+    async def test_pong_keeps_connection_open(self, websocket_transport, mock_websocket, monkeypatch):
+        """A pong read by the receive loop answers the outstanding ping."""
+        wheel = KeepaliveWheel(tick=0.01)
+        monkeypatch.setattr(ws_module, "keepalive_wheel", wheel)
+        monkeypatch.setattr(ws_module.settings, "websocket_ping_interval", 0.05)
+        pongs = asyncio.Queue()
+        mock_websocket.receive.side_effect = pongs.get
+        await websocket_transport.connect()
+        reader = asyncio.ensure_future(websocket_transport.receive_message().__anext__())
 
-    #         assert mock_websocket.receive_bytes.call_count >= 1
+        for _ in range(3):
+            await asyncio.sleep(0.07)
+            await pongs.put({"type": "websocket.receive", "bytes": b"pong"})
 
-    #         # Cancel the ping task cleanly
-    #         await websocket_transport.disconnect()
+        assert mock_websocket.send_bytes.call_count >= 2
+        mock_websocket.close.assert_not_called()
+        reader.cancel()
+        await websocket_transport.disconnect()
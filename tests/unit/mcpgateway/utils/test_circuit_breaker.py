@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for mcpgateway.utils.circuit_breaker.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+"""
+
+# Standard
+import asyncio
+
+# Third-Party
+import httpx
+import pytest
+
+# First-Party
+from mcpgateway.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, CircuitState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr("mcpgateway.utils.circuit_breaker.time.monotonic", fake)
+    return fake
+
+
+def _fail(breaker, times=1):
+    for _ in range(times):
+        with pytest.raises(RuntimeError):
+            with breaker.guard():
+                raise RuntimeError("boom")
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("t", failure_threshold=3, recovery_timeout=10)
+    _fail(breaker, 2)
+    with breaker.guard():
+        pass  # a success resets the streak
+    _fail(breaker, 2)
+    assert breaker.state == CircuitState.CLOSED
+    _fail(breaker)
+    assert breaker.state == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == pytest.approx(10)
+
+
+def test_half_open_limits_trials_and_closes_on_success(clock):
+    breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=10, half_open_max_calls=1)
+    _fail(breaker)
+    clock.now += 10
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    slot = breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one trial at a time
+    breaker.record_success(slot)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_failure_reopens(clock):
+    breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=10)
+    _fail(breaker)
+    clock.now += 10
+    _fail(breaker)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.transitions == 3
+
+
+def test_cancellation_frees_trial_slot_without_verdict(clock):
+    breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=10)
+    _fail(breaker)
+    clock.now += 10
+    with pytest.raises(KeyboardInterrupt):
+        with breaker.guard():
+            raise KeyboardInterrupt
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()  # slot is available again
+
+
+@pytest.mark.asyncio
+async def test_deadline_expiry_counts_as_failure():
+    breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=10)
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01) as deadline:
+            with breaker.guard(deadline=deadline):
+                await asyncio.sleep(1)
+    assert breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_cancellation_before_deadline_is_not_a_failure():
+    breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=10)
+
+    async def call():
+        async with asyncio.timeout(10) as deadline:
+            with breaker.guard(deadline=deadline):
+                await asyncio.sleep(1)
+
+    task = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_health_probe_success_half_opens_open_circuit(clock):
+    breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    breaker.record_success()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+
+def test_failure_while_open_restarts_recovery_timer(clock):
+    breaker = CircuitBreaker("t", failure_threshold=1, recovery_timeout=10)
+    breaker.record_failure()
+    clock.now += 8
+    breaker.record_failure()
+    clock.now += 8
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_is_failure_predicate():
+    breaker = CircuitBreaker("t", failure_threshold=1)
+    response = httpx.Response(404, request=httpx.Request("GET", "http://x"))
+    with pytest.raises(httpx.HTTPStatusError):
+        with breaker.guard(is_failure=lambda e: e.response.status_code >= 500):
+            response.raise_for_status()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_registry_keys_and_snapshot():
+    registry = CircuitBreakerRegistry()
+    assert registry.for_url("http://api.example.com/a") is registry.for_url("http://api.example.com/b?x=1")
+    assert registry.for_gateway("gw1") is not registry.for_url("http://gw1")
+    registry.for_gateway("gw1").record_failure()
+    assert registry.snapshot() == {"host:api.example.com": "closed", "gateway:gw1": "closed", "host:gw1": "closed"}
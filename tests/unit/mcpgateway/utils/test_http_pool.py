@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for mcpgateway.utils.http_pool.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+"""
+
+# Standard
+import asyncio
+import gzip
+
+# Third-Party
+import httpx
+import pytest
+
+# First-Party
+from mcpgateway.utils.http_pool import HostPoolManager, ResponseTooLargeError
+
+
+@pytest.fixture
+async def manager():
+    mgr = HostPoolManager(max_connections=4, max_keepalive_connections=2, keepalive_expiry=5, http2=False)
+    yield mgr
+    await mgr.aclose()
+
+
+def _install(mgr, url, handler):
+    """Replace the lazily created client for ``url``'s host with one on a mock transport."""
+    mgr.client_for(url)
+    key = mgr.origin(url)
+    mgr._clients[key] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_one_pool_per_host(manager):
+    a1 = manager.client_for("http://a.example.com/x")
+    a2 = manager.client_for("http://A.example.com/y?z=1")
+    b = manager.client_for("http://b.example.com/x")
+    other_port = manager.client_for("http://a.example.com:8080/x")
+
+    assert a1 is a2
+    assert len({id(a1), id(b), id(other_port)}) == 3
+    assert a1._transport._pool._max_connections == 4
+
+
+@pytest.mark.asyncio
+async def test_occupancy_tracks_in_flight_per_host(manager):
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    async def fast(request):
+        return httpx.Response(200, json={"ok": True})
+
+    _install(manager, "http://slow.example.com", slow)
+    _install(manager, "http://fast.example.com", fast)
+
+    pending = [asyncio.create_task(manager.request("POST", "http://slow.example.com/op", json={})) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    # a busy host does not block another host's pool
+    response = await manager.get("http://fast.example.com/op", params={"q": 1})
+    assert response.json() == {"ok": True}
+
+    occupancy = manager.occupancy()
+    assert occupancy["http://slow.example.com"]["in_flight"] == 3
+    assert occupancy["http://fast.example.com"]["in_flight"] == 0
+    assert occupancy["http://slow.example.com"]["max_connections"] == 4
+
+    release.set()
+    await asyncio.gather(*pending)
+    assert manager.occupancy()["http://slow.example.com"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_in_flight_released_on_error(manager):
+    def boom(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    _install(manager, "http://down.example.com", boom)
+    with pytest.raises(httpx.ConnectError):
+        await manager.request("GET", "http://down.example.com/")
+    assert manager.occupancy()["http://down.example.com"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_chunks_reported_and_size_guard(manager):
+    manager.max_response_size = 10
+
+    async def small(request):
+        async def body():
+            yield b"0123456789"
+
+        return httpx.Response(200, content=body())
+
+    async def declared_large(request):
+        return httpx.Response(200, content=b"x" * 11)
+
+    async def streamed_large(request):
+        async def body():
+            for _ in range(3):
+                yield b"xxxxx"
+
+        return httpx.Response(200, content=body())
+
+    _install(manager, "http://small.example.com", small)
+    _install(manager, "http://declared.example.com", declared_large)
+    _install(manager, "http://streamed.example.com", streamed_large)
+
+    seen = []
+
+    async def on_chunk(response, received, chunk):
+        seen.append((received, chunk))
+
+    response = await manager.get("http://small.example.com/", on_chunk=on_chunk)
+    assert seen == [(10, b"0123456789")]
+    # Chunks handed to on_chunk are not kept
+    with pytest.raises(httpx.ResponseNotRead):
+        response.content
+    assert (await manager.get("http://small.example.com/")).content == b"0123456789"
+
+    with pytest.raises(ResponseTooLargeError):
+        await manager.get("http://declared.example.com/")
+    # Without Content-Length the body is abandoned as soon as it crosses the limit
+    with pytest.raises(ResponseTooLargeError):
+        await manager.get("http://streamed.example.com/")
+    assert manager.occupancy()["http://streamed.example.com"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_buffered_body_is_not_decoded_twice(manager):
+    body = b'{"ok": true}'
+
+    async def gzipped(request):
+        return httpx.Response(200, headers={"content-encoding": "gzip"}, content=gzip.compress(body))
+
+    _install(manager, "http://gz.example.com", gzipped)
+    response = await manager.get("http://gz.example.com/")
+    assert response.json() == {"ok": True}
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_aclose_single_host(manager):
+    manager.client_for("http://a.example.com")
+    manager.client_for("http://b.example.com")
+    await manager.aclose("http://a.example.com/anything")
+    assert list(manager.occupancy()) == ["http://b.example.com"]
+
+
+@pytest.mark.asyncio
+async def test_aclose_while_requests_run_keeps_their_count(manager):
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200)
+
+    _install(manager, "http://busy.example.com", slow)
+    pending = asyncio.create_task(manager.get("http://busy.example.com/"))
+    await asyncio.sleep(0)
+
+    await manager.aclose("http://busy.example.com")
+    release.set()
+    # The request ends on the closed pool; its counter must not raise KeyError over that
+    try:
+        await pending
+    except httpx.HTTPError:
+        pass
+    assert manager._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_idle_pools_evicted_beyond_max_hosts():
+    manager = HostPoolManager(http2=False, max_hosts=2)
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200)
+
+    async def fast(request):
+        return httpx.Response(200)
+
+    _install(manager, "http://busy.example.com", slow)
+    _install(manager, "http://a.example.com", fast)
+    pending = asyncio.create_task(manager.get("http://busy.example.com/"))
+    await asyncio.sleep(0)
+    await manager.get("http://a.example.com/")
+
+    _install(manager, "http://b.example.com", fast)
+    await manager.get("http://b.example.com/")
+    # the busy pool is kept even though it is the least recently used
+    assert list(manager.occupancy()) == ["http://busy.example.com", "http://b.example.com"]
+
+    release.set()
+    await pending
+    _install(manager, "http://c.example.com", fast)
+    await manager.get("http://c.example.com/")
+    assert list(manager.occupancy()) == ["http://b.example.com", "http://c.example.com"]
+    await manager.aclose()
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setattr("mcpgateway.utils.http_pool.HTTP2_AVAILABLE", False)
+    assert HostPoolManager(http2=True).http2 is False
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for mcpgateway.utils.invocation_scheduler.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+"""
+
+# Standard
+import asyncio
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils.invocation_scheduler import InvocationScheduler, InvocationTimeoutError, SchedulerOverloadError
+
+
+async def _hold(scheduler, tool, release, order, client, gateway=None):
+    async with scheduler.slot(tool, gateway=gateway, client=client):
+        order.append(client)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_tool_limit_queues_excess_calls():
+    scheduler = InvocationScheduler(tool_limit=2, max_queue=10, timeout=5)
+    release = asyncio.Event()
+    order = []
+    tasks = [asyncio.create_task(_hold(scheduler, "echo", release, order, f"c{i}")) for i in range(5)]
+    await asyncio.sleep(0)
+
+    assert scheduler.metrics()["tools"]["echo"] == {"active": 2, "queued": 3, "limit": 2}
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert len(order) == 5
+    assert scheduler.metrics()["tools"]["echo"] == {"active": 0, "queued": 0, "limit": 2}
+
+
+@pytest.mark.asyncio
+async def test_gateway_limit_spans_tools():
+    scheduler = InvocationScheduler(tool_limit=5, gateway_limit=1, max_queue=10, timeout=5)
+    release = asyncio.Event()
+    order = []
+    a = asyncio.create_task(_hold(scheduler, "a", release, order, "x", gateway="gw"))
+    b = asyncio.create_task(_hold(scheduler, "b", release, order, "x", gateway="gw"))
+    await asyncio.sleep(0)
+
+    assert scheduler.metrics()["gateways"]["gw"]["active"] == 1
+    assert scheduler.metrics()["gateways"]["gw"]["queued"] == 1
+
+    release.set()
+    await asyncio.gather(a, b)
+    assert order == ["x", "x"]
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_round_robin_across_clients():
+    scheduler = InvocationScheduler(tool_limit=1, max_queue=10, timeout=5)
+    order = []
+
+    async def call(client):
+        async with scheduler.slot("echo", client=client):
+            order.append(client)
+            await asyncio.sleep(0)
+
+    # "busy" queues three calls before "quiet" queues one
+    tasks = [asyncio.create_task(call(c)) for c in ["busy", "busy", "busy", "busy", "quiet"]]
+    await asyncio.gather(*tasks)
+
+    assert order == ["busy", "busy", "quiet", "busy", "busy"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_immediately():
+    scheduler = InvocationScheduler(tool_limit=1, max_queue=1, timeout=5)
+    release = asyncio.Event()
+    order = []
+    first = asyncio.create_task(_hold(scheduler, "echo", release, order, "a"))
+    second = asyncio.create_task(_hold(scheduler, "echo", release, order, "b"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(SchedulerOverloadError):
+        async with scheduler.slot("echo", client="c"):
+            pass
+    assert scheduler.metrics()["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(first, second)
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_work_and_frees_slot():
+    scheduler = InvocationScheduler(tool_limit=1, max_queue=10, timeout=0.05)
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(InvocationTimeoutError):
+        async with scheduler.slot("slow"):
+            await slow()
+
+    assert cancelled.is_set()
+    assert scheduler.metrics()["timed_out"] == 1
+    assert scheduler.metrics()["tools"]["slow"]["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_deadline_includes_queue_time():
+    scheduler = InvocationScheduler(tool_limit=1, max_queue=10, timeout=5)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, "echo", release, [], "a"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(InvocationTimeoutError):
+        async with scheduler.slot("echo", client="b", timeout=0.05):
+            pass
+    # The timed-out waiter left the queue
+    assert scheduler.metrics()["tools"]["echo"]["queued"] == 0
+
+    release.set()
+    await holder
+    assert scheduler.metrics()["tools"]["echo"]["active"] == 0
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for mcpgateway.utils.keepalive.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+"""
+
+# Standard
+import asyncio
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils.keepalive import KeepaliveHandle, KeepaliveWheel
+
+
+def _place(wheel, callback, interval):
+    """Register a session at time 0 without a running loop, driving the wheel by hand."""
+    handle = KeepaliveHandle(wheel, callback, interval)
+    handle.last_active = 0.0
+    wheel._schedule(handle, interval)
+    wheel._handles.add(handle)
+    return handle
+
+
+def test_idle_sessions_fire_and_active_ones_are_rescheduled():
+    wheel = KeepaliveWheel(tick=1.0, slots=4)
+    fired = []
+    _place(wheel, lambda: fired.append("quiet"), 3.0)
+    busy = _place(wheel, lambda: fired.append("busy"), 3.0)
+
+    wheel._advance(1.0)
+    wheel._advance(2.0)
+    busy.last_active = 2.0
+    wheel._advance(3.0)
+    assert fired == ["quiet"]
+
+    wheel._advance(4.0)
+    wheel._advance(5.0)
+    assert fired == ["quiet", "busy"]
+    wheel._advance(6.0)
+    assert fired == ["quiet", "busy", "quiet"]
+    assert wheel.stats()["fired"] == 3
+
+
+def test_long_intervals_wrap_around_in_rounds():
+    wheel = KeepaliveWheel(tick=1.0, slots=4)
+    fired = []
+    _place(wheel, lambda: fired.append(1), 10.0)
+
+    for now in range(1, 10):
+        wheel._advance(float(now))
+    assert fired == []
+    wheel._advance(10.0)
+    assert fired == [1]
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_unregisters_session():
+    wheel = KeepaliveWheel(tick=0.01)
+
+    def boom():
+        raise RuntimeError("socket gone")
+
+    handle = wheel.register(boom, interval=0.02)
+    await asyncio.sleep(0.06)
+
+    assert handle.cancelled
+    assert wheel.stats()["sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_wheel_task_stops_when_last_session_leaves():
+    wheel = KeepaliveWheel(tick=0.01)
+    first = wheel.register(lambda: None, interval=1.0)
+    second = wheel.register(lambda: None, interval=1.0)
+    task = wheel._task
+
+    first.cancel()
+    first.cancel()  # idempotent
+    await asyncio.sleep(0.03)
+    assert not task.done()
+
+    second.cancel()
+    await asyncio.sleep(0.03)
+    assert task.done()
+    assert wheel.stats()["sessions"] == 0
+
+
+def test_sessions_of_a_previous_event_loop_do_not_affect_the_count():
+    wheel = KeepaliveWheel(tick=0.01)
+
+    async def register():
+        return wheel.register(lambda: None, interval=1.0)
+
+    # The old loop stops with the wheel's task still pending, as a loop running in a thread does
+    old_loop = asyncio.new_event_loop()
+    stale = old_loop.run_until_complete(register())
+
+    async def new_loop():
+        live = wheel.register(lambda: None, interval=1.0)
+        task = wheel._task
+        assert task.get_loop() is asyncio.get_running_loop()
+        # Closing a session of the old loop must not unregister the live one
+        stale.cancel()
+        await asyncio.sleep(0.03)
+        assert wheel.stats()["sessions"] == 1
+        assert not task.done()
+        live.cancel()
+        await asyncio.sleep(0.03)
+        assert task.done()
+
+    try:
+        asyncio.run(new_loop())
+    finally:
+        # Let the old loop finish its cancelled wheel task before closing it
+        old_loop.run_until_complete(asyncio.sleep(0))
+        old_loop.close()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for mcpgateway.utils.rate_limiter.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+"""
+
+# Standard
+from unittest.mock import AsyncMock
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils.rate_limiter import RateLimiter, RateLimitExceeded, TokenBucket
+
+
+def test_token_bucket_refills_continuously():
+    bucket = TokenBucket(capacity=60, refill_rate=1.0, now=0.0)
+    for _ in range(60):
+        assert bucket.consume(now=0.0) == 0.0
+    assert bucket.consume(now=0.0) == pytest.approx(1.0)
+    assert bucket.consume(now=0.5) == pytest.approx(0.5)
+    assert bucket.consume(now=1.0) == 0.0
+    # Refill never exceeds capacity
+    assert bucket.is_full(now=1000.0)
+
+
+@pytest.mark.asyncio
+async def test_limits_are_per_scope_and_key():
+    limiter = RateLimiter()
+    await limiter.hit("tool", "a", 1)
+    await limiter.hit("tool", "b", 1)
+    await limiter.hit("user", "a", 1)
+
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        await limiter.hit("tool", "a", 1)
+
+    assert exc_info.value.scope == "tool"
+    assert exc_info.value.key == "a"
+    assert 59 < exc_info.value.retry_after <= 60
+    assert exc_info.value.headers == {"Retry-After": "60"}
+
+
+@pytest.mark.asyncio
+async def test_zero_limit_disables_check():
+    limiter = RateLimiter()
+    for _ in range(100):
+        await limiter.hit("server", "1", 0)
+
+
+@pytest.mark.asyncio
+async def test_redis_script_decides_when_configured():
+    limiter = RateLimiter()
+    limiter._script = AsyncMock(side_effect=[[1, "0"], [0, "2.5"]])
+
+    await limiter.hit("gateway", "http://peer", 10)
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        await limiter.hit("gateway", "http://peer", 10)
+
+    assert exc_info.value.retry_after == 2.5
+    assert exc_info.value.headers == {"Retry-After": "3"}
+    limiter._script.assert_awaited_with(keys=["ratelimit:gateway:http://peer"], args=[10, 10 / 60.0, 1])
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_local_bucket():
+    limiter = RateLimiter()
+    limiter._script = AsyncMock(side_effect=ConnectionError("redis down"))
+
+    await limiter.hit("tool", "echo", 1)
+    with pytest.raises(RateLimitExceeded):
+        await limiter.hit("tool", "echo", 1)
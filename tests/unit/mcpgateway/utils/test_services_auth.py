@@ -10,8 +10,13 @@ Covered behaviour
 * Round-trip integrity: encode_auth ➜ decode_auth
 * Graceful handling of None for encode_auth / decode_auth
 * get_key raises ValueError when the encryption secret is unset
+* Decrypted values are cached by ciphertext and returned as copies
+* mask_auth hides secrets
 """
 
+# Standard
+from unittest.mock import patch
+
 # First-Party
 # --------------------------------------------------------------------------- #
 # Import the module under test: mcpgateway.utils.services_auth                #
@@ -24,6 +29,7 @@ import pytest
 encode_auth = services_auth.encode_auth
 decode_auth = services_auth.decode_auth
 get_key = services_auth.get_key
+mask_auth = services_auth.mask_auth
 settings = services_auth.settings
 
 
@@ -58,3 +64,34 @@ def test_get_key_without_secret_raises(monkeypatch):
     monkeypatch.setattr(settings, "auth_encryption_secret", "")
     with pytest.raises(ValueError):
         get_key()
+
+
+def test_decode_is_cached_per_ciphertext(monkeypatch):
+    monkeypatch.setattr(settings, "auth_encryption_secret", "top-secret")
+    encoded = encode_auth({"Authorization": "Bearer abc"})
+    services_auth._decrypted.clear()
+
+    with patch.object(services_auth, "_cipher", wraps=services_auth._cipher) as mock_cipher:
+        first = decode_auth(encoded)
+        first["Authorization"] = "mutated"
+        assert decode_auth(encoded) == {"Authorization": "Bearer abc"}
+        mock_cipher.assert_called_once()
+
+
+def test_decode_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(settings, "auth_encryption_secret", "top-secret")
+    monkeypatch.setattr(services_auth, "MAX_DECRYPTED_AUTH", 2)
+    services_auth._decrypted.clear()
+
+    encoded = [encode_auth({"n": str(i)}) for i in range(3)]
+
+    assert len(services_auth._decrypted) == 2
+    assert decode_auth(encoded[0]) == {"n": "0"}
+
+
+def test_mask_auth_hides_secrets(monkeypatch):
+    monkeypatch.setattr(settings, "auth_encryption_secret", "top-secret")
+    basic = encode_auth({"Authorization": "Basic YWxpY2U6cHc="})  # alice:pw
+
+    assert mask_auth("basic", basic) == {"auth_type": "basic", "username": "alice", "password": "********"}
+    assert mask_auth("none", basic) is None
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for mcpgateway.utils.single_flight.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+"""
+
+# Standard
+import asyncio
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await release.wait()
+        return object()
+
+    tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(3)]
+    other = asyncio.create_task(flight.do("other", work))
+    await asyncio.sleep(0)
+    assert sorted(flight.in_flight()) == ["k", "other"]
+
+    release.set()
+    results = await asyncio.gather(*tasks)
+    await other
+
+    assert len(calls) == 2
+    assert results[0] is results[1] is results[2]
+    assert flight.stats() == {"in_flight": 0, "leaders": 2, "coalesced": 2}
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_shared_and_not_remembered():
+    flight = SingleFlight()
+    attempts = []
+
+    async def fail():
+        attempts.append(1)
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(attempts) == 1
+
+    # A later call starts afresh
+    with pytest.raises(ValueError):
+        await flight.do("k", fail)
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(flight.do("k", work))
+    follower = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_shared_call_cancelled_when_every_caller_leaves():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def work():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    callers = [asyncio.create_task(flight.do("k", work)) for _ in range(2)]
+    await asyncio.sleep(0)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert cancelled.is_set()
+    assert flight.in_flight() == []
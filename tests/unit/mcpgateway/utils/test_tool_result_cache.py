@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for mcpgateway.utils.tool_result_cache.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+Authors: Mihai Criveti
+"""
+
+# Standard
+from types import SimpleNamespace
+
+# First-Party
+from mcpgateway.types import TextContent, ToolResult
+from mcpgateway.utils.tool_result_cache import CachePolicy, ToolResultCache
+
+
+def _result(text="ok", is_error=False):
+    return ToolResult(content=[TextContent(type="text", text=text)], is_error=is_error)
+
+
+def _tool(cache_ttl=None, stale_while_revalidate=None):
+    return SimpleNamespace(cache_ttl=cache_ttl, stale_while_revalidate=stale_while_revalidate, annotations={"cache_ttl": 30})
+
+
+def test_policy_requires_positive_ttl():
+    assert ToolResultCache.policy(_tool(30, 5)) == CachePolicy(30.0, 5.0)
+    assert ToolResultCache.policy(_tool(0)) is None
+    # Annotations are MCP metadata and do not opt a tool in
+    assert ToolResultCache.policy(_tool()) is None
+
+
+def test_key_is_canonical_and_per_tool():
+    assert ToolResultCache.key("t", {"a": 1, "b": {"y": 2, "x": 1}}) == ToolResultCache.key("t", {"b": {"x": 1, "y": 2}, "a": 1})
+    assert ToolResultCache.key("t", {"a": 1}) != ToolResultCache.key("u", {"a": 1})
+    assert ToolResultCache.key("t", {"a": 1}) != ToolResultCache.key("t", {"a": 2})
+
+
+def test_store_uses_policy_ttl_and_skips_errors():
+    cache = ToolResultCache()
+    cache.store("t:1", _result(), CachePolicy(ttl=60))
+    cache.store("t:2", _result(is_error=True), CachePolicy(ttl=60))
+
+    entry = cache.get("t:1")
+    assert entry.result.content[0].text == "ok"
+    assert entry.fresh_until - entry.stale_until == 0
+    assert cache.get("t:2") is None
+
+
+def test_cache_control_overrides_policy():
+    cache = ToolResultCache()
+    cache.store("t:1", _result(), CachePolicy(ttl=60), {"cache-control": "max-age=5, stale-while-revalidate=10"})
+    entry = cache.get("t:1")
+    assert round(entry.fresh_until - entry.stale_until) == -10
+
+    cache.store("t:1", _result(), CachePolicy(ttl=60), {"cache-control": "no-store"})
+    assert cache.get("t:1") is None
+
+
+def test_expired_entry_with_etag_is_kept_for_revalidation():
+    cache = ToolResultCache()
+    cache.store("t:1", _result(), CachePolicy(ttl=60), {"cache-control": "no-cache", "etag": '"v1"'})
+    cache.store("t:2", _result(), CachePolicy(ttl=60), {"cache-control": "no-cache"})
+
+    entry = cache.get("t:1")
+    assert entry is not None
+    assert entry.validators == {"If-None-Match": '"v1"'}
+    assert cache.get("t:2") is None
+
+
+def test_invalidate_tool_and_lru_eviction():
+    cache = ToolResultCache(max_size=2)
+    cache.store("a:1", _result(), CachePolicy(ttl=60))
+    cache.store("b:1", _result(), CachePolicy(ttl=60))
+    cache.get("a:1")
+    cache.store("c:1", _result(), CachePolicy(ttl=60))
+
+    assert cache.get("b:1") is None  # least recently used
+    cache.invalidate_tool("a")
+    assert cache.get("a:1") is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_results_started_before_invalidation_are_not_stored():
+    cache = ToolResultCache()
+    started = cache.generation(7)
+    other = cache.generation("b")
+    cache.invalidate_tool(7)
+
+    cache.store("7:1", _result("old"), CachePolicy(ttl=60), generation=started)
+    assert cache.get("7:1") is None
+    cache.store("7:1", _result("new"), CachePolicy(ttl=60), generation=cache.generation(7))
+    assert cache.get("7:1").result.content[0].text == "new"
+    # Other tools are unaffected
+    cache.store("b:1", _result(), CachePolicy(ttl=60), generation=other)
+    assert cache.get("b:1") is not None
+
+
+def test_refresh_claims_are_exclusive():
+    cache = ToolResultCache()
+    assert cache.begin_refresh("t:1")
+    assert not cache.begin_refresh("t:1")
+    cache.end_refresh("t:1")
+    assert cache.begin_refresh("t:1")
+
+
+def test_revalidated_entry_keeps_validators_a_304_omits():
+    cache = ToolResultCache()
+    cache.store("t:1", _result(), CachePolicy(ttl=0), {"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    previous = cache.get("t:1")
+
+    cache.store("t:1", previous.result, CachePolicy(ttl=0), {"cache-control": "no-cache"}, previous=previous)
+    assert cache.get("t:1").validators == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    cache.store("t:1", previous.result, CachePolicy(ttl=0), {"etag": '"v2"'}, previous=cache.get("t:1"))
+    assert cache.get("t:1").etag == '"v2"'
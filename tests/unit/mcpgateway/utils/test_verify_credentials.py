@@ -13,6 +13,8 @@ Paths covered
 * verify_basic_credentials - success & failure
 * require_basic_auth - required & optional modes
 * require_auth_override - header vs cookie precedence
+* verification cache - hits, exp cap, revocation, Redis revocation sync, key rotation
+* asymmetric keys    - PEM public key and JWKS
 
 Only dependencies needed are ``pytest`` and ``PyJWT`` (already required by the
 target module).  FastAPI `HTTPException` objects are asserted for status code
@@ -23,12 +25,18 @@ and detail.
 from __future__ import annotations
 
 # Standard
+import asyncio
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import time
+from unittest.mock import MagicMock, patch
 
 # First-Party
 from mcpgateway.utils import verify_credentials as vc  # module under test
 
 # Third-Party
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBasicCredentials
 import jwt
@@ -179,3 +187,212 @@ async def test_require_auth_override(monkeypatch):
     # Only cookie present
     res2 = await vc.require_auth_override(auth_header=None, jwt_token=cookie_token)
     assert res2["c"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Verification cache
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_verified_token_is_cached(monkeypatch):
+    monkeypatch.setattr(vc.settings, "jwt_secret_key", SECRET, raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_algorithm", ALGO, raising=False)
+
+    tok = _token({"sub": "abc"}, exp_delta=10)
+    with patch.object(vc.jwt, "decode", wraps=jwt.decode) as mock_decode:
+        first = await vc.verify_credentials(tok)
+        second = await vc.verify_jwt_token(tok)
+
+    mock_decode.assert_called_once()
+    assert second["sub"] == "abc"
+    # Callers get copies: enrichment of one result does not leak into the cache
+    assert "token" in first and "token" not in second
+
+
+@pytest.mark.asyncio
+async def test_cache_never_outlives_exp(monkeypatch):
+    monkeypatch.setattr(vc.settings, "jwt_secret_key", SECRET, raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_algorithm", ALGO, raising=False)
+
+    tok = _token({"sub": "abc"}, exp_delta=1)
+    await vc.verify_jwt_token(tok)
+
+    with patch.object(vc.time, "time", return_value=datetime.now(timezone.utc).timestamp() + 120):
+        assert vc.token_cache.get(vc.TokenCache.key(tok), (ALGO, SECRET, "", "")) is None
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_rejected(monkeypatch):
+    monkeypatch.setattr(vc.settings, "jwt_secret_key", SECRET, raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_algorithm", ALGO, raising=False)
+
+    tok = _token({"sub": "abc"}, exp_delta=10)
+    await vc.verify_jwt_token(tok)
+    await vc.revoke_token(tok)
+
+    with pytest.raises(HTTPException) as exc:
+        await vc.verify_jwt_token(tok)
+    assert exc.value.detail == "Token has been revoked"
+
+
+@pytest.mark.asyncio
+async def test_revocation_requires_exp():
+    with pytest.raises(ValueError):
+        await vc.revoke_token(_token({"sub": "abc"}))
+    with pytest.raises(ValueError):
+        await vc.revoke_token("not-a-jwt")
+
+
+class _FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.append(self.queue)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        try:
+            async with asyncio.timeout(timeout):
+                return await self.queue.get()
+        except TimeoutError:
+            return None
+
+    async def aclose(self):
+        self.redis.subscribers.remove(self.queue)
+
+
+class _FakeRedis:
+    """Stands in for the Redis all workers share."""
+
+    def __init__(self):
+        self.zset = {}
+        self.subscribers = []
+        self.calls = 0
+
+    @classmethod
+    def from_url(cls, url):
+        return cls.shared
+
+    def pubsub(self):
+        return _FakePubSub(self)
+
+    async def zadd(self, key, mapping):
+        self.calls += 1
+        self.zset.update({k.encode(): v for k, v in mapping.items()})
+
+    async def zremrangebyscore(self, key, low, high):
+        self.calls += 1
+        self.zset = {k: v for k, v in self.zset.items() if v > high}
+
+    async def zrange(self, key, start, end, withscores=False):
+        self.calls += 1
+        return list(self.zset.items())
+
+    async def publish(self, channel, message):
+        self.calls += 1
+        for queue in self.subscribers:
+            queue.put_nowait({"data": message.encode()})
+
+    async def aclose(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_revocation_is_shared_through_redis(monkeypatch):
+    monkeypatch.setattr(vc.settings, "jwt_secret_key", SECRET, raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_algorithm", ALGO, raising=False)
+    monkeypatch.setattr(vc.settings, "cache_type", "redis", raising=False)
+    monkeypatch.setattr(vc.settings, "redis_url", "redis://shared", raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_revocation_sync_interval", 0.05, raising=False)
+    monkeypatch.setattr(vc, "REDIS_AVAILABLE", True)
+    monkeypatch.setattr(vc, "Redis", _FakeRedis, raising=False)
+    _FakeRedis.shared = redis = _FakeRedis()
+    sync = vc.RevocationSync()
+    monkeypatch.setattr(vc, "token_revocations", sync)
+
+    # Revoked before this worker started: picked up by the initial load
+    early = _token({"sub": "early"}, exp_delta=10)
+    await vc.revoke_token(early)
+    assert redis.zset == {}  # not connected yet, so only local
+    await redis.zadd(vc.RevocationSync.KEY, {vc.TokenCache.key(early): time.time() + 10})
+    vc.token_cache.clear()
+
+    await sync.initialize()
+    try:
+        await asyncio.sleep(0.01)
+        assert vc.token_cache.is_revoked(vc.TokenCache.key(early))
+
+        # Revoked by another worker: arrives through pub/sub
+        tok = _token({"sub": "abc"}, exp_delta=10)
+        await vc.verify_jwt_token(tok)
+        await redis.publish(vc.RevocationSync.CHANNEL, f"{vc.TokenCache.key(tok)} {time.time() + 10}")
+        await asyncio.sleep(0.01)
+
+        # Checking a token never goes to Redis
+        calls = redis.calls
+        with pytest.raises(HTTPException) as exc:
+            await vc.verify_jwt_token(tok)
+        assert exc.value.detail == "Token has been revoked"
+        assert redis.calls == calls
+
+        # Missed messages are recovered by the periodic reload
+        missed = _token({"sub": "missed"}, exp_delta=10)
+        await redis.zadd(vc.RevocationSync.KEY, {vc.TokenCache.key(missed): time.time() + 10})
+        await asyncio.sleep(0.1)
+        assert vc.token_cache.is_revoked(vc.TokenCache.key(missed))
+
+        # Revoking here shares it
+        other = _token({"sub": "other"}, exp_delta=10)
+        await vc.revoke_token(other)
+        assert vc.TokenCache.key(other).encode() in redis.zset
+    finally:
+        await sync.shutdown()
+    assert redis.subscribers == []
+
+
+@pytest.mark.asyncio
+async def test_secret_rotation_invalidates_cache(monkeypatch):
+    monkeypatch.setattr(vc.settings, "jwt_secret_key", SECRET, raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_algorithm", ALGO, raising=False)
+
+    tok = _token({"sub": "abc"})
+    await vc.verify_jwt_token(tok)
+    monkeypatch.setattr(vc.settings, "jwt_secret_key", "rotated", raising=False)
+
+    with pytest.raises(HTTPException) as exc:
+        await vc.verify_jwt_token(tok)
+    assert exc.value.detail == "Invalid token"
+
+
+# ---------------------------------------------------------------------------
+# Asymmetric keys
+# ---------------------------------------------------------------------------
+@pytest.fixture(scope="module")
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.mark.asyncio
+async def test_public_key_verifies_rs256(monkeypatch, rsa_key):
+    pem = rsa_key.public_key().public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo).decode()
+    monkeypatch.setattr(vc.settings, "jwt_algorithm", "RS256", raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_public_key", pem, raising=False)
+
+    tok = jwt.encode({"sub": "svc"}, rsa_key, algorithm="RS256")
+    assert (await vc.verify_jwt_token(tok))["sub"] == "svc"
+
+
+@pytest.mark.asyncio
+async def test_jwks_keys_are_resolved_by_client(monkeypatch, rsa_key):
+    monkeypatch.setattr(vc.settings, "jwt_algorithm", "RS256", raising=False)
+    monkeypatch.setattr(vc.settings, "jwt_jwks_url", "https://issuer.example/jwks.json", raising=False)
+    client = MagicMock()
+    client.get_signing_key_from_jwt.return_value = SimpleNamespace(key=rsa_key.public_key())
+    monkeypatch.setitem(vc._jwks_clients, "https://issuer.example/jwks.json", client)
+
+    tok = jwt.encode({"sub": "svc"}, rsa_key, algorithm="RS256", headers={"kid": "k1"})
+    assert (await vc.verify_jwt_token(tok))["sub"] == "svc"
+    assert (await vc.verify_jwt_token(tok))["sub"] == "svc"
+
+    # Second call was served from the verification cache
+    client.get_signing_key_from_jwt.assert_called_once_with(tok)